@@ -42,6 +42,8 @@ import matplotlib.pyplot as plt
 import numpy as np
 import tensorflow as tf
 
+from garage.experiment import load_metrics, run_experiments
+
 _plot = None
 _log_dir = None
 _auto = False
@@ -111,9 +113,14 @@ def iterate_experiments(func,
                         xcolumn='TotalEnvSteps',
                         xlabel='Total Environment Steps',
                         ycolumn='Evaluation/AverageReturn',
-                        ylabel='Average Return'):
+                        ylabel='Average Return',
+                        n_parallel=1):
     """Iterate experiments for benchmarking over env_ids and seeds.
 
+    If `n_parallel` is greater than 1, the seeds of each environment run
+    concurrently, sharing one pool of sampler workers. See
+    :func:`garage.experiment.run_experiments`.
+
     Args:
         env_ids (list[str]): List of environment ids.
         snapshot_config (garage.experiment.SnapshotConfig): The experiment
@@ -125,6 +132,7 @@ def iterate_experiments(func,
         xlabel (str): Label name for x axis.
         ycolumn (str): Which column should be the JSON y axis.
         ylabel (str): Label name for y axis.
+        n_parallel (int): Number of seeds to run at a time.
 
     """
     func_name = func.__name__.replace('_', '-')
@@ -138,19 +146,27 @@ def iterate_experiments(func,
         if _plot is not None and env_id not in _plot:
             _plot[env_id] = {'xlabel': xlabel, 'ylabel': ylabel}
 
+        ctxts = []
         for seed in seeds:
             exp_name = func_name + '_' + env_id + '_' + str(seed)
-            sub_log_dir = os.path.join(_log_dir, exp_name)
-
-            tf.compat.v1.reset_default_graph()
-
-            ctxt = dict(log_dir=sub_log_dir)
+            ctxt = dict(log_dir=os.path.join(_log_dir, exp_name))
             if snapshot_config:
                 ctxt.update(snapshot_config)
-            func(ctxt, env_id=env_id, seed=seed)
+            ctxts.append(ctxt)
+
+        if n_parallel > 1:
+            run_experiments(func, [dict(env_id=env_id, seed=seed)
+                                   for seed in seeds],
+                            options=ctxts,
+                            n_parallel=n_parallel)
+        else:
+            for seed, ctxt in zip(seeds, ctxts):
+                tf.compat.v1.reset_default_graph()
+                func(ctxt, env_id=env_id, seed=seed)
 
-            if _plot is not None or _auto:
-                xs, ys = _read_csv(sub_log_dir, xcolumn, ycolumn)
+        if _plot is not None or _auto:
+            for ctxt in ctxts:
+                xs, ys = _read_metrics(ctxt['log_dir'], xcolumn, ycolumn)
                 task_ys.append(ys)
 
         if _plot is not None or _auto:
@@ -182,6 +198,28 @@ def _get_log_dir(exec_func_name):
     return str(cwd.joinpath('data', 'local', 'benchmarks', exec_func_name))
 
 
+def _read_metrics(log_dir, xcolumn, ycolumn):
+    """Read the metrics logged by an experiment and return xs and ys.
+
+    Falls back to progress.csv for experiments logged without a metrics
+    directory.
+
+    Args:
+        log_dir (str): Log directory of the experiment.
+        xcolumn (str): Which column should be the JSON x axis.
+        ycolumn (str): Which column should be the JSON y axis.
+
+    Returns:
+        list: List of x axis points.
+        list: List of y axis points.
+
+    """
+    if not os.path.isdir(os.path.join(log_dir, 'metrics')):
+        return _read_csv(log_dir, xcolumn, ycolumn)
+    metrics = load_metrics(log_dir)
+    return metrics[xcolumn].tolist(), metrics[ycolumn].tolist()
+
+
 def _read_csv(log_dir, xcolumn, ycolumn):
     """Read csv files and return xs and ys.
 
@@ -0,0 +1,9 @@
+"""Throughput benchmarks of garage components, which run in seconds.
+
+Unlike the benchmarks run by `garage_benchmark`, which train algorithms to
+compare their performance, these scripts measure the speed and memory use of
+individual components. Run them as modules, for example:
+
+    python -m garage_benchmarks.throughput.atari_preprocessing
+
+"""
@@ -0,0 +1,163 @@
+"""Benchmark the image preprocessing wrappers used with Atari.
+
+Compares the Grayscale, Resize and StackFrames wrapper chain used by the
+Atari examples against the implementation which stacked frames with
+np.stack and converted frames with scikit-image on every step.
+"""
+from collections import deque
+import warnings
+
+import click
+import gym
+import gym.spaces
+import numpy as np
+from skimage import color, img_as_ubyte
+
+from garage.envs.wrappers import Grayscale, Resize, StackFrames
+
+from garage_benchmarks.throughput.helper import measure_steps, print_table
+
+
+class _FrameEnv(gym.Env):
+    """Environment which cycles through pre-generated uint8 frames.
+
+    Args:
+        shape (tuple[int]): Shape of a frame.
+        n_frames (int): Number of distinct frames.
+
+    """
+
+    def __init__(self, shape=(210, 160, 3), n_frames=8):
+        self.observation_space = gym.spaces.Box(0,
+                                                255,
+                                                shape=shape,
+                                                dtype=np.uint8)
+        self.action_space = gym.spaces.Discrete(2)
+        self._frames = [
+            self.observation_space.sample() for _ in range(n_frames)
+        ]
+        self._t = 0
+
+    def reset(self):
+        """Reset the environment.
+
+        Returns:
+            np.ndarray: The first frame.
+
+        """
+        self._t = 0
+        return self._frames[0]
+
+    def step(self, action):
+        """Step the environment.
+
+        Args:
+            action (int): Ignored.
+
+        Returns:
+            np.ndarray: The next frame.
+            float: Reward.
+            bool: Termination signal.
+            dict: Extra information.
+
+        """
+        del action
+        self._t += 1
+        return self._frames[self._t % len(self._frames)], 0., False, {}
+
+    def render(self, mode='human'):
+        """Do not render.
+
+        Args:
+            mode (str): Ignored.
+
+        """
+
+
+class _LegacyGrayscale(Grayscale):
+    """Grayscale, converting frames with scikit-image."""
+
+    def _color_to_grayscale(self, obs):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            return img_as_ubyte(color.rgb2gray(obs))
+
+
+class _LegacyStackFrames(StackFrames):
+    """StackFrames, stacking a deque of frames with np.stack every step."""
+
+    def __init__(self, env, n_frames, axis=2):
+        super().__init__(env, n_frames, axis)
+        self._deque = deque(maxlen=n_frames)
+
+    def reset(self):
+        observation = self.env.reset()
+        self._deque.clear()
+        for _ in range(self._n_frames):
+            self._deque.append(observation)
+        return np.stack(self._deque, axis=self._axis)
+
+    def step(self, action):
+        observation, reward, done, info = self.env.step(action)
+        self._deque.append(observation)
+        return np.stack(self._deque, axis=self._axis), reward, done, info
+
+
+def _chain(grayscale_cls, stack_cls, interpolation, size, n_frames):
+    """Build a preprocessing wrapper chain.
+
+    Args:
+        grayscale_cls (type): Grayscale wrapper class.
+        stack_cls (type): Frame stacking wrapper class.
+        interpolation (str): Interpolation method of Resize.
+        size (int): Width and height of resized frames.
+        n_frames (int): Number of stacked frames.
+
+    Returns:
+        gym.Env: The wrapped environment.
+
+    """
+    env = grayscale_cls(_FrameEnv())
+    env = Resize(env, size, size, interpolation=interpolation)
+    return stack_cls(env, n_frames, axis=0)
+
+
+@click.command()
+@click.option('--n_steps', default=2000, help='Number of measured steps.')
+@click.option('--size', default=84, help='Width and height of frames.')
+@click.option('--n_frames', default=4, help='Number of stacked frames.')
+def atari_preprocessing(n_steps, size, n_frames):
+    """Measure steps/sec and memory of Atari preprocessing wrappers.
+
+    Args:
+        n_steps (int): Number of measured steps.
+        size (int): Width and height of frames.
+        n_frames (int): Number of stacked frames.
+
+    """
+    chains = {
+        'np.stack + skimage (previous)':
+        (_LegacyGrayscale, _LegacyStackFrames, 'bilinear'),
+        'ring buffer, bilinear': (Grayscale, StackFrames, 'bilinear'),
+        'ring buffer, area': (Grayscale, StackFrames, 'area'),
+    }
+    results = {}
+    for name, (grayscale_cls, stack_cls, interpolation) in chains.items():
+        env = _chain(grayscale_cls, stack_cls, interpolation, size, n_frames)
+        env.reset()
+        results[name] = measure_steps(lambda env=env: env.step(0), n_steps)
+        env.close()
+    # Stacking alone, on frames which are already preprocessed.
+    for name, stack_cls in (('np.stack only (previous)', _LegacyStackFrames),
+                            ('ring buffer only', StackFrames)):
+        env = stack_cls(_FrameEnv((size, size)), n_frames, axis=0)
+        env.reset()
+        stack = env.step
+        results[name] = measure_steps(
+            lambda env=env, stack=stack: stack(0), n_steps)
+        env.close()
+    print_table(results)
+
+
+if __name__ == '__main__':
+    atari_preprocessing()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,60 @@
+"""Helper functions for throughput benchmarks."""
+import time
+import tracemalloc
+
+
+def measure_steps(step, n_steps, n_warmup=10):
+    """Measure the speed and transient memory use of a step function.
+
+    Memory is traced with tracemalloc, which also traces numpy arrays. The
+    transient memory of a step is the peak traced memory during the step,
+    above the memory traced before it. Steps are timed separately, without
+    tracing, since tracing slows down allocations.
+
+    Args:
+        step (Callable[[], object]): Function running a single step.
+        n_steps (int): Number of steps to measure.
+        n_warmup (int): Number of steps to run before measuring.
+
+    Returns:
+        dict[str, float]: Steps per second, and mean transient KiB allocated
+            per step.
+
+    """
+    for _ in range(n_warmup):
+        step()
+
+    start = time.perf_counter()
+    for _ in range(n_steps):
+        step()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    transient = 0
+    for _ in range(n_steps):
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        step()
+        transient += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+
+    return {
+        'StepsPerSec': n_steps / elapsed,
+        'TransientKiBPerStep': transient / n_steps / 1024,
+    }
+
+
+def print_table(results):
+    """Print benchmark results as a table.
+
+    Args:
+        results (dict[str, dict[str, float]]): Results of each benchmark, by
+            name.
+
+    """
+    columns = list(next(iter(results.values())))
+    name_width = max(len(name) for name in results)
+    print(' '.join([' ' * name_width] + ['{:>20}'.format(c) for c in columns]))
+    for name, result in results.items():
+        print(' '.join([name.ljust(name_width)] +
+                       ['{:>20.2f}'.format(result[c]) for c in columns]))
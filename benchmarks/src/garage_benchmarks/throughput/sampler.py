@@ -0,0 +1,161 @@
+"""Benchmark the framework overhead of sampling.
+
+Steps :class:`~BatchPointEnv` and :class:`~BatchGridWorldEnv`, which cost
+almost nothing to simulate, directly, through a :class:`~VecWorker` and
+through a :class:`~LocalSampler`, and compares them to stepping a list of
+:class:`~PointEnv` or :class:`~GridWorldEnv` copies. The gap between the
+batch environment and the worker or sampler is the overhead of the
+framework, since the policy is a trivial random one.
+"""
+import akro
+import click
+import numpy as np
+
+from garage.envs import (BatchGridWorldEnv, BatchPointEnv, GridWorldEnv,
+                         PointEnv)
+from garage.sampler import LocalSampler, VecWorker, WorkerFactory
+
+from garage_benchmarks.throughput.helper import measure_steps, print_table
+
+
+class _RandomPolicy:
+    """Policy sampling uniformly random actions with vectorized NumPy.
+
+    Args:
+        action_space (akro.Box or akro.Discrete): Action space.
+
+    """
+
+    def __init__(self, action_space):
+        self._action_space = action_space
+
+    def reset(self, do_resets=None):
+        """Do nothing, since the policy has no state.
+
+        Args:
+            do_resets (list[bool]): Ignored.
+
+        """
+
+    def get_actions(self, observations):
+        """Sample an action for every observation.
+
+        Args:
+            observations (numpy.ndarray): Observations.
+
+        Returns:
+            numpy.ndarray: Actions.
+            dict: Empty agent info.
+
+        """
+        if isinstance(self._action_space, akro.Discrete):
+            return np.random.randint(self._action_space.n,
+                                     size=len(observations)), dict()
+        return np.random.uniform(self._action_space.low,
+                                 self._action_space.high,
+                                 size=(len(observations), ) +
+                                 self._action_space.shape), dict()
+
+
+def _env_steps(step, n_envs, n_steps):
+    """Measure the environment steps per second of a step function.
+
+    Args:
+        step (Callable[[], object]): Function stepping n_envs environments.
+        n_envs (int): Number of environments stepped by each call.
+        n_steps (int): Number of measured calls.
+
+    Returns:
+        dict[str, float]: Environment steps per second, and mean transient
+            KiB allocated per environment step.
+
+    """
+    result = measure_steps(step, n_steps)
+    return {
+        'EnvStepsPerSec': result['StepsPerSec'] * n_envs,
+        'TransientKiBPerStep': result['TransientKiBPerStep'] / n_envs,
+    }
+
+
+def _benchmark_env(name, batch_env, singles, max_episode_length, n_steps,
+                   results):
+    """Benchmark one environment, adding results for each way to step it.
+
+    Args:
+        name (str): Name of the environment.
+        batch_env (BatchEnvironment): Batch of copies of the environment.
+        singles (list[Environment]): Separate copies of the environment.
+        max_episode_length (int): Maximum episode length of the worker.
+        n_steps (int): Number of measured calls.
+        results (dict[str, dict[str, float]]): Results, by name.
+
+    """
+    n_envs = batch_env.n_envs
+    policy = _RandomPolicy(batch_env.action_space)
+    actions, _ = policy.get_actions(np.zeros(n_envs))
+
+    batch_env.reset()
+    results[name + ', batch env'] = _env_steps(
+        lambda: batch_env.step(actions), n_envs, n_steps)
+
+    for env in singles:
+        env.reset()
+    results[name + ', single envs'] = _env_steps(
+        lambda: [env.step(a) for env, a in zip(singles, actions)], n_envs,
+        n_steps)
+
+    for env_name, envs in (('batch env', batch_env), ('single envs',
+                                                      singles)):
+        worker = VecWorker(seed=1,
+                           max_episode_length=max_episode_length,
+                           worker_number=0,
+                           n_envs=n_envs)
+        worker.update_agent(policy)
+        worker.update_env(envs)
+        worker.start_episode()
+        results['{}, VecWorker over {}'.format(name, env_name)] = _env_steps(
+            worker.step_episode, n_envs, n_steps)
+
+    workers = WorkerFactory(seed=1,
+                            max_episode_length=max_episode_length,
+                            n_workers=1,
+                            worker_class=VecWorker,
+                            worker_args=dict(n_envs=n_envs))
+    sampler = LocalSampler.from_worker_factory(workers, policy, batch_env)
+    batch_size = n_envs * max_episode_length
+    results[name + ', LocalSampler over batch env'] = _env_steps(
+        lambda: sampler.obtain_samples(0, batch_size, policy), batch_size,
+        max(1, n_steps // max_episode_length))
+    sampler.shutdown_worker()
+
+
+@click.command()
+@click.option('--n_steps', default=1000, help='Number of measured steps.')
+@click.option('--n_envs', default=64, help='Number of environment copies.')
+@click.option('--max_episode_length',
+              default=100,
+              help='Maximum episode length of workers.')
+def sampler(n_steps, n_envs, max_episode_length):
+    """Measure env steps/sec and memory of stepping lightweight envs.
+
+    Args:
+        n_steps (int): Number of measured steps.
+        n_envs (int): Number of environment copies.
+        max_episode_length (int): Maximum episode length of workers.
+
+    """
+    results = {}
+    # Episodes never terminate, so the environments never need a reset when
+    # stepped directly.
+    _benchmark_env('PointEnv', BatchPointEnv(n_envs, never_done=True),
+                   [PointEnv(never_done=True) for _ in range(n_envs)],
+                   max_episode_length, n_steps, results)
+    desc = ['S' + 'F' * 7] + ['F' * 8] * 7
+    _benchmark_env('GridWorldEnv', BatchGridWorldEnv(n_envs, desc=desc),
+                   [GridWorldEnv(desc=desc) for _ in range(n_envs)],
+                   max_episode_length, n_steps, results)
+    print_table(results)
+
+
+if __name__ == '__main__':
+    sampler()  # pylint: disable=no-value-for-parameter
@@ -10,7 +10,7 @@ from torch import nn
 from torch.nn import functional as F
 
 from garage import wrap_experiment
-from garage.envs import normalize
+from garage.envs import normalize, VecMultiEnvWrapper
 from garage.experiment import deterministic
 from garage.experiment.task_sampler import MetaWorldTaskSampler
 from garage.replay_buffer import PathBuffer
@@ -59,8 +59,11 @@ def mtsac_metaworld_mt10(ctxt=None, *, seed, _gpu, n_tasks, timesteps):
                                              add_env_onehot=True)
     assert n_tasks % 10 == 0
     assert n_tasks <= 500
-    mt10_train_envs = train_task_sampler.sample(n_tasks)
-    env = mt10_train_envs[0]()
+    # Observations already include a one-hot task id, so the vectorized
+    # wrapper only steps every task at once.
+    env = VecMultiEnvWrapper(
+        [env_up() for env_up in train_task_sampler.sample(n_tasks)],
+        mode='vanilla')
     mt10_test_envs = [env_up() for env_up in test_task_sampler.sample(n_tasks)]
 
     policy = TanhGaussianMLPPolicy(
@@ -106,18 +109,14 @@ def mtsac_metaworld_mt10(ctxt=None, *, seed, _gpu, n_tasks, timesteps):
     mtsac.to()
     trainer.setup(
         algo=mtsac,
-        env=mt10_train_envs,
+        env=env,
         sampler_cls=LocalSampler,
-        # 1 sampler worker for each environment
-        n_workers=meta_batch_size,
-        # increasing n_envs increases the vectorization of a sampler worker
-        # which improves runtime performance, but you will need to adjust this
-        # depending on your memory constraints. For reference, each worker by
-        # default uses n_envs=8. Each environment is approximately ~50mb large
-        # so creating 10 envs with 8 copies comes out to 20gb of memory. Many
-        # users want to be able to run multiple seeds on 1 machine, so I have
-        # reduced this to n_envs = 2 for 2 copies in the meantime.
-        worker_args=dict(n_envs=2))
+        # A single sampler worker steps every task on each time step, so each
+        # batch holds the same number of transitions from every task. Each
+        # environment is approximately ~50mb large, so this also keeps only
+        # one copy of each task in memory.
+        n_workers=1,
+        worker_args=dict(n_envs=n_tasks))
     trainer.train(n_epochs=epochs, batch_size=batch_size)
 
 
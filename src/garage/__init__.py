@@ -1,16 +1,5 @@
 """Garage Base."""
-# yapf: disable
-
-from garage._dtypes import EpisodeBatch, TimeStep, TimeStepBatch
-from garage._environment import (Environment, EnvSpec, EnvStep, InOutSpec,
-                                 StepType, Wrapper)
-from garage._functions import (_Default, log_multitask_performance,
-                               log_performance, make_optimizer,
-                               obtain_evaluation_episodes, rollout)
-from garage.experiment.experiment import wrap_experiment
-from garage.trainer import TFTrainer, Trainer
-
-# yapf: enable
+from garage._lazy import lazy_exports
 
 __all__ = [
     '_Default',
@@ -32,3 +21,24 @@ __all__ = [
     'Trainer',
     'TFTrainer',
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'EpisodeBatch': 'garage._dtypes',
+    'TimeStep': 'garage._dtypes',
+    'TimeStepBatch': 'garage._dtypes',
+    'Environment': 'garage._environment',
+    'EnvSpec': 'garage._environment',
+    'EnvStep': 'garage._environment',
+    'InOutSpec': 'garage._environment',
+    'StepType': 'garage._environment',
+    'Wrapper': 'garage._environment',
+    '_Default': 'garage._functions',
+    'log_multitask_performance': 'garage._functions',
+    'log_performance': 'garage._functions',
+    'make_optimizer': 'garage._functions',
+    'obtain_evaluation_episodes': 'garage._functions',
+    'rollout': 'garage._functions',
+    'wrap_experiment': 'garage.experiment.experiment',
+    'TFTrainer': 'garage.trainer',
+    'Trainer': 'garage.trainer',
+})
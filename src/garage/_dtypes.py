@@ -67,6 +67,35 @@ class StepType(enum.IntEnum):
         else:
             return StepType.MID
 
+    @classmethod
+    def get_step_types(cls, step_cnts, max_episode_length, dones):
+        """Determines the step types of a batch of environment copies.
+
+        Equivalent to calling :meth:`get_step_type` for each copy.
+
+        Args:
+            step_cnts (numpy.ndarray): current step cnt of each copy.
+            max_episode_length (int): maximum episode length.
+            dones (numpy.ndarray): the done signal of each copy.
+
+        Returns:
+            list[StepType]: the step type of each copy.
+
+        Raises:
+            ValueError: if any step_cnt is < 1.
+        """
+        step_cnts = np.asarray(step_cnts)
+        if (step_cnts < 1).any():
+            raise ValueError('Expect step_cnts to be >= 1, but got {} '
+                             'instead. Did you forget to call `reset('
+                             ')`?'.format(step_cnts))
+        step_types = np.where(step_cnts == 1, StepType.FIRST, StepType.MID)
+        step_types[np.asarray(dones, dtype=bool)] = StepType.TERMINAL
+        if max_episode_length is not None:
+            step_types[step_cnts >= max_episode_length] = StepType.TIMEOUT
+        members = list(cls)
+        return [members[step_type] for step_type in step_types.tolist()]
+
 
 @dataclass(frozen=True)
 class TimeStep:
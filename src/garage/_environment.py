@@ -2,20 +2,24 @@
 
 import abc
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, TYPE_CHECKING
 
-import akro
 import numpy as np
 
 # Can't use naive garage import, or Sphinx AutoAPI breaks.
 from garage._dtypes import StepType
 
+if TYPE_CHECKING:
+    # akro imports TensorFlow if it is installed, so it is only imported by
+    # type checkers.
+    import akro
+
 
 @dataclass(frozen=True)
 class InOutSpec:
     """Describes the input and output spaces of a primitive or module."""
-    input_space: akro.Space
-    output_space: akro.Space
+    input_space: 'akro.Space'
+    output_space: 'akro.Space'
 
 
 @dataclass(frozen=True, init=False)
@@ -109,6 +113,11 @@ class EnvStep:
 
     """
 
+    # An EnvStep is created on every environment step, so avoid allocating a
+    # __dict__ for each one.
+    __slots__ = ('env_spec', 'action', 'reward', 'observation', 'env_info',
+                 'step_type')
+
     env_spec: EnvSpec
     action: np.ndarray
     reward: np.ndarray
@@ -0,0 +1,68 @@
+"""Lazy loading of the names exported by a package.
+
+Packages of garage export names from modules which import heavy
+dependencies, such as TensorFlow, PyTorch or ray. Rather than importing those
+modules when the package is imported, packages define a module-level
+`__getattr__` (PEP 562), which imports the module defining a name the first
+time the name is accessed. Hence importing a package only pays for what is
+used from it.
+"""
+import importlib
+import sys
+
+
+def lazy_exports(package, exports):
+    """Make a package import the names it exports on first access.
+
+    Used as::
+
+        __getattr__, __dir__ = lazy_exports(__name__, {
+            'LocalSampler': 'garage.sampler.local_sampler',
+        })
+
+    Imported names are stored in the package, so `__getattr__` is only
+    called once per name.
+
+    Args:
+        package (str): Name of the package, i.e. its `__name__`.
+        exports (dict[str, str]): Name of the module defining each exported
+            name, by name.
+
+    Returns:
+        Callable[[str], object]: The `__getattr__` function of the package.
+        Callable[[], list[str]]: The `__dir__` function of the package.
+
+    """
+
+    def __getattr__(name):
+        """Import an exported name of the package.
+
+        Args:
+            name (str): Name to import.
+
+        Returns:
+            object: The value of the name.
+
+        Raises:
+            AttributeError: If the package does not export the name.
+
+        """
+        try:
+            module = exports[name]
+        except KeyError:
+            raise AttributeError('module {!r} has no attribute {!r}'.format(
+                package, name)) from None
+        value = getattr(importlib.import_module(module), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__():
+        """List the names of the package, including unimported exports.
+
+        Returns:
+            list[str]: Names of the package.
+
+        """
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -1,15 +1,10 @@
 """Garage wrappers for gym environments."""
-
-from garage.envs.grid_world_env import GridWorldEnv
-from garage.envs.gym_env import GymEnv
-from garage.envs.metaworld_set_task_env import MetaWorldSetTaskEnv
-from garage.envs.multi_env_wrapper import MultiEnvWrapper
-from garage.envs.normalized_env import normalize
-from garage.envs.point_env import PointEnv
-from garage.envs.task_name_wrapper import TaskNameWrapper
-from garage.envs.task_onehot_wrapper import TaskOnehotWrapper
+from garage._lazy import lazy_exports
 
 __all__ = [
+    'BatchEnvironment',
+    'BatchGridWorldEnv',
+    'BatchPointEnv',
     'GymEnv',
     'GridWorldEnv',
     'MetaWorldSetTaskEnv',
@@ -18,4 +13,20 @@ __all__ = [
     'PointEnv',
     'TaskOnehotWrapper',
     'TaskNameWrapper',
+    'VecMultiEnvWrapper',
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'BatchEnvironment': 'garage.envs.batch_environment',
+    'BatchGridWorldEnv': 'garage.envs.batch_grid_world_env',
+    'BatchPointEnv': 'garage.envs.batch_point_env',
+    'GridWorldEnv': 'garage.envs.grid_world_env',
+    'GymEnv': 'garage.envs.gym_env',
+    'MetaWorldSetTaskEnv': 'garage.envs.metaworld_set_task_env',
+    'MultiEnvWrapper': 'garage.envs.multi_env_wrapper',
+    'normalize': 'garage.envs.normalized_env',
+    'PointEnv': 'garage.envs.point_env',
+    'TaskNameWrapper': 'garage.envs.task_name_wrapper',
+    'TaskOnehotWrapper': 'garage.envs.task_onehot_wrapper',
+    'VecMultiEnvWrapper': 'garage.envs.vec_multi_env_wrapper',
+})
@@ -0,0 +1,88 @@
+"""Base class of environments which step several copies at once."""
+import abc
+
+
+class BatchEnvironment(abc.ABC):
+    """An environment which steps a fixed number of copies on every call.
+
+    A batch environment takes a batch of actions, one per copy, and returns
+    the environment step of every copy. :class:`~VecWorker` and
+    :class:`~FragmentWorker` accept a batch environment as an environment
+    update when it has exactly one copy per environment copy of the worker.
+
+    Each copy has the observation and action space of :attr:`spec`. Copies
+    are reset individually, with :meth:`reset_env`, once their episode ends.
+
+    This is not an :class:`~Environment`, since it takes a batch of actions.
+
+    """
+
+    @property
+    @abc.abstractmethod
+    def n_envs(self):
+        """int: Number of environment copies."""
+
+    @property
+    @abc.abstractmethod
+    def spec(self):
+        """EnvSpec: Specification of a single environment copy."""
+
+    @property
+    def observation_space(self):
+        """akro.Space: Observation space of a single environment copy."""
+        return self.spec.observation_space
+
+    @property
+    def action_space(self):
+        """akro.Space: Action space of a single environment copy."""
+        return self.spec.action_space
+
+    @property
+    def envs(self):
+        """list[Environment or None]: Environment backing each copy.
+
+        None for copies simulated by the batch environment itself. Workers
+        collect running statistics from these environments.
+
+        """
+        return [None] * self.n_envs
+
+    @abc.abstractmethod
+    def reset(self):
+        """Reset all environment copies.
+
+        Returns:
+            numpy.ndarray: The first observation of every copy, stacked along
+                the first axis.
+            list[dict]: The episode-level information of every copy.
+
+        """
+
+    @abc.abstractmethod
+    def reset_env(self, index):
+        """Reset a single environment copy.
+
+        Args:
+            index (int): Index of the copy.
+
+        Returns:
+            numpy.ndarray: The first observation of the copy.
+            dict: The episode-level information of the copy.
+
+        """
+
+    @abc.abstractmethod
+    def step(self, actions):
+        """Step all environment copies.
+
+        Args:
+            actions (numpy.ndarray): Action of every copy, stacked along the
+                first axis.
+
+        Returns:
+            list[EnvStep]: The environment step of every copy.
+
+        """
+
+    def close(self):
+        """Close the environment copies."""
@@ -0,0 +1,227 @@
+"""A batch of 2D grid environments, stepped with vectorized NumPy."""
+import akro
+import numpy as np
+
+from garage import EnvSpec, EnvStep, StepType
+from garage.envs.batch_environment import BatchEnvironment
+from garage.envs.grid_world_env import parse_desc
+
+# Cell types, by the characters of a parsed grid configuration.
+_FREE, _WALL, _HOLE, _GOAL = range(4)
+_CELL_TYPES = {'S': _FREE, 'F': _FREE, 'W': _WALL, 'H': _HOLE, 'G': _GOAL}
+
+# Coordinate increment of each action: left, down, right and up.
+_INCREMENTS = np.array([[0, -1], [1, 0], [0, 1], [-1, 0]])
+
+
+class BatchGridWorldEnv(BatchEnvironment):
+    """A batch of :class:`~GridWorldEnv` copies, stepped together.
+
+    The state of every copy is held in an array, and the next state of every
+    state and action of each copy's grid is computed once, when the grid is
+    set. Stepping all copies is then a single lookup in this table, rather
+    than a Python call per copy. Each copy behaves like a
+    :class:`~GridWorldEnv` constructed with the same arguments.
+
+    Each copy may have its own grid, which is its task. All grids must have
+    the same shape.
+
+    Args:
+        n_envs (int): Number of environment copies.
+        desc (str or list[str]): grid configuration key, or the rows of a
+            grid configuration, of every copy.
+        max_episode_length (int): The maximum steps allowed for an episode.
+
+    Raises:
+        ValueError: If n_envs is not positive.
+
+    """
+
+    def __init__(self, n_envs, desc='4x4', max_episode_length=None):
+        if n_envs < 1:
+            raise ValueError('n_envs must be positive, but got '
+                             '{}.'.format(n_envs))
+        self._n_envs = n_envs
+        self._desc = parse_desc(desc)
+        self._n_row, self._n_col = self._desc.shape
+        n_states = self._n_row * self._n_col
+        self._max_episode_length = max_episode_length
+
+        self._cells = np.empty((n_envs, n_states), dtype=np.int8)
+        self._transitions = np.empty((n_envs, n_states, 4), dtype=int)
+        self._start_states = np.empty(n_envs, dtype=int)
+        self.set_task({'desc': desc})
+        self._env_indices = np.arange(n_envs)
+        self._states = self._start_states.copy()
+        self._step_cnts = np.zeros(n_envs, dtype=int)
+        # Copies whose episode ended, and which must be reset before a step.
+        self._needs_reset = np.ones(n_envs, dtype=bool)
+
+        self._spec = EnvSpec(action_space=akro.Discrete(4),
+                             observation_space=akro.Discrete(n_states),
+                             max_episode_length=max_episode_length)
+
+    @property
+    def n_envs(self):
+        """int: Number of environment copies."""
+        return self._n_envs
+
+    @property
+    def spec(self):
+        """EnvSpec: Specification of a single environment copy."""
+        return self._spec
+
+    def reset(self):
+        """Reset all environment copies.
+
+        Returns:
+            numpy.ndarray: The first observation of every copy.
+            list[dict]: The episode-level information of every copy.
+
+        """
+        self._states[:] = self._start_states
+        self._step_cnts.fill(0)
+        self._needs_reset.fill(False)
+        return self._states.copy(), [dict() for _ in range(self._n_envs)]
+
+    def reset_env(self, index):
+        """Reset a single environment copy.
+
+        Args:
+            index (int): Index of the copy.
+
+        Returns:
+            int: The first observation of the copy.
+            dict: The episode-level information of the copy.
+
+        """
+        self._states[index] = self._start_states[index]
+        self._step_cnts[index] = 0
+        self._needs_reset[index] = False
+        return int(self._states[index]), dict()
+
+    def step(self, actions):
+        """Step all environment copies.
+
+        action map:
+        0: left
+        1: down
+        2: right
+        3: up
+
+        Args:
+            actions (numpy.ndarray): The int encoding the action of every
+                copy.
+
+        Returns:
+            list[EnvStep]: The environment step of every copy.
+
+        Raises:
+            RuntimeError: if a copy is stepped after its episode ended, or
+                before `reset()` is called.
+
+        """
+        if self._needs_reset.any():
+            raise RuntimeError('reset() or reset_env() must be called before '
+                               'step()!')
+        actions = np.asarray(actions)
+        self._states = self._transitions[self._env_indices, self._states,
+                                         actions]
+        cells = self._cells[self._env_indices, self._states]
+        rewards = (cells == _GOAL).astype(np.float64)
+        dones = (cells == _HOLE) | (cells == _GOAL)
+
+        self._step_cnts += 1
+        step_types = StepType.get_step_types(self._step_cnts,
+                                             self._max_episode_length, dones)
+        self._needs_reset |= dones
+        if self._max_episode_length is not None:
+            self._needs_reset |= self._step_cnts >= self._max_episode_length
+
+        return [
+            EnvStep(env_spec=self._spec,
+                    action=action,
+                    reward=reward,
+                    observation=state,
+                    env_info={},
+                    step_type=step_type)
+            for action, reward, state, step_type in zip(
+                actions, rewards.tolist(), self._states.tolist(), step_types)
+        ]
+
+    def sample_tasks(self, num_tasks):
+        """Sample grids, with the goal moved to a random free cell.
+
+        Args:
+            num_tasks (int): Number of tasks to sample.
+
+        Returns:
+            list[dict[str, list[str]]]: A list of "tasks", where each task is
+                a dictionary containing a single key, "desc", mapping to the
+                rows of a grid configuration.
+
+        """
+        free = np.argwhere(self._desc == 'F')
+        tasks = []
+        for x, y in free[np.random.randint(len(free), size=num_tasks)]:
+            desc = self._desc.copy()
+            desc[desc == 'G'] = 'F'
+            desc[x, y] = 'G'
+            tasks.append({'desc': [''.join(row) for row in desc]})
+        return tasks
+
+    def set_task(self, task, index=None):
+        """Set the grid of one or all environment copies.
+
+        Args:
+            task (dict[str, str or list[str]]): A task (a dictionary
+                containing a single key, "desc", which should be a grid
+                configuration key, or the rows of a grid configuration).
+            index (int or None): Index of the copy to set the task of, or None
+                to set the task of all copies.
+
+        Raises:
+            ValueError: If the grid does not have the shape of this
+                environment's grids, does not have exactly one start cell, or
+                has cells of unknown type.
+
+        """
+        desc = parse_desc(task['desc'])
+        if desc.shape != self._desc.shape:
+            raise ValueError('Grids must have shape {}, but got a grid with '
+                             'shape {}.'.format(self._desc.shape, desc.shape))
+        desc = desc.ravel()
+        start_states = np.flatnonzero(desc == 'S')
+        if len(start_states) != 1:
+            raise ValueError('Grids must have exactly one start cell, but '
+                             'got {}.'.format(len(start_states)))
+        unknown = set(desc) - set(_CELL_TYPES)
+        if unknown:
+            raise ValueError('Unknown cell types {}.'.format(sorted(unknown)))
+        cells = np.array([_CELL_TYPES[c] for c in desc], dtype=np.int8)
+        if index is None:
+            index = slice(None)
+        self._cells[index] = cells
+        self._transitions[index] = self._next_states(cells)
+        self._start_states[index] = start_states[0]
+
+    def _next_states(self, cells):
+        """Compute the next state of every state and action of a grid.
+
+        Args:
+            cells (numpy.ndarray): Type of every cell of the grid.
+
+        Returns:
+            numpy.ndarray: The next state of each state and action, with
+                shape (n_states, 4).
+
+        """
+        states = np.arange(len(cells))
+        xs = np.clip(states[:, None] // self._n_col + _INCREMENTS[:, 0], 0,
+                     self._n_row - 1)
+        ys = np.clip(states[:, None] % self._n_col + _INCREMENTS[:, 1], 0,
+                     self._n_col - 1)
+        next_states = xs * self._n_col + ys
+        stay = ((cells[next_states] == _WALL)
+                | ((cells == _HOLE) | (cells == _GOAL))[:, None])
+        return np.where(stay, states[:, None], next_states)
@@ -0,0 +1,222 @@
+"""A batch of 2D point environments, stepped with vectorized NumPy."""
+import math
+
+import akro
+import numpy as np
+
+from garage import EnvSpec, EnvStep, StepType
+from garage.envs.batch_environment import BatchEnvironment
+
+
+class BatchPointEnv(BatchEnvironment):
+    """A batch of :class:`~PointEnv` copies, stepped together.
+
+    The point and goal of every copy are held in (n_envs, 2) arrays, and all
+    copies are stepped with a few vectorized NumPy operations, rather than a
+    Python call per copy. Each copy behaves like a :class:`~PointEnv`
+    constructed with the same arguments, and has its own task.
+
+    Since the simulation costs almost nothing, this is useful to measure the
+    overhead of samplers and workers.
+
+    Args:
+        n_envs (int): Number of environment copies.
+        goal (np.ndarray): A 2D array representing the initial goal position
+            of every copy.
+        arena_size (float): The size of arena where the point is constrained
+            within (-arena_size, arena_size) in each dimension
+        done_bonus (float): A numerical bonus added to the reward
+            once the point as reached the goal
+        never_done (bool): Never send a `done` signal, even if the
+            agent achieves the goal
+        max_episode_length (int): The maximum steps allowed for an episode.
+
+    Raises:
+        ValueError: If n_envs is not positive.
+
+    """
+
+    def __init__(self,
+                 n_envs,
+                 goal=np.array((1., 1.), dtype=np.float32),
+                 arena_size=5.,
+                 done_bonus=0.,
+                 never_done=False,
+                 max_episode_length=math.inf):
+        if n_envs < 1:
+            raise ValueError('n_envs must be positive, but got '
+                             '{}.'.format(n_envs))
+        goal = np.array(goal, dtype=np.float32)
+        assert ((goal >= -arena_size) & (goal <= arena_size)).all()
+        self._n_envs = n_envs
+        self._done_bonus = done_bonus
+        self._never_done = never_done
+        self._arena_size = arena_size
+        self._max_episode_length = max_episode_length
+
+        self._goals = np.tile(goal, (n_envs, 1))
+        self._tasks = [{'goal': goal}] * n_envs
+        self._points = np.zeros_like(self._goals)
+        self._step_cnts = np.zeros(n_envs, dtype=int)
+        # Copies whose episode ended, and which must be reset before a step.
+        self._needs_reset = np.ones(n_envs, dtype=bool)
+
+        observation_space = akro.Box(low=-np.inf,
+                                     high=np.inf,
+                                     shape=(3, ),
+                                     dtype=np.float32)
+        action_space = akro.Box(low=-0.1,
+                                high=0.1,
+                                shape=(2, ),
+                                dtype=np.float32)
+        self._spec = EnvSpec(action_space=action_space,
+                             observation_space=observation_space,
+                             max_episode_length=max_episode_length)
+        self._success_dist = np.linalg.norm(action_space.low)
+
+    @property
+    def n_envs(self):
+        """int: Number of environment copies."""
+        return self._n_envs
+
+    @property
+    def spec(self):
+        """EnvSpec: Specification of a single environment copy."""
+        return self._spec
+
+    def reset(self):
+        """Reset all environment copies.
+
+        Returns:
+            numpy.ndarray: The first observation of every copy, stacked along
+                the first axis.
+            list[dict]: The episode-level information of every copy.
+
+        """
+        self._points.fill(0.)
+        self._step_cnts.fill(0)
+        self._needs_reset.fill(False)
+        observations, _ = self._observations()
+        return observations, [dict(goal=task['goal']) for task in self._tasks]
+
+    def reset_env(self, index):
+        """Reset a single environment copy.
+
+        Args:
+            index (int): Index of the copy.
+
+        Returns:
+            numpy.ndarray: The first observation of the copy.
+            dict: The episode-level information of the copy.
+
+        """
+        self._points[index] = 0.
+        self._step_cnts[index] = 0
+        self._needs_reset[index] = False
+        dist = np.linalg.norm(self._goals[index])
+        first_obs = np.concatenate([self._points[index], (dist, )])
+        return first_obs, dict(goal=self._tasks[index]['goal'])
+
+    def step(self, actions):
+        """Step all environment copies.
+
+        Args:
+            actions (np.ndarray): Action of every copy, stacked along the first
+                axis.
+
+        Returns:
+            list[EnvStep]: The environment step of every copy.
+
+        Raises:
+            RuntimeError: if a copy is stepped after its episode ended, or
+                before `reset()` is called.
+
+        """
+        if self._needs_reset.any():
+            raise RuntimeError('reset() or reset_env() must be called before '
+                               'step()!')
+        actions = np.asarray(actions)
+        # enforce action space, without modifying the actions
+        self._points += np.clip(actions, self._spec.action_space.low,
+                                self._spec.action_space.high)
+        np.clip(self._points,
+                -self._arena_size,
+                self._arena_size,
+                out=self._points)
+        observations, dists = self._observations()
+        successes = dists < self._success_dist
+
+        # dense reward, with a done bonus
+        rewards = -dists.astype(np.float64)
+        rewards[successes] += self._done_bonus
+        dones = successes & (not self._never_done)
+
+        self._step_cnts += 1
+        step_types = StepType.get_step_types(self._step_cnts,
+                                             self._max_episode_length, dones)
+        self._needs_reset |= dones
+        self._needs_reset |= self._step_cnts >= self._max_episode_length
+
+        return [
+            EnvStep(env_spec=self._spec,
+                    action=action,
+                    reward=reward,
+                    observation=obs,
+                    env_info={
+                        'task': task,
+                        'success': success
+                    },
+                    step_type=step_type)
+            for action, reward, obs, task, success, step_type in zip(
+                actions, rewards.tolist(), observations, self._tasks,
+                successes.tolist(), step_types)
+        ]
+
+    def _observations(self):
+        """Compute the observation of every copy.
+
+        Returns:
+            numpy.ndarray: Observations of all copies, stacked along the first
+                axis.
+            numpy.ndarray: Distance of each copy's point to its goal.
+
+        """
+        observations = np.empty((self._n_envs, 3), dtype=np.float32)
+        observations[:, :2] = self._points
+        dists = np.linalg.norm(self._points - self._goals, axis=1)
+        observations[:, 2] = dists
+        return observations, dists
+
+    # pylint: disable=no-self-use
+    def sample_tasks(self, num_tasks):
+        """Sample a list of `num_tasks` tasks.
+
+        Args:
+            num_tasks (int): Number of tasks to sample.
+
+        Returns:
+            list[dict[str, np.ndarray]]: A list of "tasks", where each task is
+                a dictionary containing a single key, "goal", mapping to a
+                point in 2D space.
+
+        """
+        goals = np.random.uniform(-2, 2, size=(num_tasks, 2))
+        tasks = [{'goal': goal} for goal in goals]
+        return tasks
+
+    def set_task(self, task, index=None):
+        """Set the task of one or all environment copies.
+
+        Args:
+            task (dict[str, np.ndarray]): A task (a dictionary containing a
+                single key, "goal", which should be a point in 2D space).
+            index (int or None): Index of the copy to set the task of, or None
+                to set the task of all copies.
+
+        """
+        if index is None:
+            self._tasks = [task] * self._n_envs
+            self._goals[:] = task['goal']
+        else:
+            self._tasks[index] = task
+            self._goals[index] = task['goal']
@@ -35,7 +35,11 @@ class BulletEnv(GymEnv):
         """
         return super(BulletEnv, cls).__new__(cls)
 
-    def __init__(self, env, is_image=False, max_episode_length=None):
+    def __init__(self,
+                 env,
+                 is_image=False,
+                 max_episode_length=None,
+                 validation_steps=None):
         """Returns a wrapper class for bullet-based gym.Env.
 
         Args:
@@ -46,6 +50,9 @@ class BulletEnv(GymEnv):
                 false otherwise. Setting this to true converts a gym.Spaces.Box
                 obs space to an akro.Image and normalizes pixel values.
             max_episode_length (int): The maximum steps allowed for an episode.
+            validation_steps (int or None): Number of steps whose
+                observations and env_info keys are checked. See
+                :class:`~GymEnv`.
 
         """
         env_name = None
@@ -63,7 +70,8 @@ class BulletEnv(GymEnv):
 
         super().__init__(env,
                          is_image=is_image,
-                         max_episode_length=max_episode_length)
+                         max_episode_length=max_episode_length,
+                         validation_steps=validation_steps)
 
     def close(self):
         """Close the wrapped env."""
@@ -122,6 +130,7 @@ class BulletEnv(GymEnv):
         # env id is saved to help gym.make() in __setstate__
         args['id'] = env.spec.id
         args['max_episode_length'] = self._max_episode_length
+        args['validation_steps'] = self._validation_steps
 
         if 'kwargs' in args:
             del args['kwargs']
@@ -139,9 +148,12 @@ class BulletEnv(GymEnv):
         """
         env_id = state['id']
         max_episode_length = state['max_episode_length']
+        validation_steps = state.pop('validation_steps', None)
         # Create a environment via constructor arguments
         del state['id']
         del state['max_episode_length']
         env = gym.make(env_id, **state)
 
-        self.__init__(env, max_episode_length=max_episode_length)
+        self.__init__(env,
+                      max_episode_length=max_episode_length,
+                      validation_steps=validation_steps)
@@ -1,7 +1,8 @@
 """DM control environment."""
+import collections
+
 import akro
 from dm_control import suite
-from dm_control.rl.control import flatten_observation
 from dm_env import StepType as dm_StepType
 import numpy as np
 
@@ -9,31 +10,54 @@ from garage import Environment, EnvSpec, EnvStep, StepType
 from garage.envs.dm_control.dm_control_viewer import DmControlViewer
 
 
-def _flat_shape(observation):
-    """Returns the flattened shape of observation.
+def _observation_layout(observation_spec):
+    """Compute where each observation goes in a flat observation.
+
+    Observations are laid out in the same order as by
+    `dm_control.rl.control.flatten_observation`.
 
     Args:
-        observation (np.ndarray): the observation
+        observation_spec (dict[str, dm_env.specs.Array]): Specification of
+            each observation.
 
     Returns:
-        np.ndarray: the flattened dimension of observation.
+        list[tuple[str, slice]]: Key of each observation and its slice of the
+            flat observation.
+        int: Size of the flat observation.
+        numpy.dtype: Type of the flat observation.
+
     """
-    return np.sum(int(np.prod(v.shape)) for k, v in observation.items())
+    if isinstance(observation_spec, collections.OrderedDict):
+        keys = list(observation_spec.keys())
+    else:
+        keys = sorted(observation_spec.keys())
+    layout = []
+    start = 0
+    for key in keys:
+        size = int(np.prod(observation_spec[key].shape))
+        layout.append((key, slice(start, start + size)))
+        start += size
+    dtype = np.result_type(*[observation_spec[key].dtype for key in keys])
+    return layout, start, dtype
 
 
 class DMControlEnv(Environment):
     """Binding for `dm_control <https://arxiv.org/pdf/1801.00690.pdf>`."""
 
-    def __init__(self, env, name=None):
+    def __init__(self, env, name=None, observation_env_info=False):
         """Create a DMControlEnv.
 
         Args:
             env (dm_control.suite.Task): The wrapped dm_control environment.
             name (str): Name of the environment.
+            observation_env_info (bool): If True, each of the dm_control
+                observations is also returned in `env_info`, under its own
+                key. This stores every observation twice while sampling.
 
         """
         self._env = env
         self._name = name or type(env.task).__name__
+        self._observation_env_info = observation_env_info
         self._viewer = None
         self._step_cnt = None
         self._max_episode_length = 1e12
@@ -51,7 +75,8 @@ class DMControlEnv(Environment):
                                           dtype=np.float32)
 
         # observation_space
-        flat_dim = _flat_shape(self._env.observation_spec())
+        self._obs_layout, flat_dim, self._obs_dtype = _observation_layout(
+            self._env.observation_spec())
         self._observation_space = akro.Box(low=-np.inf,
                                            high=np.inf,
                                            shape=[flat_dim],
@@ -83,18 +108,40 @@ class DMControlEnv(Environment):
         return ['rgb_array']
 
     @classmethod
-    def from_suite(cls, domain_name, task_name):
+    def from_suite(cls, domain_name, task_name, observation_env_info=False):
         """Create a DmControl task given the domain name and task name.
 
         Args:
             domain_name (str): Domain name
             task_name (str): Task name
+            observation_env_info (bool): If True, each of the dm_control
+                observations is also returned in `env_info`.
 
         Return:
             dm_control.suite.Task: the dm_control task environment
         """
         return cls(env=suite.load(domain_name, task_name),
-                   name='{}.{}'.format(domain_name, task_name))
+                   name='{}.{}'.format(domain_name, task_name),
+                   observation_env_info=observation_env_info)
+
+    def _flatten_observation(self, observation):
+        """Flatten a dm_control observation.
+
+        Each observation is copied directly into its slice of a single new
+        array, without building intermediate arrays.
+
+        Args:
+            observation (dict[str, np.ndarray]): The dm_control observation.
+
+        Returns:
+            np.ndarray: The flat observation.
+
+        """
+        flat_obs = np.empty(self._observation_space.flat_dim,
+                            dtype=self._obs_dtype)
+        for key, index in self._obs_layout:
+            flat_obs[index] = np.ravel(observation[key])
+        return flat_obs
 
     def reset(self):
         """Resets the environment.
@@ -110,7 +157,7 @@ class DMControlEnv(Environment):
 
         """
         time_step = self._env.reset()
-        first_obs = flatten_observation(time_step.observation)['observations']
+        first_obs = self._flatten_observation(time_step.observation)
 
         self._step_cnt = 0
         return first_obs, {}
@@ -135,8 +182,7 @@ class DMControlEnv(Environment):
         if self._viewer:
             self._viewer.render()
 
-        observation = flatten_observation(
-            dm_time_step.observation)['observations']
+        observation = self._flatten_observation(dm_time_step.observation)
 
         self._step_cnt += 1
 
@@ -153,11 +199,16 @@ class DMControlEnv(Environment):
         if step_type in (StepType.TERMINAL, StepType.TIMEOUT):
             self._step_cnt = None
 
+        if self._observation_env_info:
+            env_info = dict(dm_time_step.observation)
+        else:
+            env_info = {}
+
         return EnvStep(env_spec=self.spec,
                        action=action,
                        reward=dm_time_step.reward,
                        observation=observation,
-                       env_info=dm_time_step.observation,
+                       env_info=env_info,
                        step_type=step_type)
 
     def render(self, mode):
@@ -31,6 +31,27 @@ MAPS = {
 }   # yapf: disable
 
 
+def parse_desc(desc):
+    """Parse a grid configuration into an array of cell types.
+
+    Args:
+        desc (str or list[str]): grid configuration key, or the rows of a
+            grid configuration.
+
+    Returns:
+        numpy.ndarray: The type of each cell, using 'S', 'F', 'W', 'H' and
+            'G' only.
+
+    """
+    if isinstance(desc, str):
+        desc = MAPS[desc]
+    desc = np.array(list(map(list, desc)))
+    desc[desc == '.'] = 'F'
+    desc[desc == 'o'] = 'H'
+    desc[desc == 'x'] = 'W'
+    return desc
+
+
 class GridWorldEnv(Environment):
     """A simply 2D grid environment.
 
@@ -48,12 +69,7 @@ class GridWorldEnv(Environment):
             desc (str): grid configuration key.
             max_episode_length (int): The maximum steps allowed for an episode.
         """
-        if isinstance(desc, str):
-            desc = MAPS[desc]
-        desc = np.array(list(map(list, desc)))
-        desc[desc == '.'] = 'F'
-        desc[desc == 'o'] = 'H'
-        desc[desc == 'x'] = 'W'
+        desc = parse_desc(desc)
         self._desc = desc
         self._n_row, self._n_col = desc.shape
         (start_x, ), (start_y, ) = np.nonzero(desc == 'S')
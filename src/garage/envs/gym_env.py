@@ -112,7 +112,11 @@ class GymEnv(Environment):
 
         return super(GymEnv, cls).__new__(cls)
 
-    def __init__(self, env, is_image=False, max_episode_length=None):
+    def __init__(self,
+                 env,
+                 is_image=False,
+                 max_episode_length=None,
+                 validation_steps=None):
         """Initializes a GymEnv.
 
         Note that if `env` and `env_name` are passed in at the same time,
@@ -125,12 +129,23 @@ class GymEnv(Environment):
                 false otherwise. Setting this to true converts a gym.Spaces.Box
                 obs space to an akro.Image and normalizes pixel values.
             max_episode_length (int): The maximum steps allowed for an episode.
+            validation_steps (int or None): Number of steps, counted from
+                construction, whose observations and env_info keys are
+                checked against the observation space and the first
+                env_info. Checking is a large part of the cost of a step of
+                cheap environments, so once an environment is known to be
+                well-behaved, a small value speeds up sampling. If None,
+                every step is checked.
 
         Raises:
-            ValueError: if `env` neither a gym.Env object nor a string.
+            ValueError: if `env` neither a gym.Env object nor a string, or
+                if `validation_steps` is negative.
             RuntimeError: if the environment is wrapped by a TimeLimit and its
                 max_episode_steps is not equal to its spec's time limit value.
         """
+        if validation_steps is not None and validation_steps < 0:
+            raise ValueError('validation_steps must be non-negative, but got '
+                             '{}.'.format(validation_steps))
         self._env = None
         if isinstance(env, str):
             self._env = gym.make(env)
@@ -158,6 +173,9 @@ class GymEnv(Environment):
         # stores env_info keys & value types to ensure subsequent env_infos
         # are consistent
         self._env_info = None
+        self._validation_steps = validation_steps
+        # Number of steps left to check, or None to check every step.
+        self._steps_to_validate = validation_steps
 
     @property
     def action_space(self):
@@ -225,10 +243,15 @@ class GymEnv(Environment):
         reward = float(reward) if not isinstance(reward, float) else reward
         self._step_cnt += 1
 
-        step_type = StepType.get_step_type(
-            step_cnt=self._step_cnt,
-            max_episode_length=self._max_episode_length,
-            done=done)
+        if (self._max_episode_length is not None
+                and self._step_cnt >= self._max_episode_length):
+            step_type = StepType.TIMEOUT
+        elif done:
+            step_type = StepType.TERMINAL
+        elif self._step_cnt == 1:
+            step_type = StepType.FIRST
+        else:
+            step_type = StepType.MID
 
         # gym envs that are wrapped in TimeLimit wrapper modify
         # the done/termination signal to be true whenever a time
@@ -249,26 +272,44 @@ class GymEnv(Environment):
         if step_type in (StepType.TERMINAL, StepType.TIMEOUT):
             self._step_cnt = None
 
-        # check that env_infos are consistent
+        if self._steps_to_validate is None:
+            self._validate(observation, info)
+        elif self._steps_to_validate > 0:
+            self._steps_to_validate -= 1
+            self._validate(observation, info)
+
+        return EnvStep(env_spec=self._spec,
+                       action=action,
+                       reward=reward,
+                       observation=observation,
+                       env_info=info,
+                       step_type=step_type)
+
+    def _validate(self, observation, info):
+        """Check that a step's observation and env_info are consistent.
+
+        Args:
+            observation (np.ndarray): Observation of the step.
+            info (dict): env_info of the step.
+
+        Raises:
+            RuntimeError: if underlying environment outputs inconsistent
+                env_info keys, or an observation which does not conform to
+                the observation space.
+
+        """
         if not self._env_info:
             self._env_info = {k: type(info[k]) for k in info}
         elif self._env_info.keys() != info.keys():
             raise RuntimeError('GymEnv outputs inconsistent env_info keys.')
-        if not self.spec.observation_space.contains(observation):
+        if not self._spec.observation_space.contains(observation):
             # Discrete actions can be either in the space normally, or one-hot
             # encoded.
-            if self.spec.observation_space.flat_dim != np.prod(
+            if self._spec.observation_space.flat_dim != np.prod(
                     observation.shape):
                 raise RuntimeError('GymEnv observation shape does not '
                                    'conform to its observation_space')
 
-        return EnvStep(env_spec=self.spec,
-                       action=action,
-                       reward=reward,
-                       observation=observation,
-                       env_info=info,
-                       step_type=step_type)
-
     def render(self, mode):
         """Renders the environment.
 
@@ -365,7 +406,8 @@ class GymEnv(Environment):
 
         """
         self.__init__(state['_env'],
-                      max_episode_length=state['_max_episode_length'])
+                      max_episode_length=state['_max_episode_length'],
+                      validation_steps=state.get('_validation_steps'))
 
     def __getattr__(self, name):
         """Handle function calls wrapped environment.
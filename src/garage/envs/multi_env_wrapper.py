@@ -88,6 +88,9 @@ class MultiEnvWrapper(Wrapper):
                    'corresponding to each env in envs')
             assert len(set(env_names)) == len(envs), msg
         self._env_names = env_names
+        self._one_hots = np.eye(self._num_tasks)
+        # Spec of each active task, computed on first use.
+        self._specs = {}
         self._task_envs = []
         for env in envs:
             if (env.observation_space.shape !=
@@ -127,9 +130,14 @@ class MultiEnvWrapper(Wrapper):
                 wrapped environments.
 
         """
-        return EnvSpec(action_space=self.action_space,
-                       observation_space=self.observation_space,
-                       max_episode_length=self._env.spec.max_episode_length)
+        spec = self._specs.get(self._active_task_index)
+        if spec is None:
+            spec = EnvSpec(
+                action_space=self.action_space,
+                observation_space=self.observation_space,
+                max_episode_length=self._env.spec.max_episode_length)
+            self._specs[self._active_task_index] = spec
+        return spec
 
     @property
     def num_tasks(self):
@@ -237,7 +245,4 @@ class MultiEnvWrapper(Wrapper):
             numpy.ndarray: one-hot representation of active task
 
         """
-        one_hot = np.zeros(self.task_space.shape)
-        index = self.active_task_index or 0
-        one_hot[index] = self.task_space.high[index]
-        return one_hot
+        return self._one_hots[self.active_task_index or 0]
@@ -1,8 +1,11 @@
 """An environment wrapper that normalizes action, observation and reward."""
+import copy
+
 import akro
 import numpy as np
 
 from garage import EnvStep, Wrapper
+from garage.np.running_stats import RunningStats
 
 
 class NormalizedEnv(Wrapper):
@@ -10,6 +13,15 @@ class NormalizedEnv(Wrapper):
 
     This wrapper normalizes action, and optionally observation and reward.
 
+    Observations and rewards are normalized with running estimates of their
+    mean and variance. By default, these are exponential moving averages,
+    which each environment estimates on its own. If obs_alpha or reward_alpha
+    is None, cumulative statistics are used instead. Cumulative statistics
+    can be shared by sampler workers: statistics gathered since the last call
+    to :meth:`pop_normalization_stats` are reported through the workers'
+    `collect_stats`, and the merged statistics of all workers are sent back
+    with :meth:`sync_normalization_stats`.
+
     Args:
         env (Environment): An environment instance.
         scale_reward (float): Scale of environment reward.
@@ -19,13 +31,18 @@ class NormalizedEnv(Wrapper):
         expected_action_scale (float): Assuming action falls in the range of
             [-expected_action_scale, expected_action_scale] when normalize it.
         flatten_obs (bool): Flatten observation if True.
-        obs_alpha (float): Update rate of moving average when estimating the
-            mean and variance of observations.
-        reward_alpha (float): Update rate of moving average when estimating the
-            mean and variance of rewards.
+        obs_alpha (float or None): Update rate of moving average when
+            estimating the mean and variance of observations. If None, use
+            cumulative statistics, which can be merged across workers.
+        reward_alpha (float or None): Update rate of moving average when
+            estimating the mean and variance of rewards. If None, use
+            cumulative statistics, which can be merged across workers.
 
     """
 
+    OBS_STATS = 'NormalizedEnv/ObsStats'
+    REWARD_STATS = 'NormalizedEnv/RewardStats'
+
     def __init__(
         self,
         env,
@@ -45,14 +62,14 @@ class NormalizedEnv(Wrapper):
         self._expected_action_scale = expected_action_scale
         self._flatten_obs = flatten_obs
 
-        self._obs_alpha = obs_alpha
         flat_obs_dim = self._env.observation_space.flat_dim
-        self._obs_mean = np.zeros(flat_obs_dim)
-        self._obs_var = np.ones(flat_obs_dim)
-
-        self._reward_alpha = reward_alpha
-        self._reward_mean = 0.
-        self._reward_var = 1.
+        self._obs_stats = RunningStats(flat_obs_dim, alpha=obs_alpha)
+        self._reward_stats = RunningStats(alpha=reward_alpha)
+        # Cumulative statistics gathered since they were last popped, to be
+        # merged with those of other workers.
+        self._obs_delta = (RunningStats(flat_obs_dim)
+                           if obs_alpha is None else None)
+        self._reward_delta = RunningStats() if reward_alpha is None else None
 
     def reset(self):
         """Call reset on wrapped env.
@@ -115,21 +132,40 @@ class NormalizedEnv(Wrapper):
                        env_info=es.env_info,
                        step_type=es.step_type)
 
-    def _update_obs_estimate(self, obs):
-        flat_obs = self._env.observation_space.flatten(obs)
-        self._obs_mean = (
-            1 - self._obs_alpha) * self._obs_mean + self._obs_alpha * flat_obs
-        self._obs_var = (
-            1 - self._obs_alpha) * self._obs_var + self._obs_alpha * np.square(
-                flat_obs - self._obs_mean)
-
-    def _update_reward_estimate(self, reward):
-        self._reward_mean = (1 - self._reward_alpha) * \
-            self._reward_mean + self._reward_alpha * reward
-        self._reward_var = (
-            1 - self._reward_alpha
-        ) * self._reward_var + self._reward_alpha * np.square(
-            reward - self._reward_mean)
+    def pop_normalization_stats(self):
+        """Take the cumulative statistics gathered since the last call.
+
+        Only observations and rewards which are normalized with cumulative
+        statistics are reported.
+
+        Returns:
+            dict[str, RunningStats]: Statistics of observations and rewards
+                seen since the last call, by name.
+
+        """
+        stats = {}
+        if self._normalize_obs and self._obs_delta is not None:
+            stats[self.OBS_STATS] = copy.deepcopy(self._obs_delta)
+            self._obs_delta.reset()
+        if self._normalize_reward and self._reward_delta is not None:
+            stats[self.REWARD_STATS] = copy.deepcopy(self._reward_delta)
+            self._reward_delta.reset()
+        return stats
+
+    def sync_normalization_stats(self, stats):
+        """Replace the statistics used for normalization.
+
+        Args:
+            stats (dict[str, RunningStats]): Merged statistics of all
+                workers, by the names used in
+                :meth:`pop_normalization_stats`. Statistics which are missing
+                are left unchanged.
+
+        """
+        if self.OBS_STATS in stats:
+            self._obs_stats = copy.deepcopy(stats[self.OBS_STATS])
+        if self.REWARD_STATS in stats:
+            self._reward_stats = copy.deepcopy(stats[self.REWARD_STATS])
 
     def _apply_normalize_obs(self, obs):
         """Compute normalized observation.
@@ -141,13 +177,14 @@ class NormalizedEnv(Wrapper):
             np.ndarray: Normalized observation.
 
         """
-        self._update_obs_estimate(obs)
         flat_obs = self._env.observation_space.flatten(obs)
-        normalized_obs = (flat_obs -
-                          self._obs_mean) / (np.sqrt(self._obs_var) + 1e-8)
+        self._obs_stats.update(flat_obs)
+        if self._obs_delta is not None:
+            self._obs_delta.update(flat_obs)
+        normalized_obs = self._obs_stats.normalize(flat_obs)
         if not self._flatten_obs:
             normalized_obs = self._env.observation_space.unflatten(
-                self._env.observation_space, normalized_obs)
+                normalized_obs)
         return normalized_obs
 
     def _apply_normalize_reward(self, reward):
@@ -160,8 +197,10 @@ class NormalizedEnv(Wrapper):
             float: Normalized reward.
 
         """
-        self._update_reward_estimate(reward)
-        return reward / (np.sqrt(self._reward_var) + 1e-8)
+        self._reward_stats.update(reward)
+        if self._reward_delta is not None:
+            self._reward_delta.update(reward)
+        return reward / (np.sqrt(self._reward_stats.var) + 1e-8)
 
 
 normalize = NormalizedEnv
@@ -0,0 +1,224 @@
+"""A vectorized wrapper env that steps every task of a multi-task env.
+
+Useful while training multi-task reinforcement learning algorithms, such as
+MTSAC, which benefit from a balanced number of samples from every task.
+"""
+import akro
+import numpy as np
+
+from garage import EnvSpec, EnvStep
+from garage.envs.batch_environment import BatchEnvironment
+
+
+class VecMultiEnvWrapper(BatchEnvironment):
+    """A wrapper which steps the environments of all tasks at once.
+
+    Unlike :class:`~MultiEnvWrapper`, which steps one sampled task at a time,
+    this wrapper holds one environment per task and steps all of them on
+    every call to :meth:`step`, so every step yields exactly one transition
+    from each task. Observations of all tasks are written into a single array,
+    and one-hot task ids are copied from rows of a precomputed identity
+    matrix.
+
+    :class:`~VecWorker` accepts it as an environment update when it has
+    exactly one environment copy per task.
+
+    This wrapper adds an integer 'task_id' to env_info every timestep.
+
+    Args:
+        envs (list(Environment)): The environment of each task.
+        mode (str): A string from 'vanilla`, 'add-onehot' and 'del-onehot'.
+            The type of observation to use. See :class:`~MultiEnvWrapper`.
+        env_names (list(str)): The names of the environments corresponding to
+            envs. An env_name in env_names must be unique.
+
+    Raises:
+        ValueError: If the environments have different observation or action
+            spaces, or mode or env_names are invalid.
+
+    """
+
+    def __init__(self, envs, mode='add-onehot', env_names=None):
+        if mode not in ['vanilla', 'add-onehot', 'del-onehot']:
+            raise ValueError('mode must be one of vanilla, add-onehot or '
+                             'del-onehot, but got {}.'.format(mode))
+        if env_names is not None and (len(set(env_names)) != len(envs)):
+            raise ValueError('env_names must hold a unique name for each env '
+                             'in envs.')
+        for env in envs:
+            if (env.observation_space.shape !=
+                    envs[0].observation_space.shape):
+                raise ValueError(
+                    'Observation space of all envs should be same.')
+            if env.action_space.shape != envs[0].action_space.shape:
+                raise ValueError('Action space of all envs should be same.')
+        self._envs = list(envs)
+        self._mode = mode
+        self._env_names = env_names
+        num_tasks = len(envs)
+        self._one_hots = np.eye(num_tasks)
+        self._task_ids = np.arange(num_tasks)
+        self._spec = EnvSpec(
+            action_space=envs[0].action_space,
+            observation_space=self._task_observation_space(),
+            max_episode_length=envs[0].spec.max_episode_length)
+
+    @property
+    def envs(self):
+        """list[Environment]: The environment of each task."""
+        return self._envs
+
+    @property
+    def num_tasks(self):
+        """int: Total number of tasks."""
+        return len(self._envs)
+
+    @property
+    def n_envs(self):
+        """int: Number of environment copies, one per task."""
+        return len(self._envs)
+
+    @property
+    def task_ids(self):
+        """numpy.ndarray: Id of every task, in the order they are stepped."""
+        return self._task_ids
+
+    @property
+    def task_space(self):
+        """akro.Box: Space of one-hot task ids."""
+        return akro.Box(np.zeros(self.num_tasks), np.ones(self.num_tasks))
+
+    @property
+    def spec(self):
+        """EnvSpec: Specification of the observations of a single task."""
+        return self._spec
+
+    def _task_observation_space(self):
+        """Compute the observation space of a single task.
+
+        Returns:
+            akro.Box: Observation space.
+
+        """
+        env_space = self._envs[0].observation_space
+        if self._mode == 'vanilla':
+            return env_space
+        env_lb, env_ub = env_space.bounds
+        if self._mode == 'add-onehot':
+            task_lb, task_ub = self.task_space.bounds
+            return akro.Box(np.concatenate([env_lb, task_lb]),
+                            np.concatenate([env_ub, task_ub]))
+        # self._mode == 'del-onehot'
+        return akro.Box(env_lb[:-self.num_tasks], env_ub[:-self.num_tasks])
+
+    def _observations(self, env_observations):
+        """Convert the observations of every task environment.
+
+        Args:
+            env_observations (list[numpy.ndarray]): Observation of each task
+                environment.
+
+        Returns:
+            numpy.ndarray: Observations of all tasks, stacked along the first
+                axis.
+
+        """
+        num_tasks = self.num_tasks
+        if self._mode == 'vanilla':
+            return np.asarray(env_observations)
+        observations = np.empty((num_tasks, ) +
+                                self._spec.observation_space.shape)
+        if self._mode == 'add-onehot':
+            for obs, env_obs in zip(observations, env_observations):
+                obs[:-num_tasks] = env_obs
+            observations[:, -num_tasks:] = self._one_hots
+        else:  # self._mode == 'del-onehot'
+            for obs, env_obs in zip(observations, env_observations):
+                obs[:] = env_obs[:-num_tasks]
+        return observations
+
+    def _observation(self, task_id, env_observation):
+        """Convert the observation of one task environment.
+
+        Args:
+            task_id (int): Id of the task.
+            env_observation (numpy.ndarray): Observation of the task
+                environment.
+
+        Returns:
+            numpy.ndarray: Observation of the task.
+
+        """
+        if self._mode == 'add-onehot':
+            return np.concatenate(
+                [env_observation, self._one_hots[task_id]])
+        if self._mode == 'del-onehot':
+            return env_observation[:-self.num_tasks]
+        return env_observation
+
+    def reset(self):
+        """Reset the environments of all tasks.
+
+        Returns:
+            numpy.ndarray: The first observation of every task, stacked along
+                the first axis.
+            list[dict]: The episode-level information of every task.
+
+        """
+        observations, episode_infos = [], []
+        for env in self._envs:
+            obs, episode_info = env.reset()
+            observations.append(obs)
+            episode_infos.append(episode_info)
+        return self._observations(observations), episode_infos
+
+    def reset_env(self, index):
+        """Reset the environment of a single task.
+
+        Args:
+            index (int): Id of the task.
+
+        Returns:
+            numpy.ndarray: The first observation of the task.
+            dict: The episode-level information of the task.
+
+        """
+        obs, episode_info = self._envs[index].reset()
+        return self._observation(index, obs), episode_info
+
+    def step(self, actions):
+        """Step the environments of all tasks.
+
+        Args:
+            actions (numpy.ndarray): Action of every task, stacked along the
+                first axis.
+
+        Returns:
+            list[EnvStep]: The environment step of every task.
+
+        """
+        env_steps = [
+            env.step(action) for env, action in zip(self._envs, actions)
+        ]
+        observations = self._observations(
+            [es.observation for es in env_steps])
+        steps = []
+        for task_id, (es, obs) in enumerate(zip(env_steps, observations)):
+            env_info = es.env_info
+            if 'task_id' not in env_info:
+                env_info['task_id'] = self._task_ids[task_id]
+            if self._env_names is not None:
+                env_info['task_name'] = self._env_names[task_id]
+            steps.append(
+                EnvStep(env_spec=self._spec,
+                        action=es.action,
+                        reward=es.reward,
+                        observation=obs,
+                        env_info=env_info,
+                        step_type=es.step_type))
+        return steps
+
+    def close(self):
+        """Close the environments of all tasks."""
+        for env in self._envs:
+            env.close()
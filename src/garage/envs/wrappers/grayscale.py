@@ -1,10 +1,10 @@
 """Grayscale wrapper for gym.Env."""
-import warnings
-
 import gym
 import gym.spaces
 import numpy as np
-from skimage import color, img_as_ubyte
+
+# Luminance weights of red, green and blue, as used by scikit-image.
+_RGB_WEIGHTS = np.array([0.2125, 0.7154, 0.0721], dtype=np.float32)
 
 
 class Grayscale(gym.Wrapper):
@@ -13,6 +13,9 @@ class Grayscale(gym.Wrapper):
     Only works with gym.spaces.Box environment with 2D RGB frames.
     The last dimension (RGB) of environment observation space will be removed.
 
+    The conversion uses buffers allocated once, so each step only allocates
+    the returned frame.
+
     Example:
         env = gym.make('Env')
         # env.observation_space = (100, 100, 3)
@@ -48,6 +51,12 @@ class Grayscale(gym.Wrapper):
             _high,
             shape=env.observation_space.shape[:-1],
             dtype=np.uint8)
+        self._frame_shape = env.observation_space.shape[:-1]
+        n_pixels = int(np.prod(self._frame_shape))
+        # Pixels are flattened, so the conversion is a single
+        # matrix-vector product.
+        self._rgb = np.empty((n_pixels, 3), dtype=np.float32)
+        self._gray = np.empty(n_pixels, dtype=np.float32)
 
     @property
     def observation_space(self):
@@ -68,7 +77,7 @@ class Grayscale(gym.Wrapper):
             np.ndarray: Observation conforming to observation_space
         """
         del kwargs
-        return _color_to_grayscale(self.env.reset())
+        return self._color_to_grayscale(self.env.reset())
 
     def step(self, action):
         """See gym.Env.
@@ -84,21 +93,22 @@ class Grayscale(gym.Wrapper):
 
         """
         obs, reward, done, info = self.env.step(action)
-        return _color_to_grayscale(obs), reward, done, info
+        return self._color_to_grayscale(obs), reward, done, info
 
+    def _color_to_grayscale(self, obs):
+        """Convert a 3-channel color observation image to grayscale and uint8.
 
-def _color_to_grayscale(obs):
-    """Convert a 3-channel color observation image to grayscale and uint8.
-
-    Args:
-       obs (np.ndarray): Observation array, conforming to observation_space
+        Args:
+           obs (np.ndarray): Observation array, conforming to
+               observation_space
 
-    Returns:
-       np.ndarray: 1-channel grayscale version of obs, represented as uint8
+        Returns:
+           np.ndarray: 1-channel grayscale version of obs, represented as
+               uint8
 
-    """
-    with warnings.catch_warnings():
-        # Suppressing warning for possible precision loss when converting
-        # from float64 to uint8
-        warnings.simplefilter('ignore')
-        return img_as_ubyte(color.rgb2gray((obs)))
+        """
+        np.copyto(self._rgb.reshape(self._frame_shape + (3, )),
+                  obs[..., :3])
+        np.dot(self._rgb, _RGB_WEIGHTS, out=self._gray)
+        np.rint(self._gray, out=self._gray)
+        return self._gray.astype(np.uint8).reshape(self._frame_shape)
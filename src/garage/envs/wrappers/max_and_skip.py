@@ -51,7 +51,7 @@ class MaxAndSkip(gym.Wrapper):
             total_reward += reward
             if done:
                 break
-        max_frame = self._obs_buffer.max(axis=0)
+        max_frame = np.maximum(self._obs_buffer[0], self._obs_buffer[1])
         return max_frame, total_reward, done, info
 
     # pylint: disable=arguments-differ
@@ -13,6 +13,12 @@ class Resize(gym.Wrapper):
 
     Only works with gym.spaces.Box environment with 2D single channel frames.
 
+    Two interpolation methods are supported. 'bilinear' resizes with
+    scikit-image. 'area' averages the source pixels covered by each resized
+    pixel, which for integer scale factors is a plain block mean. It is
+    computed as two matrix products into buffers allocated once, so each step
+    only allocates the returned frame.
+
     Example:
         | env = gym.make('Env')
         | # env.observation_space = (100, 100)
@@ -23,20 +29,25 @@ class Resize(gym.Wrapper):
         env: gym.Env to wrap.
         width: resized frame width.
         height: resized frame height.
+        interpolation (str): Either 'bilinear' or 'area'.
 
     Raises:
-        ValueError: If observation space shape is not 2
-            or environment is not gym.spaces.Box.
+        ValueError: If observation space shape is not 2, if environment is
+            not gym.spaces.Box, or if interpolation is not supported.
 
     """
 
-    def __init__(self, env, width, height):
+    def __init__(self, env, width, height, interpolation='bilinear'):
         if not isinstance(env.observation_space, gym.spaces.Box):
             raise ValueError('Resize only works with Box environment.')
 
         if len(env.observation_space.shape) != 2:
             raise ValueError('Resize only works with 2D single channel image.')
 
+        if interpolation not in ('bilinear', 'area'):
+            raise ValueError("interpolation must be 'bilinear' or 'area', "
+                             'but got {!r}.'.format(interpolation))
+
         super().__init__(env)
 
         _low = env.observation_space.low.flatten()[0]
@@ -49,6 +60,14 @@ class Resize(gym.Wrapper):
 
         self._width = width
         self._height = height
+        self._interpolation = interpolation
+        if interpolation == 'area':
+            rows, cols = env.observation_space.shape
+            self._row_weights = _area_weights(rows, width)
+            self._col_weights = _area_weights(cols, height).T.copy()
+            self._frame = np.empty((rows, cols))
+            self._partial = np.empty((width, cols))
+            self._resized = np.empty((width, height))
 
     @property
     def observation_space(self):
@@ -60,6 +79,8 @@ class Resize(gym.Wrapper):
         self._observation_space = observation_space
 
     def _observation(self, obs):
+        if self._interpolation == 'area':
+            return self._area_resize(obs)
         with warnings.catch_warnings():
             """
             Suppressing warnings for
@@ -72,6 +93,23 @@ class Resize(gym.Wrapper):
                 obs = img_as_ubyte(obs)
         return obs
 
+    def _area_resize(self, obs):
+        """Resize a frame by area averaging.
+
+        Args:
+            obs (np.ndarray): Frame to resize.
+
+        Returns:
+            np.ndarray: Resized frame.
+
+        """
+        np.copyto(self._frame, obs)
+        np.matmul(self._row_weights, self._frame, out=self._partial)
+        np.matmul(self._partial, self._col_weights, out=self._resized)
+        if self._dtype == np.uint8:
+            np.rint(self._resized, out=self._resized)
+        return self._resized.astype(self._dtype)
+
     def reset(self):
         """gym.Env reset function."""
         return self._observation(self.env.reset())
@@ -80,3 +118,24 @@ class Resize(gym.Wrapper):
         """gym.Env step function."""
         obs, reward, done, info = self.env.step(action)
         return self._observation(obs), reward, done, info
+
+
+def _area_weights(in_size, out_size):
+    """Compute weights of area interpolation along one axis.
+
+    Args:
+        in_size (int): Number of source pixels.
+        out_size (int): Number of resized pixels.
+
+    Returns:
+        np.ndarray: Weights with shape :math:`(out_size, in_size)`, where each
+            row holds the fraction of a resized pixel covered by each source
+            pixel.
+
+    """
+    scale = in_size / out_size
+    starts = np.arange(out_size)[:, None] * scale
+    pixels = np.arange(in_size)[None, :]
+    overlap = (np.minimum(pixels + 1, starts + scale) -
+               np.maximum(pixels, starts))
+    return np.clip(overlap, 0, None) / scale
@@ -1,6 +1,4 @@
 """Stack frames wrapper for gym.Env."""
-from collections import deque
-
 import gym
 import gym.spaces
 import numpy as np
@@ -12,6 +10,11 @@ class StackFrames(gym.Wrapper):
     Useful for training feed-forward agents on dynamic games.
     Only works with gym.spaces.Box environment with 2D single channel frames.
 
+    Frames are kept in a preallocated circular buffer which holds every frame
+    twice, so that the last n_frames frames are always a contiguous slice of
+    the buffer. Each step writes the new frame into the buffer in place, and
+    the stacked observation is a single copy of that slice.
+
     Args:
         env (gym.Env): gym.Env to wrap.
         n_frames (int): number of frames to stack.
@@ -42,7 +45,15 @@ class StackFrames(gym.Wrapper):
 
         self._n_frames = n_frames
         self._axis = axis
-        self._frames = deque(maxlen=n_frames)
+        frame_shape = env.observation_space.shape
+        if axis == 0:
+            buffer_shape = (2 * n_frames, ) + frame_shape
+        else:
+            buffer_shape = frame_shape + (2 * n_frames, )
+        self._buffer = np.zeros(buffer_shape,
+                                dtype=env.observation_space.dtype)
+        # Index of the oldest frame, which is overwritten next.
+        self._oldest = 0
 
         new_obs_space_shape = env.observation_space.shape + (n_frames, )
         if axis == 0:
@@ -65,6 +76,37 @@ class StackFrames(gym.Wrapper):
     def observation_space(self, observation_space):
         self._observation_space = observation_space
 
+    def _frames(self, start, stop):
+        """Get a slice of the frame buffer.
+
+        Args:
+            start (int): Index of the first frame.
+            stop (int): Index after the last frame.
+
+        Returns:
+            np.ndarray: View of the frames, stacked along the stacking axis.
+
+        """
+        if self._axis == 0:
+            return self._buffer[start:stop]
+        return self._buffer[..., start:stop]
+
+    def _push_frame(self, frame):
+        """Overwrite the oldest frame with a new one.
+
+        Args:
+            frame (np.ndarray): The new frame.
+
+        """
+        i = self._oldest
+        if self._axis == 0:
+            self._buffer[i] = frame
+            self._buffer[i + self._n_frames] = frame
+        else:
+            self._buffer[..., i] = frame
+            self._buffer[..., i + self._n_frames] = frame
+        self._oldest = (i + 1) % self._n_frames
+
     def _stack_frames(self):
         """Stacks and returns the last n_frames.
 
@@ -73,7 +115,7 @@ class StackFrames(gym.Wrapper):
             :math:`(N, n_frames, O*)` or :math:(N, O*, n_frames),
             depending on the axis specified.
         """
-        return np.stack(self._frames, axis=self._axis)
+        return self._frames(self._oldest, self._oldest + self._n_frames).copy()
 
     # pylint: disable=arguments-differ
     def reset(self):
@@ -85,10 +127,14 @@ class StackFrames(gym.Wrapper):
             bool: Termination signal
             dict: Extra information from the environment.
         """
-        observation = self.env.reset()
-        self._frames.clear()
-        for _ in range(self._n_frames):
-            self._frames.append(observation)
+        observation = np.asarray(self.env.reset())
+        if observation.dtype != self._buffer.dtype:
+            # Keep the frames' own dtype, even if it is not the one declared
+            # by the observation space.
+            self._buffer = np.empty_like(self._buffer,
+                                         dtype=observation.dtype)
+        self._buffer[...] = np.expand_dims(observation, self._axis)
+        self._oldest = 0
 
         return self._stack_frames()
 
@@ -105,6 +151,6 @@ class StackFrames(gym.Wrapper):
             dict: Extra information from the environment.
         """
         new_observation, reward, done, info = self.env.step(action)
-        self._frames.append(new_observation)
+        self._push_frame(new_observation)
 
         return self._stack_frames(), reward, done, info
@@ -1,13 +1,5 @@
 """Experiment functions."""
-# yapf: disable
-from garage.experiment.meta_evaluator import MetaEvaluator
-from garage.experiment.snapshotter import SnapshotConfig, Snapshotter
-from garage.experiment.task_sampler import (ConstructEnvsSampler,
-                                            EnvPoolSampler,
-                                            MetaWorldTaskSampler,
-                                            SetTaskSampler, TaskSampler)
-
-# yapf: enable
+from garage._lazy import lazy_exports
 
 __all__ = [
     'MetaEvaluator',
@@ -18,4 +10,21 @@ __all__ = [
     'EnvPoolSampler',
     'SetTaskSampler',
     'MetaWorldTaskSampler',
+    'MetricsOutput',
+    'load_metrics',
+    'run_experiments',
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'run_experiments': 'garage.experiment.launcher',
+    'MetaEvaluator': 'garage.experiment.meta_evaluator',
+    'load_metrics': 'garage.experiment.metrics',
+    'MetricsOutput': 'garage.experiment.metrics',
+    'SnapshotConfig': 'garage.experiment.snapshotter',
+    'Snapshotter': 'garage.experiment.snapshotter',
+    'ConstructEnvsSampler': 'garage.experiment.task_sampler',
+    'EnvPoolSampler': 'garage.experiment.task_sampler',
+    'MetaWorldTaskSampler': 'garage.experiment.task_sampler',
+    'SetTaskSampler': 'garage.experiment.task_sampler',
+    'TaskSampler': 'garage.experiment.task_sampler',
+})
@@ -1,4 +1,5 @@
 """Utilities for ensuring that experiments are deterministic."""
+import copy
 import random
 import sys
 import warnings
@@ -42,6 +43,56 @@ def set_seed(seed):
         torch.backends.cudnn.benchmark = False
 
 
+def get_rng_state():
+    """Get the state of the process-wide random number generators.
+
+    Unlike the seed, the state captures how far each generator has
+    advanced, so restoring it with :func:`set_rng_state` continues the
+    process-wide random streams where they were. Generators owned by other
+    objects are not captured. These include the `np_random` of Gym
+    environments and the generators of `akro` spaces, which environments
+    seed when they are constructed or reset. The state of TensorFlow ops,
+    which is held by their kernels, is not captured either, but the stream
+    of seeds given to new ops by :func:`get_tf_seed_stream` is.
+
+    Returns:
+        dict: The seed, and the state of Python's, NumPy's and, if it has
+            been imported, PyTorch's generators.
+
+    """
+    state = dict(seed=seed_,
+                 seed_stream=copy.deepcopy(seed_stream_),
+                 random=random.getstate(),
+                 numpy=np.random.get_state())
+    if 'torch' in sys.modules:
+        import torch  # pylint: disable=import-outside-toplevel
+        state['torch'] = torch.get_rng_state()
+        if torch.cuda.is_available():
+            state['torch_cuda'] = torch.cuda.get_rng_state_all()
+    return state
+
+
+def set_rng_state(state):
+    """Restore the process-wide random number generators.
+
+    Args:
+        state (dict): State returned by :func:`get_rng_state`.
+
+    """
+    # pylint: disable=global-statement
+    global seed_
+    global seed_stream_
+    seed_ = state['seed']
+    seed_stream_ = copy.deepcopy(state['seed_stream'])
+    random.setstate(state['random'])
+    np.random.set_state(state['numpy'])
+    if 'torch' in state:
+        import torch  # pylint: disable=import-outside-toplevel
+        torch.set_rng_state(state['torch'])
+        if 'torch_cuda' in state and torch.cuda.is_available():
+            torch.cuda.set_rng_state_all(state['torch_cuda'])
+
+
 def get_seed():
     """Get the process-wide random seed.
 
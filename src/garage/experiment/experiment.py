@@ -5,16 +5,16 @@ import enum
 import functools
 import gc
 import inspect
+import itertools
 import json
 import os
 import pathlib
 import subprocess
+import time
 import warnings
 import weakref
 
 import dateutil.tz
-import dowel
-from dowel import logger
 import numpy as np
 
 import __main__ as main
@@ -109,15 +109,31 @@ class ExperimentContext:
             iterations are saved), or "none" (do not save snapshots).
         snapshot_gap (int): Gap between snapshot iterations. Waits this number
             of iterations before taking another snapshot.
+        snapshot_async (bool): Write snapshots on a background thread, so
+            training only waits for snapshots to be captured in memory.
+        snapshot_format (str): Format of snapshot files. Either "pickle"
+            (self-contained pickle files), "sectioned" (each key of a
+            snapshot, such as "policy", can be loaded on its own) or
+            "chunked" (sectioned, and large arrays are stored in
+            content-addressed chunks, so only chunks which changed since the
+            previous snapshot are written).
 
     """
 
     # pylint: disable=too-few-public-methods
 
-    def __init__(self, *, snapshot_dir, snapshot_mode, snapshot_gap):
+    def __init__(self,
+                 *,
+                 snapshot_dir,
+                 snapshot_mode,
+                 snapshot_gap,
+                 snapshot_async=False,
+                 snapshot_format='pickle'):
         self.snapshot_dir = snapshot_dir
         self.snapshot_mode = snapshot_mode
         self.snapshot_gap = snapshot_gap
+        self.snapshot_async = snapshot_async
+        self.snapshot_format = snapshot_format
 
 
 class ExperimentTemplate:
@@ -153,6 +169,14 @@ class ExperimentTemplate:
             iterations are saved), or "none" (do not save snapshots).
         snapshot_gap (int): Gap between snapshot iterations. Waits this number
             of iterations before taking another snapshot.
+        snapshot_async (bool): Write snapshots on a background thread, so
+            training only waits for snapshots to be captured in memory.
+        snapshot_format (str): Format of snapshot files. Either "pickle"
+            (self-contained pickle files), "sectioned" (each key of a
+            snapshot, such as "policy", can be loaded on its own) or
+            "chunked" (sectioned, and large arrays are stored in
+            content-addressed chunks, so only chunks which changed since the
+            previous snapshot are written).
         archive_launch_repo (bool): Whether to save an archive of the
             repository containing the launcher script. This is a potentially
             expensive operation which is useful for ensuring reproducibility.
@@ -172,14 +196,17 @@ class ExperimentTemplate:
     # pylint: disable=too-few-public-methods
 
     def __init__(self, *, function, log_dir, name, prefix, snapshot_mode,
-                 snapshot_gap, archive_launch_repo, name_parameters,
-                 use_existing_dir, x_axis):
+                 snapshot_gap, snapshot_async, snapshot_format,
+                 archive_launch_repo, name_parameters, use_existing_dir,
+                 x_axis):
         self.function = function
         self.log_dir = log_dir
         self.name = name
         self.prefix = prefix
         self.snapshot_mode = snapshot_mode
         self.snapshot_gap = snapshot_gap
+        self.snapshot_async = snapshot_async
+        self.snapshot_format = snapshot_format
         self.archive_launch_repo = archive_launch_repo
         self.name_parameters = name_parameters
         self.use_existing_dir = use_existing_dir
@@ -266,6 +293,8 @@ class ExperimentTemplate:
                        archive_launch_repo=self.archive_launch_repo,
                        snapshot_gap=self.snapshot_gap,
                        snapshot_mode=self.snapshot_mode,
+                       snapshot_async=self.snapshot_async,
+                       snapshot_format=self.snapshot_format,
                        use_existing_dir=self.use_existing_dir,
                        x_axis=self.x_axis,
                        signature=self.__signature__)
@@ -295,6 +324,8 @@ class ExperimentTemplate:
 
         Returns:
             ExperimentContext: The created experiment context.
+            list[dowel.LogOutput]: Outputs added to the logger, which should
+                be removed and closed once the experiment ends.
 
         """
         name = options['name']
@@ -323,18 +354,32 @@ class ExperimentTemplate:
         if git_root_path and options['archive_launch_repo']:
             make_launcher_archive(git_root_path=git_root_path, log_dir=log_dir)
 
-        logger.add_output(dowel.TextOutput(text_log_file))
-        logger.add_output(dowel.CsvOutput(tabular_log_file))
-        logger.add_output(
-            dowel.TensorBoardOutput(log_dir, x_axis=options['x_axis']))
-        logger.add_output(dowel.StdOutput())
+        # dowel imports TensorFlow and PyTorch for TensorBoardOutput, so it
+        # is only imported once an experiment runs.
+        # pylint: disable=import-outside-toplevel
+        import dowel
+        from dowel import logger
+
+        from garage.experiment.metrics import METRICS_DIR, MetricsOutput
+        outputs = [
+            dowel.TextOutput(text_log_file),
+            dowel.CsvOutput(tabular_log_file),
+            MetricsOutput(os.path.join(log_dir, METRICS_DIR)),
+            dowel.TensorBoardOutput(log_dir, x_axis=options['x_axis']),
+            dowel.StdOutput()
+        ]
+        for output in outputs:
+            logger.add_output(output)
 
         logger.push_prefix('[{}] '.format(name))
         logger.log('Logging to {}'.format(log_dir))
 
-        return ExperimentContext(snapshot_dir=log_dir,
+        ctxt = ExperimentContext(snapshot_dir=log_dir,
                                  snapshot_mode=options['snapshot_mode'],
-                                 snapshot_gap=options['snapshot_gap'])
+                                 snapshot_gap=options['snapshot_gap'],
+                                 snapshot_async=options['snapshot_async'],
+                                 snapshot_format=options['snapshot_format'])
+        return ctxt, outputs
 
     def __call__(self, *args, **kwargs):
         """Wrap a function to turn it into an ExperimentTemplate.
@@ -365,10 +410,17 @@ class ExperimentTemplate:
             self._update_wrap_params()
             return self
         else:
-            ctxt = self._make_context(self._get_options(*args), **kwargs)
+            ctxt, outputs = self._make_context(self._get_options(*args),
+                                               **kwargs)
             result = self.function(ctxt, **kwargs)
+            # pylint: disable=import-outside-toplevel
+            from dowel import logger
             logger.remove_all()
             logger.pop_prefix()
+            # Flush outputs which write in the background, such as
+            # MetricsOutput, before the experiment returns.
+            for output in outputs:
+                output.close()
             gc.collect()  # See dowel issue #44
             return result
 
@@ -380,6 +432,8 @@ def wrap_experiment(function=None,
                     name=None,
                     snapshot_mode='last',
                     snapshot_gap=1,
+                    snapshot_async=False,
+                    snapshot_format='pickle',
                     archive_launch_repo=True,
                     name_parameters=None,
                     use_existing_dir=False,
@@ -420,6 +474,14 @@ def wrap_experiment(function=None,
             iterations are saved), or "none" (do not save snapshots).
         snapshot_gap (int): Gap between snapshot iterations. Waits this number
             of iterations before taking another snapshot.
+        snapshot_async (bool): Write snapshots on a background thread, so
+            training only waits for snapshots to be captured in memory.
+        snapshot_format (str): Format of snapshot files. Either "pickle"
+            (self-contained pickle files), "sectioned" (each key of a
+            snapshot, such as "policy", can be loaded on its own) or
+            "chunked" (sectioned, and large arrays are stored in
+            content-addressed chunks, so only chunks which changed since the
+            previous snapshot are written).
         archive_launch_repo (bool): Whether to save an archive of the
             repository containing the launcher script. This is a potentially
             expensive operation which is useful for ensuring reproducibility.
@@ -442,20 +504,32 @@ def wrap_experiment(function=None,
                               name=name,
                               snapshot_mode=snapshot_mode,
                               snapshot_gap=snapshot_gap,
+                              snapshot_async=snapshot_async,
+                              snapshot_format=snapshot_format,
                               archive_launch_repo=archive_launch_repo,
                               name_parameters=name_parameters,
                               use_existing_dir=use_existing_dir,
                               x_axis=x_axis)
 
 
-def dump_json(filename, data):
+def dump_json(filename, data, max_depth=16, max_items=100):
     """Dump a dictionary to a file in JSON format.
 
     Args:
         filename(str): Filename for the file.
         data(dict): Data to save to file.
+        max_depth (int or None): Containers and objects nested deeper than
+            this are summarized by their type and length. None for no limit.
+        max_items (int or None): Containers with more items than this are
+            summarized by their type, length and first max_items items. None
+            for no limit.
+
+    Returns:
+        float: Seconds spent encoding and writing the file.
+        int: Size of the file in bytes.
 
     """
+    start = time.perf_counter()
     pathlib.Path(os.path.dirname(filename)).mkdir(parents=True, exist_ok=True)
     with open(filename, 'w') as f:
         # We do our own circular reference handling.
@@ -466,7 +540,11 @@ def dump_json(filename, data):
                   indent=2,
                   sort_keys=False,
                   cls=LogEncoder,
-                  check_circular=False)
+                  check_circular=False,
+                  max_depth=max_depth,
+                  max_items=max_items)
+        size = f.tell()
+    return time.perf_counter() - start, size
 
 
 def get_metadata():
@@ -562,15 +640,27 @@ def make_launcher_archive(*, git_root_path, log_dir):
 class LogEncoder(json.JSONEncoder):
     """Encoder to be used as cls in json.dump.
 
+    Objects are encoded as a dict of their attributes, with their type in the
+    "$type" key, unless their class defines a `__log_json__` method. It is
+    then called without arguments, and its result is encoded instead. This
+    can be used to summarize large objects, such as replay buffers.
+
     Args:
         args (object): Passed to super class.
+        max_depth (int or None): Containers and objects nested deeper than
+            this are summarized by their type and length. None for no limit.
+        max_items (int or None): Containers with more items than this are
+            summarized by their type, length and first max_items items. None
+            for no limit.
         kwargs (dict): Passed to super class.
 
     """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, max_depth=None, max_items=None, **kwargs):
         super().__init__(*args, **kwargs)
         self._markers = {}
+        self._max_depth = max_depth
+        self._max_items = max_items
 
     # Modules whose contents cannot be meaningfully or safelly jsonified.
     BLOCKED_MODULES = {
@@ -579,6 +669,22 @@ class LogEncoder(json.JSONEncoder):
         'itertools',
     }
 
+    def iterencode(self, o, _one_shot=False):
+        """Encode an object, yielding each string representation.
+
+        The object is first converted to JSON types, so that containers
+        encoded natively by json are summarized like other containers.
+
+        Args:
+            o (object): Object to encode.
+            _one_shot (bool): Passed to super class.
+
+        Returns:
+            Iterator[str]: Parts of the JSON representation of o.
+
+        """
+        return super().iterencode(self.default(o), _one_shot)
+
     def default(self, o):
         """Perform JSON encoding.
 
@@ -599,7 +705,7 @@ class LogEncoder(json.JSONEncoder):
         # This circular reference checking code was copied from the standard
         # library json implementation, but it outputs a repr'd string instead
         # of ValueError on a circular reference.
-        if isinstance(o, (int, bool, float, str)):
+        if o is None or isinstance(o, (int, bool, float, str)):
             return o
         else:
             markerid = id(o)
@@ -633,16 +739,32 @@ class LogEncoder(json.JSONEncoder):
         # This circular reference checking code was copied from the standard
         # library json implementation, but it outputs a repr'd string instead
         # of ValueError on a circular reference.
+        log_json = getattr(type(o), '__log_json__', None)
+        if log_json is not None:
+            data = self.default(log_json(o))
+            if isinstance(data, dict):
+                t = type(o)
+                data.setdefault('$type', t.__module__ + '.' + t.__name__)
+            return data
         try:
             return json.JSONEncoder.default(self, o)
         except TypeError as err:
             if isinstance(o, dict):
+                if self._too_deep():
+                    return self._summarize(o)
+                truncated = (self._max_items is not None
+                             and len(o) > self._max_items)
+                items = o.items()
+                if truncated:
+                    items = itertools.islice(items, self._max_items)
                 data = {}
-                for (k, v) in o.items():
+                for (k, v) in items:
                     if isinstance(k, str):
                         data[k] = self.default(v)
                     else:
                         data[repr(k)] = self.default(v)
+                if truncated:
+                    return self._summarize(o, data)
                 return data
             elif isinstance(o, weakref.ref):
                 return repr(o)
@@ -664,7 +786,17 @@ class LogEncoder(json.JSONEncoder):
                 }
             elif isinstance(o, np.ndarray):
                 return repr(o)
+            elif isinstance(o, tuple) and hasattr(o, '_asdict'):
+                # namedtuples have empty __slots__.
+                if self._too_deep():
+                    return self._summarize(o)
+                data = {k: self.default(v) for (k, v) in o._asdict().items()}
+                t = type(o)
+                data['$type'] = t.__module__ + '.' + t.__name__
+                return data
             elif hasattr(o, '__dict__') or hasattr(o, '__slots__'):
+                if self._too_deep():
+                    return self._summarize(o)
                 obj_dict = getattr(o, '__dict__', None)
                 if obj_dict is not None:
                     data = {k: self.default(v) for (k, v) in obj_dict.items()}
@@ -684,7 +816,7 @@ class LogEncoder(json.JSONEncoder):
             else:
                 try:
                     # This case handles many built-in datatypes like deques
-                    return [self.default(v) for v in list(o)]
+                    return self._encode_iterable(o)
                 except TypeError:
                     pass
                 try:
@@ -693,3 +825,57 @@ class LogEncoder(json.JSONEncoder):
                 except TypeError:
                     pass
                 raise err
+
+    def _too_deep(self):
+        """Check whether the object being encoded is nested too deeply.
+
+        Returns:
+            bool: True if the object should be summarized.
+
+        """
+        # The markers are the containers the object is nested in, and the
+        # object itself.
+        return (self._max_depth is not None
+                and len(self._markers) > self._max_depth)
+
+    def _encode_iterable(self, o):
+        """Encode the items of an iterable, if it has not too many of them.
+
+        Args:
+            o (Iterable): Iterable to encode.
+
+        Returns:
+            list or dict: The encoded items, or a summary of o.
+
+        """
+        if self._too_deep():
+            return self._summarize(o)
+        if self._max_items is None:
+            return [self.default(v) for v in list(o)]
+        items = list(itertools.islice(o, self._max_items + 1))
+        if len(items) <= self._max_items:
+            return [self.default(v) for v in items]
+        return self._summarize(
+            o, [self.default(v) for v in items[:self._max_items]])
+
+    @staticmethod
+    def _summarize(o, items=None):
+        """Summarize a container or object which is not fully encoded.
+
+        Args:
+            o (object): Object to summarize.
+            items (list or dict or None): Encoded first items of o, if any.
+
+        Returns:
+            dict: The type of o, its length if it has one, and items.
+
+        """
+        t = type(o)
+        summary = {'$type': t.__module__ + '.' + t.__name__}
+        try:
+            summary['$len'] = len(o)
+        except TypeError:
+            pass
+        if items is not None:
+            summary['$items'] = items
+        return summary
@@ -0,0 +1,162 @@
+"""Run several variants of an experiment concurrently."""
+import multiprocessing as mp
+from multiprocessing import connection
+import traceback
+
+import psutil
+
+from garage.sampler.sampler_pool import SamplerPool
+
+
+def _run_variant(pool, slot, run_id, experiment, options, kwargs, conn):
+    """Run one variant of an experiment, in its own process.
+
+    Args:
+        pool (SamplerPool): Pool to sample with.
+        slot (int): Slot of the experiment in the pool.
+        run_id (int): Identifier of the experiment in the pool.
+        experiment (ExperimentTemplate): Experiment to run.
+        options (dict or None): Options overriding those passed to
+            `wrap_experiment`.
+        kwargs (dict): Arguments to the experiment.
+        conn (multiprocessing.connection.Connection): Connection to send the
+            result of the experiment, or the traceback of the exception it
+            raised, to the launcher.
+
+    """
+    pool.attach(slot, run_id)
+    try:
+        if options is None:
+            result = experiment(**kwargs)
+        else:
+            result = experiment(options, **kwargs)
+        conn.send((True, result))
+    except Exception:  # pylint: disable=broad-except
+        conn.send((False, traceback.format_exc()))
+    conn.close()
+
+
+def run_experiments(experiment,
+                    variants,
+                    *,
+                    options=None,
+                    n_workers=psutil.cpu_count(logical=False),
+                    n_parallel=None):
+    """Run several variants of an experiment concurrently.
+
+    Each variant runs in its own process, forked from this one, so they
+    share the modules already imported here (such as PyTorch), and log to
+    their own directory, with their own `tabular`. Rather than each
+    starting its own sampler workers, all variants sample with the workers
+    of a single :class:`~garage.sampler.SamplerPool`: every sampler
+    constructed by :meth:`Trainer.make_sampler` in a variant is a
+    :class:`~garage.sampler.PooledSampler`, with one worker in each process
+    of the pool. Experiments using :class:`TFTrainer` construct their own
+    samplers, since each TensorFlow worker needs a process of its own.
+
+    Example:
+        @wrap_experiment(name_parameters='passed')
+        def trpo_pendulum(ctxt, seed):
+            ...
+
+        run_experiments(trpo_pendulum, [dict(seed=s) for s in range(10)])
+
+    Args:
+        experiment (ExperimentTemplate): Experiment to run, i.e. a function
+            decorated with :func:`wrap_experiment`.
+        variants (list[dict]): Keyword arguments to the experiment, for each
+            variant.
+        options (dict or list[dict] or None): Options overriding those
+            passed to `wrap_experiment`, such as `log_dir`, for all variants
+            or for each variant.
+        n_workers (int): Number of sampler worker processes.
+        n_parallel (int or None): Number of variants to run at a time. All
+            of them by default.
+
+    Returns:
+        list: The result of each variant.
+
+    Raises:
+        ValueError: If `options` is a list of a different length than
+            `variants`, or `n_parallel` is less than 1.
+        RuntimeError: If any variant raised an exception. Other variants
+            still run to completion.
+
+    """
+    if isinstance(options, list):
+        if len(options) != len(variants):
+            raise ValueError('If a list of options is passed, there must be '
+                             'one for each variant ({}), but received '
+                             '{}.'.format(len(variants), len(options)))
+    else:
+        options = [options] * len(variants)
+    if n_parallel is None:
+        n_parallel = len(variants)
+    if n_parallel < 1:
+        raise ValueError('n_parallel must be at least 1, but is '
+                         '{}.'.format(n_parallel))
+    n_parallel = min(n_parallel, len(variants))
+
+    pool = SamplerPool(n_workers, n_parallel)
+    pending = list(range(len(variants)))
+    free_slots = list(range(n_parallel))
+    # Process, connection and variant of each slot in use.
+    running = {}
+    results = [None] * len(variants)
+    failures = {}
+    reported = set()
+    try:
+        while pending or running:
+            while pending and free_slots:
+                run_id = pending.pop(0)
+                slot = free_slots.pop(0)
+                conn, child_conn = mp.Pipe(duplex=False)
+                process = mp.Process(target=_run_variant,
+                                     kwargs=dict(pool=pool,
+                                                 slot=slot,
+                                                 run_id=run_id,
+                                                 experiment=experiment,
+                                                 options=options[run_id],
+                                                 kwargs=variants[run_id],
+                                                 conn=child_conn))
+                process.start()
+                child_conn.close()
+                running[slot] = (process, conn, run_id)
+            # Results are received as soon as they are sent, since a
+            # process can not exit until its result is read.
+            connection.wait(
+                [process.sentinel for process, _, _ in running.values()] +
+                [conn for _, conn, _ in running.values() if not conn.closed])
+            for slot, (process, conn, run_id) in list(running.items()):
+                if not conn.closed and conn.poll():
+                    try:
+                        succeeded, value = conn.recv()
+                        if succeeded:
+                            results[run_id] = value
+                        else:
+                            failures[run_id] = value
+                        reported.add(run_id)
+                    except EOFError:
+                        pass
+                    conn.close()
+                if process.is_alive():
+                    continue
+                process.join()
+                conn.close()
+                if run_id not in reported:
+                    failures[run_id] = 'Exited with code {}.'.format(
+                        process.exitcode)
+                pool.release(run_id)
+                del running[slot]
+                free_slots.append(slot)
+    finally:
+        for process, _, _ in running.values():
+            process.terminate()
+            process.join()
+        pool.shutdown()
+    if failures:
+        raise RuntimeError('{} of {} variants failed:\n{}'.format(
+            len(failures), len(variants), '\n'.join(
+                'Variant {}: {}'.format(variants[run_id], failures[run_id])
+                for run_id in sorted(failures))))
+    return results
@@ -32,6 +32,10 @@ class MetaEvaluator:
         worker_class (type): Type of worker the Sampler should use.
         worker_args (dict or None): Additional arguments that should be
             passed to the worker.
+        n_workers (int): Number of workers the Sampler should use. Test tasks
+            are spread across the workers.
+        sampler_cls (type): Type of Sampler to use. It must support
+            `obtain_task_episodes`.
 
     """
 
@@ -46,13 +50,17 @@ class MetaEvaluator:
                  prefix='MetaTest',
                  test_task_names=None,
                  worker_class=DefaultWorker,
-                 worker_args=None):
+                 worker_args=None,
+                 n_workers=1,
+                 sampler_cls=LocalSampler):
         self._test_task_sampler = test_task_sampler
         self._worker_class = worker_class
         if worker_args is None:
             self._worker_args = {}
         else:
             self._worker_args = worker_args
+        self._n_workers = n_workers
+        self._sampler_cls = sampler_cls
         if n_test_tasks is None:
             n_test_tasks = test_task_sampler.n_tasks
         self._n_test_tasks = n_test_tasks
@@ -67,40 +75,60 @@ class MetaEvaluator:
     def evaluate(self, algo, test_episodes_per_task=None):
         """Evaluate the Meta-RL algorithm on the test tasks.
 
+        Exploration episodes of all test tasks are sampled in a single sampler
+        call, the algorithm adapts to all tasks at once (see
+        :meth:`MetaRLAlgorithm.adapt_policies`), and the adapted policies are
+        then evaluated in a second sampler call.
+
         Args:
             algo (MetaRLAlgorithm): The algorithm to evaluate.
             test_episodes_per_task (int or None): Number of episodes per task.
+                Each adapted policy samples at least this many episodes, and
+                at least this many times max_episode_length steps.
 
         """
         if test_episodes_per_task is None:
             test_episodes_per_task = self._n_test_episodes
-        adapted_episodes = []
         logger.log('Sampling for adapation and meta-testing...')
         env_updates = self._test_task_sampler.sample(self._n_test_tasks)
         if self._test_sampler is None:
             env = env_updates[0]()
             self._max_episode_length = env.spec.max_episode_length
-            self._test_sampler = LocalSampler.from_worker_factory(
+            env.close()
+            self._test_sampler = self._sampler_cls.from_worker_factory(
                 WorkerFactory(seed=get_seed(),
                               max_episode_length=self._max_episode_length,
-                              n_workers=1,
+                              n_workers=self._n_workers,
                               worker_class=self._worker_class,
                               worker_args=self._worker_args),
                 agents=algo.get_exploration_policy(),
-                envs=env)
-        for env_up in env_updates:
-            policy = algo.get_exploration_policy()
-            eps = EpisodeBatch.concatenate(*[
-                self._test_sampler.obtain_samples(self._eval_itr, 1, policy,
-                                                  env_up)
-                for _ in range(self._n_exploration_eps)
-            ])
-            adapted_policy = algo.adapt_policy(policy, eps)
-            adapted_eps = self._test_sampler.obtain_samples(
-                self._eval_itr,
-                test_episodes_per_task * self._max_episode_length,
-                adapted_policy)
-            adapted_episodes.append(adapted_eps)
+                # Workers construct their own environments from the update,
+                # and keep them across calls to evaluate.
+                envs=env_updates[0])
+        # Each exploration policy may only be evaluated in one task.
+        exploration_policies = [
+            algo.get_exploration_policy() for _ in env_updates
+        ]
+        exploration_eps = _split_tasks(
+            self._test_sampler.obtain_task_episodes(self._n_exploration_eps,
+                                                    exploration_policies,
+                                                    env_updates),
+            self._n_exploration_eps)
+        if hasattr(algo, 'adapt_policies'):
+            adapted_policies = algo.adapt_policies(exploration_eps)
+        else:
+            adapted_policies = [
+                algo.adapt_policy(policy, eps)
+                for policy, eps in zip(exploration_policies, exploration_eps)
+            ]
+        # Like sampling test_episodes_per_task * max_episode_length steps
+        # from each task, as obtain_samples would.
+        adapted_episodes = self._test_sampler.obtain_task_episodes(
+            test_episodes_per_task,
+            adapted_policies,
+            env_updates,
+            min_steps_per_task=test_episodes_per_task *
+            self._max_episode_length)
         logger.log('Finished meta-testing...')
 
         if self._test_task_names is not None:
@@ -111,7 +139,25 @@ class MetaEvaluator:
         with tabular.prefix(self._prefix + '/' if self._prefix else ''):
             log_multitask_performance(
                 self._eval_itr,
-                EpisodeBatch.concatenate(*adapted_episodes),
+                adapted_episodes,
                 getattr(algo, 'discount', 1.0),
                 name_map=name_map)
         self._eval_itr += 1
+
+
+def _split_tasks(episodes, n_eps_per_task):
+    """Split episodes sampled by `obtain_task_episodes` by task.
+
+    Args:
+        episodes (EpisodeBatch): Episodes ordered by task.
+        n_eps_per_task (int): Number of episodes of each task.
+
+    Returns:
+        list[EpisodeBatch]: Episodes of each task.
+
+    """
+    episodes = episodes.split()
+    return [
+        EpisodeBatch.concatenate(*episodes[start:start + n_eps_per_task])
+        for start in range(0, len(episodes), n_eps_per_task)
+    ]
@@ -0,0 +1,205 @@
+"""Columnar storage of the metrics logged by an experiment.
+
+:class:`MetricsOutput` stores each row of `tabular` logged by an experiment
+in chunks of `.npz` files, with one array per key. Unlike `progress.csv`,
+which is rewritten whenever a new key is logged, chunks are only ever
+appended, and each chunk holds the keys logged in its own rows. Hence
+logging hundreds of keys stays cheap, and :func:`load_metrics` loads the
+metrics of a run into NumPy arrays without parsing text.
+"""
+import concurrent.futures
+import io
+import numbers
+import os
+
+from dowel import LogOutput, TabularInput
+import numpy as np
+
+METRICS_DIR = 'metrics'
+# Key of the number of rows in a chunk, which is stored with its columns.
+_N_ROWS = '__rows__'
+
+
+def _chunk_file_name(metrics_dir, index):
+    """Get the path of a chunk.
+
+    Args:
+        metrics_dir (str): Directory of the chunks.
+        index (int): Index of the chunk.
+
+    Returns:
+        str: Path of the chunk.
+
+    """
+    return os.path.join(metrics_dir, 'chunk_{:06d}.npz'.format(index))
+
+
+def _write_chunk(file_name, rows):
+    """Write rows of metrics to a chunk.
+
+    The chunk is written to a temporary file, which then replaces the
+    chunk, so readers never see a partially written chunk.
+
+    Args:
+        file_name (str): Path of the chunk.
+        rows (list[dict[str, float]]): Metrics of each row.
+
+    """
+    keys = set()
+    for row in rows:
+        keys.update(row)
+    columns = {
+        key: np.array([row.get(key, np.nan) for row in rows],
+                      dtype=np.float64)
+        for key in keys
+    }
+    columns[_N_ROWS] = np.array(len(rows))
+    with io.BytesIO() as buffer:
+        np.savez(buffer, **columns)
+        with open(file_name + '.tmp', 'wb') as file:
+            file.write(buffer.getbuffer())
+    os.replace(file_name + '.tmp', file_name)
+
+
+class MetricsOutput(LogOutput):
+    """Output which stores the numeric metrics logged by an experiment.
+
+    Rows are written to the chunk files of `metrics_dir` on a background
+    thread, each time the logger is dumped. Once a chunk holds
+    `rows_per_chunk` rows, later rows are written to a new chunk, so only
+    the last chunk is ever rewritten. Values which are not numbers, such as
+    strings, are not stored.
+
+    Args:
+        metrics_dir (str): Directory to write the chunks to. Created if it
+            does not exist. Chunks already in it are deleted, just as
+            `dowel.CsvOutput` truncates its file.
+        rows_per_chunk (int): Number of rows in each chunk.
+
+    Raises:
+        ValueError: If rows_per_chunk is less than 1.
+
+    """
+
+    def __init__(self, metrics_dir, rows_per_chunk=100):
+        if rows_per_chunk < 1:
+            raise ValueError('rows_per_chunk must be at least 1, but is '
+                             '{}.'.format(rows_per_chunk))
+        os.makedirs(metrics_dir, exist_ok=True)
+        for name in os.listdir(metrics_dir):
+            if name.startswith('chunk_') and name.endswith(('.npz', '.tmp')):
+                os.remove(os.path.join(metrics_dir, name))
+        self._metrics_dir = metrics_dir
+        self._rows_per_chunk = rows_per_chunk
+        self._chunk_index = 0
+        self._rows = []
+        # Whether rows were recorded since the last chunk was written.
+        self._dirty = False
+        self._executor = None
+        self._pending = None
+
+    @property
+    def types_accepted(self):
+        """tuple[type]: Types of data this output accepts."""
+        return (TabularInput, )
+
+    def record(self, data, prefix=''):
+        """Record a row of metrics.
+
+        Args:
+            data (TabularInput): Metrics to record.
+            prefix (str): Unused.
+
+        Raises:
+            ValueError: If data is not a TabularInput.
+
+        """
+        del prefix
+        if not isinstance(data, TabularInput):
+            raise ValueError('Unacceptable type.')
+        row = {}
+        for key, value in data.as_primitive_dict.items():
+            if isinstance(value, (numbers.Number, np.bool_)):
+                row[key] = value
+                data.mark(key)
+        self._rows.append(row)
+        self._dirty = True
+
+    def dump(self, step=None):
+        """Write the rows recorded since the last dump, in the background.
+
+        Waits for the previous write, so at most one write is pending.
+        Errors raised while writing are raised by the next dump.
+
+        Args:
+            step (int or None): Unused.
+
+        """
+        del step
+        if not self._dirty:
+            return
+        self.wait()
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix='metrics')
+        self._pending = self._executor.submit(
+            _write_chunk,
+            _chunk_file_name(self._metrics_dir, self._chunk_index),
+            list(self._rows))
+        self._dirty = False
+        if len(self._rows) >= self._rows_per_chunk:
+            self._chunk_index += 1
+            self._rows = []
+
+    def wait(self):
+        """Wait until the rows being written in the background are saved."""
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            pending.result()
+
+    def close(self):
+        """Write any rows not yet dumped, and stop the background thread."""
+        # close() is also called by __del__, possibly before __init__ ran.
+        if not hasattr(self, '_executor'):
+            return
+        self.dump()
+        self.wait()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+def load_metrics(log_dir):
+    """Load the metrics logged by an experiment.
+
+    Args:
+        log_dir (str): Log directory of the experiment, containing the
+            `metrics` directory written by :class:`MetricsOutput`.
+
+    Returns:
+        dict[str, np.ndarray]: Value of each metric in each row, by key.
+            Rows in which a key was not logged hold NaN.
+
+    Raises:
+        FileNotFoundError: If the log directory has no metrics.
+
+    """
+    metrics_dir = os.path.join(log_dir, METRICS_DIR)
+    chunk_names = sorted(name for name in os.listdir(metrics_dir)
+                         if name.startswith('chunk_')
+                         and name.endswith('.npz'))
+    chunks = []
+    for name in chunk_names:
+        with np.load(os.path.join(metrics_dir, name)) as chunk:
+            chunks.append({key: chunk[key] for key in chunk.files})
+    n_rows = [int(chunk.pop(_N_ROWS)) for chunk in chunks]
+    keys = set()
+    for chunk in chunks:
+        keys.update(chunk)
+    metrics = {}
+    for key in sorted(keys):
+        metrics[key] = np.concatenate([
+            chunk.get(key, np.full(n, np.nan))
+            for chunk, n in zip(chunks, n_rows)
+        ])
+    return metrics
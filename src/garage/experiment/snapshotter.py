@@ -1,13 +1,54 @@
 """Defines SnapshotConfig and Snapshotter."""
 import collections
+import concurrent.futures
 import errno
+import functools
+import hashlib
+import io
 import os
 import pathlib
+import pickle
+import struct
+import time
+import types
 
 import cloudpickle
+import numpy as np
 
 SnapshotConfig = collections.namedtuple(
-    'SnapshotConfig', ['snapshot_dir', 'snapshot_mode', 'snapshot_gap'])
+    'SnapshotConfig',
+    [
+        'snapshot_dir', 'snapshot_mode', 'snapshot_gap', 'snapshot_async',
+        'snapshot_format'
+    ],
+    defaults=(False, 'pickle'))
+
+# Buffers smaller than this are copied into the pickle stream of an
+# asynchronous or sectioned snapshot, rather than kept as separate buffers.
+_OUT_OF_BAND_MIN_BYTES = 1 << 16
+
+# First bytes of sectioned snapshot files. No pickle starts with 0xff.
+_SECTIONED_MAGIC = b'\xffgarage-snapshot'
+
+# Alignment of buffers in sectioned snapshot files, so they can be mapped
+# into memory as arrays of any dtype.
+_BUFFER_ALIGNMENT = 64
+
+# Objects of these types are pickled again in every section of a sectioned
+# snapshot they are in, rather than referenced, so sections don't depend on
+# each other just because they share strings or dtypes.
+_UNSHARED_TYPES = (type(None), bool, int, float, complex, str, bytes, tuple,
+                   frozenset, type, np.dtype, types.FunctionType,
+                   types.BuiltinFunctionType, types.ModuleType)
+
+# Size of the chunks large buffers of chunked snapshots are split into.
+_CHUNK_BYTES = 1 << 22
+
+# Directory of the chunks of chunked snapshots, in the snapshot directory.
+_CHUNK_DIR = 'chunks'
+
+# File of the checkpoint saved by Snapshotter.save_checkpoint.
+_CHECKPOINT_FILE = 'checkpoint.pkl'
 
 
 class Snapshotter:
@@ -27,6 +68,27 @@ class Snapshotter:
             save snapshots).
         snapshot_gap (int): Gap between snapshot iterations. Wait this number
             of iterations before taking another snapshot.
+        snapshot_async (bool): Write snapshots on a background thread. The
+            training thread only captures the snapshot in memory, which
+            copies large arrays once instead of pickling them, and waits for
+            the previous snapshot to finish writing, if it has not yet.
+            Snapshot files are written to a temporary file and renamed, so a
+            partially written snapshot is never loaded.
+        snapshot_format (str): Format of snapshot files. Either "pickle"
+            (every snapshot is a self-contained pickle file), "sectioned" or
+            "chunked". Sectioned snapshots store each key of a dict snapshot,
+            such as "policy", "replay_buffer" or "env" in snapshots of
+            :class:`~Trainer`, in a section which can be loaded on its own,
+            and large buffers, such as those of numpy arrays, are mapped into
+            memory when loaded. Chunked snapshots are sectioned, but large
+            buffers are split into content-addressed chunks, stored once in
+            the "chunks" directory and referenced by snapshot files, so only
+            the chunks which changed since previous snapshots are written.
+            Sectioned and chunked snapshots must be loaded with :meth:`load`.
+
+    Raises:
+        ValueError: If snapshot_format is not "pickle", "sectioned" or
+            "chunked".
 
     """
 
@@ -34,10 +96,19 @@ class Snapshotter:
                  snapshot_dir=os.path.join(os.getcwd(),
                                            'data/local/experiment'),
                  snapshot_mode='last',
-                 snapshot_gap=1):
+                 snapshot_gap=1,
+                 snapshot_async=False,
+                 snapshot_format='pickle'):
         self._snapshot_dir = snapshot_dir
         self._snapshot_mode = snapshot_mode
         self._snapshot_gap = snapshot_gap
+        self._snapshot_async = snapshot_async
+        self._snapshot_format = snapshot_format
+        self._chunks = None
+        self._executor = None
+        # Future of the snapshot being written in the background, if any.
+        self._pending = None
+        self._stats = collections.Counter()
 
         if snapshot_mode == 'gap_overwrite' and snapshot_gap <= 1:
             raise ValueError('snapshot_gap must be > 1 when using '
@@ -48,8 +119,13 @@ class Snapshotter:
             raise ValueError('snapshot_gap should be set to 1 if using '
                              'snapshot_mode="last". Did you mean to'
                              ' use snapshot_mode="gap"?')
+        if snapshot_format not in ('pickle', 'sectioned', 'chunked'):
+            raise ValueError('Invalid snapshot format {}'.format(
+                snapshot_format))
 
         pathlib.Path(snapshot_dir).mkdir(parents=True, exist_ok=True)
+        if snapshot_format == 'chunked':
+            self._chunks = _ChunkStore(os.path.join(snapshot_dir, _CHUNK_DIR))
 
     @property
     def snapshot_dir(self):
@@ -82,6 +158,16 @@ class Snapshotter:
         """
         return self._snapshot_gap
 
+    @property
+    def snapshot_async(self):
+        """bool: Whether snapshots are written on a background thread."""
+        return self._snapshot_async
+
+    @property
+    def snapshot_format(self):
+        """str: Format of snapshot files."""
+        return self._snapshot_format
+
     def save_itr_params(self, itr, params):
         """Save the parameters if at the right iteration.
 
@@ -89,64 +175,231 @@ class Snapshotter:
             itr (int): Number of iterations. Used as the index of snapshot.
             params (obj): Content of snapshot to be saved.
 
+        """
+        file_names = self._file_names(itr)
+        if file_names:
+            self._save(file_names, params)
+
+    def save_checkpoint(self, params):
+        """Save a checkpoint, replacing the previous one.
+
+        Checkpoints are saved whatever the snapshot mode, to the file
+        "checkpoint.pkl", and are loaded by passing itr='checkpoint' to
+        :meth:`load`. They are written in the format of this snapshotter,
+        on a background thread if snapshots are, and always atomically, so
+        a checkpoint interrupted while being written leaves the previous
+        one in place. Chunked snapshots make frequent checkpoints of large
+        replay buffers cheap, since only the chunks which changed since the
+        last snapshot or checkpoint are written.
+
+        Args:
+            params (obj): Content of checkpoint to be saved.
+
+        """
+        self._save([os.path.join(self._snapshot_dir, _CHECKPOINT_FILE)],
+                   params,
+                   atomic=True)
+
+    def _save(self, file_names, params, atomic=False):
+        """Save a snapshot to files.
+
+        Args:
+            file_names (list[str]): Paths of the snapshot files.
+            params (obj): Content of snapshot to be saved.
+            atomic (bool): Write the snapshot to a temporary file and rename
+                it, even when synchronously saving pickle snapshots.
+
+        """
+        start = time.perf_counter()
+        if self._snapshot_async:
+            # Wait for the previous snapshot, so at most one snapshot is held
+            # in memory while it is written.
+            self.wait()
+            self._stats['BackpressureSeconds'] += time.perf_counter() - start
+            snapshot = self._capture(params)
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix='snapshotter')
+            self._pending = self._executor.submit(self._write, file_names,
+                                                  snapshot)
+        elif self._snapshot_format != 'pickle' or atomic:
+            # The training thread waits until the snapshot is written, so
+            # buffers don't need to be copied.
+            snapshot = self._capture(params, copy=False)
+            self._stats['WriteSeconds'] += self._write(file_names, snapshot)
+        else:
+            for file_name in file_names:
+                with open(file_name, 'wb') as file:
+                    cloudpickle.dump(params, file)
+            self._stats['WriteSeconds'] += time.perf_counter() - start
+        self._stats['BlockedSeconds'] += time.perf_counter() - start
+
+    def _file_names(self, itr):
+        """Get the files to save the snapshot of an iteration to.
+
+        Args:
+            itr (int): Number of iterations. Used as the index of snapshot.
+
+        Returns:
+            list[str]: Paths of the snapshot files, if any.
+
         Raises:
             ValueError: If snapshot_mode is not one of "all", "last", "gap",
                 "gap_overwrite", "gap_and_last", or "none".
 
         """
-        file_name = None
+        file_names = []
 
         if self._snapshot_mode == 'all':
-            file_name = os.path.join(self._snapshot_dir, 'itr_%d.pkl' % itr)
+            file_names.append(
+                os.path.join(self._snapshot_dir, 'itr_%d.pkl' % itr))
         elif self._snapshot_mode == 'gap_overwrite':
             if itr % self._snapshot_gap == 0:
-                file_name = os.path.join(self._snapshot_dir, 'params.pkl')
+                file_names.append(
+                    os.path.join(self._snapshot_dir, 'params.pkl'))
         elif self._snapshot_mode == 'last':
             # override previous params
-            file_name = os.path.join(self._snapshot_dir, 'params.pkl')
+            file_names.append(os.path.join(self._snapshot_dir, 'params.pkl'))
         elif self._snapshot_mode == 'gap':
             if itr % self._snapshot_gap == 0:
-                file_name = os.path.join(self._snapshot_dir,
-                                         'itr_%d.pkl' % itr)
+                file_names.append(
+                    os.path.join(self._snapshot_dir, 'itr_%d.pkl' % itr))
         elif self._snapshot_mode == 'gap_and_last':
+            file_names.append(os.path.join(self._snapshot_dir, 'params.pkl'))
             if itr % self._snapshot_gap == 0:
-                file_name = os.path.join(self._snapshot_dir,
-                                         'itr_%d.pkl' % itr)
-            file_name_last = os.path.join(self._snapshot_dir, 'params.pkl')
-            with open(file_name_last, 'wb') as file:
-                cloudpickle.dump(params, file)
+                file_names.append(
+                    os.path.join(self._snapshot_dir, 'itr_%d.pkl' % itr))
         elif self._snapshot_mode == 'none':
             pass
         else:
             raise ValueError('Invalid snapshot mode {}'.format(
                 self._snapshot_mode))
 
-        if file_name:
-            with open(file_name, 'wb') as file:
-                cloudpickle.dump(params, file)
+        return file_names
+
+    def _capture(self, params, copy=True):
+        """Capture a snapshot in memory, in the format of this snapshotter.
+
+        Args:
+            params (obj): Content of snapshot.
+            copy (bool): Copy large buffers. If False, the captured snapshot
+                refers to the buffers of params, and is only valid until they
+                are modified.
+
+        Returns:
+            _CapturedSnapshot or _CapturedSections: The captured snapshot.
+
+        """
+        if self._snapshot_format == 'pickle':
+            return _capture(params, copy)
+        return _capture_sections(params, copy)
+
+    def _write(self, file_names, snapshot):
+        """Write a captured snapshot to files, atomically.
+
+        In the chunked format, the chunks of the snapshot's buffers are
+        written first, and chunks no longer referenced by any snapshot file
+        written by this snapshotter are deleted last.
+
+        Args:
+            file_names (list[str]): Paths of the snapshot files.
+            snapshot (_CapturedSnapshot or _CapturedSections): The captured
+                snapshot.
+
+        Returns:
+            float: Seconds spent writing the snapshot.
+
+        """
+        start = time.perf_counter()
+        chunk_names = None
+        if self._chunks is not None:
+            chunk_names = {
+                id(buffer): self._chunks.put(buffer)
+                for buffer in snapshot.buffers
+            }
+        for file_name in file_names:
+            tmp_file_name = file_name + '.tmp'
+            with open(tmp_file_name, 'wb') as file:
+                if isinstance(snapshot, _CapturedSections):
+                    snapshot.write(file, chunk_names)
+                else:
+                    pickle.dump(snapshot, file, protocol=5)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_file_name, file_name)
+            if self._chunks is not None:
+                self._chunks.track(file_name, chunk_names.values())
+        if self._chunks is not None:
+            self._chunks.collect_garbage()
+        return time.perf_counter() - start
+
+    def wait(self):
+        """Wait until the snapshot being written in the background is saved.
+
+        Errors raised while writing the snapshot are raised here.
+
+        """
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            self._stats['WriteSeconds'] += pending.result()
+
+    def collect_stats(self):
+        """Collect snapshot latencies since the last call.
 
-    def load(self, load_dir, itr='last'):
-        # pylint: disable=no-self-use
+        Returns:
+            dict[str, float]: Seconds the training thread was blocked saving
+                snapshots, of which it waited for a previous snapshot to be
+                written, and seconds spent writing snapshots. In asynchronous
+                mode, a snapshot's write time is reported once it is written.
+
+        """
+        if self._pending is not None and self._pending.done():
+            self.wait()
+        stats = {
+            'Snapshot/' + name: float(self._stats[name])
+            for name in ('BlockedSeconds', 'BackpressureSeconds',
+                         'WriteSeconds')
+        }
+        self._stats.clear()
+        return stats
+
+    def close(self):
+        """Wait for pending snapshots, and stop the background thread."""
+        self.wait()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def load(self, load_dir, itr='last', sections=None):
         """Load one snapshot of parameters from disk.
 
         Args:
             load_dir (str): Directory of the cloudpickle file
                 to resume experiment from.
             itr (int or string): Iteration to load.
-                Can be an integer, 'last' or 'first'.
+                Can be an integer, 'last', 'first' or 'checkpoint', which
+                loads the checkpoint saved by :meth:`save_checkpoint`.
+            sections (list[str] or None): Keys of the snapshot to load, or
+                None to load all of it. Only the requested sections of a
+                sectioned or chunked snapshot, and the sections they share
+                objects with, are loaded.
 
         Returns:
-            dict: Loaded snapshot.
+            dict: Loaded snapshot, or its requested sections.
 
         Raises:
             ValueError: If itr is neither an integer nor
-                one of ("last", "first").
+                one of ("last", "first", "checkpoint"), or if the snapshot
+                has none of some of the sections.
             FileNotFoundError: If the snapshot file is not found in load_dir.
             NotAFileError: If the snapshot exists but is not a file.
 
         """
+        self.wait()
         if isinstance(itr, int) or itr.isdigit():
             load_from_file = os.path.join(load_dir, 'itr_{}.pkl'.format(itr))
+        elif itr == 'checkpoint':
+            load_from_file = os.path.join(load_dir, _CHECKPOINT_FILE)
         else:
             if itr not in ('last', 'first'):
                 raise ValueError(
@@ -154,7 +407,10 @@ class Snapshotter:
 
             load_from_file = os.path.join(load_dir, 'params.pkl')
             if not os.path.isfile(load_from_file):
-                files = [f for f in os.listdir(load_dir) if f.endswith('.pkl')]
+                files = [
+                    f for f in os.listdir(load_dir)
+                    if f.endswith('.pkl') and f != _CHECKPOINT_FILE
+                ]
                 if not files:
                     raise FileNotFoundError(errno.ENOENT,
                                             os.strerror(errno.ENOENT),
@@ -167,7 +423,476 @@ class Snapshotter:
             raise NotAFileError('File not existing: ', load_from_file)
 
         with open(load_from_file, 'rb') as file:
-            return cloudpickle.load(file)
+            if file.read(len(_SECTIONED_MAGIC)) == _SECTIONED_MAGIC:
+                reader = _SectionReader(
+                    file, load_from_file,
+                    os.path.join(os.path.dirname(load_from_file),
+                                 _CHUNK_DIR))
+                return reader.load(sections)
+            file.seek(0)
+            snapshot = cloudpickle.load(file)
+        if sections is None:
+            return snapshot
+        missing = [name for name in sections if name not in snapshot]
+        if missing:
+            raise ValueError('Snapshot has no sections {}'.format(missing))
+        return {name: snapshot[name] for name in sections}
+
+
+def _take_buffer(buffers, copy, buffer):
+    """Take a large buffer out of a pickle stream.
+
+    Args:
+        buffers (list[numpy.ndarray]): Buffers taken out of the stream.
+        copy (bool): Copy the buffer.
+        buffer (pickle.PickleBuffer): Buffer being pickled.
+
+    Returns:
+        bool: False if the buffer was taken out of the stream.
+
+    """
+    raw = buffer.raw()
+    if raw.nbytes < _OUT_OF_BAND_MIN_BYTES:
+        return True
+    raw = np.frombuffer(raw, dtype=np.uint8)
+    # Copying through numpy is about twice as fast as bytearray(raw).
+    buffers.append(raw.copy() if copy else raw)
+    return False
+
+
+def _capture(params, copy=True):
+    """Capture a snapshot in memory.
+
+    The object graph is pickled, but large buffers, such as those of numpy
+    arrays, are copied out of the pickle stream, which is much faster than
+    pickling them.
+
+    Args:
+        params (obj): Content of snapshot.
+        copy (bool): Copy large buffers. If False, the captured snapshot
+            refers to the buffers of params, and is only valid until they are
+            modified.
+
+    Returns:
+        _CapturedSnapshot: The captured snapshot.
+
+    """
+    buffers = []
+    data = cloudpickle.dumps(params,
+                             protocol=5,
+                             buffer_callback=functools.partial(
+                                 _take_buffer, buffers, copy))
+    return _CapturedSnapshot(data, buffers)
+
+
+def _capture_sections(params, copy=True):
+    """Capture a snapshot in memory, pickling each key in its own section.
+
+    Sections are pickled in the order of the keys of params. An object
+    reachable from several sections is pickled in the first of them, and
+    referenced from the others, so objects shared by sections are still
+    shared when they are loaded.
+
+    Args:
+        params (obj): Content of snapshot. If it is not a dict, the snapshot
+            has a single section.
+        copy (bool): Copy large buffers. If False, the captured snapshot
+            refers to the buffers of params, and is only valid until they are
+            modified.
+
+    Returns:
+        _CapturedSections: The captured snapshot.
+
+    """
+    is_dict = isinstance(params, dict)
+    # Section and memo index of the objects pickled in each section, by id.
+    # The objects are kept, so that their ids are not reused.
+    shared = {}
+    sections = []
+    for name, value in (params.items() if is_dict else [(None, params)]):
+        buffers = []
+        file = io.BytesIO()
+        pickler = _SectionPickler(
+            file, shared, functools.partial(_take_buffer, buffers, copy))
+        pickler.dump(value)
+        for obj_id, (index, obj) in pickler.memo.copy().items():
+            if not isinstance(obj, _UNSHARED_TYPES):
+                shared.setdefault(obj_id, (name, index, obj))
+        sections.append((name, file.getvalue(), buffers))
+    return _CapturedSections(sections, is_dict)
+
+
+def _load_captured(data, buffers):
+    """Load a snapshot captured by :func:`_capture`.
+
+    Args:
+        data (bytes): Pickle stream of the snapshot.
+        buffers (list[numpy.ndarray]): Buffers copied out of the pickle
+            stream.
+
+    Returns:
+        obj: Content of the snapshot.
+
+    """
+    return pickle.loads(data, buffers=buffers)
+
+
+class _CapturedSnapshot:
+    """A snapshot captured in memory, which pickles as its content.
+
+    Loading a pickled captured snapshot returns the content of the snapshot,
+    so snapshot files can be loaded with `pickle.load`, whether they were
+    written synchronously or not.
+
+    Args:
+        data (bytes): Pickle stream of the snapshot.
+        buffers (list[numpy.ndarray]): Buffers copied out of the pickle
+            stream.
+
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, data, buffers):
+        self._data = data
+        self._buffers = buffers
+
+    @property
+    def buffers(self):
+        """list[numpy.ndarray]: Buffers taken out of the pickle stream."""
+        return self._buffers
+
+    def __reduce__(self):
+        """Pickle as a call loading the content of the snapshot.
+
+        Returns:
+            tuple: Function loading the snapshot, and its arguments.
+
+        """
+        return _load_captured, (self._data, self._buffers)
+
+
+class _CapturedSections:
+    """A sectioned snapshot captured in memory.
+
+    Args:
+        sections (list[tuple[str, bytes, list[numpy.ndarray]]]): Name,
+            pickle stream and out-of-band buffers of each section.
+        is_dict (bool): Whether the sections are the keys of a dict.
+
+    """
+
+    def __init__(self, sections, is_dict):
+        self._sections = sections
+        self._is_dict = is_dict
+
+    @property
+    def buffers(self):
+        """list[numpy.ndarray]: Buffers taken out of the pickle streams."""
+        return [
+            buffer for _, _, buffers in self._sections for buffer in buffers
+        ]
+
+    def write(self, file, chunk_names=None):
+        """Write the snapshot to a file.
+
+        The file starts with a magic string, followed by the pickle stream of
+        each section, the buffers which are not chunked, the manifest, which
+        is a pickle of the offsets of the sections and buffers, and finally
+        the offset of the manifest.
+
+        Args:
+            file (io.BufferedWriter): File to write to.
+            chunk_names (dict[int, tuple[tuple[str], int]] or None): Chunk
+                names and size of each chunked buffer, by the id of the
+                buffer, or None if buffers are stored in the file.
+
+        """
+        file.write(_SECTIONED_MAGIC)
+        manifest = {'is_dict': self._is_dict, 'sections': {}}
+        for name, data, buffers in self._sections:
+            offset = file.tell()
+            file.write(data)
+            buffer_refs = []
+            for buffer in buffers:
+                if chunk_names is not None:
+                    buffer_refs.append(('chunks', ) + chunk_names[id(buffer)])
+                    continue
+                file.write(b'\0' * (-file.tell() % _BUFFER_ALIGNMENT))
+                buffer_refs.append(('inline', file.tell(), buffer.nbytes))
+                file.write(buffer)
+            manifest['sections'][name] = (offset, len(data), buffer_refs)
+        manifest_offset = file.tell()
+        pickle.dump(manifest, file, protocol=5)
+        file.write(struct.pack('<Q', manifest_offset))
+
+
+class _SectionPickler(cloudpickle.CloudPickler):
+    """Pickler referencing objects pickled in previous sections.
+
+    Args:
+        file (io.BytesIO): File to pickle to.
+        shared (dict[int, tuple[str, int, object]]): Section and memo index
+            of the objects pickled in previous sections, by id.
+        buffer_callback (callable): Callback taking out-of-band buffers.
+
+    """
+
+    def __init__(self, file, shared, buffer_callback):
+        super().__init__(file, protocol=5, buffer_callback=buffer_callback)
+        self._shared = shared
+
+    def persistent_id(self, obj):
+        """Get the reference to an object pickled in a previous section.
+
+        Args:
+            obj (object): Object being pickled.
+
+        Returns:
+            tuple or None: The section and memo index of the object, or None
+                to pickle obj normally.
+
+        """
+        ref = self._shared.get(id(obj))
+        if ref is None:
+            return None
+        return ('object', ) + ref[:2]
+
+
+class _SectionReader:
+    """Reader of the sections of a sectioned snapshot file.
+
+    Args:
+        file (io.BufferedReader): Snapshot file.
+        file_name (str): Path of the snapshot file.
+        chunk_dir (str): Path of the directory of chunks.
+
+    """
+
+    def __init__(self, file, file_name, chunk_dir):
+        self._file = file
+        self._file_name = file_name
+        self._chunk_dir = chunk_dir
+        file.seek(-8, os.SEEK_END)
+        file.seek(struct.unpack('<Q', file.read(8))[0])
+        self._manifest = pickle.load(file)
+        # Loaded content and unpickler memo of each section, by name.
+        self._loaded = {}
+
+    def load(self, sections=None):
+        """Load sections of the snapshot.
+
+        Args:
+            sections (list[str] or None): Names of the sections to load, or
+                None to load the whole snapshot.
+
+        Returns:
+            obj: The snapshot, or a dict of the requested sections.
+
+        Raises:
+            ValueError: If the snapshot has none of some of the sections.
+
+        """
+        if not self._manifest['is_dict']:
+            if sections is not None:
+                raise ValueError('Snapshot has no sections {}'.format(
+                    list(sections)))
+            return self._load_section(None)[0]
+        if sections is None:
+            sections = self._manifest['sections']
+        missing = [
+            name for name in sections
+            if name not in self._manifest['sections']
+        ]
+        if missing:
+            raise ValueError('Snapshot has no sections {}'.format(missing))
+        return {name: self._load_section(name)[0] for name in sections}
+
+    def load_object(self, section, index):
+        """Load an object pickled in a section.
+
+        Args:
+            section (str): Name of the section.
+            index (int): Memo index of the object in the section.
+
+        Returns:
+            object: The object.
+
+        """
+        return self._load_section(section)[1][index]
+
+    def _load_section(self, name):
+        """Load a section, and the sections it references.
+
+        Args:
+            name (str): Name of the section.
+
+        Returns:
+            object: Content of the section.
+            dict[int, object]: Unpickler memo of the section.
+
+        """
+        if name not in self._loaded:
+            offset, nbytes, buffer_refs = self._manifest['sections'][name]
+            self._file.seek(offset)
+            data = self._file.read(nbytes)
+            unpickler = _SectionUnpickler(
+                io.BytesIO(data), self,
+                [self._load_buffer(ref) for ref in buffer_refs])
+            content = unpickler.load()
+            self._loaded[name] = (content, unpickler.memo.copy())
+        return self._loaded[name]
+
+    def _load_buffer(self, ref):
+        """Load an out-of-band buffer.
+
+        Buffers stored in the snapshot file, or in a single chunk, are mapped
+        into memory, copy-on-write, and only read when accessed.
+
+        Args:
+            ref (tuple): Offset and size of a buffer in the snapshot file, or
+                chunk names and size of a chunked buffer.
+
+        Returns:
+            numpy.ndarray: The buffer.
+
+        """
+        if ref[0] == 'inline':
+            _, offset, nbytes = ref
+            return np.memmap(self._file_name,
+                             dtype=np.uint8,
+                             mode='c',
+                             offset=offset,
+                             shape=(nbytes, ))
+        _, names, nbytes = ref
+        if len(names) == 1:
+            return np.memmap(os.path.join(self._chunk_dir, names[0]),
+                             dtype=np.uint8,
+                             mode='c',
+                             shape=(nbytes, ))
+        buffer = np.empty(nbytes, dtype=np.uint8)
+        view = memoryview(buffer)
+        offset = 0
+        for name in names:
+            with open(os.path.join(self._chunk_dir, name), 'rb') as file:
+                offset += file.readinto(view[offset:offset + _CHUNK_BYTES])
+        return buffer
+
+
+class _SectionUnpickler(pickle.Unpickler):
+    """Unpickler of a section, loading objects of other sections.
+
+    Args:
+        file (io.BytesIO): Pickle stream of the section.
+        reader (_SectionReader): Reader of the snapshot.
+        buffers (list[numpy.ndarray]): Out-of-band buffers of the section.
+
+    """
+
+    def __init__(self, file, reader, buffers):
+        super().__init__(file, buffers=buffers)
+        self._reader = reader
+
+    def persistent_load(self, pid):
+        """Load an object pickled in another section.
+
+        Args:
+            pid (tuple): The section and memo index of the object.
+
+        Returns:
+            object: The object.
+
+        Raises:
+            pickle.UnpicklingError: If pid is not a reference to an object.
+
+        """
+        if not isinstance(pid, tuple) or pid[0] != 'object':
+            raise pickle.UnpicklingError(
+                'Unsupported persistent id {!r}'.format(pid))
+        return self._reader.load_object(pid[1], pid[2])
+
+
+class _ChunkStore:
+    """Directory of content-addressed chunks of snapshot buffers.
+
+    Each chunk is stored in a file named after the SHA-256 digest of its
+    content, so chunks which did not change since a previous snapshot are not
+    written again.
+
+    Args:
+        chunk_dir (str): Path of the directory of chunks.
+
+    """
+
+    def __init__(self, chunk_dir):
+        self._chunk_dir = chunk_dir
+        # Names of the chunks in the directory, listed on the first write.
+        self._known = None
+        # Chunks written by this store, which it may delete.
+        self._created = set()
+        # Chunks referenced by each snapshot file written with this store.
+        self._file_chunks = {}
+
+    def put(self, buffer):
+        """Store the chunks of a buffer which are not stored yet.
+
+        Args:
+            buffer (numpy.ndarray): Buffer of bytes.
+
+        Returns:
+            tuple[tuple[str], int]: Names of the chunks of the buffer, and its
+                size in bytes.
+
+        """
+        if self._known is None:
+            pathlib.Path(self._chunk_dir).mkdir(parents=True, exist_ok=True)
+            self._known = {
+                name
+                for name in os.listdir(self._chunk_dir)
+                if not name.endswith('.tmp')
+            }
+        names = []
+        for offset in range(0, buffer.nbytes, _CHUNK_BYTES):
+            chunk = buffer[offset:offset + _CHUNK_BYTES]
+            name = hashlib.sha256(chunk).hexdigest()
+            if name not in self._known:
+                path = os.path.join(self._chunk_dir, name)
+                with open(path + '.tmp', 'wb') as file:
+                    file.write(chunk)
+                    file.flush()
+                    os.fsync(file.fileno())
+                os.replace(path + '.tmp', path)
+                self._known.add(name)
+                self._created.add(name)
+            names.append(name)
+        return tuple(names), buffer.nbytes
+
+    def track(self, file_name, refs):
+        """Record the chunks a snapshot file references.
+
+        Args:
+            file_name (str): Path of the snapshot file.
+            refs (Iterable[tuple[tuple[str], int]]): Chunk names and size of
+                each buffer of the snapshot, as returned by :meth:`put`.
+
+        """
+        self._file_chunks[file_name] = {
+            name
+            for names, _ in refs for name in names
+        }
+
+    def collect_garbage(self):
+        """Delete chunks this store wrote which are no longer referenced.
+
+        Chunks which were not written by this store, such as those of a
+        previous experiment in the same directory, are never deleted.
+
+        """
+        referenced = set().union(*self._file_chunks.values())
+        for name in self._created - referenced:
+            os.remove(os.path.join(self._chunk_dir, name))
+            self._known.discard(name)
+        self._created &= referenced
 
 
 class NotAFileError(Exception):
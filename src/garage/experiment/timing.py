@@ -0,0 +1,514 @@
+"""Hierarchical timers and counters, for profiling training.
+
+Timers measure the wall-clock time spent in a block of code, and may be
+nested. A timer named "Optimize" started while a timer named "Train" is
+running is recorded as "Train/Optimize". Counters count events, such as
+environment steps. Timers are used either as context managers or as
+decorators:
+
+    from garage.experiment import timing
+
+    with timing.timed('Sample'):
+        episodes = sampler.obtain_samples(...)
+    timing.count('EnvSteps', sum(episodes.lengths))
+
+    @timing.timed('Optimize')
+    def _optimize(self, ...):
+        ...
+
+Timing is disabled by default, and then costs a function call and a flag
+check per timer. Once enabled with :func:`enable`, :class:`~Trainer` records
+the results of each epoch to tabular, as "Timing/<timer>" (seconds spent in
+the timer during the epoch) and "Throughput/<counter>PerSec" (events counted
+per second of the epoch), e.g. "Throughput/EnvStepsPerSec". Timers can also
+be written to a trace file in the Chrome trace event format, which can be
+opened in chrome://tracing or https://ui.perfetto.dev to inspect them as a
+flame graph.
+
+The call stacks of the process can also be sampled periodically, and
+written to a file in the "collapsed" format of py-spy and flamegraph.pl,
+which speedscope (https://www.speedscope.app) can open as a flame graph.
+
+Timers and counters are global to a process, and are not thread-safe. They
+are disabled in processes forked from it. Sampler workers running in other
+processes are profiled whenever timing is enabled in the process sampling
+from them: their timers are reported by the sampler as "Worker/Timing/*",
+and their sampled stacks are added to the stacks of this process.
+
+"""
+import collections
+import functools
+import json
+import os
+import sys
+import threading
+import time
+
+_enabled = False
+# Timers running, as pairs of their path and start time.
+_stack = []
+_seconds = collections.defaultdict(float)
+_counts = collections.defaultdict(float)
+_last_collect = None
+_trace_file = None
+_trace_events = []
+_n_trace_events = 0
+# Stack samples not yet written or collected, and the lock guarding them,
+# since they are added by a sampling thread.
+_stacks = collections.Counter()
+_stacks_lock = threading.Lock()
+_stack_totals = collections.Counter()
+_stack_file = None
+_stack_sampler = None
+# Configuration of timing in sampler workers, if this is a sampler worker.
+_worker_config = None
+
+
+def enable(trace_file=None, stack_file=None, stack_interval=0.01):
+    """Enable timers and counters.
+
+    Args:
+        trace_file (str or None): Path of a file to write the timers to, in
+            the Chrome trace event format, or None to not write a trace.
+            Timers are written to the file each time stats are collected,
+            and when timing is disabled.
+        stack_file (str or None): Path of a file to write sampled call stacks
+            to, in the collapsed stack format, or None to not sample stacks.
+            Stacks of this thread and of sampler workers are sampled, and
+            written each time stats are collected, and when timing is
+            disabled.
+        stack_interval (float): Seconds between stack samples.
+
+    Raises:
+        ValueError: If stack_interval is not positive.
+
+    """
+    # pylint: disable=global-statement
+    global _enabled, _last_collect, _trace_file, _n_trace_events, _stack_file
+    if stack_interval <= 0:
+        raise ValueError('stack_interval must be positive, but got '
+                         '{}.'.format(stack_interval))
+    disable()
+    _enabled = True
+    _last_collect = time.perf_counter()
+    if trace_file is not None:
+        # pylint: disable=consider-using-with
+        _trace_file = open(trace_file, 'w')
+        _trace_file.write('[\n')
+        _n_trace_events = 0
+    if stack_file is not None:
+        _stack_file = stack_file
+        _start_stack_sampler('main', stack_interval)
+
+
+def disable():
+    """Disable timers and counters, and close the trace file, if any."""
+    # pylint: disable=global-statement
+    global _enabled, _trace_file, _stack_file, _worker_config
+    _stop_stack_sampler()
+    if _stack_file is not None:
+        _flush_stacks()
+        _stack_file = None
+    _stack_totals.clear()
+    _enabled = False
+    _worker_config = None
+    _stack.clear()
+    _seconds.clear()
+    _counts.clear()
+    if _trace_file is not None:
+        _flush_trace()
+        _trace_file.write('\n]\n')
+        _trace_file.close()
+        _trace_file = None
+
+
+def is_enabled():
+    """Check whether timers and counters are enabled.
+
+    Returns:
+        bool: True if timers and counters are enabled.
+
+    """
+    return _enabled
+
+
+def timed(name, trace=True):
+    """Time a block of code, or every call of a function.
+
+    Args:
+        name (str): Name of the timer. It is prefixed by the names of the
+            timers running when it starts.
+        trace (bool): Whether to write each use of the timer to the trace
+            file. Timers used every environment step should not be traced,
+            since the trace would grow too large.
+
+    Returns:
+        _Timer: A context manager, which can also decorate a function.
+
+    """
+    return _Timer(name, trace)
+
+
+def count(name, n=1):
+    """Count events.
+
+    Args:
+        name (str): Name of the counter.
+        n (int or float): Number of events.
+
+    """
+    if _enabled:
+        _counts[name] += n
+
+
+def collect_stats():
+    """Collect timers and counters since the last call.
+
+    Timers and counters which were used before, but not since the last call,
+    are reported as zero, so the same keys are reported every time.
+
+    Returns:
+        dict[str, float]: Seconds spent in each timer, as "Timing/<timer>",
+            and events per second of each counter, as
+            "Throughput/<counter>PerSec". Empty if timing is disabled.
+
+    """
+    # pylint: disable=global-statement
+    global _last_collect
+    if not _enabled:
+        return {}
+    now = time.perf_counter()
+    elapsed = now - _last_collect
+    _last_collect = now
+    stats = {}
+    for path, seconds in _seconds.items():
+        stats['Timing/' + path] = seconds
+        _seconds[path] = 0.
+    for name, n in _counts.items():
+        stats['Throughput/{}PerSec'.format(name)] = (n / elapsed
+                                                     if elapsed > 0 else 0.)
+        _counts[name] = 0.
+    _flush_trace()
+    if _stack_file is not None:
+        _flush_stacks()
+    return stats
+
+
+def worker_config():
+    """Get the configuration of timing in sampler workers.
+
+    Samplers send this to their workers, which pass it to
+    :func:`configure_worker`.
+
+    Returns:
+        dict or None: Configuration of timing in sampler workers, or None if
+            timing is disabled.
+
+    """
+    if not _enabled:
+        return None
+    return dict(pid=os.getpid(),
+                stack_interval=(_stack_sampler.interval
+                                if _stack_sampler is not None else None))
+
+
+def configure_worker(config, name):
+    """Configure timing in a sampler worker process.
+
+    Workers running in the sampling process itself, e.g. in Ray's local mode,
+    are timed by the sampling process, so they are not configured.
+
+    Args:
+        config (dict or None): Configuration from :func:`worker_config`.
+        name (str): Name of the worker, prefixed to its sampled stacks.
+
+    Returns:
+        bool: True if the configuration of timing changed.
+
+    """
+    # pylint: disable=global-statement
+    global _enabled, _last_collect, _worker_config
+    if config == _worker_config or (config is not None
+                                    and config['pid'] == os.getpid()):
+        return False
+    disable()
+    if config is not None:
+        _enabled = True
+        _last_collect = time.perf_counter()
+        _worker_config = config
+        if config['stack_interval'] is not None:
+            _start_stack_sampler(name, config['stack_interval'])
+    return True
+
+
+def is_worker():
+    """Check whether timing was configured by a sampler in another process.
+
+    Returns:
+        bool: True if this process is a profiled sampler worker.
+
+    """
+    return _worker_config is not None
+
+
+def collect_stacks():
+    """Collect the stacks sampled since the last call.
+
+    Returns:
+        StackSamples: Number of samples of each stack.
+
+    """
+    with _stacks_lock:
+        stacks = StackSamples(_stacks)
+        _stacks.clear()
+    return stacks
+
+
+def add_stacks(stacks):
+    """Add stacks sampled elsewhere, e.g. in a sampler worker.
+
+    The stacks are written to the stack file along with the stacks of this
+    process. They are ignored if no stack file is being written.
+
+    Args:
+        stacks (StackSamples): Number of samples of each stack.
+
+    """
+    if _stack_file is not None:
+        with _stacks_lock:
+            _stacks.update(stacks)
+
+
+def _flush_stacks():
+    """Rewrite the stack file with all stacks sampled so far."""
+    _stack_totals.update(collect_stacks())
+    tmp_file = _stack_file + '.tmp'
+    with open(tmp_file, 'w') as f:
+        for stack, n in sorted(_stack_totals.items()):
+            f.write('{} {}\n'.format(stack, n))
+    os.replace(tmp_file, _stack_file)
+
+
+def _flush_trace():
+    """Write the trace events recorded since the last flush."""
+    # pylint: disable=global-statement
+    global _n_trace_events
+    if _trace_file is None:
+        return
+    for event in _trace_events:
+        if _n_trace_events:
+            _trace_file.write(',\n')
+        _trace_file.write(json.dumps(event))
+        _n_trace_events += 1
+    _trace_events.clear()
+    _trace_file.flush()
+
+
+def _start_stack_sampler(name, interval):
+    """Start sampling the stacks of the calling thread.
+
+    Args:
+        name (str): Name of the process, prefixed to the stacks.
+        interval (float): Seconds between samples.
+
+    """
+    # pylint: disable=global-statement
+    global _stack_sampler
+    _stack_sampler = _StackSampler(name, interval, threading.get_ident())
+    _stack_sampler.start()
+
+
+def _stop_stack_sampler():
+    """Stop sampling stacks, if stacks are sampled."""
+    # pylint: disable=global-statement
+    global _stack_sampler
+    if _stack_sampler is not None:
+        _stack_sampler.stop()
+        _stack_sampler = None
+
+
+def _forget_in_child():
+    """Disable timing in a forked child process.
+
+    The child must not write to its parent's trace file, nor accumulate trace
+    events which it never writes.
+
+    """
+    # pylint: disable=global-statement
+    global _enabled, _trace_file, _stack_file, _stack_sampler, _stacks_lock
+    global _worker_config
+    _enabled = False
+    _trace_file = None
+    _stack_file = None
+    # The sampling thread does not exist in the child, and may have held
+    # the lock when the process forked.
+    _stack_sampler = None
+    _stacks_lock = threading.Lock()
+    _worker_config = None
+    _stack.clear()
+    _seconds.clear()
+    _counts.clear()
+    _trace_events.clear()
+    _stacks.clear()
+    _stack_totals.clear()
+
+
+os.register_at_fork(after_in_child=_forget_in_child)
+
+
+class _Timer:
+    """Timer usable as a context manager or a decorator.
+
+    The timer has no state of its own, so the same timer can be nested in
+    itself, e.g. when it decorates a recursive function.
+
+    Args:
+        name (str): Name of the timer.
+        trace (bool): Whether to write each use of the timer to the trace
+            file.
+
+    """
+
+    def __init__(self, name, trace):
+        self._name = name
+        self._trace = trace
+
+    def __enter__(self):
+        """Start the timer, if timing is enabled.
+
+        Returns:
+            _Timer: This timer.
+
+        """
+        if _enabled:
+            path = (_stack[-1][0] + '/' + self._name
+                    if _stack else self._name)
+            _stack.append((path, time.perf_counter()))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stop the timer, and record the time spent in it.
+
+        Args:
+            exc_type (type): Type of the exception raised in the block, if
+                any.
+            exc_value (BaseException): Exception raised in the block, if any.
+            traceback (traceback): Traceback of the exception, if any.
+
+        """
+        if not _enabled or not _stack:
+            return
+        end = time.perf_counter()
+        path, start = _stack.pop()
+        _seconds[path] += end - start
+        if self._trace and _trace_file is not None:
+            _trace_events.append({
+                'name': self._name,
+                'cat': path,
+                'ph': 'X',
+                'ts': start * 1e6,
+                'dur': (end - start) * 1e6,
+                'pid': os.getpid(),
+                'tid': threading.get_ident(),
+            })
+
+    def __call__(self, func):
+        """Time every call of a function.
+
+        Args:
+            func (callable): Function to time.
+
+        Returns:
+            callable: The timed function.
+
+        """
+
+        @functools.wraps(func)
+        def timed_func(*args, **kwargs):
+            """Call the function in the timer.
+
+            Args:
+                args (tuple): Positional arguments of the function.
+                kwargs (dict): Keyword arguments of the function.
+
+            Returns:
+                object: The result of the function.
+
+            """
+            if not _enabled:
+                return func(*args, **kwargs)
+            with self:
+                return func(*args, **kwargs)
+
+        return timed_func
+
+
+class StackSamples(collections.Counter):
+    """Number of samples of each call stack, in the collapsed stack format.
+
+    Each stack is a string of frames, from the outermost to the innermost,
+    separated by semicolons. Adding 0 returns a copy, so samples can be
+    summed with `sum` or `collections.Counter`, like other worker statistics.
+
+    """
+
+    def __add__(self, other):
+        """Add two samples of stacks.
+
+        Args:
+            other (StackSamples or int): Samples to add, or 0.
+
+        Returns:
+            StackSamples: The summed samples.
+
+        """
+        result = StackSamples(self)
+        if not (isinstance(other, int) and other == 0):
+            result.update(other)
+        return result
+
+    __radd__ = __add__
+
+
+class _StackSampler(threading.Thread):
+    """Thread periodically sampling the stack of another thread.
+
+    Args:
+        name (str): Name of the process, used as the outermost frame.
+        interval (float): Seconds between samples.
+        thread_id (int): Identifier of the sampled thread.
+
+    """
+
+    def __init__(self, name, interval, thread_id):
+        super().__init__(name='garage-stack-sampler', daemon=True)
+        self._name = name
+        self.interval = interval
+        self._thread_id = thread_id
+        self._stopped = threading.Event()
+
+    def run(self):
+        """Sample the stack until stopped."""
+        while not self._stopped.wait(self.interval):
+            # pylint: disable=protected-access
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                return
+            frames = []
+            while frame is not None:
+                code = frame.f_code
+                frames.append('{} ({}:{})'.format(code.co_name,
+                                                  code.co_filename,
+                                                  frame.f_lineno))
+                frame = frame.f_back
+            frames.append(self._name)
+            stack = ';'.join(reversed(frames))
+            del frame
+            with _stacks_lock:
+                _stacks[stack] += 1
+
+    def stop(self):
+        """Stop sampling, and wait for the thread to finish."""
+        self._stopped.set()
+        if self is not threading.current_thread():
+            self.join()
@@ -8,6 +8,7 @@ from garage.np._functions import (concat_tensor_dict_list, discount_cumsum,
                                   stack_and_pad_tensor_dict_list,
                                   stack_tensor_dict_list, truncate_tensor_dict,
                                   unflatten_tensors)
+from garage.np.running_stats import RunningStats
 
 # yapf: enable
 
@@ -27,4 +28,5 @@ __all__ = [
     'slice_nested_dict',
     'rrse',
     'sliding_window',
+    'RunningStats',
 ]
@@ -2,7 +2,6 @@
 import warnings
 
 import numpy as np
-import scipy.signal
 
 
 def explained_variance_1d(ypred, y, valids=None):
@@ -124,6 +123,8 @@ def discount_cumsum(x, discount):
 
 
     """
+    # scipy.signal is slow to import, so it is imported on first use.
+    import scipy.signal  # pylint: disable=import-outside-toplevel
     return scipy.signal.lfilter([1], [1, float(-discount)], x[::-1],
                                 axis=-1)[::-1]
 
@@ -4,7 +4,7 @@ import collections
 from dowel import logger, tabular
 import numpy as np
 
-from garage import log_performance
+from garage import EpisodeBatch, log_performance
 from garage.np.algos.rl_algorithm import RLAlgorithm
 from garage.sampler import RaySampler
 
@@ -30,6 +30,12 @@ class CEM(RLAlgorithm):
         init_std (float): Initial std for policy param distribution.
         extra_std (float): Decaying std added to param distribution.
         extra_decay_time (float): Epochs that it takes to decay extra std.
+        episodes_per_sample (int or None): If set, evaluate the whole
+            population of each epoch at once. All `n_samples` policies are
+            drawn up front, and each is evaluated on exactly this many
+            episodes, with the policies spread across the sampler workers.
+            Otherwise, policies are evaluated one at a time, each on a batch
+            of the trainer's batch size.
 
     """
 
@@ -41,7 +47,8 @@ class CEM(RLAlgorithm):
                  init_std=1,
                  best_frac=0.05,
                  extra_std=1.,
-                 extra_decay_time=100):
+                 extra_decay_time=100,
+                 episodes_per_sample=None):
         self.policy = policy
         self.max_episode_length = env_spec.max_episode_length
 
@@ -55,6 +62,7 @@ class CEM(RLAlgorithm):
         self._env_spec = env_spec
         self._discount = discount
         self._n_samples = n_samples
+        self._episodes_per_sample = episodes_per_sample
 
         self._cur_std = None
         self._cur_mean = None
@@ -64,22 +72,26 @@ class CEM(RLAlgorithm):
         self._n_best = None
         self._n_params = None
 
-    def _sample_params(self, epoch):
+    def _sample_params(self, epoch, n_samples=None):
         """Return sample parameters.
 
         Args:
             epoch (int): Epoch number.
+            n_samples (int or None): Number of parameter vectors to sample. If
+                None, a single vector is sampled.
 
         Returns:
-            np.ndarray: A numpy array of parameter values.
+            np.ndarray: A numpy array of parameter values, of shape
+                :math:`(N, P)` if n_samples is given, otherwise :math:`(P,)`.
 
         """
         extra_var_mult = max(1.0 - epoch / self._extra_decay_time, 0)
         sample_std = np.sqrt(
             np.square(self._cur_std) +
             np.square(self._extra_std) * extra_var_mult)
-        return np.random.standard_normal(
-            self._n_params) * sample_std + self._cur_mean
+        shape = self._n_params if n_samples is None else (n_samples,
+                                                          self._n_params)
+        return np.random.standard_normal(shape) * sample_std + self._cur_mean
 
     def train(self, trainer):
         """Initialize variables and start training.
@@ -109,6 +121,10 @@ class CEM(RLAlgorithm):
         last_return = None
 
         for _ in trainer.step_epochs():
+            if self._episodes_per_sample is not None:
+                last_return = self._train_population(trainer)
+                trainer.step_itr += self._n_samples
+                continue
             for _ in range(self._n_samples):
                 trainer.step_path = trainer.obtain_episodes(trainer.step_itr)
                 last_return = self._train_once(trainer.step_itr,
@@ -168,3 +184,40 @@ class CEM(RLAlgorithm):
 
         logger.log(tabular)
         return rtn
+
+    def _train_population(self, trainer):
+        """Sample and evaluate a whole population, then update.
+
+        Args:
+            trainer (Trainer): Experiment trainer, used to sample episodes.
+
+        Returns:
+            float: The best average return in the population.
+
+        """
+        itr = trainer.step_itr
+        epoch = itr // self._n_samples
+        population = self._sample_params(epoch, self._n_samples)
+        episodes = trainer.obtain_episodes_per_update(
+            self._episodes_per_sample, list(population))
+        episodes = EpisodeBatch.concatenate(*episodes)
+        trainer.step_path = episodes
+
+        undiscounted_returns = log_performance(itr,
+                                               episodes,
+                                               discount=self._discount)
+        self._episode_reward_mean.extend(undiscounted_returns)
+        tabular.record('Extras/EpisodeRewardMean',
+                       np.mean(self._episode_reward_mean))
+        tabular.record('Epoch', epoch)
+        avg_rtns = np.reshape(undiscounted_returns,
+                              (self._n_samples, -1)).mean(axis=1)
+
+        # MLE of normal distribution over the n_best top policies
+        best_params = population[np.argsort(-avg_rtns)[:self._n_best]]
+        self._cur_mean = best_params.mean(axis=0)
+        self._cur_std = best_params.std(axis=0)
+        self.policy.set_param_values(self._cur_mean)
+
+        logger.log(tabular)
+        return avg_rtns.max()
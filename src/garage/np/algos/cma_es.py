@@ -5,7 +5,7 @@ import cma
 from dowel import logger, tabular
 import numpy as np
 
-from garage import log_performance
+from garage import EpisodeBatch, log_performance
 from garage.np.algos.rl_algorithm import RLAlgorithm
 from garage.sampler import RaySampler
 
@@ -24,10 +24,22 @@ class CMAES(RLAlgorithm):
         n_samples (int): Number of policies sampled in one epoch.
         discount (float): Environment reward discount.
         sigma0 (float): Initial std for param distribution.
+        episodes_per_sample (int or None): If set, evaluate the whole
+            population of each epoch at once. All `n_samples` policies are
+            drawn up front, and each is evaluated on exactly this many
+            episodes, with the policies spread across the sampler workers.
+            Otherwise, policies are evaluated one at a time, each on a batch
+            of the trainer's batch size.
 
     """
 
-    def __init__(self, env_spec, policy, n_samples, discount=0.99, sigma0=1.):
+    def __init__(self,
+                 env_spec,
+                 policy,
+                 n_samples,
+                 discount=0.99,
+                 sigma0=1.,
+                 episodes_per_sample=None):
         self.policy = policy
         self.max_episode_length = env_spec.max_episode_length
         self.sampler_cls = RaySampler
@@ -36,6 +48,7 @@ class CMAES(RLAlgorithm):
         self._discount = discount
         self._sigma0 = sigma0
         self._n_samples = n_samples
+        self._episodes_per_sample = episodes_per_sample
         self._episode_reward_mean = collections.deque(maxlen=100)
 
         self._es = None
@@ -67,14 +80,21 @@ class CMAES(RLAlgorithm):
         init_mean = self.policy.get_param_values()
         self._es = cma.CMAEvolutionStrategy(init_mean, self._sigma0,
                                             {'popsize': self._n_samples})
-        self._all_params = self._sample_params()
-        self._cur_params = self._all_params[0]
-        self.policy.set_param_values(self._cur_params)
         self._all_returns = []
 
         # start actual training
         last_return = None
 
+        if self._episodes_per_sample is not None:
+            for _ in trainer.step_epochs():
+                last_return = self._train_population(trainer)
+                trainer.step_itr += self._n_samples
+            return last_return
+
+        self._all_params = self._sample_params()
+        self._cur_params = self._all_params[0]
+        self.policy.set_param_values(self._cur_params)
+
         for _ in trainer.step_epochs():
             for _ in range(self._n_samples):
                 trainer.step_path = trainer.obtain_episodes(trainer.step_itr)
@@ -128,3 +148,36 @@ class CMAES(RLAlgorithm):
 
         logger.log(tabular)
         return rtn
+
+    def _train_population(self, trainer):
+        """Sample and evaluate a whole population, then update.
+
+        Args:
+            trainer (Trainer): Experiment trainer, used to sample episodes.
+
+        Returns:
+            float: The best average return in the population.
+
+        """
+        itr = trainer.step_itr
+        population = self._sample_params()
+        episodes = trainer.obtain_episodes_per_update(
+            self._episodes_per_sample, population)
+        episodes = EpisodeBatch.concatenate(*episodes)
+        trainer.step_path = episodes
+
+        undiscounted_returns = log_performance(itr,
+                                               episodes,
+                                               discount=self._discount)
+        self._episode_reward_mean.extend(undiscounted_returns)
+        tabular.record('Extras/EpisodeRewardMean',
+                       np.mean(self._episode_reward_mean))
+        tabular.record('Epoch', itr // self._n_samples)
+        avg_rtns = np.reshape(undiscounted_returns,
+                              (self._n_samples, -1)).mean(axis=1)
+
+        self._es.tell(population, -avg_rtns)
+        self.policy.set_param_values(self._es.best.get()[0])
+
+        logger.log(tabular)
+        return avg_rtns.max()
@@ -39,3 +39,25 @@ class MetaRLAlgorithm(RLAlgorithm, abc.ABC):
                 exploration_episodes.
 
         """
+
+    def adapt_policies(self, exploration_episodes):
+        """Produce policies adapted for several tasks.
+
+        Algorithms which can adapt to several tasks at once should override
+        this method. By default, :meth:`adapt_policy` is called once per task.
+
+        Args:
+            exploration_episodes (list[EpisodeBatch]): Episodes with which to
+                adapt to each task. These are generated by policies returned
+                from get_exploration_policy() while exploring the environment
+                of each task.
+
+        Returns:
+            list[Policy]: A policy adapted to each task. The policies are
+                distinct objects, so they can be sampled concurrently.
+
+        """
+        return [
+            self.adapt_policy(self.get_exploration_policy(), eps)
+            for eps in exploration_episodes
+        ]
@@ -1,6 +1,8 @@
 """Base class for all baselines."""
 import abc
 
+import numpy as np
+
 
 class Baseline(abc.ABC):
     """Base class for all baselines."""
@@ -25,3 +27,31 @@ class Baseline(abc.ABC):
             numpy.ndarray: Predicted value.
 
         """
+
+    def predict_episodes(self, paths, lengths):
+        """Predict values of several episodes at once.
+
+        Subclasses which can predict a whole batch at once should override
+        this. By default, each episode is predicted separately.
+
+        Args:
+            paths (dict[numpy.ndarray]): Sample paths of several episodes,
+                with each value concatenated across episodes along the first
+                axis.
+            lengths (numpy.ndarray): Length of each episode.
+
+        Returns:
+            numpy.ndarray: Predicted value of every time step, concatenated
+                across episodes.
+
+        """
+        splits = np.cumsum(lengths)[:-1]
+        episodes = {
+            key: np.split(value, splits)
+            for key, value in paths.items()
+        }
+        return np.concatenate([
+            self.predict({key: value[i]
+                          for key, value in episodes.items()})
+            for i in range(len(lengths))
+        ])
@@ -1,5 +1,6 @@
 """A linear value function (baseline) based on features."""
 import numpy as np
+import scipy.linalg
 
 from garage.np.baselines.baseline import Baseline
 
@@ -7,17 +8,39 @@ from garage.np.baselines.baseline import Baseline
 class LinearFeatureBaseline(Baseline):
     """A linear value function (baseline) based on features.
 
+    The baseline is fit by ridge regression, solving the normal equations
+    with a Cholesky factorization of the regularized Gram matrix. If the
+    factorization fails, the regularization is increased, reusing the Gram
+    matrix, which is the expensive part of the fit.
+
     Args:
         env_spec (garage.envs.env_spec.EnvSpec): Environment specification.
         reg_coeff (float): Regularization coefficient.
         name (str): Name of baseline.
+        gram_decay (float or None): If set, the Gram matrix and feature-return
+            moments are accumulated across calls to :meth:`fit`, with older
+            statistics weighted down by this factor on every call. Otherwise,
+            each fit only uses the paths passed to it.
+
+    Raises:
+        ValueError: If gram_decay is not in (0, 1].
 
     """
 
-    def __init__(self, env_spec, reg_coeff=1e-5, name='LinearFeatureBaseline'):
+    def __init__(self,
+                 env_spec,
+                 reg_coeff=1e-5,
+                 name='LinearFeatureBaseline',
+                 gram_decay=None):
         del env_spec
+        if gram_decay is not None and not 0. < gram_decay <= 1.:
+            raise ValueError('gram_decay must be in (0, 1], but got '
+                             '{}.'.format(gram_decay))
         self._coeffs = None
         self._reg_coeff = reg_coeff
+        self._gram_decay = gram_decay
+        self._gram = None
+        self._moment = None
         self.name = name
         self.lower_bound = -10
         self.upper_bound = 10
@@ -40,22 +63,45 @@ class LinearFeatureBaseline(Baseline):
         """
         self._coeffs = flattened_params
 
-    def _features(self, path):
+    @property
+    def _feature_keys(self):
+        """list[str]: Keys of the paths used to build features."""
+        return ['observations']
+
+    def _features(self, path, lengths=None):
         """Extract features from path.
 
         Args:
-            path (list[dict]): Sample paths.
+            path (dict[numpy.ndarray]): Sample paths, possibly of several
+                episodes concatenated along the first axis.
+            lengths (numpy.ndarray): Length of each episode in path. If None,
+                path holds a single episode.
 
         Returns:
             numpy.ndarray: Extracted features.
 
         """
-        obs = np.clip(path['observations'], self.lower_bound, self.upper_bound)
-        length = len(path['observations'])
-        al = np.arange(length).reshape(-1, 1) / 100.0
-        return np.concatenate(
-            [obs, obs**2, al, al**2, al**3,
-             np.ones((length, 1))], axis=1)
+        obs = path['observations']
+        n, obs_dim = len(obs), obs.shape[1]
+        feats = np.empty((n, 2 * obs_dim + 4))
+        np.clip(obs,
+                self.lower_bound,
+                self.upper_bound,
+                out=feats[:, :obs_dim])
+        np.square(feats[:, :obs_dim], out=feats[:, obs_dim:2 * obs_dim])
+        al = feats[:, 2 * obs_dim]
+        al[:] = np.arange(n)
+        if lengths is not None and len(lengths) > 1:
+            # Time step within each episode.
+            starts = np.cumsum(lengths) - lengths
+            al -= np.repeat(starts, lengths)
+        al /= 100.0
+        np.square(al, out=feats[:, 2 * obs_dim + 1])
+        np.multiply(feats[:, 2 * obs_dim + 1],
+                    al,
+                    out=feats[:, 2 * obs_dim + 2])
+        feats[:, -1] = 1
+        return feats
 
     # pylint: disable=unsubscriptable-object
     def fit(self, paths):
@@ -65,16 +111,34 @@ class LinearFeatureBaseline(Baseline):
             paths (list[dict]): Sample paths.
 
         """
-        featmat = np.concatenate([self._features(path) for path in paths])
-        returns = np.concatenate([path['returns'] for path in paths])
+        path = {
+            key: np.concatenate([p[key] for p in paths])
+            for key in self._feature_keys
+        }
+        lengths = np.array([len(p['returns']) for p in paths])
+        returns = np.concatenate([p['returns'] for p in paths])
+        featmat = self._features(path, lengths)
+        gram = featmat.T.dot(featmat)
+        moment = featmat.T.dot(returns)
+        if self._gram_decay is not None:
+            if self._gram is not None and self._gram.shape == gram.shape:
+                gram += self._gram_decay * self._gram
+                moment += self._gram_decay * self._moment
+            self._gram = gram
+            self._moment = moment
         reg_coeff = self._reg_coeff
+        identity = np.identity(gram.shape[0])
         for _ in range(5):
-            self._coeffs = np.linalg.lstsq(
-                featmat.T.dot(featmat) +
-                reg_coeff * np.identity(featmat.shape[1]),
-                featmat.T.dot(returns),
-                rcond=-1)[0]
-            if not np.any(np.isnan(self._coeffs)):
+            try:
+                factor = scipy.linalg.cho_factor(gram + reg_coeff * identity,
+                                                 check_finite=False)
+                coeffs = scipy.linalg.cho_solve(factor,
+                                                moment,
+                                                check_finite=False)
+            except np.linalg.LinAlgError:
+                coeffs = None
+            if coeffs is not None and np.all(np.isfinite(coeffs)):
+                self._coeffs = coeffs
                 break
             reg_coeff *= 10
 
@@ -91,3 +155,21 @@ class LinearFeatureBaseline(Baseline):
         if self._coeffs is None:
             return np.zeros(len(paths['observations']))
         return self._features(paths).dot(self._coeffs)
+
+    def predict_episodes(self, paths, lengths):
+        """Predict values of several episodes at once.
+
+        Args:
+            paths (dict[numpy.ndarray]): Sample paths of several episodes,
+                with each value concatenated across episodes along the first
+                axis.
+            lengths (numpy.ndarray): Length of each episode.
+
+        Returns:
+            numpy.ndarray: Predicted value of every time step, concatenated
+                across episodes.
+
+        """
+        if self._coeffs is None:
+            return np.zeros(len(paths['observations']))
+        return self._features(paths, lengths).dot(self._coeffs)
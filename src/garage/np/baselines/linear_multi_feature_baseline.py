@@ -12,6 +12,10 @@ class LinearMultiFeatureBaseline(LinearFeatureBaseline):
         reg_coeff (float): Regularization coefficient.
         features (list[str]): Name of features.
         name (str): Name of baseline.
+        gram_decay (float or None): If set, the Gram matrix and feature-return
+            moments are accumulated across calls to :meth:`fit`, with older
+            statistics weighted down by this factor on every call. Otherwise,
+            each fit only uses the paths passed to it.
 
     """
 
@@ -19,26 +23,40 @@ class LinearMultiFeatureBaseline(LinearFeatureBaseline):
                  env_spec,
                  features=None,
                  reg_coeff=1e-5,
-                 name='LinearMultiFeatureBaseline'):
-        super().__init__(env_spec, reg_coeff, name)
+                 name='LinearMultiFeatureBaseline',
+                 gram_decay=None):
+        super().__init__(env_spec, reg_coeff, name, gram_decay=gram_decay)
         features = features or ['observations']
         self._feature_names = features
 
-    def _features(self, path):
+    @property
+    def _feature_keys(self):
+        """list[str]: Keys of the paths used to build features."""
+        return self._feature_names
+
+    def _features(self, path, lengths=None):
         """Extract features from path.
 
         Args:
-            path (list[dict]): Sample paths.
+            path (dict[numpy.ndarray]): Sample paths, possibly of several
+                episodes concatenated along the first axis.
+            lengths (numpy.ndarray): Length of each episode in path. Unused,
+                since these features do not depend on the time step.
 
         Returns:
             numpy.ndarray: Extracted features.
 
         """
-        features = [
-            np.clip(path[feature_name], -10, 10)
-            for feature_name in self._feature_names
-        ]
-        n = len(path['observations'])
-        return np.concatenate(sum([[f, f**2]
-                                   for f in features], []) + [np.ones((n, 1))],
-                              axis=1)
+        del lengths
+        features = [path[feature_name] for feature_name in self._feature_names]
+        n = len(features[0])
+        dims = [f.shape[1] for f in features]
+        feats = np.empty((n, 2 * sum(dims) + 1))
+        start = 0
+        for f, dim in zip(features, dims):
+            np.clip(f, -10, 10, out=feats[:, start:start + dim])
+            np.square(feats[:, start:start + dim],
+                      out=feats[:, start + dim:start + 2 * dim])
+            start += 2 * dim
+        feats[:, -1] = 1
+        return feats
@@ -1,35 +1,137 @@
+"""Minibatch iteration over a fixed set of inputs."""
+import sys
+
 import numpy as np
 
 
 class BatchDataset:
+    """Iterate over shuffled minibatches of a set of inputs.
+
+    Rather than gathering a fresh copy of every input for every minibatch,
+    each input is permuted once per epoch into a contiguous buffer which is
+    allocated on first use and reused across epochs. Minibatches are then
+    yielded as slices (views) of these buffers, so iterating costs one gather
+    per input per epoch, regardless of the number of minibatches.
+
+    Inputs may be :class:`numpy.ndarray` or :class:`torch.Tensor`. Torch
+    tensors are permuted with torch ops on their own device, and never
+    round-trip through NumPy. Tensors which require gradients are gathered
+    out-of-place, so that gradients still flow to the original tensor.
+
+    Note that the yielded minibatches alias the permutation buffers, which
+    are overwritten at the start of the next epoch. Callers which need to
+    keep a minibatch across epochs must copy it.
+
+    Args:
+        inputs (list[numpy.ndarray or torch.Tensor]): Inputs to iterate over.
+            All inputs must have the same size in the first dimension.
+        batch_size (int or None): Size of each minibatch. If None, the inputs
+            are yielded whole, in their original order.
+        extra_inputs (list): Extra inputs, which are appended to every
+            minibatch unchanged.
+
+    """
+
     def __init__(self, inputs, batch_size, extra_inputs=None):
         self._inputs = [i for i in inputs]
         if extra_inputs is None:
             extra_inputs = []
         self._extra_inputs = extra_inputs
         self._batch_size = batch_size
+        self._buffers = [None] * len(self._inputs)
+        self._stale = True
+        self._ids = None
+        self._torch_ids = {}
         if batch_size is not None:
             self._ids = np.arange(self._inputs[0].shape[0])
             self.update()
 
     @property
     def number_batches(self):
+        """int: Number of minibatches yielded per epoch."""
         if self._batch_size is None:
             return 1
         return int(np.ceil(self._inputs[0].shape[0] * 1.0 / self._batch_size))
 
     def iterate(self, update=True):
+        """Iterate over one epoch of minibatches.
+
+        Args:
+            update (bool): If True, reshuffle after the epoch is finished.
+
+        Yields:
+            list: A minibatch of each input, followed by the extra inputs.
+
+        """
         if self._batch_size is None:
             yield list(self._inputs) + list(self._extra_inputs)
         else:
+            if self._stale:
+                self._permute()
             for itr in range(self.number_batches):
                 batch_start = itr * self._batch_size
                 batch_end = (itr + 1) * self._batch_size
-                batch_ids = self._ids[batch_start:batch_end]
-                batch = [d[batch_ids] for d in self._inputs]
-                yield list(batch) + list(self._extra_inputs)
+                batch = [b[batch_start:batch_end] for b in self._buffers]
+                yield batch + list(self._extra_inputs)
             if update:
                 self.update()
 
     def update(self):
+        """Draw a new permutation of the inputs for the next epoch."""
         np.random.shuffle(self._ids)
+        self._stale = True
+
+    def _permute(self):
+        """Gather every input into its buffer, in the current order."""
+        for i, data in enumerate(self._inputs):
+            if _is_torch_tensor(data):
+                self._buffers[i] = self._permute_tensor(data, self._buffers[i])
+            else:
+                if self._buffers[i] is None:
+                    self._buffers[i] = np.empty_like(data, order='C')
+                np.take(data, self._ids, axis=0, out=self._buffers[i])
+        self._stale = False
+
+    def _permute_tensor(self, data, buffer):
+        """Gather a torch.Tensor in the current order.
+
+        Args:
+            data (torch.Tensor): Tensor to permute.
+            buffer (torch.Tensor or None): Buffer from the previous epoch, or
+                None on the first epoch.
+
+        Returns:
+            torch.Tensor: The permuted tensor.
+
+        """
+        import torch  # pylint: disable=import-outside-toplevel
+        ids = self._torch_ids.get(data.device)
+        if ids is None:
+            # On the CPU this shares memory with self._ids, so it follows
+            # every shuffle without further copies.
+            ids = torch.from_numpy(self._ids).to(data.device)
+            self._torch_ids[data.device] = ids
+        elif ids.device.type != 'cpu':
+            ids.copy_(torch.from_numpy(self._ids))
+        if data.requires_grad:
+            return torch.index_select(data, 0, ids)
+        if buffer is None:
+            buffer = torch.empty_like(data,
+                                      memory_format=torch.contiguous_format)
+        return torch.index_select(data, 0, ids, out=buffer)
+
+
+def _is_torch_tensor(data):
+    """Check whether data is a torch.Tensor, without importing torch.
+
+    Args:
+        data (object): Data to check.
+
+    Returns:
+        bool: True if data is a torch.Tensor.
+
+    """
+    if 'torch' not in sys.modules:
+        return False
+    import torch  # pylint: disable=import-outside-toplevel
+    return isinstance(data, torch.Tensor)
@@ -0,0 +1,209 @@
+"""Running estimates of the mean and variance of a stream of values."""
+import copy
+
+import numpy as np
+
+
+class RunningStats:
+    """Running estimate of the elementwise mean and variance of values.
+
+    Two estimators are supported:
+
+    * If `alpha` is None, the cumulative mean and variance of all values seen
+      so far are computed with Welford's algorithm. Cumulative statistics can
+      be merged with Chan's parallel algorithm, so statistics gathered in
+      several processes can be combined exactly, either with :meth:`merge`
+      or with `+`.
+    * Otherwise, an exponential moving average with update rate `alpha` is
+      used, starting from a mean of 0 and a variance of 1.
+
+    All updates happen in place, in buffers allocated once, so
+    :meth:`update` can be called every time step.
+
+    Args:
+        shape (tuple[int] or int): Shape of a single value.
+        alpha (float or None): Update rate of the exponential moving average,
+            or None to compute cumulative statistics.
+
+    Raises:
+        ValueError: If alpha is not in (0, 1].
+
+    """
+
+    def __init__(self, shape=(), alpha=None):
+        if alpha is not None and not 0. < alpha <= 1.:
+            raise ValueError('alpha must be in (0, 1], but got '
+                             '{}.'.format(alpha))
+        self._alpha = alpha
+        self.count = 0
+        self._mean = np.zeros(shape)
+        if alpha is None:
+            # Sum of squared differences from the mean.
+            self._m2 = np.zeros(shape)
+        else:
+            self._var = np.ones(shape)
+        self._delta = np.zeros(shape)
+        self._buf = np.zeros(shape)
+
+    @property
+    def cumulative(self):
+        """bool: Whether these are cumulative statistics, which can be merged.
+        """
+        return self._alpha is None
+
+    @property
+    def mean(self):
+        """numpy.ndarray: Estimated mean."""
+        return self._mean
+
+    @property
+    def var(self):
+        """numpy.ndarray: Estimated variance. 1 before any value is seen."""
+        if self._alpha is not None:
+            return self._var
+        if self.count == 0:
+            return np.ones_like(self._m2)
+        return self._m2 / self.count
+
+    @property
+    def std(self):
+        """numpy.ndarray: Estimated standard deviation."""
+        return np.sqrt(self.var)
+
+    def update(self, x):
+        """Update the statistics with a single value.
+
+        Args:
+            x (numpy.ndarray or float): New value.
+
+        """
+        self.count += 1
+        if self._alpha is None:
+            np.subtract(x, self._mean, out=self._delta)
+            np.multiply(self._delta, 1. / self.count, out=self._buf)
+            self._mean += self._buf
+            np.subtract(x, self._mean, out=self._buf)
+            self._buf *= self._delta
+            self._m2 += self._buf
+        else:
+            self._mean *= 1 - self._alpha
+            np.multiply(x, self._alpha, out=self._buf)
+            self._mean += self._buf
+            np.subtract(x, self._mean, out=self._buf)
+            np.square(self._buf, out=self._buf)
+            self._buf *= self._alpha
+            self._var *= 1 - self._alpha
+            self._var += self._buf
+
+    def update_batch(self, xs):
+        """Update the statistics with a batch of values.
+
+        Args:
+            xs (numpy.ndarray): New values, stacked along the first axis.
+
+        """
+        xs = np.asarray(xs)
+        if len(xs) == 0:
+            return
+        if self._alpha is not None:
+            for x in xs:
+                self.update(x)
+            return
+        batch_mean = xs.mean(axis=0)
+        batch_m2 = np.square(xs - batch_mean).sum(axis=0)
+        self._merge_moments(len(xs), batch_mean, batch_m2)
+
+    def normalize(self, x, out=None, epsilon=1e-8):
+        """Normalize a value with the current statistics.
+
+        Args:
+            x (numpy.ndarray or float): Value, or batch of values, to
+                normalize.
+            out (numpy.ndarray or None): Array to write the result to.
+            epsilon (float): Added to the standard deviation to avoid
+                dividing by zero.
+
+        Returns:
+            numpy.ndarray: The normalized value.
+
+        """
+        std = self._buf
+        if self._alpha is not None:
+            np.sqrt(self._var, out=std)
+        elif self.count == 0:
+            std.fill(1.)
+        else:
+            np.divide(self._m2, self.count, out=std)
+            np.sqrt(std, out=std)
+        std += epsilon
+        if out is None:
+            return (x - self._mean) / std
+        np.subtract(x, self._mean, out=out)
+        return np.divide(out, std, out=out)
+
+    def merge(self, other):
+        """Merge cumulative statistics gathered elsewhere into these.
+
+        Args:
+            other (RunningStats): Statistics of other values.
+
+        Raises:
+            ValueError: If either statistics are not cumulative.
+
+        """
+        if not (self.cumulative and other.cumulative):
+            raise ValueError('Only cumulative statistics (alpha=None) can be '
+                             'merged.')
+        # pylint: disable=protected-access
+        self._merge_moments(other.count, other._mean, other._m2)
+
+    def reset(self):
+        """Forget all values seen so far."""
+        self.count = 0
+        self._mean.fill(0.)
+        if self._alpha is None:
+            self._m2.fill(0.)
+        else:
+            self._var.fill(1.)
+
+    def _merge_moments(self, count, mean, m2):
+        """Merge moments of other values into these statistics.
+
+        Args:
+            count (int): Number of other values.
+            mean (numpy.ndarray): Mean of other values.
+            m2 (numpy.ndarray): Sum of squared differences from the mean of
+                other values.
+
+        """
+        if count == 0:
+            return
+        total = self.count + count
+        np.subtract(mean, self._mean, out=self._delta)
+        np.square(self._delta, out=self._buf)
+        self._buf *= self.count * count / total
+        self._m2 += m2
+        self._m2 += self._buf
+        self._delta *= count / total
+        self._mean += self._delta
+        self.count = total
+
+    def __add__(self, other):
+        """Merge two cumulative statistics into new statistics.
+
+        Adding 0 returns a copy, so statistics can be summed with `sum` or
+        `collections.Counter`.
+
+        Args:
+            other (RunningStats or int): Statistics to merge, or 0.
+
+        Returns:
+            RunningStats: The merged statistics.
+
+        """
+        merged = copy.deepcopy(self)
+        if not (isinstance(other, int) and other == 0):
+            merged.merge(other)
+        return merged
+
+    __radd__ = __add__
@@ -255,3 +255,25 @@ class PathBuffer:
 
         """
         return int(self._transitions_stored)
+
+    def __log_json__(self):
+        """Summarize the buffer in experiment logs, instead of its contents.
+
+        Returns:
+            dict: Capacity, numbers of transitions and episodes stored, and
+                the shape and dtype of the array of each key.
+
+        """
+        return {
+            'capacity': self._capacity,
+            'n_transitions_stored': self.n_transitions_stored,
+            'n_episodes_stored': len(self._path_segments),
+            'env_spec': self._env_spec,
+            'buffer': {
+                key: {
+                    'shape': buf_arr.shape,
+                    'dtype': str(buf_arr.dtype)
+                }
+                for key, buf_arr in self._buffer.items()
+            },
+        }
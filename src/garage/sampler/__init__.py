@@ -1,37 +1,52 @@
 """Samplers which run agents in environments."""
-# yapf: disable
-from garage.sampler._dtypes import InProgressEpisode
-from garage.sampler._functions import _apply_env_update
-from garage.sampler.default_worker import DefaultWorker
-from garage.sampler.env_update import (EnvUpdate,
-                                       ExistingEnvUpdate,
-                                       NewEnvUpdate,
-                                       SetTaskUpdate)
-from garage.sampler.fragment_worker import FragmentWorker
-from garage.sampler.local_sampler import LocalSampler
-from garage.sampler.multiprocessing_sampler import MultiprocessingSampler
-from garage.sampler.ray_sampler import RaySampler
-from garage.sampler.sampler import Sampler
-from garage.sampler.vec_worker import VecWorker
-from garage.sampler.worker import Worker
-from garage.sampler.worker_factory import WorkerFactory
-
-# yapf: enable
+from garage._lazy import lazy_exports
 
 __all__ = [
     '_apply_env_update',
+    '_collect_env_stats',
     'InProgressEpisode',
     'FragmentWorker',
     'Sampler',
     'LocalSampler',
     'RaySampler',
     'MultiprocessingSampler',
+    'SamplerPool',
+    'PooledSampler',
     'VecWorker',
     'WorkerFactory',
     'Worker',
     'DefaultWorker',
+    'EnvCache',
+    'EnvFactory',
     'EnvUpdate',
+    'EnvStatsUpdate',
     'NewEnvUpdate',
     'SetTaskUpdate',
     'ExistingEnvUpdate',
+    'TaskScheduler',
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'InProgressEpisode': 'garage.sampler._dtypes',
+    '_apply_env_update': 'garage.sampler._functions',
+    '_collect_env_stats': 'garage.sampler._functions',
+    'DefaultWorker': 'garage.sampler.default_worker',
+    'EnvCache': 'garage.sampler.env_cache',
+    'EnvFactory': 'garage.sampler.env_update',
+    'EnvStatsUpdate': 'garage.sampler.env_update',
+    'EnvUpdate': 'garage.sampler.env_update',
+    'ExistingEnvUpdate': 'garage.sampler.env_update',
+    'NewEnvUpdate': 'garage.sampler.env_update',
+    'SetTaskUpdate': 'garage.sampler.env_update',
+    'FragmentWorker': 'garage.sampler.fragment_worker',
+    'LocalSampler': 'garage.sampler.local_sampler',
+    'MultiprocessingSampler': 'garage.sampler.multiprocessing_sampler',
+    'RaySampler': 'garage.sampler.ray_sampler',
+    'Sampler': 'garage.sampler.sampler',
+    'PooledSampler': 'garage.sampler.sampler_pool',
+    'SamplerPool': 'garage.sampler.sampler_pool',
+    'TaskScheduler': 'garage.sampler.task_scheduler',
+    'VecWorker': 'garage.sampler.vec_worker',
+    'Worker': 'garage.sampler.worker',
+    'WorkerFactory': 'garage.sampler.worker_factory',
+})
@@ -59,7 +59,20 @@ class InProgressEpisode:
 
         """
         es = self.env.step(action)
+        self.add_step(es, agent_info)
+        return es.observation
+
+    def add_step(self, es, agent_info):
+        """Record a step of the environment taken elsewhere.
+
+        Used when the environment is stepped together with the environments
+        of other episodes, such as by a :class:`~VecMultiEnvWrapper`.
+
+        Args:
+            es (EnvStep): The environment step.
+            agent_info (dict[str, np.ndarray]): Extra agent information.
 
+        """
         self.observations.append(es.observation)
         self.rewards.append(es.reward)
         self.actions.append(es.action)
@@ -68,7 +81,6 @@ class InProgressEpisode:
         for k, v in es.env_info.items():
             self.env_infos[k].append(v)
         self.step_types.append(es.step_type)
-        return es.observation
 
     def to_batch(self):
         """Convert this in-progress episode into a EpisodeBatch.
@@ -1,9 +1,14 @@
 """Functions used by multiple Samplers or Workers."""
-from garage import Environment
-from garage.sampler.env_update import EnvUpdate
+import collections
 
+import numpy as np
 
-def _apply_env_update(old_env, env_update):
+from garage import EpisodeBatch, Environment
+from garage.experiment import timing
+from garage.sampler.env_update import EnvUpdate, SetTaskUpdate
+
+
+def _apply_env_update(old_env, env_update, env_cache=None):
     """Use any non-None env_update as a new environment.
 
     A simple env update function. If env_update is not None, it should be
@@ -17,6 +22,9 @@ def _apply_env_update(old_env, env_update):
         env_update (Environment or EnvUpdate or None): The environment to
             replace the existing env with. Note that other implementations
             of `Worker` may take different types for this parameter.
+        env_cache (EnvCache or None): Cache of constructed environments, which
+            :class:`SetTaskUpdate` uses when switching between environment
+            types.
 
     Returns:
         Environment: The updated environment (may be a different object from
@@ -28,7 +36,9 @@ def _apply_env_update(old_env, env_update):
 
     """
     if env_update is not None:
-        if isinstance(env_update, EnvUpdate):
+        if isinstance(env_update, SetTaskUpdate):
+            return env_update(old_env, env_cache=env_cache), True
+        elif isinstance(env_update, EnvUpdate):
             return env_update(old_env), True
         elif isinstance(env_update, Environment):
             if old_env is not None:
@@ -38,3 +48,207 @@ def _apply_env_update(old_env, env_update):
             raise TypeError('Unknown environment update type.')
     else:
         return old_env, False
+
+
+def _collect_env_stats(envs):
+    """Collect running statistics gathered by environments.
+
+    Args:
+        envs (list[Environment or None]): Environments of a worker.
+
+    Returns:
+        dict[str, RunningStats]: Statistics gathered by the environments since
+            the last call, merged across environments, by name.
+
+    """
+    stats = collections.Counter()
+    for env in envs:
+        pop_stats = getattr(env, 'pop_normalization_stats', None)
+        if pop_stats is not None:
+            stats.update(pop_stats())
+    return dict(stats)
+
+
+def _collect_profile_stats(busy_seconds, idle_seconds):
+    """Collect the profile of a sampler worker process since the last call.
+
+    Workers are profiled when timing is enabled in the sampling process,
+    which enables it in the worker with :func:`timing.configure_worker`.
+
+    Args:
+        busy_seconds (float): Seconds the worker spent sampling since the
+            last call.
+        idle_seconds (float): Seconds the worker spent waiting for the
+            sampler since the last call.
+
+    Returns:
+        dict[str, float or StackSamples]: Busy and idle time, the timers of
+            the worker, as "Worker/Timing/<timer>", and its sampled stacks,
+            as "Worker/Stacks". Empty if the worker is not profiled.
+
+    """
+    if not timing.is_worker():
+        return {}
+    stats = {
+        'Worker/' + name: value
+        for name, value in timing.collect_stats().items()
+    }
+    stats['Worker/BusySeconds'] = busy_seconds
+    stats['Worker/IdleSeconds'] = idle_seconds
+    stacks = timing.collect_stacks()
+    if stacks:
+        stats['Worker/Stacks'] = stacks
+    return stats
+
+
+def _merge_worker_stats(worker_stats):
+    """Sum the statistics of several workers, and summarize their profiles.
+
+    Args:
+        worker_stats (dict[int, collections.Counter]): Statistics gathered
+            by each worker, by worker number.
+
+    Returns:
+        dict[str, object]: Statistics summed across workers, by name. If the
+            workers were profiled, the fraction of time each worker spent
+            sampling is added as "Worker/<number>/Utilization", the mean
+            over workers as "Worker/Utilization", and the fraction of
+            sampling time spent in the agent rather than the environment as
+            "Worker/AgentFraction". Sampled stacks are passed to
+            :func:`timing.add_stacks`, rather than returned.
+
+    """
+    stats = collections.Counter()
+    utilizations = []
+    for worker_number, stats_of_worker in sorted(worker_stats.items()):
+        stats.update(stats_of_worker)
+        busy = stats_of_worker.get('Worker/BusySeconds', 0.)
+        idle = stats_of_worker.get('Worker/IdleSeconds', 0.)
+        if busy + idle > 0:
+            utilization = busy / (busy + idle)
+            stats['Worker/{}/Utilization'.format(worker_number)] = utilization
+            utilizations.append(utilization)
+    if utilizations:
+        stats['Worker/Utilization'] = np.mean(utilizations)
+    agent_seconds = sum(value for name, value in stats.items()
+                        if name.endswith('/GetAction'))
+    env_seconds = sum(value for name, value in stats.items()
+                      if name.endswith('/EnvStep'))
+    if agent_seconds + env_seconds > 0:
+        stats['Worker/AgentFraction'] = (agent_seconds /
+                                         (agent_seconds + env_seconds))
+    stacks = stats.pop('Worker/Stacks', None)
+    if stacks:
+        timing.add_stacks(stacks)
+    return dict(stats)
+
+
+def _obtain_task_episodes(sampler,
+                          scheduler,
+                          n_eps_per_task,
+                          agent_update,
+                          env_updates,
+                          min_steps_per_task=0):
+    """Sample a number of episodes from each of several tasks.
+
+    Tasks are assigned to workers by a :class:`TaskScheduler`, and each
+    round of tasks is sampled by a single call to
+    `sampler.obtain_exact_episodes`. If the scheduler has a single worker,
+    each task is sampled by all of the sampler's workers.
+
+    Args:
+        sampler (Sampler): Sampler to sample with.
+        scheduler (TaskScheduler): Scheduler of the sampler's workers.
+        n_eps_per_task (int): Minimum number of episodes to gather from each
+            task.
+        agent_update (object): Agent update to sample every task with. If a
+            list is passed in, it must have the same length as env_updates,
+            and holds the agent update of each task.
+        env_updates (list[EnvUpdate]): Environment update of each task.
+        min_steps_per_task (int): Minimum number of steps to gather from each
+            task. Episodes are added to a task one at a time until it has
+            this many steps.
+
+    Raises:
+        ValueError: If a list of agent updates does not match env_updates.
+
+    Returns:
+        EpisodeBatch: Batch of episodes, ordered by task, with the index of
+            the task of each episode in `episode_infos['task_index']`.
+
+    """
+    if isinstance(agent_update, list):
+        if len(agent_update) != len(env_updates):
+            raise ValueError('If a list of agent updates is passed, there '
+                             'must be one for each task ({}), but received '
+                             '{}.'.format(len(env_updates),
+                                          len(agent_update)))
+        agent_updates = agent_update
+    else:
+        agent_updates = [agent_update] * len(env_updates)
+    task_episodes = [[] for _ in env_updates]
+    n_kept = [None] * len(env_updates)
+    pending = list(range(len(env_updates)))
+    n_eps_per_round = n_eps_per_task
+    while pending:
+        rounds = scheduler.schedule([env_updates[task] for task in pending])
+        for assignment in rounds:
+            assignment = [pending[task] for task in assignment]
+            n_eps = -(-n_eps_per_round //
+                      min(collections.Counter(assignment).values()))
+            agent_update = [agent_updates[task] for task in assignment]
+            env_update = [env_updates[task] for task in assignment]
+            if len(assignment) == 1:
+                # Every worker samples the task, so the scheduler need not
+                # know the sampler's number of workers.
+                agent_update, env_update = agent_update[0], env_update[0]
+            episodes = sampler.obtain_exact_episodes(
+                n_eps, agent_update=agent_update,
+                env_update=env_update).split()
+            for worker, task in enumerate(assignment):
+                task_episodes[task].extend(
+                    episodes[worker * n_eps:(worker + 1) * n_eps])
+        for task in pending:
+            n_kept[task] = _n_episodes_kept(task_episodes[task],
+                                            n_eps_per_task,
+                                            min_steps_per_task)
+        pending = [task for task in pending if n_kept[task] is None]
+        n_eps_per_round = 1
+    batches = []
+    for task, episodes in enumerate(task_episodes):
+        batch = EpisodeBatch.concatenate(*episodes[:n_kept[task]])
+        episode_infos = dict(batch.episode_infos_by_episode)
+        episode_infos['task_index'] = np.full(n_kept[task], task)
+        batches.append(
+            EpisodeBatch(env_spec=batch.env_spec,
+                         episode_infos=episode_infos,
+                         observations=batch.observations,
+                         last_observations=batch.last_observations,
+                         actions=batch.actions,
+                         rewards=batch.rewards,
+                         env_infos=batch.env_infos,
+                         agent_infos=batch.agent_infos,
+                         step_types=batch.step_types,
+                         lengths=batch.lengths))
+    return EpisodeBatch.concatenate(*batches)
+
+
+def _n_episodes_kept(episodes, n_eps, min_steps):
+    """Count the episodes of a task to keep.
+
+    Args:
+        episodes (list[EpisodeBatch]): Episodes sampled from the task, in
+            order.
+        n_eps (int): Minimum number of episodes to keep.
+        min_steps (int): Minimum number of steps to keep.
+
+    Returns:
+        int or None: Number of episodes to keep, or None if more are needed.
+
+    """
+    steps = 0
+    for n_kept, episode in enumerate(episodes, 1):
+        steps += len(episode.actions)
+        if n_kept >= n_eps and steps >= min_steps:
+            return n_kept
+    return None
@@ -1,13 +1,20 @@
 """Default Worker class."""
 from collections import defaultdict
+import time
 
 import numpy as np
 
 from garage import EpisodeBatch, StepType
-from garage.experiment import deterministic
-from garage.sampler import _apply_env_update
+from garage.experiment import deterministic, timing
+from garage.sampler import _apply_env_update, _collect_env_stats
+from garage.sampler.env_cache import EnvCache
 from garage.sampler.worker import Worker
 
+# Timers of the stages of each step. They are not traced, since they are used
+# every step.
+_GET_ACTION_TIMER = timing.timed('GetAction', trace=False)
+_ENV_STEP_TIMER = timing.timed('EnvStep', trace=False)
+
 
 class DefaultWorker(Worker):
     """Initialize a worker.
@@ -19,6 +26,19 @@ class DefaultWorker(Worker):
         worker_number (int): The number of the worker where this update is
             occurring. This argument is used to set a different seed for each
             worker.
+        env_cache_size (int): Number of environments to keep when switching
+            between environment types with a :class:`SetTaskUpdate`, so that
+            switching back does not construct a new environment. If 0, old
+            environments are closed instead.
+
+    Besides the statistics of its environment cache, a worker reports the
+    time it spent constructing and updating environments, including its
+    initial environment, as `Worker/EnvSetupSeconds`.
+
+    If timing is enabled, the time spent getting actions from the agent,
+    stepping the environment and collecting episodes is timed, as
+    "GetAction", "EnvStep" and "CollectEpisode". See
+    :mod:`garage.experiment.timing`.
 
     Attributes:
         agent (Policy or None): The worker's agent.
@@ -26,17 +46,22 @@ class DefaultWorker(Worker):
 
     """
 
+    DEFAULT_ENV_CACHE_SIZE = 4
+
     def __init__(
             self,
             *,  # Require passing by keyword, since everything's an int.
             seed,
             max_episode_length,
-            worker_number):
+            worker_number,
+            env_cache_size=DEFAULT_ENV_CACHE_SIZE):
         super().__init__(seed=seed,
                          max_episode_length=max_episode_length,
                          worker_number=worker_number)
         self.agent = None
         self.env = None
+        self._env_cache = EnvCache(env_cache_size)
+        self._env_setup_time = 0.
         self._env_steps = []
         self._observations = []
         self._last_observations = []
@@ -86,7 +111,45 @@ class DefaultWorker(Worker):
             TypeError: If env_update is not one of the documented types.
 
         """
-        self.env, _ = _apply_env_update(self.env, env_update)
+        self.env, _ = self._update_one_env(self.env, env_update)
+
+    def _update_one_env(self, env, env_update):
+        """Apply an update to one environment, timing how long it takes.
+
+        Args:
+            env (Environment or None): Environment to update.
+            env_update (Environment or EnvUpdate or None): The update.
+
+        Returns:
+            Environment: The updated environment.
+            bool: True if an update happened.
+
+        """
+        if env_update is None:
+            return env, False
+        start = time.perf_counter()
+        env, updated = _apply_env_update(env, env_update, self._env_cache)
+        self._env_setup_time += time.perf_counter() - start
+        return env, updated
+
+    def _collect_worker_stats(self, envs):
+        """Collect statistics common to all workers since the last call.
+
+        Args:
+            envs (list[Environment or None]): Environments of the worker.
+
+        Returns:
+            dict[str, float or RunningStats]: Hits, misses and evictions of
+                the worker's environment cache, time spent setting up
+                environments, and running statistics gathered by the
+                environments.
+
+        """
+        stats = self._env_cache.collect_stats()
+        stats['Worker/EnvSetupSeconds'] = self._env_setup_time
+        self._env_setup_time = 0.
+        stats.update(_collect_env_stats(envs))
+        return stats
 
     def start_episode(self):
         """Begin a new episode."""
@@ -106,8 +169,10 @@ class DefaultWorker(Worker):
 
         """
         if self._eps_length < self._max_episode_length:
-            a, agent_info = self.agent.get_action(self._prev_obs)
-            es = self.env.step(a)
+            with _GET_ACTION_TIMER:
+                a, agent_info = self.agent.get_action(self._prev_obs)
+            with _ENV_STEP_TIMER:
+                es = self.env.step(a)
             self._observations.append(self._prev_obs)
             self._env_steps.append(es)
             for k, v in agent_info.items():
@@ -121,6 +186,7 @@ class DefaultWorker(Worker):
         self._last_observations.append(self._prev_obs)
         return True
 
+    @timing.timed('CollectEpisode')
     def collect_episode(self):
         """Collect the current episode, clearing the internal buffer.
 
@@ -173,6 +239,7 @@ class DefaultWorker(Worker):
                             agent_infos=dict(agent_infos),
                             lengths=np.asarray(lengths, dtype='i'))
 
+    @timing.timed('Rollout')
     def rollout(self):
         """Sample a single episode of the agent in the environment.
 
@@ -185,6 +252,18 @@ class DefaultWorker(Worker):
             pass
         return self.collect_episode()
 
+    def collect_stats(self):
+        """Collect statistics gathered by the worker since the last call.
+
+        Returns:
+            dict[str, float or RunningStats]: Hits, misses and evictions of
+                the worker's environment cache, time spent setting up its
+                environment, and running statistics gathered by it.
+
+        """
+        return self._collect_worker_stats([self.env])
+
     def shutdown(self):
         """Close the worker's environment."""
         self.env.close()
+        self._env_cache.close()
@@ -0,0 +1,99 @@
+"""A bounded cache of constructed environments."""
+import collections
+
+
+class EnvCache:
+    """A least-recently-used cache of constructed environments.
+
+    Workers keep environments they switch away from in this cache, so that
+    switching back to an environment of the same type only needs a call to
+    `set_task`, rather than constructing a new environment. Environments are
+    removed from the cache while they are in use, so a cached environment is
+    never shared.
+
+    Args:
+        capacity (int): Maximum number of environments to keep. Environments
+            evicted from a full cache are closed. If 0, environments are
+            closed as soon as they are put in the cache.
+
+    Raises:
+        ValueError: If capacity is negative.
+
+    """
+
+    def __init__(self, capacity):
+        if capacity < 0:
+            raise ValueError('capacity must be non-negative, but got '
+                             '{}.'.format(capacity))
+        self._capacity = capacity
+        self._envs = collections.OrderedDict()
+        self._stats = collections.Counter()
+
+    def __len__(self):
+        """Get the number of cached environments.
+
+        Returns:
+            int: Number of cached environments.
+
+        """
+        return sum(len(envs) for envs in self._envs.values())
+
+    def pop(self, key):
+        """Take the most recently cached environment with a key.
+
+        Args:
+            key (object): Hashable key of the environment, such as its type.
+
+        Returns:
+            Environment or None: The environment, or None if no environment
+                with this key is cached.
+
+        """
+        envs = self._envs.get(key)
+        if not envs:
+            self._stats['Misses'] += 1
+            return None
+        self._stats['Hits'] += 1
+        env = envs.pop()
+        if not envs:
+            del self._envs[key]
+        return env
+
+    def put(self, key, env):
+        """Cache an environment which is no longer in use.
+
+        Args:
+            key (object): Hashable key of the environment, such as its type.
+            env (Environment): Environment to cache.
+
+        """
+        self._envs.setdefault(key, []).append(env)
+        self._envs.move_to_end(key)
+        while len(self) > self._capacity:
+            # Evict the least recently used environment.
+            oldest_key, oldest = next(iter(self._envs.items()))
+            oldest.pop(0).close()
+            if not oldest:
+                del self._envs[oldest_key]
+            self._stats['Evictions'] += 1
+
+    def collect_stats(self):
+        """Collect cache statistics gathered since the last call.
+
+        Returns:
+            dict[str, int]: Number of cache hits, misses and evictions.
+
+        """
+        stats = {
+            'EnvCache/' + name: self._stats[name]
+            for name in ('Hits', 'Misses', 'Evictions')
+        }
+        self._stats.clear()
+        return stats
+
+    def close(self):
+        """Close all cached environments."""
+        for envs in self._envs.values():
+            for env in envs:
+                env.close()
+        self._envs.clear()
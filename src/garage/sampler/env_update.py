@@ -62,6 +62,49 @@ class NewEnvUpdate(EnvUpdate):
         return self._env_constructor()
 
 
+class EnvFactory(EnvUpdate):
+    """:class:`~EnvUpdate` that constructs an environment from its arguments.
+
+    Pass an EnvFactory instead of an environment instance to a sampler or to
+    :meth:`~garage.trainer.Trainer.setup`. Only the constructor and its
+    arguments are copied or pickled, and each worker constructs its own
+    environment, so workers of a
+    :class:`~garage.sampler.MultiprocessingSampler` or
+    :class:`~garage.sampler.RaySampler` construct their environments in
+    parallel. This is much faster than copying environments which are slow to
+    pickle, such as MuJoCo or dm_control environments.
+
+    Args:
+        env_constructor (Callable[..., Environment]): Callable that constructs
+            an environment, such as an environment type. Must be picklable.
+        *args: Positional arguments to env_constructor.
+        **kwargs: Keyword arguments to env_constructor.
+
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, env_constructor, *args, **kwargs):
+        self._env_constructor = env_constructor
+        self._args = args
+        self._kwargs = kwargs
+
+    def __call__(self, old_env=None):
+        """Construct a new environment.
+
+        Args:
+            old_env (Environment or None): Previous environment, which is
+                closed.
+
+        Returns:
+            Environment: The new environment.
+
+        """
+        if old_env is not None:
+            old_env.close()
+        return self._env_constructor(*self._args, **self._kwargs)
+
+
 class SetTaskUpdate(EnvUpdate):
     """:class:`~EnvUpdate` that calls set_task with the provided task.
 
@@ -83,6 +126,11 @@ class SetTaskUpdate(EnvUpdate):
         self._task = task
         self._wrapper_cons = wrapper_constructor
 
+    @property
+    def env_type(self):
+        """type: Type of environment this update sets the task of."""
+        return self._env_type
+
     def _make_env(self):
         """Construct the environment, wrapping if necessary.
 
@@ -96,12 +144,18 @@ class SetTaskUpdate(EnvUpdate):
             env = self._wrapper_cons(env, self._task)
         return env
 
-    def __call__(self, old_env=None):
+    def __call__(self, old_env=None, env_cache=None):
         """Update an environment.
 
         Args:
             old_env (Environment or None): Previous environment. Should not be
                 used after being passed in, and should not be closed.
+            env_cache (EnvCache or None): If given, an old environment of a
+                different type is put in this cache instead of being closed,
+                and environments are taken from it, rather than constructed,
+                whenever possible. Like an old environment of the right type,
+                a cached environment is reused with its wrappers, and only has
+                its task set.
 
         Returns:
             Environment: The new, updated environment.
@@ -109,15 +163,24 @@ class SetTaskUpdate(EnvUpdate):
         """
         if old_env is None:
             return self._make_env()
-        elif not isinstance(getattr(old_env, 'unwrapped', old_env),
-                            self._env_type):
+        unwrapped = getattr(old_env, 'unwrapped', old_env)
+        if isinstance(unwrapped, self._env_type):
+            old_env.set_task(self._task)
+            return old_env
+        if env_cache is None:
             warnings.warn('SetTaskEnvUpdate is closing an environment. This '
                           'may indicate a very slow TaskSampler setup.')
             old_env.close()
             return self._make_env()
+        # Take the new environment out of the cache before caching the old
+        # one, so that a full cache does not evict the environment we need.
+        env = env_cache.pop(self._env_type)
+        if env is None:
+            env = self._make_env()
         else:
-            old_env.set_task(self._task)
-            return old_env
+            env.set_task(self._task)
+        env_cache.put(type(unwrapped), old_env)
+        return env
 
 
 class ExistingEnvUpdate(EnvUpdate):
@@ -157,3 +220,38 @@ class ExistingEnvUpdate(EnvUpdate):
                       'method of transmitting environments to other '
                       'processes.')
         return self.__dict__
+
+
+class EnvStatsUpdate(EnvUpdate):
+    """:class:`~EnvUpdate` that synchronizes running environment statistics.
+
+    Environments which estimate statistics of their observations or rewards
+    while sampling, such as :class:`~garage.envs.normalized_env.NormalizedEnv`
+    with cumulative statistics, report statistics gathered since the last
+    report through the workers' `collect_stats`. This update sends the merged
+    statistics of all workers back to each worker's environment, which is
+    otherwise left as it is.
+
+    Args:
+        stats (dict[str, RunningStats]): Merged statistics, by name.
+
+    """
+
+    def __init__(self, stats):
+        self._stats = stats
+
+    def __call__(self, old_env=None):
+        """Update an environment.
+
+        Args:
+            old_env (Environment or None): Previous environment. Environments
+                without running statistics are left unchanged.
+
+        Returns:
+            Environment: The same environment, with synchronized statistics.
+
+        """
+        sync = getattr(old_env, 'sync_normalization_stats', None)
+        if sync is not None:
+            sync(self._stats)
+        return old_env
@@ -4,8 +4,11 @@ import copy
 import numpy as np
 
 from garage import EpisodeBatch, StepType
-from garage.sampler import _apply_env_update, InProgressEpisode
-from garage.sampler.default_worker import DefaultWorker
+from garage.envs import BatchEnvironment
+from garage.experiment import timing
+from garage.sampler import InProgressEpisode
+from garage.sampler.default_worker import (_ENV_STEP_TIMER,
+                                           _GET_ACTION_TIMER, DefaultWorker)
 
 
 class FragmentWorker(DefaultWorker):
@@ -13,6 +16,10 @@ class FragmentWorker(DefaultWorker):
 
     Useful for off-policy RL.
 
+    If the worker is sent a :class:`~BatchEnvironment`, such as a
+    :class:`~VecMultiEnvWrapper` with one task per environment copy, all
+    copies are stepped by a single call to it.
+
     Args:
         seed (int): The seed to use to intialize random number generators.
         max_episode_length (int or float): The maximum length of episodes which
@@ -25,6 +32,8 @@ class FragmentWorker(DefaultWorker):
         timesteps_per_call (int): Maximum number of timesteps to gather per env
             per call to the worker. Defaults to 1 (i.e. gather 1 timestep per
             env each call, or n_envs timesteps in total each call).
+        env_cache_size (int): Number of environments to keep when switching
+            between environment types, shared by all environment copies.
 
     """
 
@@ -36,14 +45,17 @@ class FragmentWorker(DefaultWorker):
                  max_episode_length,
                  worker_number,
                  n_envs=DEFAULT_N_ENVS,
-                 timesteps_per_call=1):
+                 timesteps_per_call=1,
+                 env_cache_size=DefaultWorker.DEFAULT_ENV_CACHE_SIZE):
         super().__init__(seed=seed,
                          max_episode_length=max_episode_length,
-                         worker_number=worker_number)
+                         worker_number=worker_number,
+                         env_cache_size=env_cache_size)
         self._n_envs = n_envs
         self._timesteps_per_call = timesteps_per_call
         self._needs_env_reset = True
         self._envs = [None] * n_envs
+        self._vec_env = None
         self._agents = [None] * n_envs
         self._episode_lengths = [0] * self._n_envs
         self._complete_fragments = []
@@ -55,17 +67,32 @@ class FragmentWorker(DefaultWorker):
 
         If passed a list (*inside* this list passed to the Sampler itself),
         distributes the environments across the "vectorization" dimension.
+        If passed a :class:`~BatchEnvironment`, each environment copy is one
+        of its copies.
 
         Args:
-            env_update(Environment or EnvUpdate or None): The environment to
-                replace the existing env with. Note that other implementations
-                of `Worker` may take different types for this parameter.
+            env_update(Environment or EnvUpdate or BatchEnvironment or None):
+                The environment to replace the existing env with. Note that
+                other implementations of `Worker` may take different types for
+                this parameter.
 
         Raises:
             TypeError: If env_update is not one of the documented types.
-            ValueError: If the wrong number of updates is passed.
+            ValueError: If the wrong number of updates or copies is passed.
 
         """
+        if isinstance(env_update, BatchEnvironment):
+            if env_update.n_envs != self._n_envs:
+                raise ValueError('A BatchEnvironment must have exactly '
+                                 'n_envs ({}) copies, but it has {} '
+                                 'copies.'.format(self._n_envs,
+                                                  env_update.n_envs))
+            if env_update is not self._vec_env:
+                self._close_envs()
+            self._vec_env = env_update
+            self._envs = list(env_update.envs)
+            self._needs_env_reset = True
+            return
         if isinstance(env_update, list):
             if len(env_update) != self._n_envs:
                 raise ValueError('If separate environments are passed for '
@@ -78,8 +105,11 @@ class FragmentWorker(DefaultWorker):
                 copy.deepcopy(env_update) for _ in range(self._n_envs)
             ]
         if env_update:
+            if self._vec_env is not None:
+                # The copies belong to the batch environment.
+                self._close_envs()
             for env_index, env_up in enumerate(env_update):
-                self._envs[env_index], up = _apply_env_update(
+                self._envs[env_index], up = self._update_one_env(
                     self._envs[env_index], env_up)
                 self._needs_env_reset |= up
 
@@ -89,7 +119,42 @@ class FragmentWorker(DefaultWorker):
             self._needs_env_reset = False
             self.agent.reset([True] * len(self._envs))
             self._episode_lengths = [0] * len(self._envs)
-            self._fragments = [InProgressEpisode(env) for env in self._envs]
+            if self._vec_env is not None:
+                observations, episode_infos = self._vec_env.reset()
+                self._fragments = [
+                    InProgressEpisode(self._vec_env, obs, episode_info)
+                    for obs, episode_info in zip(observations, episode_infos)
+                ]
+            else:
+                self._fragments = [
+                    InProgressEpisode(env) for env in self._envs
+                ]
+
+    def _new_fragment(self, env_index):
+        """Start a new episode in a single environment copy.
+
+        Args:
+            env_index (int): Index of the environment copy.
+
+        Returns:
+            InProgressEpisode: The new episode.
+
+        """
+        if self._vec_env is not None:
+            obs, episode_info = self._vec_env.reset_env(env_index)
+            return InProgressEpisode(self._vec_env, obs, episode_info)
+        return InProgressEpisode(self._envs[env_index])
+
+    def _close_envs(self):
+        """Close the current environments."""
+        if self._vec_env is not None:
+            self._vec_env.close()
+            self._vec_env = None
+        else:
+            for env in self._envs:
+                if env is not None:
+                    env.close()
+        self._envs = [None] * self._n_envs
 
     def step_episode(self):
         """Take a single time-step in the current episode.
@@ -99,25 +164,35 @@ class FragmentWorker(DefaultWorker):
 
         """
         prev_obs = np.asarray([frag.last_obs for frag in self._fragments])
-        actions, agent_infos = self.agent.get_actions(prev_obs)
+        with _GET_ACTION_TIMER:
+            actions, agent_infos = self.agent.get_actions(prev_obs)
         completes = [False] * len(self._envs)
+        env_steps = None
+        if self._vec_env is not None:
+            with _ENV_STEP_TIMER:
+                env_steps = self._vec_env.step(actions)
         for i, action in enumerate(actions):
             frag = self._fragments[i]
             if self._episode_lengths[i] < self._max_episode_length:
                 agent_info = {k: v[i] for (k, v) in agent_infos.items()}
-                frag.step(action, agent_info)
+                if env_steps is not None:
+                    frag.add_step(env_steps[i], agent_info)
+                else:
+                    with _ENV_STEP_TIMER:
+                        frag.step(action, agent_info)
                 self._episode_lengths[i] += 1
             if (self._episode_lengths[i] >= self._max_episode_length
                     or frag.step_types[-1] == StepType.TERMINAL):
                 self._episode_lengths[i] = 0
                 complete_frag = frag.to_batch()
                 self._complete_fragments.append(complete_frag)
-                self._fragments[i] = InProgressEpisode(self._envs[i])
+                self._fragments[i] = self._new_fragment(i)
                 completes[i] = True
         if any(completes):
             self.agent.reset(completes)
         return any(completes)
 
+    @timing.timed('CollectEpisode')
     def collect_episode(self):
         """Gather fragments from all in-progress episodes.
 
@@ -126,7 +201,7 @@ class FragmentWorker(DefaultWorker):
 
         """
         for i, frag in enumerate(self._fragments):
-            assert frag.env is self._envs[i]
+            assert frag.env is (self._vec_env or self._envs[i])
             if len(frag.rewards) > 0:
                 complete_frag = frag.to_batch()
                 self._complete_fragments.append(complete_frag)
@@ -137,6 +212,7 @@ class FragmentWorker(DefaultWorker):
         self._complete_fragments = []
         return result
 
+    @timing.timed('Rollout')
     def rollout(self):
         """Sample a single episode of the agent in the environment.
 
@@ -150,7 +226,18 @@ class FragmentWorker(DefaultWorker):
         complete_frag = self.collect_episode()
         return complete_frag
 
+    def collect_stats(self):
+        """Collect statistics gathered by the worker since the last call.
+
+        Returns:
+            dict[str, float or RunningStats]: Hits, misses and evictions of
+                the worker's environment cache, time spent setting up its
+                environments, and running statistics gathered by them.
+
+        """
+        return self._collect_worker_stats(self._envs)
+
     def shutdown(self):
         """Close the worker's environments."""
-        for env in self._envs:
-            env.close()
+        self._close_envs()
+        self._env_cache.close()
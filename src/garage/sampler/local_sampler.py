@@ -1,8 +1,11 @@
 """Sampler that runs workers in the main process."""
+import collections
 import copy
 
 from garage import EpisodeBatch
+from garage.experiment import timing
 from garage.sampler.sampler import Sampler
+from garage.sampler.task_scheduler import TaskScheduler
 
 
 class LocalSampler(Sampler):
@@ -40,6 +43,7 @@ class LocalSampler(Sampler):
         for worker, agent, env in zip(self._workers, self._agents, self._envs):
             worker.update_agent(agent)
             worker.update_env(env)
+        self._task_scheduler = TaskScheduler(worker_factory.n_workers)
         self.total_env_steps = 0
 
     @classmethod
@@ -88,6 +92,7 @@ class LocalSampler(Sampler):
             worker.update_agent(agent_up)
             worker.update_env(env_up)
 
+    @timing.timed('ObtainSamples')
     def obtain_samples(self, itr, num_samples, agent_update, env_update=None):
         """Collect at least a given number transitions (timesteps).
 
@@ -109,7 +114,8 @@ class LocalSampler(Sampler):
             EpisodeBatch: The batch of collected episodes.
 
         """
-        self._update_workers(agent_update, env_update)
+        with timing.timed('UpdateWorkers'):
+            self._update_workers(agent_update, env_update)
         batches = []
         completed_samples = 0
         while True:
@@ -118,10 +124,12 @@ class LocalSampler(Sampler):
                 completed_samples += len(batch.actions)
                 batches.append(batch)
                 if completed_samples >= num_samples:
-                    samples = EpisodeBatch.concatenate(*batches)
+                    with timing.timed('Concatenate'):
+                        samples = EpisodeBatch.concatenate(*batches)
                     self.total_env_steps += sum(samples.lengths)
                     return samples
 
+    @timing.timed('ObtainSamples')
     def obtain_exact_episodes(self,
                               n_eps_per_worker,
                               agent_update,
@@ -146,16 +154,37 @@ class LocalSampler(Sampler):
                 then all episodes from worker 1, etc.
 
         """
-        self._update_workers(agent_update, env_update)
+        agent_updates = self._factory.prepare_worker_messages(agent_update)
+        env_updates = self._factory.prepare_worker_messages(
+            env_update, preprocess=copy.deepcopy)
         batches = []
-        for worker in self._workers:
+        for worker, agent_up, env_up in zip(self._workers, agent_updates,
+                                            env_updates):
+            # Workers run one after another, so each worker is only updated
+            # right before it samples. This keeps per-worker agent updates
+            # correct even when workers share a single agent.
+            worker.update_agent(agent_up)
+            worker.update_env(env_up)
             for _ in range(n_eps_per_worker):
                 batch = worker.rollout()
                 batches.append(batch)
-        samples = EpisodeBatch.concatenate(*batches)
+        with timing.timed('Concatenate'):
+            samples = EpisodeBatch.concatenate(*batches)
         self.total_env_steps += sum(samples.lengths)
         return samples
 
+    def collect_worker_stats(self):
+        """Collect statistics gathered by the workers since the last call.
+
+        Returns:
+            dict[str, float]: Statistics summed across workers, by name.
+
+        """
+        stats = collections.Counter()
+        for worker in self._workers:
+            stats.update(worker.collect_stats())
+        return dict(stats)
+
     def shutdown_worker(self):
         """Shutdown the workers."""
         for worker in self._workers:
@@ -181,6 +210,8 @@ class LocalSampler(Sampler):
 
         """
         self.__dict__.update(state)
+        # New workers hold none of the environments the old workers held.
+        self._task_scheduler = TaskScheduler(self._factory.n_workers)
         self._workers = [
             self._factory(i) for i in range(self._factory.n_workers)
         ]
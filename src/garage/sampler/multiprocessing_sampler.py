@@ -1,15 +1,20 @@
 """A multiprocessing sampler which avoids waiting as much as possible."""
-from collections import defaultdict
+from collections import Counter, defaultdict
 import itertools
 import multiprocessing as mp
 import queue
+import time
 
 import click
 import cloudpickle
 import setproctitle
 
 from garage import EpisodeBatch
+from garage.experiment import timing
+from garage.sampler._functions import (_collect_profile_stats,
+                                       _merge_worker_stats)
 from garage.sampler.sampler import Sampler
+from garage.sampler.task_scheduler import TaskScheduler
 
 
 class MultiprocessingSampler(Sampler):
@@ -59,6 +64,9 @@ class MultiprocessingSampler(Sampler):
             for worker_number in range(self._factory.n_workers)
         ]
         self._agent_version = 0
+        self._worker_stats = defaultdict(Counter)
+        self._profile_config = None
+        self._task_scheduler = TaskScheduler(self._factory.n_workers)
         for w in self._workers:
             w.start()
         self.total_env_steps = 0
@@ -114,11 +122,13 @@ class MultiprocessingSampler(Sampler):
                 try:
                     q.put_nowait(('start', (agent_updates[worker_number],
                                             env_updates[worker_number],
-                                            self._agent_version)))
+                                            self._agent_version,
+                                            self._profile_config)))
                     updated_workers.add(worker_number)
                 except queue.Full:
                     pass
 
+    @timing.timed('ObtainSamples')
     def obtain_samples(self, itr, num_samples, agent_update, env_update=None):
         """Collect at least a given number transitions (timesteps).
 
@@ -147,10 +157,12 @@ class MultiprocessingSampler(Sampler):
         batches = []
         completed_samples = 0
         self._agent_version += 1
+        self._profile_config = timing.worker_config()
         updated_workers = set()
-        agent_ups = self._factory.prepare_worker_messages(
-            agent_update, cloudpickle.dumps)
-        env_ups = self._factory.prepare_worker_messages(env_update)
+        with timing.timed('UpdateWorkers'):
+            agent_ups = self._factory.prepare_worker_messages(
+                agent_update, cloudpickle.dumps)
+            env_ups = self._factory.prepare_worker_messages(env_update)
 
         with click.progressbar(length=num_samples, label='Sampling') as pbar:
             while completed_samples < num_samples:
@@ -159,8 +171,10 @@ class MultiprocessingSampler(Sampler):
                     try:
                         tag, contents = self._to_sampler.get_nowait()
                         if tag == 'episode':
-                            batch, version, worker_n = contents
-                            del worker_n
+                            batch, version, worker_n, stats = contents
+                            self._receive_stats(
+                                worker_n, stats,
+                                version != self._agent_version)
                             if version == self._agent_version:
                                 batches.append(batch)
                                 num_returned_samples = batch.lengths.sum()
@@ -183,10 +197,12 @@ class MultiprocessingSampler(Sampler):
                 except queue.Full:
                     pass
 
-        samples = EpisodeBatch.concatenate(*batches)
+        with timing.timed('Concatenate'):
+            samples = EpisodeBatch.concatenate(*batches)
         self.total_env_steps += sum(samples.lengths)
         return samples
 
+    @timing.timed('ObtainSamples')
     def obtain_exact_episodes(self,
                               n_eps_per_worker,
                               agent_update,
@@ -215,10 +231,12 @@ class MultiprocessingSampler(Sampler):
 
         """
         self._agent_version += 1
+        self._profile_config = timing.worker_config()
         updated_workers = set()
-        agent_ups = self._factory.prepare_worker_messages(
-            agent_update, cloudpickle.dumps)
-        env_ups = self._factory.prepare_worker_messages(env_update)
+        with timing.timed('UpdateWorkers'):
+            agent_ups = self._factory.prepare_worker_messages(
+                agent_update, cloudpickle.dumps)
+            env_ups = self._factory.prepare_worker_messages(env_update)
         episodes = defaultdict(list)
 
         with click.progressbar(length=self._factory.n_workers,
@@ -230,7 +248,9 @@ class MultiprocessingSampler(Sampler):
                 tag, contents = self._to_sampler.get()
 
                 if tag == 'episode':
-                    batch, version, worker_n = contents
+                    batch, version, worker_n, stats = contents
+                    self._receive_stats(worker_n, stats,
+                                        version != self._agent_version)
 
                     if version == self._agent_version:
                         if len(episodes[worker_n]) < n_eps_per_worker:
@@ -257,10 +277,43 @@ class MultiprocessingSampler(Sampler):
         ordered_episodes = list(
             itertools.chain(
                 *[episodes[i] for i in range(self._factory.n_workers)]))
-        samples = EpisodeBatch.concatenate(*ordered_episodes)
+        with timing.timed('Concatenate'):
+            samples = EpisodeBatch.concatenate(*ordered_episodes)
         self.total_env_steps += sum(samples.lengths)
         return samples
 
+    def _receive_stats(self, worker_number, stats, stale):
+        """Record the statistics sent by a worker along with an episode.
+
+        Args:
+            worker_number (int): Number of the worker.
+            stats (dict[str, object]): Statistics gathered by the worker.
+            stale (bool): Whether the episode was sampled with an outdated
+                agent, and is discarded.
+
+        """
+        self._worker_stats[worker_number].update(stats)
+        if stale and self._profile_config is not None:
+            self._worker_stats[worker_number]['Worker/StaleEpisodes'] += 1
+
+    def collect_worker_stats(self):
+        """Collect statistics gathered by the workers since the last call.
+
+        Statistics are sent along with each episode, so this does not
+        communicate with the workers.
+
+        If timing is enabled, workers are profiled, and their timers,
+        utilization and number of discarded stale episodes are included. See
+        :mod:`garage.experiment.timing`.
+
+        Returns:
+            dict[str, float]: Statistics summed across workers, by name.
+
+        """
+        stats = _merge_worker_stats(self._worker_stats)
+        self._worker_stats.clear()
+        return stats
+
     def shutdown_worker(self):
         """Shutdown the workers."""
         for (q, w) in zip(self._to_worker, self._workers):
@@ -322,6 +375,9 @@ def run_worker(factory, to_worker, to_sampler, worker_number, agent, env):
     Critically, the worker never blocks on sending messages back to the
     sampler, to ensure it remains responsive to messages.
 
+    The "start" message also configures timing in the worker. If timing is
+    enabled, the worker's profile is sent along with its statistics.
+
     Args:
         factory (WorkerFactory): Pickleable factory for creating workers.
             Should be transmitted to other processes / nodes where work needs
@@ -360,6 +416,12 @@ def run_worker(factory, to_worker, to_sampler, worker_number, agent, env):
 
     version = 0
     streaming_samples = False
+    # Statistics not yet sent to the sampler.
+    stats = Counter()
+    # Time since statistics were last sent, and how much of it was spent
+    # waiting for messages.
+    last_sent = time.perf_counter()
+    idle_seconds = 0.
 
     while True:
         if streaming_samples:
@@ -372,21 +434,38 @@ def run_worker(factory, to_worker, to_sampler, worker_number, agent, env):
                 contents = None
         else:
             # We're not streaming anymore, so wait for a message.
+            wait_start = time.perf_counter()
             tag, contents = to_worker.get()
+            idle_seconds += time.perf_counter() - wait_start
 
         if tag == 'start':
             # Update env and policy.
-            agent_update, env_update, version = contents
-            inner_worker.update_agent(cloudpickle.loads(agent_update))
-            inner_worker.update_env(env_update)
+            agent_update, env_update, version, profile_config = contents
+            if timing.configure_worker(profile_config,
+                                       'worker-{}'.format(worker_number)):
+                last_sent = time.perf_counter()
+                idle_seconds = 0.
+            with timing.timed('Update'):
+                inner_worker.update_agent(cloudpickle.loads(agent_update))
+                inner_worker.update_env(env_update)
             streaming_samples = True
         elif tag == 'stop':
             streaming_samples = False
         elif tag == 'continue':
             batch = inner_worker.rollout()
+            stats.update(inner_worker.collect_stats())
+            now = time.perf_counter()
+            stats.update(
+                _collect_profile_stats(now - last_sent - idle_seconds,
+                                       idle_seconds))
+            last_sent = now
+            idle_seconds = 0.
             try:
-                to_sampler.put_nowait(
-                    ('episode', (batch, version, worker_number)))
+                with timing.timed('SendEpisode'):
+                    to_sampler.put_nowait(('episode', (batch, version,
+                                                       worker_number,
+                                                       dict(stats))))
+                stats.clear()
             except queue.Full:
                 # Either the sampler has fallen far behind the workers, or we
                 # missed a "stop" message. Either way, stop streaming.
@@ -6,15 +6,20 @@ The sampler workers must implement some type of set agent parameters
 function, and a rollout function.
 
 """
-from collections import defaultdict
+from collections import Counter, defaultdict
 import itertools
+import time
 
 import click
 import cloudpickle
 import ray
 
 from garage import EpisodeBatch
+from garage.experiment import timing
+from garage.sampler._functions import (_collect_profile_stats,
+                                       _merge_worker_stats)
 from garage.sampler.sampler import Sampler
+from garage.sampler.task_scheduler import TaskScheduler
 
 
 class RaySampler(Sampler):
@@ -37,6 +42,8 @@ class RaySampler(Sampler):
         self._envs = self._worker_factory.prepare_worker_messages(envs)
         self._all_workers = defaultdict(None)
         self._workers_started = False
+        self._worker_stats = defaultdict(Counter)
+        self._task_scheduler = TaskScheduler(worker_factory.n_workers)
         self.start_worker()
         self.total_env_steps = 0
 
@@ -78,6 +85,7 @@ class RaySampler(Sampler):
                 worker_id, self._envs[worker_id], agent_pkls[worker_id],
                 self._worker_factory)
 
+    @timing.timed('UpdateWorkers')
     def _update_workers(self, agent_update, env_update):
         """Update all of the workers.
 
@@ -100,12 +108,15 @@ class RaySampler(Sampler):
             agent_update, ray.put)
         env_ids = self._worker_factory.prepare_worker_messages(
             env_update, ray.put)
+        profile_config = timing.worker_config()
         for worker_id in range(self._worker_factory.n_workers):
             worker = self._all_workers[worker_id]
             updating_workers.append(
-                worker.update.remote(param_ids[worker_id], env_ids[worker_id]))
+                worker.update.remote(param_ids[worker_id], env_ids[worker_id],
+                                     profile_config))
         return updating_workers
 
+    @timing.timed('ObtainSamples')
     def obtain_samples(self, itr, num_samples, agent_update, env_update=None):
         """Sample the policy for new episodes.
 
@@ -162,17 +173,20 @@ class RaySampler(Sampler):
                                             timeout=0.001)
                 active_workers = not_ready
                 for result in ready:
-                    ready_worker_id, episode_batch = ray.get(result)
+                    ready_worker_id, episode_batch, stats = ray.get(result)
+                    self._worker_stats[ready_worker_id].update(stats)
                     idle_worker_ids.append(ready_worker_id)
                     num_returned_samples = episode_batch.lengths.sum()
                     completed_samples += num_returned_samples
                     batches.append(episode_batch)
                     pbar.update(num_returned_samples)
 
-        samples = EpisodeBatch.concatenate(*batches)
+        with timing.timed('Concatenate'):
+            samples = EpisodeBatch.concatenate(*batches)
         self.total_env_steps += sum(samples.lengths)
         return samples
 
+    @timing.timed('ObtainSamples')
     def obtain_exact_episodes(self,
                               n_eps_per_worker,
                               agent_update,
@@ -236,7 +250,8 @@ class RaySampler(Sampler):
                                             timeout=0.001)
                 active_workers = not_ready
                 for result in ready:
-                    ready_worker_id, episode_batch = ray.get(result)
+                    ready_worker_id, episode_batch, stats = ray.get(result)
+                    self._worker_stats[ready_worker_id].update(stats)
                     episodes[ready_worker_id].append(episode_batch)
 
                     if len(episodes[ready_worker_id]) < n_eps_per_worker:
@@ -248,10 +263,28 @@ class RaySampler(Sampler):
             itertools.chain(
                 *[episodes[i] for i in range(self._worker_factory.n_workers)]))
 
-        samples = EpisodeBatch.concatenate(*ordered_episodes)
+        with timing.timed('Concatenate'):
+            samples = EpisodeBatch.concatenate(*ordered_episodes)
         self.total_env_steps += sum(samples.lengths)
         return samples
 
+    def collect_worker_stats(self):
+        """Collect statistics gathered by the workers since the last call.
+
+        Statistics are sent along with each episode, so this does not
+        communicate with the workers.
+
+        If timing is enabled, workers are profiled, and their timers and
+        utilization are included. See :mod:`garage.experiment.timing`.
+
+        Returns:
+            dict[str, float]: Statistics summed across workers, by name.
+
+        """
+        stats = _merge_worker_stats(self._worker_stats)
+        self._worker_stats.clear()
+        return stats
+
     def shutdown_worker(self):
         """Shuts down the worker."""
         for worker in self._all_workers.values():
@@ -277,30 +310,58 @@ class SamplerWorker:
         self.worker_id = worker_id
         self.inner_worker.update_env(env)
         self.inner_worker.update_agent(cloudpickle.loads(agent_pkl))
+        # Time since the profile was last collected, and how much of it was
+        # spent between calls from the sampler.
+        self._last_collect = time.perf_counter()
+        self._last_call_end = self._last_collect
+        self._idle_seconds = 0.
 
-    def update(self, agent_update, env_update):
+    def update(self, agent_update, env_update, profile_config=None):
         """Update the agent and environment.
 
         Args:
             agent_update (object): Agent update.
             env_update (object): Environment update.
+            profile_config (dict or None): Configuration of timing in this
+                worker, from :func:`timing.worker_config`.
 
         Returns:
             int: The worker id.
 
         """
-        self.inner_worker.update_agent(agent_update)
-        self.inner_worker.update_env(env_update)
+        start = time.perf_counter()
+        self._idle_seconds += start - self._last_call_end
+        if timing.configure_worker(profile_config,
+                                   'worker-{}'.format(self.worker_id)):
+            self._last_collect = start
+            self._idle_seconds = 0.
+        with timing.timed('Update'):
+            self.inner_worker.update_agent(agent_update)
+            self.inner_worker.update_env(env_update)
+        self._last_call_end = time.perf_counter()
         return self.worker_id
 
     def rollout(self):
         """Sample one episode of the agent in the environment.
 
         Returns:
-            tuple[int, EpisodeBatch]: Worker ID and batch of samples.
+            tuple[int, EpisodeBatch, dict[str, float]]: Worker ID, batch of
+                samples, and statistics gathered by the worker since the last
+                rollout.
 
         """
-        return (self.worker_id, self.inner_worker.rollout())
+        start = time.perf_counter()
+        self._idle_seconds += start - self._last_call_end
+        batch = self.inner_worker.rollout()
+        stats = self.inner_worker.collect_stats()
+        self._last_call_end = time.perf_counter()
+        stats.update(
+            _collect_profile_stats(
+                self._last_call_end - self._last_collect - self._idle_seconds,
+                self._idle_seconds))
+        self._last_collect = self._last_call_end
+        self._idle_seconds = 0.
+        return (self.worker_id, batch, stats)
 
     def shutdown(self):
         """Shuts down the worker."""
@@ -3,6 +3,9 @@
 import abc
 import copy
 
+from garage.sampler._functions import _obtain_task_episodes
+from garage.sampler.task_scheduler import TaskScheduler
+
 
 class Sampler(abc.ABC):
     """Abstract base class of all samplers.
@@ -91,6 +94,55 @@ class Sampler(abc.ABC):
 
         """
 
+    def obtain_task_episodes(self,
+                             n_eps_per_task,
+                             agent_update,
+                             env_updates,
+                             min_steps_per_task=0):
+        """Sample a number of episodes from each of several tasks.
+
+        Tasks are assigned to workers which recently sampled a task of the
+        same environment type, so that workers rarely construct new
+        environments, and sampled with `obtain_exact_episodes`. Samplers
+        which know their number of workers should set `_task_scheduler` to a
+        :class:`TaskScheduler` of that many workers. Otherwise, each task is
+        sampled by all workers in turn.
+
+        Args:
+            n_eps_per_task (int): Number of episodes to gather from each
+                task. Exact unless more are needed for min_steps_per_task.
+            agent_update (object): Value which will be passed into the
+                `agent_update_fn` before sampling episodes. If a list is passed
+                in, it must have the same length as env_updates, and holds the
+                agent update of each task.
+            env_updates (list[EnvUpdate]): Environment update of each task.
+            min_steps_per_task (int): Minimum number of steps to gather from
+                each task. Episodes are added to a task one at a time until
+                it has this many steps, as `obtain_samples` does.
+
+        Returns:
+            EpisodeBatch: Batch of episodes, ordered by task, with the index of
+                the task of each episode in `episode_infos['task_index']`.
+
+        """
+        # Subclasses need not call __init__, so this is set on first use.
+        if getattr(self, '_task_scheduler', None) is None:
+            self._task_scheduler = TaskScheduler(n_workers=1)
+        return _obtain_task_episodes(self, self._task_scheduler,
+                                     n_eps_per_task, agent_update, env_updates,
+                                     min_steps_per_task)
+
+    def collect_worker_stats(self):
+        """Collect statistics gathered by the workers since the last call.
+
+        Returns:
+            dict[str, float]: Statistics summed across workers, by name. Empty
+                by default.
+
+        """
+        # pylint: disable=no-self-use
+        return {}
+
     @abc.abstractmethod
     def shutdown_worker(self):
         """Terminate workers if necessary.
@@ -0,0 +1,506 @@
+"""Sampler workers shared by several experiments running concurrently."""
+from collections import Counter, defaultdict
+import itertools
+import multiprocessing as mp
+import traceback
+
+import cloudpickle
+import setproctitle
+
+from garage import EpisodeBatch
+from garage.experiment import timing
+from garage.experiment.deterministic import get_rng_state, set_rng_state
+from garage.sampler._functions import _merge_worker_stats
+from garage.sampler.sampler import Sampler
+from garage.sampler.task_scheduler import TaskScheduler
+
+# The pool this process samples with, if it runs one of the experiments
+# sharing a pool. Set by SamplerPool.attach().
+_attached_pool = None
+
+
+def attached_pool():
+    """Get the pool the experiment in this process samples with.
+
+    Returns:
+        SamplerPool or None: The pool, or None if the experiment does not
+            share sampler workers.
+
+    """
+    return _attached_pool
+
+
+class SamplerPool:
+    """Sampler worker processes shared by several experiments.
+
+    Each experiment runs in its own process, and samples with a
+    :class:`PooledSampler`. Every worker process of the pool holds one
+    :class:`Worker` for each sampler, built by the sampler's
+    :class:`WorkerFactory`, and samples for whichever experiment asks it
+    to. Hence the workers, and the environments they construct, are only
+    started once, and are kept busy by all experiments.
+
+    The pool must be created before the processes of the experiments are
+    forked, since they inherit its queues. See
+    :func:`~garage.experiment.run_experiments`.
+
+    Args:
+        n_workers (int): Number of worker processes.
+        n_slots (int): Number of experiments which may sample from the pool
+            at the same time.
+
+    """
+
+    def __init__(self, n_workers, n_slots):
+        self.n_workers = n_workers
+        self._to_worker = [mp.Queue() for _ in range(n_workers)]
+        self._to_run = [mp.Queue() for _ in range(n_slots)]
+        # See MultiprocessingSampler.
+        for q in self._to_worker:
+            q.cancel_join_thread()
+        self._workers = [
+            mp.Process(target=run_pool_worker,
+                       kwargs=dict(to_worker=self._to_worker[worker_number],
+                                   to_run=self._to_run,
+                                   worker_number=worker_number),
+                       daemon=False) for worker_number in range(n_workers)
+        ]
+        for w in self._workers:
+            w.start()
+        self._slot = None
+        self._run_id = None
+        self._n_samplers = 0
+
+    def attach(self, slot, run_id):
+        """Sample with this pool in the experiment run by this process.
+
+        Args:
+            slot (int): Slot of the experiment, which no other running
+                experiment uses.
+            run_id (int): Identifier of the experiment, unique among all
+                experiments sharing the pool.
+
+        """
+        # pylint: disable=global-statement
+        global _attached_pool
+        self._slot = slot
+        self._run_id = run_id
+        _attached_pool = self
+
+    def _register(self, factory, agents, envs):
+        """Construct the workers of a new sampler in every worker process.
+
+        Args:
+            factory (WorkerFactory): Factory of the sampler's workers.
+            agents (list[bytes]): Pickled agent of each worker.
+            envs (list[Environment]): Environment of each worker.
+
+        Returns:
+            tuple[int, int]: Key identifying the sampler's workers.
+
+        """
+        key = (self._run_id, self._n_samplers)
+        self._n_samplers += 1
+        for q, agent, env in zip(self._to_worker, agents, envs):
+            q.put(('register', (self._slot, key, factory, agent, env)))
+        return key
+
+    def _request(self, worker_number, message):
+        """Send a message to a worker process.
+
+        Args:
+            worker_number (int): Number of the worker process.
+            message (tuple[str, object]): Tag and contents of the message.
+
+        """
+        self._to_worker[worker_number].put(message)
+
+    def _receive(self, key, version):
+        """Wait for an episode sampled for a sampler.
+
+        Args:
+            key (tuple[int, int]): Key identifying the sampler's workers.
+            version (int): Version of the sampler's requests to wait for.
+
+        Returns:
+            EpisodeBatch: The episode.
+            int: Number of the worker process which sampled it.
+            dict[str, object]: Statistics gathered by the worker.
+
+        Raises:
+            RuntimeError: If the worker raised an exception.
+            AssertionError: On internal errors.
+
+        """
+        while True:
+            tag, (request, contents) = self._to_run[self._slot].get()
+            # Episodes requested by an earlier sampler of this slot, or by an
+            # earlier call of this sampler which raised an exception, are
+            # discarded. Errors constructing workers have no version.
+            if request[0] != key or request[1] not in (version, None):
+                continue
+            if tag == 'episode':
+                return contents
+            elif tag == 'error':
+                worker_number, message = contents
+                raise RuntimeError('Sampler pool worker {} raised an '
+                                   'exception:\n{}'.format(
+                                       worker_number, message))
+            raise AssertionError('Unknown tag {} with contents {}'.format(
+                tag, contents))
+
+    def release(self, run_id):
+        """Shut down all workers of an experiment.
+
+        Called once the experiment's process exits, in case it did not shut
+        down its samplers.
+
+        Args:
+            run_id (int): Identifier of the experiment.
+
+        """
+        for q in self._to_worker:
+            q.put(('release', run_id))
+
+    def shutdown(self):
+        """Shut down the worker processes."""
+        for q in self._to_worker:
+            q.put(('exit', ()))
+        for w in self._workers:
+            w.join()
+        for q in itertools.chain(self._to_worker, self._to_run):
+            q.close()
+
+
+class PooledSampler(Sampler):
+    """Sampler that samples with the workers of a :class:`SamplerPool`.
+
+    Can only be constructed in an experiment run by
+    :func:`~garage.experiment.run_experiments`, which makes
+    :meth:`Trainer.make_sampler` construct this sampler instead of the
+    sampler the experiment asks for.
+
+    Args:
+        worker_factory (WorkerFactory): Pickleable factory for creating
+            workers. Sent to the worker processes of the pool, which
+            construct the workers. Must have as many workers as the pool.
+        agents (Policy or List[Policy]): Agent(s) to use to sample episodes.
+            If a list is passed in, it must have length exactly
+            `worker_factory.n_workers`, and will be spread across the
+            workers.
+        envs (Environment or List[Environment]): Environment from which
+            episodes are sampled. If a list is passed in, it must have length
+            exactly `worker_factory.n_workers`, and will be spread across the
+            workers.
+
+    Raises:
+        ValueError: If this process does not share a pool, or the pool does
+            not have as many workers as `worker_factory`.
+
+    """
+
+    # The pool's methods for its samplers are private to this module.
+    # pylint: disable=protected-access
+
+    def __init__(self, worker_factory, agents, envs):
+        # pylint: disable=super-init-not-called
+        self._pool = attached_pool()
+        if self._pool is None:
+            raise ValueError('PooledSampler can only be used by experiments '
+                             'run by garage.experiment.run_experiments().')
+        if worker_factory.n_workers != self._pool.n_workers:
+            raise ValueError('The sampler pool has {} workers, but the '
+                             'worker factory has {}.'.format(
+                                 self._pool.n_workers,
+                                 worker_factory.n_workers))
+        self._factory = worker_factory
+        self._agents = self._factory.prepare_worker_messages(
+            agents, cloudpickle.dumps)
+        self._envs = self._factory.prepare_worker_messages(envs)
+        self._key = self._pool._register(self._factory, self._agents,
+                                         self._envs)
+        self._version = 0
+        self._worker_stats = defaultdict(Counter)
+        self._task_scheduler = TaskScheduler(self._factory.n_workers)
+        self.total_env_steps = 0
+
+    @classmethod
+    def from_worker_factory(cls, worker_factory, agents, envs):
+        """Construct this sampler.
+
+        Args:
+            worker_factory (WorkerFactory): Pickleable factory for creating
+                workers. Sent to the worker processes of the pool, which
+                construct the workers.
+            agents (Policy or List[Policy]): Agent(s) to use to sample
+                episodes. If a list is passed in, it must have length exactly
+                `worker_factory.n_workers`, and will be spread across the
+                workers.
+            envs (Environment or List[Environment]): Environment from which
+                episodes are sampled. If a list is passed in, it must have
+                length exactly `worker_factory.n_workers`, and will be spread
+                across the workers.
+
+        Returns:
+            Sampler: An instance of `cls`.
+
+        """
+        return cls(worker_factory, agents, envs)
+
+    def _request_rollout(self, worker_number, agent_update, env_update):
+        """Ask a worker to sample an episode.
+
+        Args:
+            worker_number (int): Number of the worker.
+            agent_update (bytes or None): Pickled agent update to apply
+                first, if any.
+            env_update (object): Environment update to apply first, if any.
+
+        """
+        self._pool._request(
+            worker_number,
+            ('rollout', (self._key, self._version, agent_update, env_update)))
+
+    def _receive(self):
+        """Wait for an episode requested by this sampler.
+
+        Returns:
+            EpisodeBatch: The episode.
+            int: Number of the worker which sampled it.
+
+        """
+        batch, worker_number, stats = self._pool._receive(
+            self._key, self._version)
+        self._worker_stats[worker_number].update(stats)
+        return batch, worker_number
+
+    @timing.timed('ObtainSamples')
+    def obtain_samples(self, itr, num_samples, agent_update, env_update=None):
+        """Collect at least a given number transitions (timesteps).
+
+        Episodes are sampled in rounds, in which each worker samples one
+        episode, until enough transitions have been sampled. Hence the
+        episodes do not depend on how fast each worker is. Workers which
+        finish a round early sample for other experiments sharing the pool.
+
+        Args:
+            itr(int): The current iteration number. Using this argument is
+                deprecated.
+            num_samples (int): Minimum number of transitions / timesteps to
+                sample.
+            agent_update (object): Value which will be passed into the
+                `agent_update_fn` before sampling episodes. If a list is passed
+                in, it must have length exactly `factory.n_workers`, and will
+                be spread across the workers.
+            env_update (object): Value which will be passed into the
+                `env_update_fn` before sampling episodes. If a list is passed
+                in, it must have length exactly `factory.n_workers`, and will
+                be spread across the workers.
+
+        Returns:
+            EpisodeBatch: The batch of collected episodes.
+
+        """
+        del itr
+        self._version += 1
+        with timing.timed('UpdateWorkers'):
+            agent_ups = self._factory.prepare_worker_messages(
+                agent_update, cloudpickle.dumps)
+            env_ups = self._factory.prepare_worker_messages(env_update)
+        batches = []
+        completed_samples = 0
+        while completed_samples < num_samples:
+            for worker_number in range(self._factory.n_workers):
+                self._request_rollout(worker_number, agent_ups[worker_number],
+                                      env_ups[worker_number])
+            # Updates are only applied before the first round.
+            agent_ups = env_ups = [None] * self._factory.n_workers
+            episodes = [None] * self._factory.n_workers
+            for _ in range(self._factory.n_workers):
+                batch, worker_number = self._receive()
+                episodes[worker_number] = batch
+                completed_samples += batch.lengths.sum()
+            batches.extend(episodes)
+        with timing.timed('Concatenate'):
+            samples = EpisodeBatch.concatenate(*batches)
+        self.total_env_steps += sum(samples.lengths)
+        return samples
+
+    @timing.timed('ObtainSamples')
+    def obtain_exact_episodes(self,
+                              n_eps_per_worker,
+                              agent_update,
+                              env_update=None):
+        """Sample an exact number of episodes per worker.
+
+        Args:
+            n_eps_per_worker (int): Exact number of episodes to gather for
+                each worker.
+            agent_update (object): Value which will be passed into the
+                `agent_update_fn` before sampling episodes. If a list is passed
+                in, it must have length exactly `factory.n_workers`, and will
+                be spread across the workers.
+            env_update (object): Value which will be passed into the
+                `env_update_fn` before sampling episodes. If a list is passed
+                in, it must have length exactly `factory.n_workers`, and will
+                be spread across the workers.
+
+        Returns:
+            EpisodeBatch: Batch of gathered episodes. Always in worker
+                order. In other words, first all episodes from worker 0,
+                then all episodes from worker 1, etc.
+
+        """
+        self._version += 1
+        with timing.timed('UpdateWorkers'):
+            agent_ups = self._factory.prepare_worker_messages(
+                agent_update, cloudpickle.dumps)
+            env_ups = self._factory.prepare_worker_messages(env_update)
+        for worker_number in range(self._factory.n_workers):
+            self._request_rollout(worker_number, agent_ups[worker_number],
+                                  env_ups[worker_number])
+            for _ in range(n_eps_per_worker - 1):
+                self._request_rollout(worker_number, None, None)
+        episodes = defaultdict(list)
+        for _ in range(n_eps_per_worker * self._factory.n_workers):
+            batch, worker_number = self._receive()
+            episodes[worker_number].append(batch)
+        ordered_episodes = list(
+            itertools.chain(
+                *[episodes[i] for i in range(self._factory.n_workers)]))
+        with timing.timed('Concatenate'):
+            samples = EpisodeBatch.concatenate(*ordered_episodes)
+        self.total_env_steps += sum(samples.lengths)
+        return samples
+
+    def collect_worker_stats(self):
+        """Collect statistics gathered by the workers since the last call.
+
+        Statistics are sent along with each episode, so this does not
+        communicate with the workers.
+
+        Returns:
+            dict[str, float]: Statistics summed across workers, by name.
+
+        """
+        stats = _merge_worker_stats(self._worker_stats)
+        self._worker_stats.clear()
+        return stats
+
+    def shutdown_worker(self):
+        """Shut down this sampler's workers, but not the pool."""
+        for worker_number in range(self._factory.n_workers):
+            self._pool._request(worker_number, ('unregister', self._key))
+
+    def __getstate__(self):
+        """Get the pickle state.
+
+        Returns:
+            dict: The pickled state.
+
+        """
+        return dict(
+            factory=self._factory,
+            agents=[cloudpickle.loads(agent) for agent in self._agents],
+            envs=self._envs)
+
+    def __setstate__(self, state):
+        """Unpickle the state.
+
+        Args:
+            state (dict): Unpickled state.
+
+        """
+        self.__init__(state['factory'], state['agents'], state['envs'])
+
+
+def run_pool_worker(to_worker, to_run, worker_number):
+    """Run a worker process of a :class:`SamplerPool`.
+
+    Handles one message at a time, in the order they were sent by all
+    experiments sharing the pool:
+
+    * "register" constructs the workers of a new sampler.
+    * "rollout" samples an episode with a sampler's workers, and sends it
+      back to the sampler's experiment.
+    * "unregister" shuts down the workers of a sampler.
+    * "release" shuts down the workers of all samplers of an experiment.
+    * "exit" shuts down all workers and terminates.
+
+    Each sampler's workers have their own random number generator states,
+    which are swapped in while they sample. Hence each experiment samples
+    the same episodes however the experiments' requests are interleaved.
+
+    If a worker raises an exception, it is sent to the sampler's
+    experiment, rather than terminating the worker process.
+
+    Args:
+        to_worker (multiprocessing.Queue): Queue to send messages to the
+            worker process.
+        to_run (list[multiprocessing.Queue]): Queue to send episodes back to
+            the experiment using each slot of the pool.
+        worker_number (int): Number of this worker process, and of the
+            workers it constructs.
+
+    Raises:
+        AssertionError: On internal errors.
+
+    """
+    for q in to_run:
+        q.cancel_join_thread()
+    setproctitle.setproctitle('worker:' + setproctitle.getproctitle())
+
+    # Slot, worker and random number generator state of each sampler.
+    workers = {}
+
+    while True:
+        tag, contents = to_worker.get()
+        if tag == 'register':
+            slot, key, factory, agent, env = contents
+            try:
+                inner_worker = factory(worker_number)
+                inner_worker.update_agent(cloudpickle.loads(agent))
+                inner_worker.update_env(env)
+                workers[key] = (slot, inner_worker, get_rng_state())
+            except Exception:  # pylint: disable=broad-except
+                to_run[slot].put(('error', ((key, None),
+                                            (worker_number,
+                                             traceback.format_exc()))))
+        elif tag == 'rollout':
+            key, version, agent_update, env_update = contents
+            if key not in workers:
+                # The sampler failed to register, or its experiment exited.
+                continue
+            slot, inner_worker, rng_state = workers[key]
+            try:
+                set_rng_state(rng_state)
+                if agent_update is not None:
+                    inner_worker.update_agent(cloudpickle.loads(agent_update))
+                inner_worker.update_env(env_update)
+                batch = inner_worker.rollout()
+                workers[key] = (slot, inner_worker, get_rng_state())
+                to_run[slot].put(('episode',
+                                  ((key, version),
+                                   (batch, worker_number,
+                                    inner_worker.collect_stats()))))
+            except Exception:  # pylint: disable=broad-except
+                to_run[slot].put(('error', ((key, version),
+                                            (worker_number,
+                                             traceback.format_exc()))))
+        elif tag in ('unregister', 'release'):
+            keys = [
+                key for key in workers
+                if key == contents or (tag == 'release' and key[0] == contents)
+            ]
+            for key in keys:
+                workers.pop(key)[1].shutdown()
+        elif tag == 'exit':
+            for _, inner_worker, _ in workers.values():
+                inner_worker.shutdown()
+            to_worker.close()
+            for q in to_run:
+                q.close()
+            return
+        else:
+            raise AssertionError('Unknown tag {} with contents {}'.format(
+                tag, contents))
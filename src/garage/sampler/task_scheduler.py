@@ -0,0 +1,157 @@
+"""Assignment of tasks to sampler workers."""
+import collections
+
+from garage.sampler.default_worker import DefaultWorker
+from garage.sampler.env_update import SetTaskUpdate
+
+
+class TaskScheduler:
+    """Assigns tasks to sampler workers, by environment affinity.
+
+    Meta-RL task samplers return many tasks which share a few environment
+    types. Switching a worker to a task of another environment type is slow,
+    since the worker has to construct (or at best take from its
+    :class:`~EnvCache`) an environment of that type. This scheduler remembers
+    which environment types each worker was recently sent, and assigns every
+    task to a worker which already holds an environment of its type, when
+    there is one.
+
+    Tasks are scheduled in rounds, with one task per worker in each round.
+    If a round has fewer tasks than workers, the remaining workers share the
+    tasks of the round, so that every worker is kept busy.
+
+    Only :class:`~SetTaskUpdate` tasks have an environment type. Other
+    environment updates are assigned to any free worker.
+
+    Args:
+        n_workers (int): Number of sampler workers.
+        affinity_size (int): Number of recently sent environment types to
+            remember for each worker. This should exceed the size of the
+            workers' environment caches by one, for the environment in use.
+
+    """
+
+    def __init__(self,
+                 n_workers,
+                 affinity_size=DefaultWorker.DEFAULT_ENV_CACHE_SIZE + 1):
+        self._n_workers = n_workers
+        self._affinity_size = affinity_size
+        # Recently sent environment types of each worker, most recent last.
+        self._recent = [[] for _ in range(n_workers)]
+
+    def schedule(self, env_updates):
+        """Split tasks into rounds, and assign each task to workers.
+
+        Args:
+            env_updates (list[EnvUpdate]): Environment update of each task.
+
+        Returns:
+            list[list[int]]: For each round, the index of the task each worker
+                samples. Every task appears in exactly one round.
+
+        """
+        keys = [_env_key(env_up) for env_up in env_updates]
+        pending = list(range(len(env_updates)))
+        rounds = []
+        while pending:
+            assignment = [None] * self._n_workers
+            # Pass 0 matches the environment each worker holds, pass 1 any
+            # environment the worker holds recently, and pass 2 anything.
+            for affinity in range(3):
+                for worker in range(self._n_workers):
+                    if assignment[worker] is not None or not pending:
+                        continue
+                    task = self._match(worker, pending, keys, affinity)
+                    if task is not None:
+                        assignment[worker] = task
+                        pending.remove(task)
+            self._share_round(assignment, keys)
+            for worker, task in enumerate(assignment):
+                self._remember(worker, keys[task])
+            rounds.append(assignment)
+        return rounds
+
+    def _match(self, worker, tasks, keys, affinity):
+        """Find a task for a worker.
+
+        Args:
+            worker (int): Index of the worker.
+            tasks (list[int]): Candidate tasks, in order of preference.
+            keys (list[type or None]): Environment type of every task.
+            affinity (int): 0 to only match the environment the worker holds,
+                1 to match any environment it held recently, and 2 to match
+                any task.
+
+        Returns:
+            int or None: The matching task, if any.
+
+        """
+        recent = self._recent[worker]
+        for task in tasks:
+            key = keys[task]
+            if affinity == 2:
+                return task
+            if key is None:
+                continue
+            if affinity == 0 and recent and recent[-1] is key:
+                return task
+            if affinity == 1 and key in recent:
+                return task
+        return None
+
+    def _share_round(self, assignment, keys):
+        """Assign free workers to the tasks of a round.
+
+        Free workers are spread evenly over the tasks of the round, preferring
+        tasks whose environment the worker holds.
+
+        Args:
+            assignment (list[int or None]): Task of each worker, or None for
+                free workers. Modified in place.
+            keys (list[type or None]): Environment type of every task.
+
+        """
+        counts = collections.Counter(task for task in assignment
+                                     if task is not None)
+        for worker, task in enumerate(assignment):
+            if task is not None:
+                continue
+            fewest = min(counts.values())
+            candidates = [t for t, count in counts.items() if count == fewest]
+            for affinity in range(3):
+                task = self._match(worker, candidates, keys, affinity)
+                if task is not None:
+                    break
+            assignment[worker] = task
+            counts[task] += 1
+
+    def _remember(self, worker, key):
+        """Record that a worker was sent an environment type.
+
+        Args:
+            worker (int): Index of the worker.
+            key (type or None): Environment type sent to the worker.
+
+        """
+        if key is None:
+            return
+        recent = self._recent[worker]
+        if key in recent:
+            recent.remove(key)
+        recent.append(key)
+        del recent[:-self._affinity_size]
+
+
+def _env_key(env_update):
+    """Get the environment type an update switches a worker to.
+
+    Args:
+        env_update (object): An environment update.
+
+    Returns:
+        type or None: The environment type, if known.
+
+    """
+    if isinstance(env_update, SetTaskUpdate):
+        return env_update.env_type
+    return None
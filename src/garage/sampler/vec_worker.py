@@ -5,8 +5,10 @@ import copy
 import numpy as np
 
 from garage import EpisodeBatch, StepType
-from garage.sampler import _apply_env_update
-from garage.sampler.default_worker import DefaultWorker
+from garage.envs import BatchEnvironment
+from garage.experiment import timing
+from garage.sampler.default_worker import (_ENV_STEP_TIMER,
+                                           _GET_ACTION_TIMER, DefaultWorker)
 
 
 class VecWorker(DefaultWorker):
@@ -17,6 +19,10 @@ class VecWorker(DefaultWorker):
     of actions, which is generally much more efficient than computing a single
     action when using neural networks.
 
+    If the worker is sent a :class:`~BatchEnvironment`, such as a
+    :class:`~VecMultiEnvWrapper` with one task per environment copy, all
+    copies are stepped by a single call to it.
+
     Args:
         seed (int): The seed to use to intialize random number generators.
         max_episode_length (int or float): The maximum length of episodes which
@@ -25,6 +31,8 @@ class VecWorker(DefaultWorker):
             occurring in. This argument is used  set a different seed for
             each worker.
         n_envs (int): Number of environment copies to use.
+        env_cache_size (int): Number of environments to keep when switching
+            between environment types, shared by all environment copies.
     """
 
     DEFAULT_N_ENVS = 8
@@ -34,15 +42,18 @@ class VecWorker(DefaultWorker):
                  seed,
                  max_episode_length,
                  worker_number,
-                 n_envs=DEFAULT_N_ENVS):
+                 n_envs=DEFAULT_N_ENVS,
+                 env_cache_size=DefaultWorker.DEFAULT_ENV_CACHE_SIZE):
         super().__init__(seed=seed,
                          max_episode_length=max_episode_length,
-                         worker_number=worker_number)
+                         worker_number=worker_number,
+                         env_cache_size=env_cache_size)
         self._n_envs = n_envs
         self._completed_episodes = []
         self._needs_agent_reset = True
         self._needs_env_reset = True
         self._envs = [None] * n_envs
+        self._vec_env = None
         self._agents = [None] * n_envs
         self._episode_lengths = [0] * self._n_envs
 
@@ -55,8 +66,9 @@ class VecWorker(DefaultWorker):
         self._step_types = [[], ] * n
         self._env_infos = [collections.defaultdict(list), ] * n
         self._agent_infos = [collections.defaultdict(list), ] * n
-        self._episode_infos = [collections.defaultdict(list), ] * n
         # yapf: enable
+        # Episode-level information of each environment's current episode.
+        self._episode_infos = [{}] * n
 
     def update_agent(self, agent_update):
         """Update an agent, assuming it implements :class:`~Policy`.
@@ -77,16 +89,31 @@ class VecWorker(DefaultWorker):
 
         If passed a list (*inside* this list passed to the Sampler itself),
         distributes the environments across the "vectorization" dimension.
+        If passed a :class:`~BatchEnvironment`, each environment copy is one
+        of its copies.
 
         Args:
-            env_update(Environment or EnvUpdate or None): The environment to
-                replace the existing env with. Note that other implementations
-                of `Worker` may take different types for this parameter.
+            env_update(Environment or EnvUpdate or BatchEnvironment or None):
+                The environment to replace the existing env with. Note that
+                other implementations of `Worker` may take different types for
+                this parameter.
 
         Raises:
             TypeError: If env_update is not one of the documented types.
-            ValueError: If the wrong number of updates is passed.
+            ValueError: If the wrong number of updates or copies is passed.
         """
+        if isinstance(env_update, BatchEnvironment):
+            if env_update.n_envs != self._n_envs:
+                raise ValueError('A BatchEnvironment must have exactly '
+                                 'n_envs ({}) copies, but it has {} '
+                                 'copies.'.format(self._n_envs,
+                                                  env_update.n_envs))
+            if env_update is not self._vec_env:
+                self._close_envs()
+            self._vec_env = env_update
+            self._envs = list(env_update.envs)
+            self._needs_env_reset = True
+            return
         if isinstance(env_update, list):
             if len(env_update) != self._n_envs:
                 raise ValueError('If separate environments are passed for '
@@ -99,8 +126,11 @@ class VecWorker(DefaultWorker):
                 copy.deepcopy(env_update) for _ in range(self._n_envs)
             ]
         if env_update:
+            if self._vec_env is not None:
+                # The copies belong to the batch environment.
+                self._close_envs()
             for env_index, env_up in enumerate(env_update):
-                self._envs[env_index], up = _apply_env_update(
+                self._envs[env_index], up = self._update_one_env(
                     self._envs[env_index], env_up)
                 self._needs_env_reset |= up
 
@@ -110,20 +140,23 @@ class VecWorker(DefaultWorker):
             n = len(self._envs)
             self.agent.reset([True] * n)
             if self._needs_env_reset:
-                obs_list, episode_infos_list = [], []
-                for env in self._envs:
-                    obs, episode_info = env.reset()
-                    obs_list.append(obs)
-                    episode_infos_list.append(episode_info)
-
-                self._prev_obs = np.asarray(obs_list)
-                self._episode_infos = np.array(episode_infos_list)
+                if self._vec_env is not None:
+                    self._prev_obs, self._episode_infos = (
+                        self._vec_env.reset())
+                else:
+                    obs_list, self._episode_infos = [], []
+                    for env in self._envs:
+                        obs, episode_info = env.reset()
+                        obs_list.append(obs)
+                        self._episode_infos.append(episode_info)
+                    self._prev_obs = np.asarray(obs_list)
             else:
                 # Avoid calling reset on environments that are already at the
                 # start of an episode.
-                for i, env in enumerate(self._envs):
+                for i in range(n):
                     if self._episode_lengths[i] > 0:
-                        self._prev_obs[i], self._episode_infos[i] = env.reset()
+                        self._prev_obs[i], self._episode_infos[i] = (
+                            self._reset_env(i))
             self._episode_lengths = [0 for _ in range(n)]
             self._observations = [[] for _ in range(n)]
             self._actions = [[] for _ in range(n)]
@@ -136,21 +169,52 @@ class VecWorker(DefaultWorker):
             self._needs_agent_reset = False
             self._needs_env_reset = False
 
+    def _reset_env(self, env_index):
+        """Reset a single environment copy.
+
+        Args:
+            env_index (int): Index of the environment copy.
+
+        Returns:
+            numpy.ndarray: The first observation of the environment.
+            dict: The episode-level information of the environment.
+
+        """
+        if self._vec_env is not None:
+            return self._vec_env.reset_env(env_index)
+        return self._envs[env_index].reset()
+
+    def _close_envs(self):
+        """Close the current environments."""
+        if self._vec_env is not None:
+            self._vec_env.close()
+            self._vec_env = None
+        else:
+            for env in self._envs:
+                if env is not None:
+                    env.close()
+        self._envs = [None] * self._n_envs
+
     def _gather_episode(self, episode_number, last_observation):
         assert 0 < self._episode_lengths[
             episode_number] <= self._max_episode_length
         env_infos = self._env_infos[episode_number]
         agent_infos = self._agent_infos[episode_number]
-        episode_infos = self._episode_infos[episode_number]
         for k, v in env_infos.items():
             env_infos[k] = np.asarray(v)
         for k, v in agent_infos.items():
             agent_infos[k] = np.asarray(v)
-        for k, v in episode_infos.items():
-            episode_infos[k] = np.asarray(v)
+        episode_infos = {
+            k: np.asarray([v])
+            for k, v in self._episode_infos[episode_number].items()
+        }
+        if self._vec_env is not None:
+            env_spec = self._vec_env.spec
+        else:
+            env_spec = self._envs[episode_number].spec
         eps = EpisodeBatch(
-            env_spec=self._envs[episode_number].spec,
-            episode_infos=dict(episode_infos),
+            env_spec=env_spec,
+            episode_infos=episode_infos,
             observations=np.asarray(self._observations[episode_number]),
             last_observations=np.asarray([last_observation]),
             actions=np.asarray(self._actions[episode_number]),
@@ -168,10 +232,10 @@ class VecWorker(DefaultWorker):
         self._rewards[episode_number] = []
         self._step_types[episode_number] = []
         self._episode_lengths[episode_number] = 0
-        self._prev_obs[episode_number] = self._envs[episode_number].reset()[0]
+        (self._prev_obs[episode_number],
+         self._episode_infos[episode_number]) = self._reset_env(episode_number)
         self._env_infos[episode_number] = collections.defaultdict(list)
         self._agent_infos[episode_number] = collections.defaultdict(list)
-        self._episode_infos[episode_number] = collections.defaultdict(list)
 
     def step_episode(self):
         """Take a single time-step in the current episode.
@@ -180,21 +244,31 @@ class VecWorker(DefaultWorker):
             bool: True iff at least one of the episodes was completed.
         """
         finished = False
-        actions, agent_info = self.agent.get_actions(self._prev_obs)
+        with _GET_ACTION_TIMER:
+            actions, agent_info = self.agent.get_actions(self._prev_obs)
         completes = [False] * len(self._envs)
-        for i, action in enumerate(actions):
-            if self._episode_lengths[i] < self._max_episode_length:
-                es = self._envs[i].step(action)
-                self._observations[i].append(self._prev_obs[i])
-                self._rewards[i].append(es.reward)
-                self._actions[i].append(es.action)
-                for k, v in agent_info.items():
-                    self._agent_infos[i][k].append(v[i])
-                for k, v in es.env_info.items():
-                    self._env_infos[i][k].append(v)
-                self._episode_lengths[i] += 1
-                self._step_types[i].append(es.step_type)
-                self._prev_obs[i] = es.observation
+        with _ENV_STEP_TIMER:
+            if self._vec_env is not None:
+                env_steps = self._vec_env.step(actions)
+            else:
+                env_steps = [
+                    env.step(action)
+                    for env, action in zip(self._envs, actions)
+                ]
+        # The recorded observations are rows of the previous array, so the
+        # next observations are written to a new one.
+        prev_obs = self._prev_obs
+        self._prev_obs = np.asarray([es.observation for es in env_steps])
+        for i, es in enumerate(env_steps):
+            self._observations[i].append(prev_obs[i])
+            self._rewards[i].append(es.reward)
+            self._actions[i].append(es.action)
+            for k, v in agent_info.items():
+                self._agent_infos[i][k].append(v[i])
+            for k, v in es.env_info.items():
+                self._env_infos[i][k].append(v)
+            self._episode_lengths[i] += 1
+            self._step_types[i].append(es.step_type)
             if self._episode_lengths[i] >= self._max_episode_length or es.last:
                 self._gather_episode(i, es.observation)
                 completes[i] = True
@@ -203,6 +277,7 @@ class VecWorker(DefaultWorker):
             self.agent.reset(completes)
         return finished
 
+    @timing.timed('CollectEpisode')
     def collect_episode(self):
         """Collect all completed episodes.
 
@@ -218,7 +293,18 @@ class VecWorker(DefaultWorker):
         self._completed_episodes = []
         return result
 
+    def collect_stats(self):
+        """Collect statistics gathered by the worker since the last call.
+
+        Returns:
+            dict[str, float or RunningStats]: Hits, misses and evictions of
+                the worker's environment cache, time spent setting up its
+                environments, and running statistics gathered by them.
+
+        """
+        return self._collect_worker_stats(self._envs)
+
     def shutdown(self):
         """Close the worker's environments."""
-        for env in self._envs:
-            env.close()
+        self._close_envs()
+        self._env_cache.close()
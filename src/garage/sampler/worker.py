@@ -73,6 +73,18 @@ class Worker(abc.ABC):
 
         """
 
+    def collect_stats(self):
+        """Collect statistics gathered by the worker since the last call.
+
+        Samplers sum these across workers, and the trainer logs the totals.
+
+        Returns:
+            dict[str, float]: Statistics, by name. Empty by default.
+
+        """
+        # pylint: disable=no-self-use
+        return {}
+
     def shutdown(self):
         """Shutdown the worker."""
 
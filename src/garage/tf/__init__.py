@@ -1,18 +1,5 @@
 """Tensorflow Branch."""
-# yapf: disable
-from garage.tf._functions import (center_advs, compile_function,
-                                  compute_advantages, concat_tensor_dict_list,
-                                  concat_tensor_list, discounted_returns,
-                                  filter_valids, filter_valids_dict,
-                                  flatten_batch, flatten_batch_dict,
-                                  flatten_inputs, flatten_tensor_variables,
-                                  get_target_ops, graph_inputs, new_tensor,
-                                  new_tensor_like, pad_tensor, pad_tensor_dict,
-                                  pad_tensor_n, positive_advs,
-                                  split_tensor_dict_list,
-                                  stack_tensor_dict_list)
-
-# yapf: enable
+from garage._lazy import lazy_exports
 
 __all__ = [
     'compile_function',
@@ -38,3 +25,28 @@ __all__ = [
     'positive_advs',
     'discounted_returns',
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'center_advs': 'garage.tf._functions',
+    'compile_function': 'garage.tf._functions',
+    'compute_advantages': 'garage.tf._functions',
+    'concat_tensor_dict_list': 'garage.tf._functions',
+    'concat_tensor_list': 'garage.tf._functions',
+    'discounted_returns': 'garage.tf._functions',
+    'filter_valids': 'garage.tf._functions',
+    'filter_valids_dict': 'garage.tf._functions',
+    'flatten_batch': 'garage.tf._functions',
+    'flatten_batch_dict': 'garage.tf._functions',
+    'flatten_inputs': 'garage.tf._functions',
+    'flatten_tensor_variables': 'garage.tf._functions',
+    'get_target_ops': 'garage.tf._functions',
+    'graph_inputs': 'garage.tf._functions',
+    'new_tensor': 'garage.tf._functions',
+    'new_tensor_like': 'garage.tf._functions',
+    'pad_tensor': 'garage.tf._functions',
+    'pad_tensor_dict': 'garage.tf._functions',
+    'pad_tensor_n': 'garage.tf._functions',
+    'positive_advs': 'garage.tf._functions',
+    'split_tensor_dict_list': 'garage.tf._functions',
+    'stack_tensor_dict_list': 'garage.tf._functions',
+})
@@ -109,9 +109,7 @@ class RL2NPO(NPO):
                 :math:`(N, max_episode_length * episode_per_task)`.
 
         """
-        obs = [
-            self._baseline.predict({'observations': obs})
-            for obs in episodes.observations_list
-        ]
-        return pad_batch_array(np.concatenate(obs), episodes.lengths,
+        baselines = self._baseline.predict_episodes(
+            {'observations': episodes.observations}, episodes.lengths)
+        return pad_batch_array(baselines, episodes.lengths,
                                self.max_episode_length)
@@ -6,6 +6,7 @@ import tensorflow as tf
 
 from garage import (_Default, log_performance, make_optimizer,
                     obtain_evaluation_episodes)
+from garage.experiment import timing
 from garage.np.algos import RLAlgorithm
 from garage.sampler import FragmentWorker, LocalSampler
 from garage.tf import compile_function, get_target_ops
@@ -240,6 +241,11 @@ class DDPG(RLAlgorithm):
             self._f_init_target = f_init_target
             self._f_update_target = f_update_target
 
+    @property
+    def replay_buffer(self):
+        """ReplayBuffer: Replay buffer the algorithm samples from."""
+        return self._replay_buffer
+
     def __getstate__(self):
         """Object.__getstate__.
 
@@ -283,7 +289,7 @@ class DDPG(RLAlgorithm):
         trainer.enable_logging = False
 
         for _ in trainer.step_epochs():
-            for cycle in range(self._steps_per_epoch):
+            for cycle in trainer.step_cycles(self._steps_per_epoch):
                 trainer.step_path = trainer.obtain_episodes(trainer.step_itr)
                 if hasattr(self.exploration_policy, 'update'):
                     self.exploration_policy.update(trainer.step_path)
@@ -291,8 +297,9 @@ class DDPG(RLAlgorithm):
                 if (cycle == 0 and self._replay_buffer.n_transitions_stored >=
                         self._min_buffer_size):
                     trainer.enable_logging = True
-                    eval_episodes = obtain_evaluation_episodes(
-                        self.policy, self._eval_env)
+                    with timing.timed('Evaluate'):
+                        eval_episodes = obtain_evaluation_episodes(
+                            self.policy, self._eval_env)
                     last_returns = log_performance(trainer.step_itr,
                                                    eval_episodes,
                                                    discount=self._discount)
@@ -300,6 +307,7 @@ class DDPG(RLAlgorithm):
 
         return np.mean(last_returns)
 
+    @timing.timed('Train')
     def _train_once(self, itr, episodes):
         """Perform one step of policy optimization given one batch of samples.
 
@@ -6,6 +6,7 @@ import numpy as np
 import tensorflow as tf
 
 from garage import log_performance, make_optimizer, obtain_evaluation_episodes
+from garage.experiment import timing
 from garage.np.algos import RLAlgorithm
 from garage.sampler import FragmentWorker, LocalSampler
 from garage.tf import compile_function, get_target_ops
@@ -208,7 +209,7 @@ class DQN(RLAlgorithm):
 
         qf_losses = []
         for _ in trainer.step_epochs():
-            for cycle in range(self._steps_per_epoch):
+            for cycle in trainer.step_cycles(self._steps_per_epoch):
                 trainer.step_path = trainer.obtain_episodes(trainer.step_itr)
                 if hasattr(self.exploration_policy, 'update'):
                     self.exploration_policy.update(trainer.step_path)
@@ -217,8 +218,9 @@ class DQN(RLAlgorithm):
                 if (cycle == 0 and self._replay_buffer.n_transitions_stored >=
                         self._min_buffer_size):
                     trainer.enable_logging = True
-                    eval_episodes = obtain_evaluation_episodes(
-                        self.policy, self._eval_env)
+                    with timing.timed('Evaluate'):
+                        eval_episodes = obtain_evaluation_episodes(
+                            self.policy, self._eval_env)
                     last_returns = log_performance(trainer.step_itr,
                                                    eval_episodes,
                                                    discount=self._discount)
@@ -228,6 +230,7 @@ class DQN(RLAlgorithm):
 
         return np.mean(last_returns)
 
+    @timing.timed('Train')
     def _train_once(self, itr, episodes):
         """Perform one step of policy optimization given one batch of samples.
 
@@ -280,6 +283,11 @@ class DQN(RLAlgorithm):
 
         return loss
 
+    @property
+    def replay_buffer(self):
+        """ReplayBuffer: Replay buffer the algorithm samples from."""
+        return self._replay_buffer
+
     def __getstate__(self):
         """Parameters to save in snapshot.
 
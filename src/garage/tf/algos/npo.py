@@ -8,6 +8,7 @@ import numpy as np
 import tensorflow as tf
 
 from garage import log_performance, make_optimizer
+from garage.experiment import timing
 from garage.np import explained_variance_1d, pad_batch_array
 from garage.np.algos import RLAlgorithm
 from garage.sampler import RaySampler
@@ -178,6 +179,7 @@ class NPO(RLAlgorithm):
 
         return last_return
 
+    @timing.timed('Train')
     def _train_once(self, itr, episodes):
         """Perform one step of policy optimization given one batch of samples.
 
@@ -190,11 +192,9 @@ class NPO(RLAlgorithm):
 
         """
         # -- Stage: Calculate and pad baselines
-        obs = [
-            self._baseline.predict({'observations': obs})
-            for obs in episodes.observations_list
-        ]
-        baselines = pad_batch_array(np.concatenate(obs), episodes.lengths,
+        baselines = self._baseline.predict_episodes(
+            {'observations': episodes.observations}, episodes.lengths)
+        baselines = pad_batch_array(baselines, episodes.lengths,
                                     self.max_episode_length)
 
         # -- Stage: Run and calculate performance of the algorithm
@@ -210,6 +210,7 @@ class NPO(RLAlgorithm):
 
         return np.mean(undiscounted_returns)
 
+    @timing.timed('Optimize')
     def _optimize_policy(self, episodes, baselines):
         """Optimize policy.
 
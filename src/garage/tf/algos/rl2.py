@@ -167,11 +167,13 @@ class RL2Worker(DefaultWorker):
 
 
 class NoResetPolicy:
-    """A policy that does not reset.
+    """A policy that only resets before its first episode.
 
     For RL2 meta-test, the policy should not reset after meta-RL
     adapation. The hidden state will be retained as it is where
-    the adaptation takes place.
+    the adaptation takes place. Since each exploration policy explores a
+    single task, the hidden state is reset once, before the first episode
+    of that task.
 
     Args:
         policy (garage.tf.policies.Policy): Policy itself.
@@ -183,9 +185,13 @@ class NoResetPolicy:
 
     def __init__(self, policy):
         self._policy = policy
+        self._needs_reset = True
 
     def reset(self):
         """Environment reset function."""
+        if self._needs_reset:
+            self._policy.reset()
+            self._needs_reset = False
 
     def get_action(self, obs):
         """Get a single action from this policy for the input observation.
@@ -229,12 +235,13 @@ class RL2AdaptedPolicy:
     """
 
     def __init__(self, policy):
-        self._initial_hiddens = policy._prev_hiddens[:]
+        # The policy resets its hidden state in place, so keep a copy.
+        self._initial_hiddens = np.copy(policy._prev_hiddens)
         self._policy = policy
 
     def reset(self):
         """Environment reset function."""
-        self._policy._prev_hiddens = self._initial_hiddens
+        self._policy._prev_hiddens = np.copy(self._initial_hiddens)
 
     def get_action(self, obs):
         """Get a single action from this policy for the input observation.
@@ -398,6 +405,56 @@ class RL2(MetaRLAlgorithm, abc.ABC):
         """
         return RL2AdaptedPolicy(exploration_policy._policy)
 
+    def adapt_policies(self, exploration_episodes):
+        """Produce policies adapted for several tasks.
+
+        Exploration episodes may be sampled in other processes, so the hidden
+        state the policy reached at the end of each task's exploration
+        episodes is recomputed from their observations, for all tasks at
+        once.
+
+        Args:
+            exploration_episodes (list[EpisodeBatch]): Episodes with which to
+                adapt to each task, generated by policies returned from
+                get_exploration_policy() exploring each task.
+
+        Returns:
+            list[RL2AdaptedPolicy]: A policy adapted to each task.
+
+        """
+        policy = self._policy
+        observations = [eps.observations for eps in exploration_episodes]
+        actions = [
+            policy.action_space.flatten_n(eps.actions)
+            for eps in exploration_episodes
+        ]
+        lengths = [len(obs) for obs in observations]
+        final_hiddens = [None] * len(exploration_episodes)
+        # Actions are sampled but discarded, so leave the global random
+        # state as it was.
+        random_state = np.random.get_state()
+        policy.reset(np.ones(len(exploration_episodes), dtype=bool))
+        for step in range(max(lengths)):
+            # Tasks whose episodes have ended repeat their last step, and
+            # their hidden states are no longer recorded.
+            indices = [min(step, length - 1) for length in lengths]
+            policy.get_actions(
+                np.stack([obs[i] for obs, i in zip(observations, indices)]))
+            if getattr(policy, '_state_include_action', False):
+                policy._prev_actions = np.stack(
+                    [act[i] for act, i in zip(actions, indices)])
+            for task, length in enumerate(lengths):
+                if step == length - 1:
+                    final_hiddens[task] = np.copy(
+                        policy._prev_hiddens[task:task + 1])
+        np.random.set_state(random_state)
+        adapted_policies = []
+        for hiddens in final_hiddens:
+            policy._prev_hiddens = hiddens
+            adapted_policies.append(RL2AdaptedPolicy(policy))
+        policy.reset()
+        return adapted_policies
+
     # pylint: disable=protected-access
     def _process_samples(self, itr, episodes):
         # pylint: disable=too-many-statements
@@ -224,18 +224,12 @@ class TENPO(RLAlgorithm):
                                                discount=self._discount)
 
         # Calculate baseline predictions
-        baselines = []
-        start = 0
-        for length in episodes.lengths:
-            stop = start + length
-            baseline = self._baseline.predict(
-                dict(observations=episodes.observations[start:stop],
-                     tasks=episodes.env_infos['task_onehot'][start:stop],
-                     latents=episodes.agent_infos['latent'][start:stop]))
-            baselines.append(baseline)
-            start = stop
-        baselines = pad_batch_array(np.concatenate(baselines),
-                                    episodes.lengths, self.max_episode_length)
+        baselines = self._baseline.predict_episodes(
+            dict(observations=episodes.observations,
+                 tasks=episodes.env_infos['task_onehot'],
+                 latents=episodes.agent_infos['latent']), episodes.lengths)
+        baselines = pad_batch_array(baselines, episodes.lengths,
+                                    self.max_episode_length)
 
         # Process trajectories
         embed_eps, embed_ep_infos = self._process_episodes(episodes)
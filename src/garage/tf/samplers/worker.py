@@ -137,3 +137,12 @@ class TFWorkerWrapper(Worker):
 
         """
         return self._inner_worker.collect_episode()
+
+    def collect_stats(self):
+        """Collect statistics gathered by the worker since the last call.
+
+        Returns:
+            dict[str, float]: Statistics, by name.
+
+        """
+        return self._inner_worker.collect_stats()
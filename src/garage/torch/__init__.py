@@ -1,19 +1,31 @@
 """PyTorch-backed modules and algorithms."""
-# yapf: disable
-from garage.torch._functions import (compute_advantages, dict_np_to_torch,
-                                     filter_valids, flatten_batch,
-                                     flatten_to_single_vector, global_device,
-                                     NonLinearity, np_to_torch, pad_to_last,
-                                     prefer_gpu, product_of_gaussians,
-                                     set_gpu_mode, soft_update_model,
-                                     torch_to_np, TransposeImage,
-                                     update_module_params)
+from garage._lazy import lazy_exports
 
-# yapf: enable
 __all__ = [
     'compute_advantages', 'dict_np_to_torch', 'filter_valids', 'flatten_batch',
     'global_device', 'np_to_torch', 'pad_to_last', 'prefer_gpu',
     'product_of_gaussians', 'set_gpu_mode', 'soft_update_model', 'torch_to_np',
     'update_module_params', 'NonLinearity', 'flatten_to_single_vector',
-    'TransposeImage'
+    'TransposeImage', 'flatten_module_params', 'get_flat_params'
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'compute_advantages': 'garage.torch._functions',
+    'dict_np_to_torch': 'garage.torch._functions',
+    'filter_valids': 'garage.torch._functions',
+    'flatten_batch': 'garage.torch._functions',
+    'flatten_module_params': 'garage.torch._functions',
+    'flatten_to_single_vector': 'garage.torch._functions',
+    'get_flat_params': 'garage.torch._functions',
+    'global_device': 'garage.torch._functions',
+    'NonLinearity': 'garage.torch._functions',
+    'np_to_torch': 'garage.torch._functions',
+    'pad_to_last': 'garage.torch._functions',
+    'prefer_gpu': 'garage.torch._functions',
+    'product_of_gaussians': 'garage.torch._functions',
+    'set_gpu_mode': 'garage.torch._functions',
+    'soft_update_model': 'garage.torch._functions',
+    'torch_to_np': 'garage.torch._functions',
+    'TransposeImage': 'garage.torch._functions',
+    'update_module_params': 'garage.torch._functions',
+})
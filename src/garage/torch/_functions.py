@@ -8,6 +8,7 @@ This collection of functions can be used to manage the following:
         - converting Tensors to GPU Tensors
         - Converting Tensors into `numpy.ndarray` format and vice versa
     - Updating model parameters
+    - Storing model parameters in a single flat buffer
 """
 import copy
 import dataclasses
@@ -261,12 +262,134 @@ def soft_update_model(target_model, source_model, tau):
             soft target update.
 
     """
+    target_flat = get_flat_params(target_model)
+    source_flat = get_flat_params(source_model)
+    if (target_flat is not None and source_flat is not None
+            and target_flat.shape == source_flat.shape):
+        with torch.no_grad():
+            target_flat.mul_(1.0 - tau).add_(source_flat, alpha=tau)
+        return
     for target_param, param in zip(target_model.parameters(),
                                    source_model.parameters()):
         target_param.data.copy_(target_param.data * (1.0 - tau) +
                                 param.data * tau)
 
 
+def flatten_module_params(module):
+    """Store all parameters and buffers of a module in one flat buffer.
+
+    Each parameter and buffer of the module is replaced, in place, by a view
+    into a single contiguous tensor. Reading or writing the module state then
+    costs one copy of that tensor, rather than one copy per parameter, and
+    pickling the module serializes a single storage.
+
+    The layout is checked by :func:`get_flat_params`, which re-flattens the
+    module if its parameters have been moved (e.g. by
+    :meth:`torch.nn.Module.to`).
+
+    Args:
+        module (torch.nn.Module): Module to flatten.
+
+    Returns:
+        torch.Tensor: The flat buffer, of shape :math:`(P, )`, where P is the
+            total number of elements in the parameters and buffers of the
+            module.
+
+    Raises:
+        ValueError: If the parameters and buffers of the module do not all
+            have the same dtype and device.
+
+    """
+    tensors = _flat_param_tensors(module)
+    if not tensors:
+        raise ValueError('Module has no parameters or buffers to flatten.')
+    dtypes = {t.dtype for t in tensors}
+    devices = {t.device for t in tensors}
+    if len(dtypes) > 1 or len(devices) > 1:
+        raise ValueError('All parameters and buffers must have the same dtype '
+                         'and device to be flattened, but got dtypes {} and '
+                         'devices {}.'.format(dtypes, devices))
+    flat = torch.empty(sum(t.numel() for t in tensors),
+                       dtype=tensors[0].dtype,
+                       device=tensors[0].device)
+    offset = 0
+    with torch.no_grad():
+        for tensor in tensors:
+            view = flat[offset:offset + tensor.numel()].view_as(tensor)
+            view.copy_(tensor)
+            tensor.data = view
+            offset += tensor.numel()
+    # pylint: disable=protected-access
+    module._flat_params = flat
+    return flat
+
+
+def get_flat_params(module):
+    """Get the flat buffer backing a module's parameters, if there is one.
+
+    Args:
+        module (torch.nn.Module): A module, which may have been flattened with
+            :func:`flatten_module_params`.
+
+    Returns:
+        torch.Tensor or None: The flat buffer, or None if the module has not
+            been flattened, or its parameters have been replaced by tensors
+            which are not leaf parameters (e.g. by
+            :func:`update_module_params`).
+
+    """
+    flat = getattr(module, '_flat_params', None)
+    if flat is None:
+        return None
+    tensors = _flat_param_tensors(module)
+    if _is_flat_layout(tensors, flat):
+        return flat
+    if all(isinstance(p, nn.Parameter) for p in module.parameters()):
+        return flatten_module_params(module)
+    return None
+
+
+def _flat_param_tensors(module):
+    """Get the tensors stored in a module's flat buffer, in order.
+
+    Args:
+        module (torch.nn.Module): A module.
+
+    Returns:
+        list[torch.Tensor]: Parameters, followed by buffers.
+
+    """
+    tensors = []
+    seen = set()
+    for tensor in list(module.parameters()) + list(module.buffers()):
+        if id(tensor) not in seen:
+            seen.add(id(tensor))
+            tensors.append(tensor)
+    return tensors
+
+
+def _is_flat_layout(tensors, flat):
+    """Check that tensors are consecutive views into a flat buffer.
+
+    Args:
+        tensors (list[torch.Tensor]): Tensors to check.
+        flat (torch.Tensor): Flat buffer.
+
+    Returns:
+        bool: True if the tensors exactly tile the flat buffer.
+
+    """
+    base = flat.data_ptr()
+    item_size = flat.element_size()
+    offset = 0
+    for tensor in tensors:
+        if (tensor.device != flat.device or tensor.dtype != flat.dtype
+                or tensor.data_ptr() != base + offset * item_size):
+            return False
+        offset += tensor.numel()
+    return offset == flat.numel()
+
+
 def set_gpu_mode(mode, gpu_id=0):
     """Set GPU mode and device ID.
 
@@ -8,6 +8,7 @@ import torch
 
 from garage import (_Default, log_performance, make_optimizer,
                     obtain_evaluation_episodes)
+from garage.experiment import timing
 from garage.np.algos import RLAlgorithm
 from garage.sampler import FragmentWorker, LocalSampler
 from garage.torch import dict_np_to_torch, torch_to_np
@@ -154,7 +155,7 @@ class DDPG(RLAlgorithm):
         trainer.enable_logging = False
 
         for _ in trainer.step_epochs():
-            for cycle in range(self._steps_per_epoch):
+            for cycle in trainer.step_cycles(self._steps_per_epoch):
                 trainer.step_path = trainer.obtain_episodes(trainer.step_itr)
                 if hasattr(self.exploration_policy, 'update'):
                     self.exploration_policy.update(trainer.step_path)
@@ -162,8 +163,9 @@ class DDPG(RLAlgorithm):
                 if (cycle == 0 and self.replay_buffer.n_transitions_stored >=
                         self._min_buffer_size):
                     trainer.enable_logging = True
-                    eval_eps = obtain_evaluation_episodes(
-                        self.policy, self._eval_env)
+                    with timing.timed('Evaluate'):
+                        eval_eps = obtain_evaluation_episodes(
+                            self.policy, self._eval_env)
                     last_returns = log_performance(trainer.step_itr,
                                                    eval_eps,
                                                    discount=self._discount)
@@ -171,6 +173,7 @@ class DDPG(RLAlgorithm):
 
         return np.mean(last_returns)
 
+    @timing.timed('Train')
     def train_once(self, itr, episodes):
         """Perform one iteration of training.
 
@@ -9,6 +9,7 @@ import torch.nn.functional as F
 
 from garage import _Default, log_performance, make_optimizer
 from garage._functions import obtain_evaluation_episodes
+from garage.experiment import timing
 from garage.np.algos import RLAlgorithm
 from garage.sampler import FragmentWorker
 from garage.torch import global_device, np_to_torch
@@ -147,27 +148,31 @@ class DQN(RLAlgorithm):
         trainer.enable_logging = True
 
         for _ in trainer.step_epochs():
-            if (self.replay_buffer.n_transitions_stored >=
-                    self._min_buffer_size):
-                logger.log('Evaluating policy')
-
-                params_before = self.exploration_policy.get_param_values()
-                eval_eps = obtain_evaluation_episodes(
-                    (self.exploration_policy
-                     if not self._deterministic_eval else self.policy),
-                    self._eval_env,
-                    num_eps=self._num_eval_episodes,
-                    max_episode_length=self._max_episode_length_eval)
-                self.exploration_policy.set_param_values(params_before)
-
-                last_returns = log_performance(trainer.step_itr,
-                                               eval_eps,
-                                               discount=self._discount)
-                self._episode_reward_mean.extend(last_returns)
-                tabular.record('Evaluation/100EpRewardMean',
-                               np.mean(self._episode_reward_mean))
-
-            for _ in range(self._steps_per_epoch):
+            for cycle in trainer.step_cycles(self._steps_per_epoch):
+                # Evaluate at the start of the epoch, as part of its first
+                # cycle, so a checkpoint taken later in the epoch resumes
+                # without evaluating again.
+                if (cycle == 0 and self.replay_buffer.n_transitions_stored >=
+                        self._min_buffer_size):
+                    logger.log('Evaluating policy')
+
+                    params_before = self.exploration_policy.get_param_values()
+                    with timing.timed('Evaluate'):
+                        eval_eps = obtain_evaluation_episodes(
+                            (self.exploration_policy
+                             if not self._deterministic_eval else self.policy),
+                            self._eval_env,
+                            num_eps=self._num_eval_episodes,
+                            max_episode_length=self._max_episode_length_eval)
+                    self.exploration_policy.set_param_values(params_before)
+
+                    last_returns = log_performance(trainer.step_itr,
+                                                   eval_eps,
+                                                   discount=self._discount)
+                    self._episode_reward_mean.extend(last_returns)
+                    tabular.record('Evaluation/100EpRewardMean',
+                                   np.mean(self._episode_reward_mean))
+
                 trainer.step_path = trainer.obtain_episodes(trainer.step_itr)
                 if hasattr(self.exploration_policy, 'update'):
                     self.exploration_policy.update(trainer.step_path)
@@ -177,6 +182,7 @@ class DQN(RLAlgorithm):
 
         return np.mean(last_returns)
 
+    @timing.timed('Train')
     def _train_once(self, itr, episodes):
         """Perform one iteration of training.
 
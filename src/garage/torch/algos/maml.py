@@ -1,6 +1,7 @@
 """Model-Agnostic Meta-Learning (MAML) algorithm implementation for RL."""
 # yapf: disable
 import collections
+import contextlib
 import copy
 
 from dowel import tabular
@@ -11,7 +12,8 @@ from garage import (_Default, EpisodeBatch, log_multitask_performance,
                     make_optimizer)
 from garage.np import discount_cumsum
 from garage.sampler import RaySampler
-from garage.torch import update_module_params
+from garage.torch import (compute_advantages, flatten_batch,
+                          update_module_params)
 from garage.torch.optimizers import (ConjugateGradientOptimizer,
                                      DifferentiableSGD)
 
@@ -39,6 +41,17 @@ class MAML:
         meta_evaluator (MetaEvaluator): A meta evaluator for meta-testing. If
             None, don't do meta-testing.
         evaluate_every_n_epochs (int): Do meta-testing every this epochs.
+        episodes_per_task (int or None): If set, sample exactly this many
+            episodes from each task, and sample all tasks of each adaptation
+            step together, by sending each sampler worker its own task and
+            policy parameters. Otherwise, tasks are sampled one at a time,
+            using the trainer's batch size for each.
+        vectorize_tasks (bool): If True, compute the inner-loop adaptation,
+            meta-objective and KL constraint for all tasks at once, using
+            :func:`torch.func.vmap` over stacked per-task parameters, rather
+            than adapting the policy in place for each task in turn. Every
+            one of the `num_grad_updates` inner steps is differentiated
+            through. Requires PyTorch 2.0 or newer.
 
     """
 
@@ -53,7 +66,12 @@ class MAML:
                  outer_lr=1e-3,
                  num_grad_updates=1,
                  meta_evaluator=None,
-                 evaluate_every_n_epochs=1):
+                 evaluate_every_n_epochs=1,
+                 episodes_per_task=None,
+                 vectorize_tasks=False):
+        if vectorize_tasks and not hasattr(torch, 'func'):
+            raise ValueError('vectorize_tasks requires torch.func, which is '
+                             'available in PyTorch 2.0 or newer.')
         self.sampler_cls = RaySampler
 
         self.max_episode_length = inner_algo.max_episode_length
@@ -73,6 +91,9 @@ class MAML:
                                               lr=_Default(outer_lr),
                                               eps=_Default(1e-5))
         self._evaluate_every_n_epochs = evaluate_every_n_epochs
+        self._episodes_per_task = episodes_per_task
+        self._vectorize_tasks = vectorize_tasks
+        self._task_batch_cache = None
 
     def train(self, trainer):
         """Obtain samples and start training for each epoch.
@@ -103,9 +124,10 @@ class MAML:
             all_samples (list[list[_MAMLEpisodeBatch]]): A two
                 dimensional list of _MAMLEpisodeBatch of size
                 [meta_batch_size * (num_grad_updates + 1)]
-            all_params (list[dict]): A list of named parameter dictionaries.
-                Each dictionary contains key value pair of names (str) and
-                parameters (torch.Tensor).
+            all_params (list[dict] or dict): A list of named parameter
+                dictionaries. Each dictionary contains key value pair of names
+                (str) and parameters (torch.Tensor). If tasks are vectorized,
+                a single dictionary of parameters stacked across tasks.
 
         Returns:
             float: Average return.
@@ -145,6 +167,7 @@ class MAML:
             self._meta_evaluator.evaluate(self)
 
         update_module_params(self._old_policy, old_theta)
+        self._task_batch_cache = None
 
         return average_return
 
@@ -186,35 +209,142 @@ class MAML:
             tuple: Tuple of (all_samples, all_params).
                 all_samples (list[_MAMLEpisodeBatch]): A list of size
                     [meta_batch_size * (num_grad_updates + 1)]
-                all_params (list[dict]): A list of named parameter
-                    dictionaries.
+                all_params (list[dict] or dict): A list of named parameter
+                    dictionaries, or if tasks are vectorized, a dictionary of
+                    parameters stacked across tasks.
 
         """
         tasks = self._task_sampler.sample(self._meta_batch_size)
         all_samples = [[] for _ in range(len(tasks))]
-        all_params = []
         theta = dict(self._policy.named_parameters())
+        if self._vectorize_tasks:
+            task_params = theta
+        else:
+            task_params = [theta] * len(tasks)
+
+        for j in range(self._num_grad_updates + 1):
+            if j == 0:
+                agent_updates = [self._policy.get_param_values()] * len(tasks)
+                task_episodes = self._obtain_task_episodes(
+                    trainer, tasks, agent_updates)
+            else:
+                agent_updates = self._task_agent_updates(task_params)
+                # The workers of a LocalSampler load updates into the policy
+                # itself, so it holds copies of theta while they sample.
+                update_module_params(self._policy, {
+                    name: param.detach().clone()
+                    for name, param in theta.items()
+                })
+                try:
+                    task_episodes = self._obtain_task_episodes(
+                        trainer, tasks, agent_updates)
+                finally:
+                    update_module_params(self._policy, theta)
+            batches = [
+                self._process_samples(episodes) for episodes in task_episodes
+            ]
+            for task_samples, batch_samples in zip(all_samples, batches):
+                task_samples.append(batch_samples)
+
+            # The last iteration does only sampling but no adapting
+            if j < self._num_grad_updates:
+                # A grad need to be kept for the next grad update
+                # Except for the last grad update
+                require_grad = j < self._num_grad_updates - 1
+                if self._vectorize_tasks:
+                    task_params = self._adapt_tasks(
+                        task_params, self._stack_task_batches(batches),
+                        set_grad=require_grad)
+                else:
+                    task_params = [
+                        self._adapt_from(params, batch_samples, require_grad)
+                        for params, batch_samples in zip(task_params, batches)
+                    ]
+
+        return all_samples, task_params
+
+    def _obtain_task_episodes(self, trainer, tasks, agent_updates):
+        """Sample episodes from each task.
+
+        If `episodes_per_task` is set, tasks are spread across the sampler
+        workers with :meth:`Trainer.obtain_episodes_per_update`, so that as
+        many tasks as there are workers are sampled by a single sampler
+        call.
 
-        for i, env_up in enumerate(tasks):
+        Args:
+            trainer (Trainer): A trainer instance to obtain samples.
+            tasks (list[EnvUpdate]): Task environment updates.
+            agent_updates (list[object]): Parameters of the policy to sample
+                each task with.
 
-            for j in range(self._num_grad_updates + 1):
-                episodes = trainer.obtain_episodes(trainer.step_itr,
-                                                   env_update=env_up)
-                batch_samples = self._process_samples(episodes)
-                all_samples[i].append(batch_samples)
+        Returns:
+            list[EpisodeBatch]: Episodes sampled from each task.
 
-                # The last iteration does only sampling but no adapting
-                if j < self._num_grad_updates:
-                    # A grad need to be kept for the next grad update
-                    # Except for the last grad update
-                    require_grad = j < self._num_grad_updates - 1
-                    self._adapt(batch_samples, set_grad=require_grad)
+        """
+        if self._episodes_per_task is None:
+            return [
+                trainer.obtain_episodes(trainer.step_itr,
+                                        agent_update=agent_up,
+                                        env_update=env_up)
+                for env_up, agent_up in zip(tasks, agent_updates)
+            ]
+        return trainer.obtain_episodes_per_update(self._episodes_per_task,
+                                                  agent_updates,
+                                                  env_updates=tasks)
+
+    def _task_agent_updates(self, task_params):
+        """Build the agent updates which sample with adapted parameters.
 
-            all_params.append(dict(self._policy.named_parameters()))
-            # Restore to pre-updated policy
-            update_module_params(self._policy, theta)
+        Args:
+            task_params (list[dict] or dict): Named parameters of each task,
+                or parameters stacked across tasks.
+
+        Returns:
+            list[dict]: State dictionary of the policy with the parameters of
+                each task.
 
-        return all_samples, all_params
+        """
+        if isinstance(task_params, dict):
+            n_tasks = len(next(iter(task_params.values())))
+            task_params = [{
+                name: param[i]
+                for name, param in task_params.items()
+            } for i in range(n_tasks)]
+        # Buffers are the same for every task.
+        state_dict = self._policy.state_dict()
+        return [{
+            **state_dict,
+            **{name: param.detach()
+               for name, param in params.items()}
+        } for params in task_params]
+
+    def _adapt_from(self, params, batch_samples, set_grad):
+        """Adapt the policy from given parameters, then restore it.
+
+        Args:
+            params (dict): Named parameters to adapt from.
+            batch_samples (_MAMLEpisodeBatch): Samples data for one
+                task and one gradient step.
+            set_grad (bool): if False, update policy parameters in-place.
+                Else, allow taking gradient of functions of updated parameters
+                with respect to pre-updated parameters.
+
+        Returns:
+            dict: Named adapted parameters.
+
+        """
+        theta = dict(self._policy.named_parameters())
+        # Drop, rather than zero, the gradients of theta. The gradients of
+        # previously adapted tasks may still be part of their graphs.
+        for param in theta.values():
+            param.grad = None
+        update_module_params(self._policy, params)
+        self._adapt(batch_samples, set_grad=set_grad)
+        adapted = dict(self._policy.named_parameters())
+        update_module_params(self._policy, theta)
+        for param in theta.values():
+            param.grad = None
+        return adapted
 
     def _adapt(self, batch_samples, set_grad=True):
         """Performs one MAML inner step to update the policy.
@@ -264,6 +394,9 @@ class MAML:
             torch.Tensor: Calculated mean value of loss.
 
         """
+        if self._vectorize_tasks:
+            return self._compute_vectorized_meta_loss(all_samples, all_params,
+                                                      set_grad)
         theta = dict(self._policy.named_parameters())
         old_theta = dict(self._old_policy.named_parameters())
 
@@ -304,6 +437,9 @@ class MAML:
             torch.Tensor: Calculated mean value of KL divergence.
 
         """
+        if self._vectorize_tasks:
+            return self._compute_vectorized_kl_constraint(
+                all_samples, all_params, set_grad)
         theta = dict(self._policy.named_parameters())
         old_theta = dict(self._old_policy.named_parameters())
 
@@ -325,6 +461,300 @@ class MAML:
 
         return torch.stack(kls).mean()
 
+    def _stacked_task_batches(self, all_samples):
+        """Stack the samples of every task, for each adaptation step.
+
+        The result is cached until the end of the current iteration, since
+        the meta-objective and KL constraint are evaluated several times on
+        the same samples.
+
+        Args:
+            all_samples (list[list[_MAMLEpisodeBatch]]): A two
+                dimensional list of _MAMLEpisodeBatch of size
+                [meta_batch_size * (num_grad_updates + 1)]
+
+        Returns:
+            list[_MAMLTaskBatch]: Stacked samples for each adaptation step.
+
+        """
+        if (self._task_batch_cache is None
+                or self._task_batch_cache[0] is not all_samples):
+            stacked = [
+                self._stack_task_batches(
+                    [task_samples[i] for task_samples in all_samples])
+                for i in range(self._num_grad_updates + 1)
+            ]
+            self._task_batch_cache = (all_samples, stacked)
+        return self._task_batch_cache[1]
+
+    @staticmethod
+    def _stack_task_batches(batches):
+        """Stack samples from several tasks along a new leading dimension.
+
+        Tasks with fewer episodes are padded with empty episodes, which are
+        excluded by the returned masks.
+
+        Args:
+            batches (list[_MAMLEpisodeBatch]): Samples data for each task.
+
+        Returns:
+            _MAMLTaskBatch: Samples of all tasks.
+
+        """
+        n_eps = max(len(batch.valids) for batch in batches)
+
+        def pad(tensor):
+            padding = tensor.new_zeros((n_eps - len(tensor), ) +
+                                       tensor.shape[1:])
+            return torch.cat([tensor, padding])
+
+        obs = torch.stack([pad(batch.observations) for batch in batches])
+        max_length = obs.shape[2]
+        step_masks = []
+        episode_masks = []
+        for batch in batches:
+            lengths = pad(batch.valids.long())
+            step_masks.append(
+                torch.arange(max_length).unsqueeze(0) < lengths.unsqueeze(1))
+            episode_masks.append(
+                torch.arange(n_eps) < len(batch.valids))
+        return _MAMLTaskBatch(
+            observations=obs,
+            actions=torch.stack([pad(batch.actions) for batch in batches]),
+            rewards=torch.stack([pad(batch.rewards) for batch in batches]),
+            baselines=torch.stack([pad(batch.baselines)
+                                   for batch in batches]),
+            step_masks=torch.stack(step_masks).float(),
+            episode_masks=torch.stack(episode_masks).float())
+
+    def _task_loss(self, observations, actions, rewards, baselines,
+                   step_masks):
+        r"""Compute the inner loss of one task from padded samples.
+
+        This computes the same loss as the inner algorithm, but using masks
+        instead of dropping padded time steps, so that it can be vectorized
+        over tasks.
+
+        Args:
+            observations (torch.Tensor): Observations with shape
+                :math:`(N, T, O*)`.
+            actions (torch.Tensor): Actions with shape :math:`(N, T, A*)`.
+            rewards (torch.Tensor): Rewards with shape :math:`(N, T)`.
+            baselines (torch.Tensor): Value function estimation at each step
+                with shape :math:`(N, T)`.
+            step_masks (torch.Tensor): Mask of valid steps with shape
+                :math:`(N, T)`.
+
+        Returns:
+            torch.Tensor: Calculated negative mean scalar value of objective.
+
+        """
+        # pylint: disable=protected-access
+        inner_algo = self._inner_algo
+        n_valid = step_masks.sum()
+        advantages = compute_advantages(inner_algo._discount,
+                                        inner_algo._gae_lambda,
+                                        inner_algo.max_episode_length,
+                                        baselines, rewards)
+        if inner_algo._center_adv:
+            means = (advantages * step_masks).sum() / n_valid
+            variance = (((advantages - means) * step_masks)**2).sum() / (
+                n_valid - 1)
+            advantages = (advantages - means) / (variance + 1e-8)
+        if inner_algo._positive_adv:
+            advantages = advantages - torch.where(
+                step_masks.bool(), advantages,
+                torch.full_like(advantages, float('inf'))).min()
+
+        obs_flat = flatten_batch(observations)
+        objectives = inner_algo._compute_objective(flatten_batch(advantages),
+                                                   obs_flat,
+                                                   flatten_batch(actions),
+                                                   flatten_batch(rewards))
+        if inner_algo._entropy_regularzied:
+            policy_entropies = inner_algo._compute_policy_entropy(obs_flat)
+            objectives = objectives + (inner_algo._policy_ent_coeff *
+                                       policy_entropies)
+        return -(objectives * flatten_batch(step_masks)).sum() / n_valid
+
+    def _task_kl_constraint(self, observations, episode_masks):
+        r"""Compute the KL constraint of one task from padded samples.
+
+        Args:
+            observations (torch.Tensor): Observations with shape
+                :math:`(N, T, O*)`.
+            episode_masks (torch.Tensor): Mask of non-padding episodes with
+                shape :math:`(N, )`.
+
+        Returns:
+            torch.Tensor: Calculated mean scalar value of KL divergence.
+
+        """
+        with torch.no_grad():
+            old_dist = self._old_policy(observations)[0]
+        new_dist = self._policy(observations)[0]
+        kl = torch.distributions.kl.kl_divergence(old_dist, new_dist)
+        return (kl * episode_masks.unsqueeze(1)).sum() / (
+            episode_masks.sum() * kl.shape[1])
+
+    def _vmap_tasks(self, fn, params, old_params, *task_inputs, grad=False):
+        """Evaluate a per-task function on all tasks at once.
+
+        The policy (and, if old_params is given, the old policy) is evaluated
+        functionally with the given parameters, using
+        :func:`torch.func.functional_call`.
+
+        Args:
+            fn (callable): Per-task function, taking unbatched task inputs.
+            params (dict): Policy parameters, either shared by all tasks or
+                stacked across tasks.
+            old_params (dict or None): Old policy parameters, either shared by
+                all tasks or stacked across tasks. If None, the current
+                parameters of the old policy are used.
+            *task_inputs (torch.Tensor): Inputs stacked across tasks.
+            grad (bool): If True, return the gradient of fn with respect to
+                params, instead of its value.
+
+        Returns:
+            torch.Tensor or dict: Output of fn for each task, or if grad is
+                True, its gradient for each task.
+
+        """
+        module = _FunctionalTaskModule(self._policy, self._old_policy, fn)
+
+        def task_fn(params, old_params, *inputs):
+            module_params = {'policy.' + k: v for k, v in params.items()}
+            if old_params is not None:
+                module_params.update(
+                    ('old_policy.' + k, v) for k, v in old_params.items())
+            return torch.func.functional_call(module,
+                                              module_params,
+                                              inputs,
+                                              tie_weights=False,
+                                              strict=False)
+
+        if grad:
+            task_fn = torch.func.grad(task_fn)
+        in_dims = (self._task_dim(params), self._task_dim(old_params)) + (
+            0, ) * len(task_inputs)
+        with _distribution_validation(False):
+            return torch.func.vmap(task_fn, in_dims=in_dims)(params,
+                                                             old_params,
+                                                             *task_inputs)
+
+    def _task_dim(self, params):
+        """Get the dimension along which parameters are stacked across tasks.
+
+        Args:
+            params (dict or None): Policy parameters.
+
+        Returns:
+            int or None: 0 if params are stacked across tasks, else None.
+
+        """
+        if params is None:
+            return None
+        name, param = next(iter(self._policy.named_parameters()))
+        return 0 if params[name].dim() > param.dim() else None
+
+    def _adapt_tasks(self, params, task_batch, set_grad=True):
+        """Perform one MAML inner step for all tasks at once.
+
+        Args:
+            params (dict): Policy parameters to adapt from, either shared by
+                all tasks or stacked across tasks.
+            task_batch (_MAMLTaskBatch): Samples of all tasks for one
+                gradient step.
+            set_grad (bool): if False, the adapted parameters are detached.
+                Else, allow taking gradient of functions of updated parameters
+                with respect to pre-updated parameters.
+
+        Returns:
+            dict: Adapted parameters, stacked across tasks.
+
+        """
+        grads = self._vmap_tasks(self._task_loss,
+                                 params,
+                                 None,
+                                 task_batch.observations,
+                                 task_batch.actions,
+                                 task_batch.rewards,
+                                 task_batch.baselines,
+                                 task_batch.step_masks,
+                                 grad=True)
+        lr = self._inner_optimizer.lr
+        with torch.set_grad_enabled(set_grad):
+            adapted = {
+                name: param - lr * grads[name]
+                for name, param in params.items()
+            }
+        if not set_grad:
+            adapted = {name: p.detach() for name, p in adapted.items()}
+        return adapted
+
+    def _compute_vectorized_meta_loss(self, all_samples, all_params,
+                                      set_grad):
+        """Compute loss to meta-optimize, vectorized over tasks.
+
+        Args:
+            all_samples (list[list[_MAMLEpisodeBatch]]): A two
+                dimensional list of _MAMLEpisodeBatch of size
+                [meta_batch_size * (num_grad_updates + 1)]
+            all_params (dict): Parameters used to sample the last step of
+                each task, stacked across tasks.
+            set_grad (bool): Whether to enable gradient calculation or not.
+
+        Returns:
+            torch.Tensor: Calculated mean value of loss.
+
+        """
+        task_batches = self._stacked_task_batches(all_samples)
+        params = dict(self._policy.named_parameters())
+        for i in range(self._num_grad_updates):
+            require_grad = i < self._num_grad_updates - 1 or set_grad
+            params = self._adapt_tasks(params,
+                                       task_batches[i],
+                                       set_grad=require_grad)
+        last_update = task_batches[-1]
+        with torch.set_grad_enabled(set_grad):
+            losses = self._vmap_tasks(self._task_loss, params, all_params,
+                                      last_update.observations,
+                                      last_update.actions,
+                                      last_update.rewards,
+                                      last_update.baselines,
+                                      last_update.step_masks)
+        return losses.mean()
+
+    def _compute_vectorized_kl_constraint(self, all_samples, all_params,
+                                          set_grad):
+        """Compute KL divergence, vectorized over tasks.
+
+        Args:
+            all_samples (list[list[_MAMLEpisodeBatch]]): Two
+                dimensional list of _MAMLEpisodeBatch of size
+                [meta_batch_size * (num_grad_updates + 1)]
+            all_params (dict): Parameters used to sample the last step of
+                each task, stacked across tasks.
+            set_grad (bool): Whether to enable gradient calculation or not.
+
+        Returns:
+            torch.Tensor: Calculated mean value of KL divergence.
+
+        """
+        task_batches = self._stacked_task_batches(all_samples)
+        params = dict(self._policy.named_parameters())
+        for i in range(self._num_grad_updates):
+            require_grad = i < self._num_grad_updates - 1 or set_grad
+            params = self._adapt_tasks(params,
+                                       task_batches[i],
+                                       set_grad=require_grad)
+        last_update = task_batches[-1]
+        with torch.set_grad_enabled(set_grad):
+            kls = self._vmap_tasks(self._task_kl_constraint, params,
+                                   all_params, last_update.observations,
+                                   last_update.episode_masks)
+        return kls.mean()
+
     def _compute_policy_entropy(self, task_samples):
         """Compute policy entropy.
 
@@ -336,7 +766,7 @@ class MAML:
             torch.Tensor: Computed entropy value.
 
         """
-        obs = torch.stack([samples.observations for samples in task_samples])
+        obs = torch.cat([samples.observations for samples in task_samples])
         # pylint: disable=protected-access
         entropies = self._inner_algo._compute_policy_entropy(obs)
         return entropies.mean()
@@ -526,3 +956,73 @@ class _MAMLEpisodeBatch(
             prescribed types and shapes.
 
     """
+
+
+_MAMLTaskBatch = collections.namedtuple('_MAMLTaskBatch', [
+    'observations', 'actions', 'rewards', 'baselines', 'step_masks',
+    'episode_masks'
+])
+_MAMLTaskBatch.__doc__ = r"""Padded samples of several tasks, stacked.
+
+All fields have a leading task dimension :math:`K`, followed by the episode
+dimension :math:`N` (padded to the largest number of episodes in any task)
+and, except for `episode_masks`, the time dimension :math:`T`.
+
+"""
+
+
+class _FunctionalTaskModule(torch.nn.Module):
+    """Module which evaluates a MAML task function with swapped parameters.
+
+    Wrapping the policies as submodules lets
+    :func:`torch.func.functional_call` substitute their parameters for the
+    whole duration of an arbitrary function of the policies.
+
+    Args:
+        policy (garage.torch.policies.Policy): Policy.
+        old_policy (garage.torch.policies.Policy): Old policy.
+        fn (callable): Function to evaluate.
+
+    """
+
+    def __init__(self, policy, old_policy, fn):
+        super().__init__()
+        self.policy = policy
+        self.old_policy = old_policy
+        self._fn = fn
+
+    # pylint: disable=arguments-differ
+    def forward(self, *inputs):
+        """Evaluate the function.
+
+        Args:
+            *inputs (torch.Tensor): Inputs to the function.
+
+        Returns:
+            torch.Tensor: Output of the function.
+
+        """
+        return self._fn(*inputs)
+
+
+@contextlib.contextmanager
+def _distribution_validation(enabled):
+    """Set whether torch.distributions validate their arguments.
+
+    Validation relies on data-dependent control flow, which can not be
+    vectorized by :func:`torch.func.vmap`.
+
+    Args:
+        enabled (bool): Whether to validate arguments.
+
+    Yields:
+        None: Nothing.
+
+    """
+    # pylint: disable=protected-access
+    previous = torch.distributions.Distribution._validate_args
+    torch.distributions.Distribution.set_default_validate_args(enabled)
+    try:
+        yield
+    finally:
+        torch.distributions.Distribution.set_default_validate_args(previous)
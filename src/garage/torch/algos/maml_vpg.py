@@ -42,6 +42,11 @@ class MAMLVPG(MAML):
         meta_evaluator (garage.experiment.MetaEvaluator): A meta evaluator for
             meta-testing. If None, don't do meta-testing.
         evaluate_every_n_epochs (int): Do meta-testing every this epochs.
+        episodes_per_task (int or None): If set, sample exactly this many
+            episodes from each task, sampling all tasks of each adaptation
+            step together. Otherwise, tasks are sampled one at a time.
+        vectorize_tasks (bool): If True, adapt and evaluate all tasks at once
+            with :func:`torch.func.vmap`. Requires PyTorch 2.0 or newer.
 
     """
 
@@ -63,7 +68,9 @@ class MAMLVPG(MAML):
                  meta_batch_size=20,
                  num_grad_updates=1,
                  meta_evaluator=None,
-                 evaluate_every_n_epochs=1):
+                 evaluate_every_n_epochs=1,
+                 episodes_per_task=None,
+                 vectorize_tasks=False):
         policy_optimizer = OptimizerWrapper(
             (torch.optim.Adam, dict(lr=inner_lr)), policy)
         vf_optimizer = OptimizerWrapper((torch.optim.Adam, dict(lr=inner_lr)),
@@ -94,4 +101,6 @@ class MAMLVPG(MAML):
                          outer_lr=outer_lr,
                          num_grad_updates=num_grad_updates,
                          meta_evaluator=meta_evaluator,
-                         evaluate_every_n_epochs=evaluate_every_n_epochs)
+                         evaluate_every_n_epochs=evaluate_every_n_epochs,
+                         episodes_per_task=episodes_per_task,
+                         vectorize_tasks=vectorize_tasks)
@@ -21,6 +21,10 @@ class MTSAC(SAC):
     The alphas are accessed by using a the one-hot encoding of an id that is
     assigned to each task.
 
+    To sample the same number of transitions from every task, train on a
+    :class:`~garage.envs.VecMultiEnvWrapper` holding all tasks, with a single
+    sampler worker whose `n_envs` is the number of tasks.
+
     Args:
         policy (garage.torch.policy.Policy): Policy/Actor/Agent that is being
             optimized by SAC.
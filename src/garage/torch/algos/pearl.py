@@ -615,6 +615,57 @@ class PEARL(MetaRLAlgorithm):
 
         return self._policy
 
+    def adapt_policies(self, exploration_episodes):
+        """Produce policies adapted for several tasks.
+
+        When every task has the same number of exploration steps, the
+        posteriors of all tasks are inferred in a single pass of the context
+        encoder.
+
+        Args:
+            exploration_episodes (list[EpisodeBatch]): Episodes to which to
+                adapt, for each task.
+
+        Returns:
+            list[Policy]: A policy adapted to each task. The policies share
+                networks with the meta-policy, but each holds the latent
+                context of its own task.
+
+        """
+        contexts = []
+        for eps in exploration_episodes:
+            total_steps = sum(eps.lengths)
+            r = eps.rewards.reshape(total_steps, 1)
+            contexts.append(
+                np.hstack((eps.observations, eps.actions,
+                           r)).reshape(1, total_steps, -1))
+        if len({ctxt.shape for ctxt in contexts}) == 1:
+            context = torch.as_tensor(np.concatenate(contexts),
+                                      device=global_device()).float()
+            self._policy.infer_posterior(context)
+            beliefs = [(self._policy.z_means, self._policy.z_vars,
+                        self._policy.z)]
+        else:
+            beliefs = []
+            for ctxt in contexts:
+                context = torch.as_tensor(ctxt, device=global_device()).float()
+                self._policy.infer_posterior(context)
+                beliefs.append((self._policy.z_means, self._policy.z_vars,
+                                self._policy.z))
+        z_means, z_vars, z = (torch.cat(b).detach() for b in zip(*beliefs))
+        self._policy.reset_belief()
+
+        # Only copy the latent context, not the networks.
+        memo = {id(net): net for net in self._policy.networks}
+        policies = []
+        for i in range(len(contexts)):
+            policy = copy.deepcopy(self._policy, memo=dict(memo))
+            policy.z_means = z_means[i:i + 1]
+            policy.z_vars = z_vars[i:i + 1]
+            policy.z = z[i:i + 1]
+            policies.append(policy)
+        return policies
+
     def to(self, device=None):
         """Put all the networks within the model on device.
 
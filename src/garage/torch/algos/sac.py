@@ -9,6 +9,7 @@ import torch
 import torch.nn.functional as F
 
 from garage import log_performance, obtain_evaluation_episodes, StepType
+from garage.experiment import timing
 from garage.np.algos import RLAlgorithm
 from garage.sampler import FragmentWorker, RaySampler
 from garage.torch import dict_np_to_torch, global_device
@@ -186,7 +187,7 @@ class SAC(RLAlgorithm):
             self._eval_env = trainer.get_env_copy()
         last_return = None
         for _ in trainer.step_epochs():
-            for _ in range(self._steps_per_epoch):
+            for _ in trainer.step_cycles(self._steps_per_epoch):
                 if not (self.replay_buffer.n_transitions_stored >=
                         self._min_buffer_size):
                     batch_size = int(self._min_buffer_size)
@@ -217,6 +218,7 @@ class SAC(RLAlgorithm):
 
         return np.mean(last_return)
 
+    @timing.timed('Train')
     def train_once(self, itr=None, paths=None):
         """Complete 1 training iteration of SAC.
 
@@ -451,6 +453,7 @@ class SAC(RLAlgorithm):
 
         return policy_loss, qf1_loss, qf2_loss
 
+    @timing.timed('Evaluate')
     def _evaluate_policy(self, epoch):
         """Evaluate the performance of the policy via deterministic sampling.
 
@@ -8,6 +8,7 @@ import torch.nn.functional as F
 
 from garage import (_Default, log_performance, make_optimizer,
                     obtain_evaluation_episodes)
+from garage.experiment import timing
 from garage.np.algos import RLAlgorithm
 from garage.sampler import FragmentWorker, LocalSampler
 from garage.torch import (dict_np_to_torch, global_device, soft_update_model,
@@ -192,7 +193,7 @@ class TD3(RLAlgorithm):
             self._eval_env = trainer.get_env_copy()
         trainer.enable_logging = False
         for _ in trainer.step_epochs():
-            for cycle in range(self._steps_per_epoch):
+            for cycle in trainer.step_cycles(self._steps_per_epoch):
                 # Obtain trasnsition batch and store it in replay buffer.
                 # Get action randomly from environment within warm-up steps.
                 # Afterwards, get action from policy.
@@ -225,6 +226,7 @@ class TD3(RLAlgorithm):
                                     prefix='Evaluation')
                 trainer.step_itr += 1
 
+    @timing.timed('Train')
     def _train_once(self, itr):
         """Perform one iteration of training.
 
@@ -335,6 +337,7 @@ class TD3(RLAlgorithm):
         return (critic_loss.detach(), target_Q, current_Q.detach(),
                 self._actor_loss.detach())
 
+    @timing.timed('Evaluate')
     def _evaluate_policy(self):
         """Evaluate the performance of the policy via deterministic rollouts.
 
@@ -374,6 +377,11 @@ class TD3(RLAlgorithm):
         tabular.record('QFunction/AverageAbsY',
                        np.mean(np.abs(self._epoch_ys)))
 
+    @property
+    def replay_buffer(self):
+        """ReplayBuffer: Replay buffer the algorithm samples from."""
+        return self._replay_buffer
+
     @property
     def networks(self):
         """Return all the networks within the model.
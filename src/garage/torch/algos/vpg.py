@@ -8,6 +8,7 @@ import torch
 import torch.nn.functional as F
 
 from garage import log_performance
+from garage.experiment import timing
 from garage.np import discount_cumsum
 from garage.np.algos import RLAlgorithm
 from garage.sampler import RaySampler
@@ -132,6 +133,7 @@ class VPG(RLAlgorithm):
         """
         return self._discount
 
+    @timing.timed('Train')
     def _train_once(self, itr, eps):
         """Train the algorithm once.
 
@@ -226,6 +228,7 @@ class VPG(RLAlgorithm):
 
         return last_return
 
+    @timing.timed('Optimize')
     def _train(self, obs, actions, rewards, returns, advs):
         r"""Train the policy and value function with minibatch.
 
@@ -345,6 +348,7 @@ class VPG(RLAlgorithm):
 
         return -objectives.mean()
 
+    @timing.timed('ComputeAdvantages')
     def _compute_advantage(self, rewards, valids, baselines):
         r"""Compute mean value of loss.
 
@@ -33,6 +33,10 @@ class OptimizerWrapper:
 
         Notes: P is the size of minibatch (self._minibatch_size)
 
+        Inputs are permuted once per optimization epoch, and each batch is a
+        view into the permuted inputs, which are overwritten by the next
+        epoch.
+
         Args:
             *inputs (list[torch.Tensor]): A list of inputs. Each input has
                 shape :math:`(N \dot [T], *)`.
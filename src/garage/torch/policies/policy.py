@@ -1,9 +1,11 @@
 """Base Policy."""
 import abc
 
+import numpy as np
 import torch
 
 from garage.np.policies import Policy as BasePolicy
+from garage.torch._functions import flatten_module_params, get_flat_params
 
 
 class Policy(torch.nn.Module, BasePolicy, abc.ABC):
@@ -46,15 +48,31 @@ class Policy(torch.nn.Module, BasePolicy, abc.ABC):
 
         """
 
+    def flatten_parameters(self):
+        """Store all parameters of the policy in a single flat buffer.
+
+        After calling this, :meth:`get_param_values` returns a flat
+        :class:`numpy.ndarray` and :meth:`set_param_values` loads one, each
+        with a single copy, and :func:`~garage.torch.soft_update_model`
+        updates the policy with one fused operation.
+
+        """
+        flatten_module_params(self)
+
     def get_param_values(self):
         """Get the parameters to the policy.
 
         This method is included to ensure consistency with TF policies.
 
         Returns:
-            dict: The parameters (in the form of the state dictionary).
+            dict or np.ndarray: The parameters (in the form of the state
+                dictionary), or a flat array if :meth:`flatten_parameters`
+                has been called.
 
         """
+        flat = get_flat_params(self)
+        if flat is not None:
+            return flat.detach().cpu().numpy().copy()
         return self.state_dict()
 
     def set_param_values(self, state_dict):
@@ -63,10 +81,23 @@ class Policy(torch.nn.Module, BasePolicy, abc.ABC):
         This method is included to ensure consistency with TF policies.
 
         Args:
-            state_dict (dict): State dictionary.
+            state_dict (dict or np.ndarray or torch.Tensor): State dictionary,
+                or flat parameters from a policy with flattened parameters.
+
+        Raises:
+            ValueError: If flat parameters are passed to a policy which has
+                not been flattened.
 
         """
-        self.load_state_dict(state_dict)
+        if isinstance(state_dict, (np.ndarray, torch.Tensor)):
+            flat = get_flat_params(self)
+            if flat is None:
+                raise ValueError('Flat parameter values can only be loaded '
+                                 'after calling flatten_parameters().')
+            with torch.no_grad():
+                flat.copy_(torch.as_tensor(state_dict))
+        else:
+            self.load_state_dict(state_dict)
 
     @property
     def name(self):
@@ -8,21 +8,53 @@ from dowel import logger, tabular
 import psutil
 
 # This is avoiding a circular import
-from garage.experiment.deterministic import get_seed, set_seed
+from garage._dtypes import EpisodeBatch
+from garage.experiment import timing
+from garage.experiment.deterministic import (get_rng_state, get_seed,
+                                             set_rng_state, set_seed)
 from garage.experiment.experiment import dump_json
 from garage.experiment.snapshotter import Snapshotter
+from garage.np.running_stats import RunningStats
 from garage.sampler.default_worker import DefaultWorker
+from garage.sampler.env_update import EnvStatsUpdate, EnvUpdate
+from garage.sampler.sampler_pool import attached_pool, PooledSampler
 from garage.sampler.worker_factory import WorkerFactory
 
-# pylint: disable=no-name-in-module
 
-tf = False
-TFWorkerClassWrapper = False
-try:
-    import tensorflow as tf
-    from garage.tf.samplers import TFWorkerClassWrapper  # noqa: E501; pylint: disable=ungrouped-imports
-except ImportError:
-    pass
+def _import_tf():
+    """Import TensorFlow for :class:`TFTrainer`.
+
+    TensorFlow is only imported once a TFTrainer is used, so that importing
+    garage does not pay for importing it.
+
+    Returns:
+        module: The tensorflow module.
+
+    Raises:
+        ImportError: If TensorFlow is not installed.
+
+    """
+    try:
+        import tensorflow as tf  # pylint: disable=import-outside-toplevel
+    except ImportError as e:
+        raise ImportError('TFTrainer requires TensorFlow. To use it, please '
+                          'install TensorFlow.') from e
+    return tf
+
+
+def _check_checkpoint_every(checkpoint_every):
+    """Check the number of cycles between checkpoints.
+
+    Args:
+        checkpoint_every (int or None): Number of cycles between checkpoints.
+
+    Raises:
+        ValueError: If checkpoint_every is not positive.
+
+    """
+    if checkpoint_every is not None and checkpoint_every < 1:
+        raise ValueError('checkpoint_every must be positive, but is '
+                         '{}'.format(checkpoint_every))
 
 
 class ExperimentStats:
@@ -72,17 +104,27 @@ class TrainArgs:
         store_episodes (bool): Save episodes in snapshot.
         pause_for_plot (bool): Pause for plot.
         start_epoch (int): The starting epoch. Used for resume().
+        checkpoint_every (int or None): Number of cycles between the
+            checkpoints saved within an epoch, or None to only snapshot at
+            the end of epochs.
 
     """
 
-    def __init__(self, n_epochs, batch_size, plot, store_episodes,
-                 pause_for_plot, start_epoch):
+    def __init__(self,
+                 n_epochs,
+                 batch_size,
+                 plot,
+                 store_episodes,
+                 pause_for_plot,
+                 start_epoch,
+                 checkpoint_every=None):
         self.n_epochs = n_epochs
         self.batch_size = batch_size
         self.plot = plot
         self.store_episodes = store_episodes
         self.pause_for_plot = pause_for_plot
         self.start_epoch = start_epoch
+        self.checkpoint_every = checkpoint_every
 
 
 class Trainer:
@@ -124,10 +166,16 @@ class Trainer:
 
     """
 
+    # Whether experiments run by run_experiments() sample with the
+    # launcher's pool of workers.
+    _use_sampler_pool = True
+
     def __init__(self, snapshot_config):
         self._snapshotter = Snapshotter(snapshot_config.snapshot_dir,
                                         snapshot_config.snapshot_mode,
-                                        snapshot_config.snapshot_gap)
+                                        snapshot_config.snapshot_gap,
+                                        snapshot_config.snapshot_async,
+                                        snapshot_config.snapshot_format)
 
         self._has_setup = False
         self._plot = False
@@ -148,6 +196,9 @@ class Trainer:
         self._itr_start_time = None
         self.step_itr = None
         self.step_episode = None
+        self._epoch = None
+        # Checkpoint restored by restore(), until training resumes from it.
+        self._checkpoint = None
 
         # only used for off-policy algorithms
         self.enable_logging = True
@@ -156,6 +207,11 @@ class Trainer:
         self._worker_class = None
         self._worker_args = None
 
+        # Running statistics of the workers' environments, merged across
+        # workers, and an update to send them back to the workers.
+        self._env_stats = {}
+        self._env_stats_update = None
+
     def make_sampler(self,
                      sampler_cls,
                      *,
@@ -209,6 +265,10 @@ class Trainer:
             sampler_args = {}
         if worker_args is None:
             worker_args = {}
+        pool = attached_pool()
+        if pool is not None and self._use_sampler_pool:
+            sampler_cls = PooledSampler
+            n_workers = pool.n_workers
         return sampler_cls.from_worker_factory(WorkerFactory(
             seed=seed,
             max_episode_length=max_episode_length,
@@ -237,7 +297,9 @@ class Trainer:
 
         Args:
             algo (RLAlgorithm): An algorithm instance.
-            env (Environment): An environment instance.
+            env (Environment or EnvFactory): An environment instance, or a
+                factory which workers use to construct their own
+                environments.
             sampler_cls (type): A class which implements :class:`Sampler`.
             sampler_args (dict): Arguments to be passed to sampler constructor.
             n_workers (int): The number of workers the sampler should use.
@@ -294,6 +356,7 @@ class Trainer:
         if self._plot:
             self._plotter.close()
 
+    @timing.timed('Sample')
     def obtain_episodes(self,
                         itr,
                         batch_size=None,
@@ -342,10 +405,104 @@ class Trainer:
         episodes = self._sampler.obtain_samples(
             itr, (batch_size or self._train_args.batch_size),
             agent_update=agent_update,
-            env_update=env_update)
-        self._stats.total_env_steps += sum(episodes.lengths)
+            env_update=self._with_env_stats(env_update))
+        self._count_env_steps(episodes)
         return episodes
 
+    @timing.timed('Sample')
+    def obtain_exact_episodes(self,
+                              n_eps_per_worker,
+                              agent_update=None,
+                              env_update=None):
+        """Obtain an exact number of episodes from each sampler worker.
+
+        Args:
+            n_eps_per_worker (int): Exact number of episodes to gather for
+                each worker.
+            agent_update (object): Value which will be passed into the
+                `agent_update_fn` before doing sampling episodes. If a list is
+                passed in, it must have length exactly `factory.n_workers`, and
+                will be spread across the workers.
+            env_update (object): Value which will be passed into the
+                `env_update_fn` before sampling episodes. If a list is passed
+                in, it must have length exactly `factory.n_workers`, and will
+                be spread across the workers.
+
+        Raises:
+            ValueError: If the trainer was initialized without a sampler.
+
+        Returns:
+            EpisodeBatch: Batch of episodes, in worker order.
+
+        """
+        if self._sampler is None:
+            raise ValueError('trainer was not initialized with `sampler_cls`. '
+                             'Either provide `sampler_cls` to trainer.setup, '
+                             ' or set `algo.sampler_cls`.')
+        if agent_update is None:
+            policy = getattr(self._algo, 'exploration_policy', None)
+            if policy is None:
+                policy = self._algo.policy
+            agent_update = policy.get_param_values()
+        episodes = self._sampler.obtain_exact_episodes(
+            n_eps_per_worker,
+            agent_update=agent_update,
+            env_update=self._with_env_stats(env_update))
+        self._count_env_steps(episodes)
+        return episodes
+
+    @timing.timed('Sample')
+    def obtain_episodes_per_update(self,
+                                   n_episodes,
+                                   agent_updates,
+                                   env_updates=None):
+        """Obtain an exact number of episodes with each of several updates.
+
+        Updates are assigned to sampler workers by the sampler's task
+        scheduler, which sends updates of the same environment type to the
+        same workers where possible, so that workers rarely construct new
+        environments. Updates sampled in the same sampler call share the
+        workers evenly.
+
+        Args:
+            n_episodes (int): Exact number of episodes to gather with each
+                update.
+            agent_updates (list[object]): Agent update to sample each batch of
+                episodes with.
+            env_updates (list[object] or None): Environment update to sample
+                each batch of episodes with. If None, the environments of the
+                workers are not updated.
+
+        Raises:
+            ValueError: If agent_updates and env_updates differ in length, or
+                if the trainer was initialized without a sampler.
+
+        Returns:
+            list[EpisodeBatch]: Episodes sampled with each update, in the
+                order of the updates.
+
+        """
+        if self._sampler is None:
+            raise ValueError('trainer was not initialized with `sampler_cls`. '
+                             'Either provide `sampler_cls` to trainer.setup, '
+                             ' or set `algo.sampler_cls`.')
+        if env_updates is None:
+            env_updates = [None] * len(agent_updates)
+        if len(env_updates) != len(agent_updates):
+            raise ValueError('agent_updates and env_updates must have the '
+                             'same length, but got {} and {}.'.format(
+                                 len(agent_updates), len(env_updates)))
+        episodes = self._sampler.obtain_task_episodes(n_episodes,
+                                                      agent_updates,
+                                                      env_updates)
+        self._count_env_steps(episodes)
+        # Episodes are ordered by task, with n_episodes episodes per task.
+        episodes = episodes.split()
+        return [
+            EpisodeBatch.concatenate(*episodes[start:start + n_episodes])
+            for start in range(0, len(episodes), n_episodes)
+        ]
+
     def obtain_samples(self,
                        itr,
                        batch_size=None,
@@ -378,6 +535,7 @@ class Trainer:
         eps = self.obtain_episodes(itr, batch_size, agent_update, env_update)
         return eps.to_list()
 
+    @timing.timed('Snapshot')
     def save(self, epoch):
         """Save snapshot of current batch.
 
@@ -392,8 +550,39 @@ class Trainer:
             raise NotSetupError('Use setup() to setup trainer before saving.')
 
         logger.log('Saving snapshot...')
+        self._snapshotter.save_itr_params(epoch, self._snapshot_params())
+        logger.log('Saved')
+
+    @timing.timed('Checkpoint')
+    def _save_checkpoint(self, cycle):
+        """Save a checkpoint in the middle of the current epoch.
+
+        Args:
+            cycle (int): Number of cycles of the epoch done.
+
+        """
+        self._stats.total_itr = self.step_itr
+        params = self._snapshot_params()
+        params['checkpoint'] = dict(epoch=self._epoch,
+                                    cycle=cycle,
+                                    enable_logging=self.enable_logging,
+                                    rng_state=get_rng_state())
+        self._snapshotter.save_checkpoint(params)
+        logger.log('Saved checkpoint after cycle {}'.format(cycle))
+
+    def _snapshot_params(self):
+        """Get the state of the experiment to snapshot.
 
+        Returns:
+            dict: State of the experiment.
+
+        """
         params = dict()
+        # Sectioned snapshots store each key in its own section, and objects
+        # shared by several sections in the first of them, so the policy and
+        # replay buffer can be loaded without the rest of the algorithm.
+        params['policy'] = getattr(self._algo, 'policy', None)
+        params['replay_buffer'] = getattr(self._algo, 'replay_buffer', None)
         # Save arguments
         params['setup_args'] = self._setup_args
         params['train_args'] = self._train_args
@@ -405,19 +594,26 @@ class Trainer:
         params['n_workers'] = self._n_workers
         params['worker_class'] = self._worker_class
         params['worker_args'] = self._worker_args
-
-        self._snapshotter.save_itr_params(epoch, params)
-
-        logger.log('Saved')
+        params['env_stats'] = self._env_stats
+        return params
 
     def restore(self, from_dir, from_epoch='last'):
         """Restore experiment from snapshot.
 
+        Restoring the checkpoint saved within an epoch (see :meth:`train`)
+        resumes training at the cycle after the checkpoint, with the
+        process-wide random number generators in the state they were in
+        (see :func:`~garage.experiment.deterministic.get_rng_state`). The
+        generators of environments, such as the `np_random` of Gym
+        environments, are not checkpointed, so environments with random
+        dynamics or initial states may not continue as if training had not
+        been interrupted.
+
         Args:
             from_dir (str): Directory of the pickle file
                 to resume experiment from.
             from_epoch (str or int): The epoch to restore from.
-                Can be 'first', 'last' or a number.
+                Can be 'first', 'last', 'checkpoint' or a number.
                 Not applicable when snapshot_mode='last'.
 
         Returns:
@@ -439,6 +635,9 @@ class Trainer:
                    n_workers=saved['n_workers'],
                    worker_class=saved['worker_class'],
                    worker_args=saved['worker_args'])
+        self._env_stats = saved.get('env_stats', {})
+        if self._env_stats:
+            self._env_stats_update = EnvStatsUpdate(self._env_stats)
 
         n_epochs = self._train_args.n_epochs
         last_epoch = self._stats.total_epoch
@@ -461,9 +660,59 @@ class Trainer:
         logger.log(fmt.format('last_itr', last_itr))
         logger.log(fmt.format('total_env_steps', total_env_steps))
 
-        self._train_args.start_epoch = last_epoch + 1
+        self._checkpoint = saved.get('checkpoint')
+        if self._checkpoint is None:
+            self._train_args.start_epoch = last_epoch + 1
+        else:
+            self._train_args.start_epoch = self._checkpoint['epoch']
+            logger.log(fmt.format('-- Checkpoint --', '-- Value --'))
+            logger.log(fmt.format('epoch', self._checkpoint['epoch']))
+            logger.log(fmt.format('cycle', self._checkpoint['cycle']))
         return copy.copy(self._train_args)
 
+    def _count_env_steps(self, episodes):
+        """Count the environment steps of sampled episodes.
+
+        Args:
+            episodes (EpisodeBatch): Sampled episodes.
+
+        """
+        n_env_steps = sum(episodes.lengths)
+        self._stats.total_env_steps += n_env_steps
+        timing.count('EnvSteps', n_env_steps)
+
+    def _merge_env_stats(self, worker_stats):
+        """Merge running statistics of the workers' environments.
+
+        The merged statistics are sent back to the workers with the next
+        sampler call which does not update the environments otherwise.
+
+        Args:
+            worker_stats (dict[str, object]): Statistics collected from the
+                workers. Running statistics are removed from it.
+
+        """
+        for name, value in list(worker_stats.items()):
+            if isinstance(value, RunningStats):
+                del worker_stats[name]
+                self._env_stats[name] = self._env_stats.get(name, 0) + value
+                self._env_stats_update = EnvStatsUpdate(self._env_stats)
+
+    def _with_env_stats(self, env_update):
+        """Send pending environment statistics along with an env update.
+
+        Args:
+            env_update (object): Environment update passed to the sampler.
+
+        Returns:
+            object: env_update, or an update carrying merged environment
+                statistics if env_update is None and statistics are pending.
+
+        """
+        if env_update is None and self._env_stats_update is not None:
+            env_update, self._env_stats_update = self._env_stats_update, None
+        return env_update
+
     def log_diagnostics(self, pause_for_plot=False):
         """Log diagnostics.
 
@@ -474,6 +723,15 @@ class Trainer:
         logger.log('Time %.2f s' % (time.time() - self._start_time))
         logger.log('EpochTime %.2f s' % (time.time() - self._itr_start_time))
         tabular.record('TotalEnvSteps', self._stats.total_env_steps)
+        if self._sampler is not None:
+            worker_stats = self._sampler.collect_worker_stats()
+            self._merge_env_stats(worker_stats)
+            for name, value in worker_stats.items():
+                tabular.record(name, value)
+        for name, value in self._snapshotter.collect_stats().items():
+            tabular.record(name, value)
+        for name, value in timing.collect_stats().items():
+            tabular.record(name, value)
         logger.log(tabular)
 
         if self._plot:
@@ -487,7 +745,8 @@ class Trainer:
               batch_size=None,
               plot=False,
               store_episodes=False,
-              pause_for_plot=False):
+              pause_for_plot=False,
+              checkpoint_every=None):
         """Start training.
 
         Args:
@@ -496,9 +755,16 @@ class Trainer:
             plot (bool): Visualize an episode from the policy after each epoch.
             store_episodes (bool): Save episodes in snapshot.
             pause_for_plot (bool): Pause for plot.
+            checkpoint_every (int or None): Save a checkpoint every this many
+                cycles within an epoch, which :meth:`restore` can resume
+                from. Only algorithms which step through the cycles of their
+                epochs with :meth:`step_cycles`, such as off-policy
+                algorithms, save checkpoints. Each checkpoint replaces the
+                previous one.
 
         Raises:
             NotSetupError: If train() is called before setup().
+            ValueError: If checkpoint_every is not positive.
 
         Returns:
             float: The average return in last epoch cycle.
@@ -507,6 +773,7 @@ class Trainer:
         if not self._has_setup:
             raise NotSetupError(
                 'Use setup() to setup trainer before training.')
+        _check_checkpoint_every(checkpoint_every)
 
         # Save arguments for restore
         self._train_args = TrainArgs(n_epochs=n_epochs,
@@ -514,16 +781,20 @@ class Trainer:
                                      plot=plot,
                                      store_episodes=store_episodes,
                                      pause_for_plot=pause_for_plot,
-                                     start_epoch=0)
+                                     start_epoch=0,
+                                     checkpoint_every=checkpoint_every)
 
         self._plot = plot
         self._start_worker()
 
         log_dir = self._snapshotter.snapshot_dir
         summary_file = os.path.join(log_dir, 'experiment.json')
-        dump_json(summary_file, self)
+        seconds, size = dump_json(summary_file, self)
+        logger.log('Wrote {} ({:.1f} KiB) in {:.3f}s'.format(
+            summary_file, size / 1024, seconds))
 
         average_return = self._algo.train(self)
+        self._snapshotter.close()
         self._shutdown_worker()
 
         return average_return
@@ -560,10 +831,16 @@ class Trainer:
 
         logger.log('Obtaining samples...')
 
+        if self._checkpoint is not None:
+            # The algorithm resets this when it starts training.
+            self.enable_logging = self._checkpoint['enable_logging']
+
         for epoch in range(self._train_args.start_epoch, n_epochs):
             self._itr_start_time = time.time()
+            self._epoch = epoch
             with logger.prefix('epoch #%d | ' % epoch):
                 yield epoch
+                self._checkpoint = None
                 save_episode = (self.step_episode
                                 if self._train_args.store_episodes else None)
 
@@ -578,12 +855,53 @@ class Trainer:
                     logger.dump_all(self.step_itr)
                     tabular.clear()
 
+    def step_cycles(self, n_cycles):
+        """Step through the cycles of an epoch.
+
+        Off-policy algorithms sample and optimize several times in each
+        epoch. When they iterate over this generator, rather than over
+        `range(n_cycles)`, the trainer saves a checkpoint every
+        `checkpoint_every` cycles (see :meth:`train`), and training restored
+        from a checkpoint resumes at the cycle after it. Episodes in progress
+        in the sampler's workers, and the random number generators of their
+        environments, are not checkpointed.
+
+        Args:
+            n_cycles (int): Number of cycles in each epoch.
+
+        Yields:
+            int: The next cycle of the epoch.
+
+        Examples:
+            for epoch in trainer.step_epochs():
+                for cycle in trainer.step_cycles(steps_per_epoch):
+                    trainer.step_episode = trainer.obtain_samples(...)
+                    self.train_once(...)
+                    trainer.step_itr += 1
+
+        """
+        start = 0
+        if self._checkpoint is not None:
+            start = self._checkpoint['cycle']
+            set_rng_state(self._checkpoint['rng_state'])
+            self._checkpoint = None
+        # Snapshots saved by older versions of garage have no
+        # checkpoint_every.
+        checkpoint_every = getattr(self._train_args, 'checkpoint_every', None)
+        for cycle in range(start, n_cycles):
+            yield cycle
+            # The epoch is snapshotted after its last cycle.
+            if (checkpoint_every and cycle + 1 < n_cycles
+                    and (cycle + 1) % checkpoint_every == 0):
+                self._save_checkpoint(cycle + 1)
+
     def resume(self,
                n_epochs=None,
                batch_size=None,
                plot=None,
                store_episodes=None,
-               pause_for_plot=None):
+               pause_for_plot=None,
+               checkpoint_every=None):
         """Resume from restored experiment.
 
         This method provides the same interface as train().
@@ -597,9 +915,12 @@ class Trainer:
             plot (bool): Visualize an episode from the policy after each epoch.
             store_episodes (bool): Save episodes in snapshot.
             pause_for_plot (bool): Pause for plot.
+            checkpoint_every (int): Save a checkpoint every this many cycles
+                within an epoch.
 
         Raises:
             NotSetupError: If resume() is called before restore().
+            ValueError: If checkpoint_every is not positive.
 
         Returns:
             float: The average return in last epoch cycle.
@@ -617,8 +938,12 @@ class Trainer:
             self._train_args.store_episodes = store_episodes
         if pause_for_plot is not None:
             self._train_args.pause_for_plot = pause_for_plot
+        if checkpoint_every is not None:
+            _check_checkpoint_every(checkpoint_every)
+            self._train_args.checkpoint_every = checkpoint_every
 
         average_return = self._algo.train(self)
+        self._snapshotter.close()
         self._shutdown_worker()
 
         return average_return
@@ -626,15 +951,26 @@ class Trainer:
     def get_env_copy(self):
         """Get a copy of the environment.
 
+        If the trainer was set up with an environment factory, such as an
+        :class:`~garage.sampler.EnvFactory`, a new environment is constructed
+        instead of copying one.
+
         Returns:
             Environment: An environment instance.
 
         """
+        if isinstance(self._env, EnvUpdate):
+            return self._env()
         if self._env:
             return cloudpickle.loads(cloudpickle.dumps(self._env))
         else:
             return None
 
+    @property
+    def n_workers(self):
+        """int: Number of workers used by the sampler."""
+        return self._n_workers
+
     @property
     def total_env_steps(self):
         """Total environment steps collected.
@@ -713,7 +1049,12 @@ class TFTrainer(Trainer):
 
     """
 
+    # Each TensorFlow worker enters a Session of its own, so the workers of
+    # several experiments can not share a process.
+    _use_sampler_pool = False
+
     def __init__(self, snapshot_config, sess=None):
+        tf = _import_tf()
         super().__init__(snapshot_config=snapshot_config)
         self.sess = sess or tf.compat.v1.Session()
         self.sess_entered = False
@@ -725,6 +1066,7 @@ class TFTrainer(Trainer):
             TFTrainer: This trainer.
 
         """
+        tf = _import_tf()
         if tf.compat.v1.get_default_session() is not self.sess:
             self.sess.__enter__()
             self.sess_entered = True
@@ -739,6 +1081,7 @@ class TFTrainer(Trainer):
             exc_tb (object): Traceback.
 
         """
+        tf = _import_tf()
         if tf.compat.v1.get_default_session(
         ) is self.sess and self.sess_entered:
             self.sess.__exit__(exc_type, exc_val, exc_tb)
@@ -771,9 +1114,10 @@ class TFTrainer(Trainer):
             sampler_cls: An instance of the sampler class.
 
         """
+        # pylint: disable=import-outside-toplevel
+        from garage.tf.samplers import TFWorkerClassWrapper
         if worker_class is None:
             worker_class = getattr(self._algo, 'worker_cls', DefaultWorker)
-        # pylint: disable=useless-super-delegation
         return super().make_sampler(
             sampler_cls,
             seed=seed,
@@ -803,7 +1147,9 @@ class TFTrainer(Trainer):
 
         Args:
             algo (RLAlgorithm): An algorithm instance.
-            env (Environment): An environment instance.
+            env (Environment or EnvFactory): An environment instance, or a
+                factory which workers use to construct their own
+                environments.
             sampler_cls (type): A class which implements :class:`Sampler`
             sampler_args (dict): Arguments to be passed to sampler constructor.
             n_workers (int): The number of workers the sampler should use.
@@ -823,6 +1169,7 @@ class TFTrainer(Trainer):
         if self._plot:
             # pylint: disable=import-outside-toplevel
             from garage.tf.plotter import Plotter
+            tf = _import_tf()
             self._plotter = Plotter(self.get_env_copy(),
                                     self._algo.policy,
                                     sess=tf.compat.v1.get_default_session())
@@ -830,6 +1177,7 @@ class TFTrainer(Trainer):
 
     def initialize_tf_vars(self):
         """Initialize all uninitialized variables in session."""
+        tf = _import_tf()
         with tf.name_scope('initialize_tf_vars'):
             uninited_set = [
                 e.decode() for e in self.sess.run(
@@ -840,17 +1188,3 @@ class TFTrainer(Trainer):
                     v for v in tf.compat.v1.global_variables()
                     if v.name.split(':')[0] in uninited_set
                 ]))
-
-
-class __FakeTFTrainer:
-    # noqa: E501; pylint: disable=missing-param-doc,too-few-public-methods,no-method-argument
-    """Raises an ImportError for environments without TensorFlow."""
-
-    def __init__(*args, **kwargs):
-        raise ImportError(
-            'TFTrainer requires TensorFlow. To use it, please install '
-            'TensorFlow.')
-
-
-if not tf:
-    TFTrainer = __FakeTFTrainer  # noqa: F811
@@ -3,7 +3,9 @@ from copy import copy
 import pickle
 
 import dm_control.mujoco
+from dm_control.rl.control import flatten_observation
 import dm_control.suite
+import numpy as np
 import pytest
 
 from garage.envs.dm_control import DMControlEnv
@@ -100,6 +102,28 @@ class TestDMControlEnv:
             assert a == a_copy
         env.close()
 
+    def test_flattens_observations(self):
+        domain_name, task_name = dm_control.suite.ALL_TASKS[0]
+        env = DMControlEnv.from_suite(domain_name, task_name)
+        env.reset()
+        es = env.step(env.action_space.sample())
+        assert es.env_info == {}
+        time_step = env._env.reset()
+        assert np.array_equal(
+            env._flatten_observation(time_step.observation),
+            flatten_observation(time_step.observation)['observations'])
+        env.close()
+
+    def test_observation_env_info(self):
+        domain_name, task_name = dm_control.suite.ALL_TASKS[0]
+        env = DMControlEnv.from_suite(domain_name,
+                                      task_name,
+                                      observation_env_info=True)
+        env.reset()
+        es = env.step(env.action_space.sample())
+        assert set(es.env_info) == set(env._env.observation_spec())
+        env.close()
+
     def test_catch_no_reset(self):
         domain_name, task_name = dm_control.suite.ALL_TASKS[0]
         env = DMControlEnv.from_suite(domain_name, task_name)
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from garage import StepType
+from garage.envs import BatchGridWorldEnv, GridWorldEnv
+
+
+def test_matches_grid_world_env():
+    n_envs = 5
+    env = BatchGridWorldEnv(n_envs, desc='4x4_safe', max_episode_length=20)
+    singles = [
+        GridWorldEnv(desc='4x4_safe', max_episode_length=20)
+        for _ in range(n_envs)
+    ]
+    obs, _ = env.reset()
+    assert list(obs) == [single.reset()[0] for single in singles]
+    for _ in range(200):
+        actions = np.random.randint(4, size=n_envs)
+        env_steps = env.step(actions)
+        for i, (es, single) in enumerate(zip(env_steps, singles)):
+            single_es = single.step(actions[i])
+            assert es.observation == single_es.observation
+            assert es.reward == single_es.reward
+            assert es.step_type == single_es.step_type
+            if es.last:
+                assert env.reset_env(i)[0] == single.reset()[0]
+
+
+def test_per_copy_tasks():
+    env = BatchGridWorldEnv(2, desc='chain')
+    env.set_task({'desc': ['SGFFFFFFFFFFFFFFFFFFFFFFFFFFF']}, index=1)
+    env.reset()
+    env_steps = env.step([1, 2])
+    assert env_steps[0].step_type == StepType.FIRST
+    assert env_steps[1].step_type == StepType.TERMINAL
+    assert env_steps[1].reward == 1.
+
+
+def test_sample_tasks():
+    env = BatchGridWorldEnv(3, desc='8x8')
+    tasks = env.sample_tasks(3)
+    for i, task in enumerate(tasks):
+        assert ''.join(task['desc']).count('G') == 1
+        env.set_task(task, i)
+    env.reset()
+    env.step([0, 1, 2])
+
+
+def test_invalid_tasks():
+    env = BatchGridWorldEnv(2, desc='4x4')
+    with pytest.raises(ValueError):
+        env.set_task({'desc': '8x8'})
+    with pytest.raises(ValueError):
+        env.set_task({'desc': ['FFFF', 'FFFF', 'FFFF', 'FFFG']})
+    with pytest.raises(ValueError):
+        env.set_task({'desc': ['SFFF', 'FFFF', 'FFFF', 'FFFZ']})
@@ -0,0 +1,87 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from garage import StepType
+from garage.envs import BatchPointEnv, PointEnv
+
+
+def test_matches_point_env():
+    n_envs = 4
+    env = BatchPointEnv(n_envs, done_bonus=2., max_episode_length=30)
+    singles = [
+        PointEnv(done_bonus=2., max_episode_length=30) for _ in range(n_envs)
+    ]
+    # The first copy starts next to its goal and does not move, so its
+    # episodes terminate.
+    tasks = [{'goal': np.array([0.05, 0.05])}] + env.sample_tasks(n_envs - 1)
+    tasks = [{'goal': task['goal'].astype(np.float32)} for task in tasks]
+    for i, (task, single) in enumerate(zip(tasks, singles)):
+        env.set_task(task, i)
+        single.set_task(task)
+    obs, episode_infos = env.reset()
+    for i, single in enumerate(singles):
+        single_obs, single_info = single.reset()
+        assert np.allclose(obs[i], single_obs)
+        assert episode_infos[i]['goal'] is single_info['goal']
+    terminated = False
+    for _ in range(60):
+        actions = np.random.uniform(-0.2, 0.2,
+                                    size=(n_envs, 2)).astype(np.float32)
+        actions[0] = 0.
+        env_steps = env.step(actions)
+        for i, (es, single) in enumerate(zip(env_steps, singles)):
+            single_es = single.step(actions[i])
+            assert np.allclose(es.observation,
+                               single_es.observation,
+                               atol=1e-6)
+            assert es.reward == pytest.approx(single_es.reward)
+            assert es.step_type == single_es.step_type
+            assert es.env_info['success'] == single_es.env_info['success']
+            assert es.env_info['task'] is tasks[i]
+            if es.last:
+                terminated |= es.step_type == StepType.TERMINAL
+                assert np.allclose(env.reset_env(i)[0], single.reset()[0])
+    assert terminated
+
+
+def test_step_before_reset():
+    env = BatchPointEnv(2, max_episode_length=1)
+    with pytest.raises(RuntimeError):
+        env.step(np.zeros((2, 2)))
+    env.reset()
+    env.step(np.zeros((2, 2)))
+    env.reset_env(0)
+    with pytest.raises(RuntimeError):
+        env.step(np.zeros((2, 2)))
+    env.reset_env(1)
+    env.step(np.zeros((2, 2)))
+
+
+def test_does_not_modify_actions():
+    env = BatchPointEnv(2)
+    env.reset()
+    actions = np.ones((2, 2))
+    env.step(actions)
+    assert (actions == 1).all()
+
+
+def test_set_task_of_all_copies():
+    env = BatchPointEnv(3)
+    env.set_task({'goal': np.array([-1., 2.])})
+    _, episode_infos = env.reset()
+    assert all((info['goal'] == [-1., 2.]).all() for info in episode_infos)
+
+
+def test_pickleable():
+    env = BatchPointEnv(2)
+    round_trip = pickle.loads(pickle.dumps(env))
+    obs, _ = round_trip.reset()
+    assert obs.shape == (2, 3)
+    assert round_trip.observation_space.contains(obs[0])
+
+
+def test_invalid_n_envs():
+    with pytest.raises(ValueError):
+        BatchPointEnv(0)
@@ -158,3 +158,22 @@ def test_is_pickleable():
     h = pickle.dumps(env)
     env_pickled = pickle.loads(h)
     assert env.spec == env_pickled.spec
+
+
+def test_validation_steps():
+    env = GymEnv('MountainCar-v0', validation_steps=2)
+    env.reset()
+    env.step(env.action_space.sample())
+    env._env_info = {'k1': 'v1'}
+    with pytest.raises(RuntimeError,
+                       match='GymEnv outputs inconsistent env_info keys.'):
+        env.step(env.action_space.sample())
+    # Later steps are not checked.
+    env.step(env.action_space.sample())
+    env_pickled = pickle.loads(pickle.dumps(env))
+    assert env_pickled._validation_steps == 2
+
+
+def test_invalid_validation_steps():
+    with pytest.raises(ValueError):
+        GymEnv('MountainCar-v0', validation_steps=-1)
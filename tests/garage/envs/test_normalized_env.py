@@ -4,6 +4,8 @@ import numpy as np
 
 from garage.envs import PointEnv
 from garage.envs.normalized_env import NormalizedEnv
+from garage.np.policies import FixedPolicy
+from garage.sampler import EnvStatsUpdate, LocalSampler, WorkerFactory
 
 from tests.helpers import step_env
 
@@ -47,3 +49,33 @@ class TestNormalizedEnv:
         obs = env.reset()[0]
 
         assert obs.shape == env.observation_space.shape
+
+    def test_share_normalization_stats(self):
+        env = NormalizedEnv(PointEnv(goal=(1., 2.), max_episode_length=5),
+                            normalize_obs=True,
+                            normalize_reward=True,
+                            obs_alpha=None,
+                            reward_alpha=None)
+        policy = FixedPolicy(env.spec,
+                             scripted_actions=[
+                                 env.action_space.sample() for _ in range(5)
+                             ])
+        workers = WorkerFactory(seed=100, max_episode_length=5, n_workers=2)
+        sampler = LocalSampler.from_worker_factory(workers, policy, env)
+        episodes = sampler.obtain_exact_episodes(2, policy)
+        stats = sampler.collect_worker_stats()
+        obs_stats = stats[NormalizedEnv.OBS_STATS]
+        # Each worker resets once before every episode.
+        n_obs = sum(episodes.lengths) + len(episodes.lengths)
+        assert obs_stats.count == n_obs
+        assert stats[NormalizedEnv.REWARD_STATS].count == sum(
+            episodes.lengths)
+        sampler.obtain_exact_episodes(1,
+                                      policy,
+                                      env_update=EnvStatsUpdate(stats))
+        for worker in sampler._workers:
+            worker_stats = worker.env._obs_stats
+            assert worker_stats.count == n_obs + 6
+        assert sampler.collect_worker_stats()[
+            NormalizedEnv.OBS_STATS].count == 12
+        sampler.shutdown_worker()
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from garage.envs import PointEnv, VecMultiEnvWrapper
+
+
+def _envs():
+    return [
+        PointEnv(goal=np.array([1., 0.]), max_episode_length=5),
+        PointEnv(goal=np.array([0., 1.]), max_episode_length=5),
+        PointEnv(goal=np.array([-1., 0.]), max_episode_length=5),
+    ]
+
+
+def test_steps_all_tasks():
+    env = VecMultiEnvWrapper(_envs(), env_names=['a', 'b', 'c'])
+    assert env.num_tasks == 3
+    assert env.n_envs == 3
+    assert env.observation_space.shape == (6, )
+    obs, episode_infos = env.reset()
+    assert obs.shape == (3, 6)
+    assert np.array_equal(obs[:, -3:], np.eye(3))
+    assert len(episode_infos) == 3
+    env_steps = env.step(np.zeros((3, 2)))
+    assert len(env_steps) == 3
+    for task_id, es in enumerate(env_steps):
+        assert es.env_info['task_id'] == task_id
+        assert es.env_info['task_name'] == 'abc'[task_id]
+        assert es.observation.shape == (6, )
+        assert es.observation[3 + task_id] == 1
+        assert es.env_spec is env.spec
+    obs, _ = env.reset_env(1)
+    assert np.array_equal(obs[-3:], [0, 1, 0])
+    env.close()
+
+
+def test_vanilla_and_del_onehot():
+    env = VecMultiEnvWrapper(_envs(), mode='vanilla')
+    assert env.reset()[0].shape == (3, 3)
+    env = VecMultiEnvWrapper(_envs(), mode='del-onehot')
+    assert env.observation_space.shape == (0, )
+    env.reset()
+    assert env.step(np.zeros((3, 2)))[0].observation.shape == (0, )
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        VecMultiEnvWrapper(_envs(), mode='onehot')
+    with pytest.raises(ValueError):
+        VecMultiEnvWrapper(_envs(), env_names=['a', 'a', 'b'])
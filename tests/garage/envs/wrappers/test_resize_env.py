@@ -44,3 +44,25 @@ class TestResize:
         self.env_r.reset()
         obs_r, _, _, _ = self.env_r.step(1)
         assert obs_r.shape == (self.width, self.height)
+
+    def test_resize_invalid_interpolation(self):
+        with pytest.raises(ValueError):
+            Resize(self.env, width=4, height=4, interpolation='cubic')
+
+    def test_resize_area(self):
+        env = DummyDiscrete2DEnv(random=False)
+        env.observation_space = gym.spaces.Box(low=0,
+                                               high=255,
+                                               shape=(4, 6),
+                                               dtype=np.uint8)
+        env_r = Resize(env, width=2, height=3, interpolation='area')
+        frame = np.arange(24, dtype=np.uint8).reshape(4, 6)
+        resized = env_r._observation(frame)
+        assert resized.dtype == np.uint8
+        np.testing.assert_array_equal(
+            resized, np.rint(frame.reshape(2, 2, 3, 2).mean(axis=(1, 3))))
+        # The returned frame is not reused by later steps.
+        env_r._observation(frame + 1)
+        np.testing.assert_array_equal(
+            resized, np.rint(frame.reshape(2, 2, 3, 2).mean(axis=(1, 3))))
+        env_r.close()
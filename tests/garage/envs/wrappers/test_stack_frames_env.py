@@ -78,3 +78,20 @@ class TestStackFrames:
             StackFrames(DummyDiscrete2DEnv(random=False),
                         n_frames=self.n_frames,
                         axis=5)
+
+    def test_stack_frames_returns_copies(self):
+        env = StackFrames(DummyDiscrete2DEnv(random=True),
+                          n_frames=self.n_frames,
+                          axis=0)
+        first = env.reset()
+        first_copy = first.copy()
+        frames = []
+        for _ in range(2 * self.n_frames + 1):
+            obs, _, _, _ = env.step(1)
+            frames.append(obs[-1].copy())
+            np.testing.assert_array_equal(obs[-1], frames[-1])
+            if len(frames) >= self.n_frames:
+                np.testing.assert_array_equal(obs,
+                                              frames[-self.n_frames:])
+        np.testing.assert_array_equal(first, first_copy)
+        env.close()
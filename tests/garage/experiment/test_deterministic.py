@@ -96,3 +96,22 @@ def test_deterministic_random():
     ]
 
     assert rand_array == deterministic_array
+
+
+def test_rng_state():
+    """Test restoring the state of the random number generators"""
+    deterministic.set_seed(7)
+    random.random()
+    deterministic.get_tf_seed_stream()
+    state = deterministic.get_rng_state()
+    expected = (random.random(), np.random.rand(3), torch.rand(3),
+                deterministic.get_tf_seed_stream())
+    deterministic.set_seed(8)
+    deterministic.set_rng_state(state)
+    assert deterministic.get_seed() == 7
+    values = (random.random(), np.random.rand(3), torch.rand(3),
+              deterministic.get_tf_seed_stream())
+    assert values[0] == expected[0]
+    assert np.array_equal(values[1], expected[1])
+    assert torch.equal(values[2], expected[2])
+    assert values[3] == expected[3]
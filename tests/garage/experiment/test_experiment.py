@@ -1,3 +1,5 @@
+import collections
+import json
 import os
 import pathlib
 import shutil
@@ -8,7 +10,8 @@ import textwrap
 
 import pytest
 
-from garage.experiment.experiment import wrap_experiment
+from garage.experiment.experiment import (dump_json, LogEncoder,
+                                          wrap_experiment)
 
 
 def _hard_rmtree(path):
@@ -499,3 +502,73 @@ def test_wrap_experiment_invalid_options():
 
     with pytest.raises(ValueError):
         test_exp(dict(logdir=logdir))
+
+
+class Nested:
+
+    def __init__(self, child=None):
+        self.child = child
+        self.segments = collections.deque(range(1000))
+
+
+class Summarized:
+
+    def __init__(self):
+        self.contents = list(range(1000))
+
+    def __log_json__(self):
+        return {'n_contents': len(self.contents)}
+
+
+def test_log_encoder_summarizes_large_containers():
+    data = json.loads(json.dumps(Nested(), cls=LogEncoder, max_items=3))
+    assert data['segments'] == {
+        '$type': 'collections.deque',
+        '$len': 1000,
+        '$items': [0, 1, 2]
+    }
+    data = json.loads(
+        json.dumps({str(i): i
+                    for i in range(10)},
+                   cls=LogEncoder,
+                   max_items=2))
+    assert data == {
+        '$type': 'builtins.dict',
+        '$len': 10,
+        '$items': {
+            '0': 0,
+            '1': 1
+        }
+    }
+    # Without a budget, everything is encoded.
+    data = json.loads(json.dumps(Nested(), cls=LogEncoder))
+    assert data['segments'] == list(range(1000))
+
+
+def test_log_encoder_summarizes_deep_objects():
+    data = json.loads(
+        json.dumps(Nested(Nested(Nested())), cls=LogEncoder, max_depth=2))
+    assert data['child']['$type'].endswith('.Nested')
+    assert data['child']['segments'] == {
+        '$type': 'collections.deque',
+        '$len': 1000
+    }
+    assert data['child']['child'] == {'$type': data['child']['$type']}
+
+
+def test_log_encoder_log_json_hook():
+    data = json.loads(json.dumps({'a': Summarized()}, cls=LogEncoder))
+    assert data['a']['n_contents'] == 1000
+    assert data['a']['$type'].endswith('.Summarized')
+
+
+def test_dump_json(tmp_path):
+    file_name = str(tmp_path / 'experiment.json')
+    seconds, size = dump_json(file_name, {'a': None, 'b': Nested()},
+                              max_items=10)
+    assert seconds > 0
+    assert size == os.path.getsize(file_name)
+    with open(file_name) as file:
+        data = json.load(file)
+    assert data['a'] is None
+    assert data['b']['segments']['$len'] == 1000
@@ -0,0 +1,76 @@
+import csv
+import os
+
+import pytest
+
+from garage import wrap_experiment
+from garage.envs import PointEnv
+from garage.experiment import deterministic, run_experiments
+from garage.sampler import LocalSampler
+from garage.torch.algos import VPG
+from garage.torch.policies import GaussianMLPPolicy
+from garage.torch.value_functions import GaussianMLPValueFunction
+from garage.trainer import Trainer
+
+
+@wrap_experiment(archive_launch_repo=False)
+def vpg_point(ctxt, seed, fail=False):
+    if fail:
+        raise ValueError('Failed on purpose')
+    deterministic.set_seed(seed)
+    env = PointEnv(max_episode_length=5)
+    policy = GaussianMLPPolicy(env.spec, hidden_sizes=(8, ))
+    value_function = GaussianMLPValueFunction(env.spec, hidden_sizes=(8, ))
+    algo = VPG(env_spec=env.spec,
+               policy=policy,
+               value_function=value_function,
+               discount=0.99)
+    trainer = Trainer(ctxt)
+    trainer.setup(algo, env, sampler_cls=LocalSampler)
+    trainer.train(n_epochs=2, batch_size=20)
+    return type(trainer._sampler).__name__, trainer.total_env_steps
+
+
+def _read_column(log_dir, column):
+    with open(os.path.join(log_dir, 'progress.csv')) as f:
+        return [float(row[column]) for row in csv.DictReader(f)]
+
+
+@pytest.mark.timeout(120)
+def test_run_experiments(tmp_path):
+    log_dirs = [str(tmp_path / 'seed_{}'.format(seed)) for seed in range(3)]
+    results = run_experiments(vpg_point,
+                              [dict(seed=seed) for seed in range(3)],
+                              options=[dict(log_dir=d) for d in log_dirs],
+                              n_workers=2,
+                              n_parallel=2)
+    assert [name for name, _ in results] == ['PooledSampler'] * 3
+    for log_dir, (_, total_env_steps) in zip(log_dirs, results):
+        assert _read_column(log_dir, 'TotalEnvSteps')[-1] == total_env_steps
+    returns = [
+        _read_column(log_dir, 'Evaluation/AverageReturn')
+        for log_dir in log_dirs
+    ]
+    assert returns[0] != returns[1]
+
+    # Variants sample the same episodes however they are run.
+    (result, ) = run_experiments(vpg_point, [dict(seed=1)],
+                                 options=dict(log_dir=str(tmp_path / 'rerun')),
+                                 n_workers=2)
+    assert result == results[1]
+    assert (_read_column(str(tmp_path / 'rerun'),
+                         'Evaluation/AverageReturn') == returns[1])
+
+
+@pytest.mark.timeout(120)
+def test_run_experiments_reports_failures(tmp_path):
+    with pytest.raises(RuntimeError, match='1 of 2 variants failed'):
+        run_experiments(vpg_point,
+                        [dict(seed=0), dict(seed=1, fail=True)],
+                        options=dict(log_dir=str(tmp_path / 'exp')),
+                        n_workers=1)
+    assert os.path.exists(str(tmp_path / 'exp' / 'progress.csv'))
+    with pytest.raises(ValueError):
+        run_experiments(vpg_point, [dict(seed=0)], options=[{}, {}])
+    with pytest.raises(ValueError):
+        run_experiments(vpg_point, [dict(seed=0)], n_parallel=0)
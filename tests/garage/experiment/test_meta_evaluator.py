@@ -106,6 +106,24 @@ def test_meta_evaluator():
         assert float(rows[1]['MetaTest/__unnamed_task__/Iteration']) == 1
 
 
+def test_meta_evaluator_multiple_workers():
+    set_seed(100)
+    tasks = SetTaskSampler(PointEnv, wrapper=set_length)
+    env = PointEnv(max_episode_length=200)
+    algo = OptimalActionInference(env=env, max_episode_length=200)
+    meta_eval = MetaEvaluator(test_task_sampler=tasks,
+                              n_test_tasks=5,
+                              n_exploration_eps=2,
+                              n_test_episodes=2,
+                              n_workers=3)
+    tabular.clear()
+    meta_eval.evaluate(algo)
+    # Episodes which reach the goal end early, so each task samples at least
+    # 2 episodes, and until it has 2 * 200 steps.
+    assert tabular.as_dict['MetaTest/__unnamed_task__/NumEpisodes'] >= 10
+    assert tabular.as_dict['MetaTest/__unnamed_task__/Iteration'] == 0
+
+
 class MockAlgo:
 
     sampler_cls = LocalSampler
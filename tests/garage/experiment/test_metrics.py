@@ -0,0 +1,88 @@
+import os
+
+from dowel import logger, tabular, TabularInput
+import numpy as np
+import pytest
+
+from garage import wrap_experiment
+from garage.experiment import load_metrics, MetricsOutput
+
+
+def _log(output, **row):
+    tabular = TabularInput()
+    for key, value in row.items():
+        tabular.record(key, value)
+    output.record(tabular)
+    output.dump()
+
+
+def test_metrics_output(tmp_path):
+    output = MetricsOutput(str(tmp_path / 'metrics'), rows_per_chunk=2)
+    _log(output, **{'Return/Average': 1.5, 'Epoch': 0})
+    _log(output, **{'Return/Average': 2.5, 'Epoch': 1, 'Name': 'skipped'})
+    # Keys logged for the first time are added to later rows only.
+    _log(output, **{'Return/Average': 3.5, 'Epoch': 2, 'Task/Success': True})
+    output.wait()
+    assert sorted(os.listdir(str(tmp_path / 'metrics'))) == [
+        'chunk_000000.npz', 'chunk_000001.npz'
+    ]
+    metrics = load_metrics(str(tmp_path))
+    assert sorted(metrics) == ['Epoch', 'Return/Average', 'Task/Success']
+    assert np.array_equal(metrics['Epoch'], [0, 1, 2])
+    assert np.array_equal(metrics['Return/Average'], [1.5, 2.5, 3.5])
+    assert np.array_equal(metrics['Task/Success'], [np.nan, np.nan, 1.],
+                          equal_nan=True)
+
+    # Rows recorded but not dumped are written when the output is closed.
+    tabular = TabularInput()
+    tabular.record('Epoch', 3)
+    output.record(tabular)
+    output.close()
+    output.close()
+    metrics = load_metrics(str(tmp_path))
+    assert np.array_equal(metrics['Epoch'], [0, 1, 2, 3])
+    assert np.isnan(metrics['Return/Average'][3])
+
+
+def test_metrics_output_replaces_existing_chunks(tmp_path):
+    metrics_dir = str(tmp_path / 'metrics')
+    output = MetricsOutput(metrics_dir, rows_per_chunk=2)
+    for epoch in range(5):
+        _log(output, Epoch=epoch)
+    output.close()
+    output = MetricsOutput(metrics_dir, rows_per_chunk=2)
+    _log(output, Epoch=100)
+    output.close()
+    assert os.listdir(metrics_dir) == ['chunk_000000.npz']
+    assert np.array_equal(load_metrics(str(tmp_path))['Epoch'], [100])
+
+
+def test_metrics_output_invalid_arguments(tmp_path):
+    with pytest.raises(ValueError):
+        MetricsOutput(str(tmp_path), rows_per_chunk=0)
+    output = MetricsOutput(str(tmp_path))
+    with pytest.raises(ValueError):
+        output.record('not tabular')
+    output.close()
+
+
+def test_experiment_logs_metrics(tmp_path):
+    log_dir = str(tmp_path / 'exp')
+    # Other tests may leave outputs logging to deleted files.
+    logger.remove_all()
+    tabular.clear()
+
+    @wrap_experiment(log_dir=log_dir, archive_launch_repo=False)
+    def log_metrics(ctxt):
+        del ctxt
+        for epoch in range(3):
+            tabular.record('Epoch', epoch)
+            logger.log(tabular)
+            logger.dump_all()
+        # Rows not dumped are written when the experiment closes its outputs.
+        tabular.record('Epoch', 3)
+        logger.log(tabular)
+
+    log_metrics()
+    tabular.clear()
+    assert np.array_equal(load_metrics(log_dir)['Epoch'], [0, 1, 2, 3])
@@ -1,7 +1,9 @@
+import os
 from os import path as osp
 import pickle
 import tempfile
 
+import numpy as np
 import pytest
 
 from garage.experiment import Snapshotter
@@ -19,6 +21,16 @@ configurations = [('all', {
 }), ('none', {})]
 
 
+class NotLoadable:
+    """An object failing to load, to test sections are loaded separately."""
+
+    def __init__(self):
+        self.value = 1
+
+    def __setstate__(self, state):
+        raise AssertionError('NotLoadable was loaded')
+
+
 class TestSnapshotter:
 
     def setup_method(self):
@@ -28,8 +40,9 @@ class TestSnapshotter:
         self.temp_dir.cleanup()
 
     @pytest.mark.parametrize('mode, files', [*configurations])
-    def test_snapshotter(self, mode, files):
-        snapshotter = Snapshotter(self.temp_dir.name, mode, 1)
+    @pytest.mark.parametrize('snapshot_async', [False, True])
+    def test_snapshotter(self, mode, files, snapshot_async):
+        snapshotter = Snapshotter(self.temp_dir.name, mode, 1, snapshot_async)
 
         assert snapshotter.snapshot_dir == self.temp_dir.name
         assert snapshotter.snapshot_mode == mode
@@ -38,6 +51,7 @@ class TestSnapshotter:
         snapshot_data = [{'testparam': 1}, {'testparam': 4}]
         snapshotter.save_itr_params(1, snapshot_data[0])
         snapshotter.save_itr_params(2, snapshot_data[1])
+        snapshotter.close()
 
         for f, num in files.items():
             filename = osp.join(self.temp_dir.name, f)
@@ -62,6 +76,171 @@ class TestSnapshotter:
             data = pickle.load(pkl_file)
             assert data == snapshot_data[1]
 
+    def test_async_snapshot_is_captured_on_save(self):
+        snapshotter = Snapshotter(self.temp_dir.name, 'all', 1, True)
+        assert snapshotter.snapshot_async
+        buffer = np.arange(100000.)
+        params = {'buffer': buffer, 'small': np.ones(3)}
+        snapshotter.save_itr_params(1, params)
+        # Changes made after saving must not be in the snapshot.
+        buffer[:] = -1
+        params['small'] = None
+        snapshotter.save_itr_params(2, params)
+        loaded = snapshotter.load(self.temp_dir.name, 1)
+        assert np.array_equal(loaded['buffer'], np.arange(100000.))
+        assert np.array_equal(loaded['small'], np.ones(3))
+        # Loaded arrays can be modified, like arrays pickled synchronously.
+        loaded['buffer'][0] = 1.
+        with open(osp.join(self.temp_dir.name, 'itr_2.pkl'), 'rb') as file:
+            loaded = pickle.load(file)
+        assert (loaded['buffer'] == -1).all()
+        assert loaded['small'] is None
+        stats = snapshotter.collect_stats()
+        assert stats['Snapshot/BlockedSeconds'] > 0
+        assert stats['Snapshot/WriteSeconds'] > 0
+        assert snapshotter.collect_stats()['Snapshot/WriteSeconds'] == 0
+        assert not any(f.endswith('.tmp') for f in os.listdir(
+            self.temp_dir.name))
+        snapshotter.close()
+
+    @pytest.mark.parametrize('snapshot_async', [False, True])
+    def test_chunked_snapshots_only_write_changed_chunks(
+            self, snapshot_async):
+        snapshotter = Snapshotter(self.temp_dir.name,
+                                  'all',
+                                  snapshot_async=snapshot_async,
+                                  snapshot_format='chunked')
+        assert snapshotter.snapshot_format == 'chunked'
+        chunk_dir = osp.join(self.temp_dir.name, 'chunks')
+        # A replay buffer of 4 chunks of 4 MiB, and a shared reference to it.
+        observations = np.zeros(16 << 20, dtype=np.uint8)
+        params = {'buffer': {'observation': observations}, 'n': 0}
+        params['same'] = params['buffer']
+        snapshotter.save_itr_params(1, params)
+        snapshotter.wait()
+        # The 4 chunks have the same content, so only one is stored.
+        assert len(os.listdir(chunk_dir)) == 1
+
+        # Change the first chunk, and a single byte of the second one.
+        observations[:(4 << 20) + 1] = 1
+        params['n'] = 1
+        snapshotter.save_itr_params(2, params)
+        snapshotter.wait()
+        assert len(os.listdir(chunk_dir)) == 3
+        # Snapshot files only hold references to the chunks.
+        assert osp.getsize(osp.join(self.temp_dir.name, 'itr_2.pkl')) < 4096
+
+        loaded = snapshotter.load(self.temp_dir.name, 1)
+        assert (loaded['buffer']['observation'] == 0).all()
+        assert loaded['same'] is loaded['buffer']
+        loaded = snapshotter.load(self.temp_dir.name, 2)
+        assert np.array_equal(loaded['buffer']['observation'], observations)
+        assert loaded['n'] == 1
+        loaded['buffer']['observation'][0] = 2
+        snapshotter.close()
+
+    def test_chunked_snapshots_delete_unreferenced_chunks(self):
+        snapshotter = Snapshotter(self.temp_dir.name,
+                                  'last',
+                                  snapshot_format='chunked')
+        chunk_dir = osp.join(self.temp_dir.name, 'chunks')
+        previous_chunk = osp.join(chunk_dir, 'previous')
+        os.makedirs(chunk_dir)
+        with open(previous_chunk, 'wb') as file:
+            file.write(b'previous experiment')
+        for i in range(3):
+            snapshotter.save_itr_params(i, {'buffer': np.full(100000, i)})
+        assert len(os.listdir(chunk_dir)) == 2
+        assert osp.exists(previous_chunk)
+        loaded = snapshotter.load(self.temp_dir.name)
+        assert (loaded['buffer'] == 2).all()
+
+    @pytest.mark.parametrize('snapshot_format', ['sectioned', 'chunked'])
+    def test_sectioned_snapshots_load_sections(self, snapshot_format):
+        snapshotter = Snapshotter(self.temp_dir.name,
+                                  'last',
+                                  snapshot_format=snapshot_format)
+        policy = {'weights': np.arange(100000.)}
+        replay_buffer = {'observation': np.ones((50000, 2), np.float32)}
+        algo = {'policy': policy, 'replay_buffer': replay_buffer}
+        snapshotter.save_itr_params(
+            1, {
+                'policy': policy,
+                'replay_buffer': replay_buffer,
+                'algo': algo,
+                'env': NotLoadable()
+            })
+
+        loaded = snapshotter.load(self.temp_dir.name, sections=['policy'])
+        assert list(loaded) == ['policy']
+        weights = loaded['policy']['weights']
+        assert np.array_equal(weights, np.arange(100000.))
+        # Large arrays are mapped into memory, and can be modified without
+        # modifying the snapshot.
+        base = weights.base
+        while not isinstance(base, (np.memmap, type(None))):
+            base = base.base
+        assert base is not None
+        weights[:] = 0
+        loaded = snapshotter.load(self.temp_dir.name,
+                                  sections=['algo', 'replay_buffer'])
+        assert np.array_equal(loaded['algo']['policy']['weights'],
+                              np.arange(100000.))
+        # Objects shared by sections are still shared.
+        assert loaded['algo']['replay_buffer'] is loaded['replay_buffer']
+        assert loaded['replay_buffer']['observation'].dtype == np.float32
+        with pytest.raises(AssertionError, match='NotLoadable'):
+            snapshotter.load(self.temp_dir.name)
+        with pytest.raises(ValueError):
+            snapshotter.load(self.temp_dir.name, sections=['missing'])
+
+    def test_sectioned_snapshot_of_non_dict(self):
+        snapshotter = Snapshotter(self.temp_dir.name,
+                                  'last',
+                                  snapshot_format='sectioned')
+        snapshotter.save_itr_params(1, [1, np.zeros(100000)])
+        loaded = snapshotter.load(self.temp_dir.name)
+        assert loaded[0] == 1
+        assert (loaded[1] == 0).all()
+        with pytest.raises(ValueError):
+            snapshotter.load(self.temp_dir.name, sections=['policy'])
+
+    def test_load_sections_of_pickle_snapshot(self):
+        snapshotter = Snapshotter(self.temp_dir.name, 'last')
+        snapshotter.save_itr_params(1, {'policy': 1, 'env': 2})
+        assert snapshotter.load(self.temp_dir.name,
+                                sections=['policy']) == {
+                                    'policy': 1
+                                }
+        with pytest.raises(ValueError):
+            snapshotter.load(self.temp_dir.name, sections=['missing'])
+
+    @pytest.mark.parametrize('snapshot_format',
+                             ['pickle', 'sectioned', 'chunked'])
+    @pytest.mark.parametrize('snapshot_async', [False, True])
+    def test_checkpoints(self, snapshot_format, snapshot_async):
+        snapshotter = Snapshotter(self.temp_dir.name,
+                                  'all',
+                                  snapshot_async=snapshot_async,
+                                  snapshot_format=snapshot_format)
+        snapshotter.save_itr_params(1, {'n': 1})
+        snapshotter.save_checkpoint({'n': 2, 'buffer': np.arange(100000)})
+        snapshotter.save_checkpoint({'n': 3, 'buffer': np.arange(100000)})
+        loaded = snapshotter.load(self.temp_dir.name, 'checkpoint')
+        assert loaded['n'] == 3
+        assert np.array_equal(loaded['buffer'], np.arange(100000))
+        # Checkpoints are not snapshots of an iteration.
+        assert snapshotter.load(self.temp_dir.name, 'first')['n'] == 1
+        assert snapshotter.load(self.temp_dir.name, 'last')['n'] == 1
+        snapshotter.close()
+        assert sorted(f for f in os.listdir(self.temp_dir.name)
+                      if f != 'chunks') == ['checkpoint.pkl', 'itr_1.pkl']
+
+    def test_invalid_snapshot_format(self):
+        with pytest.raises(ValueError):
+            Snapshotter(snapshot_dir=self.temp_dir.name,
+                        snapshot_format='invalid')
+
     def test_invalid_snapshot_mode(self):
         with pytest.raises(ValueError):
             snapshotter = Snapshotter(snapshot_dir=self.temp_dir.name,
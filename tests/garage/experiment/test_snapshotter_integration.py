@@ -15,12 +15,15 @@ configurations = [('last', 4), ('first', 0), (3, 3)]
 
 class TestSnapshot(TfGraphTestCase):
 
+    snapshot_async = False
+
     def setup_method(self):
         super().setup_method()
         self.temp_dir = tempfile.TemporaryDirectory()
         snapshot_config = SnapshotConfig(snapshot_dir=self.temp_dir.name,
                                          snapshot_mode='all',
-                                         snapshot_gap=1)
+                                         snapshot_gap=1,
+                                         snapshot_async=self.snapshot_async)
         fixture_exp(snapshot_config, self.sess)
         for c in self.graph.collections:
             self.graph.clear_collection(c)
@@ -43,3 +46,8 @@ class TestSnapshot(TfGraphTestCase):
         snapshotter = Snapshotter()
         with pytest.raises(ValueError):
             snapshotter.load(self.temp_dir.name, 'foo')
+
+
+class TestAsyncSnapshot(TestSnapshot):
+
+    snapshot_async = True
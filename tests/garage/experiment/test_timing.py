@@ -0,0 +1,186 @@
+"""Tests for timing.py"""
+import collections
+import json
+import os
+import time
+
+import pytest
+
+from garage.experiment import timing
+
+
+@pytest.fixture(autouse=True)
+def reset_timing():
+    """Disable timing after each test."""
+    yield
+    timing.disable()
+
+
+def test_disabled_by_default():
+    assert not timing.is_enabled()
+    with timing.timed('A'):
+        timing.count('Steps', 10)
+    assert timing.collect_stats() == {}
+
+
+def test_nested_timers():
+    timing.enable()
+    with timing.timed('A'):
+        time.sleep(0.01)
+        with timing.timed('B'):
+            time.sleep(0.01)
+    with timing.timed('B'):
+        pass
+    stats = timing.collect_stats()
+    assert set(stats) == {'Timing/A', 'Timing/A/B', 'Timing/B'}
+    assert stats['Timing/A'] >= stats['Timing/A/B'] >= 0.01
+    assert stats['Timing/A'] >= 0.02
+
+
+def test_decorator():
+
+    @timing.timed('Outer')
+    def outer(x):
+        return inner(x) + 1
+
+    @timing.timed('Inner')
+    def inner(x):
+        return 2 * x
+
+    assert outer.__name__ == 'outer'
+    assert outer(1) == 3
+    assert timing.collect_stats() == {}
+    timing.enable()
+    assert outer(1) == 3
+    assert set(timing.collect_stats()) == {
+        'Timing/Outer', 'Timing/Outer/Inner'
+    }
+
+
+def test_timer_stops_on_exception():
+    timing.enable()
+    with pytest.raises(ValueError):
+        with timing.timed('A'):
+            raise ValueError
+    with timing.timed('B'):
+        pass
+    assert set(timing.collect_stats()) == {'Timing/A', 'Timing/B'}
+
+
+def test_throughput():
+    timing.enable()
+    timing.count('EnvSteps', 100)
+    timing.count('EnvSteps', 50)
+    time.sleep(0.01)
+    stats = timing.collect_stats()
+    assert 0 < stats['Throughput/EnvStepsPerSec'] <= 150 / 0.01
+
+
+def test_unused_keys_are_zero():
+    timing.enable()
+    with timing.timed('A'):
+        timing.count('EnvSteps', 10)
+    timing.collect_stats()
+    assert timing.collect_stats() == {
+        'Timing/A': 0.,
+        'Throughput/EnvStepsPerSec': 0.
+    }
+
+
+def test_trace_file(tmp_path):
+    trace_file = os.path.join(str(tmp_path), 'trace.json')
+    timing.enable(trace_file)
+    with timing.timed('A'):
+        with timing.timed('B'):
+            pass
+    timing.collect_stats()
+    with timing.timed('C'):
+        pass
+    timing.disable()
+    with open(trace_file) as f:
+        events = json.load(f)
+    assert [event['cat'] for event in events] == ['A/B', 'A', 'C']
+    assert [event['name'] for event in events] == ['B', 'A', 'C']
+    assert all(event['ph'] == 'X' for event in events)
+    inner, outer = events[:2]
+    assert outer['ts'] <= inner['ts']
+    assert inner['ts'] + inner['dur'] <= outer['ts'] + outer['dur']
+
+
+def test_forked_child_disables_timing():
+    timing.enable()
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.write(write_fd, b'1' if timing.is_enabled() else b'0')
+        os._exit(0)
+    os.close(write_fd)
+    enabled_in_child = os.read(read_fd, 1)
+    os.close(read_fd)
+    os.waitpid(pid, 0)
+    assert enabled_in_child == b'0'
+    assert timing.is_enabled()
+
+
+def test_untraced_timer(tmp_path):
+    trace_file = os.path.join(str(tmp_path), 'trace.json')
+    timing.enable(trace_file)
+    with timing.timed('A', trace=False):
+        pass
+    assert 'Timing/A' in timing.collect_stats()
+    timing.disable()
+    with open(trace_file) as f:
+        assert json.load(f) == []
+
+
+def test_stack_samples_sum():
+    a = timing.StackSamples({'main;f': 1})
+    b = timing.StackSamples({'main;f': 2, 'main;g': 1})
+    assert sum([a, b]) == {'main;f': 3, 'main;g': 1}
+    counter = collections.Counter()
+    counter.update({'Stacks': a})
+    counter.update({'Stacks': b})
+    assert counter['Stacks'] == {'main;f': 3, 'main;g': 1}
+
+
+def _busy_loop(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_stack_file(tmp_path):
+    stack_file = os.path.join(str(tmp_path), 'stacks.txt')
+    with pytest.raises(ValueError):
+        timing.enable(stack_file=stack_file, stack_interval=0)
+    timing.enable(stack_file=stack_file, stack_interval=0.001)
+    _busy_loop(0.1)
+    timing.add_stacks(timing.StackSamples({'worker-0;rollout (a.py:1)': 5}))
+    timing.disable()
+    with open(stack_file) as f:
+        lines = f.read().splitlines()
+    stacks = dict(line.rsplit(' ', 1) for line in lines)
+    assert stacks['worker-0;rollout (a.py:1)'] == '5'
+    busy = [
+        stack for stack in stacks
+        if stack.startswith('main;') and '_busy_loop' in stack
+    ]
+    assert busy
+    assert busy[0].split(';')[-1].startswith('_busy_loop (')
+
+
+def test_worker_config():
+    assert timing.worker_config() is None
+    timing.enable()
+    config = timing.worker_config()
+    assert config == dict(pid=os.getpid(), stack_interval=None)
+    # Workers in the sampling process are timed by the sampling process.
+    assert not timing.configure_worker(config, 'worker-0')
+    assert not timing.is_worker()
+    config = dict(config, pid=-1)
+    timing.disable()
+    assert timing.configure_worker(config, 'worker-0')
+    assert timing.is_worker() and timing.is_enabled()
+    assert not timing.configure_worker(config, 'worker-0')
+    assert timing.configure_worker(None, 'worker-0')
+    assert not timing.is_worker() and not timing.is_enabled()
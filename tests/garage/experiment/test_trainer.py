@@ -1,12 +1,19 @@
+import csv
+import json
+
+from dowel import CsvOutput, logger
 import pytest
 import torch
 
-from garage.envs import GymEnv, normalize
-from garage.experiment import deterministic
+from garage.envs import GymEnv, normalize, PointEnv
+from garage.experiment import deterministic, SnapshotConfig, timing
+from garage.np.exploration_policies import AddOrnsteinUhlenbeckNoise
 from garage.plotter import Plotter
-from garage.sampler import LocalSampler
-from garage.torch.algos import PPO
-from garage.torch.policies import GaussianMLPPolicy
+from garage.replay_buffer import PathBuffer
+from garage.sampler import EnvFactory, LocalSampler
+from garage.torch.algos import DDPG, PPO
+from garage.torch.policies import DeterministicMLPPolicy, GaussianMLPPolicy
+from garage.torch.q_functions import ContinuousMLPQFunction
 from garage.torch.value_functions import GaussianMLPValueFunction
 from garage.trainer import Trainer
 
@@ -94,3 +101,178 @@ def test_setup_no_max_episode_length():
     algo.policy = ()
     with pytest.raises(ValueError, match='max_episode_length'):
         trainer.setup(algo, None, sampler_cls=LocalSampler)
+
+
+def test_get_env_copy_from_env_factory():
+    trainer = Trainer(snapshot_config)
+    trainer.setup(CrashingAlgo(), EnvFactory(PointEnv, max_episode_length=7))
+    env = trainer.get_env_copy()
+    assert isinstance(env, PointEnv)
+    assert env.spec.max_episode_length == 7
+    assert trainer.get_env_copy() is not env
+
+
+@pytest.mark.parametrize('snapshot_format',
+                         ['pickle', 'sectioned', 'chunked'])
+def test_async_snapshots(tmp_path, snapshot_format):
+    # Other tests may leave outputs logging to deleted files.
+    logger.remove_all()
+    deterministic.set_seed(0)
+    env = PointEnv(max_episode_length=5)
+    policy = GaussianMLPPolicy(env_spec=env.spec, hidden_sizes=(8, ))
+    value_function = GaussianMLPValueFunction(env_spec=env.spec,
+                                              hidden_sizes=(8, ))
+    algo = PPO(env_spec=env.spec,
+               policy=policy,
+               value_function=value_function,
+               discount=0.99)
+    config = SnapshotConfig(snapshot_dir=str(tmp_path),
+                            snapshot_mode='all',
+                            snapshot_gap=1,
+                            snapshot_async=True,
+                            snapshot_format=snapshot_format)
+    trainer = Trainer(config)
+    trainer.setup(algo, env, sampler_cls=LocalSampler)
+    trainer.train(n_epochs=2, batch_size=20)
+    # train() waits for the last snapshot to be written, and stops the
+    # thread writing snapshots.
+    assert sorted(f.name for f in tmp_path.iterdir()
+                  if f.suffix == '.pkl') == ['itr_0.pkl', 'itr_1.pkl']
+    assert trainer._snapshotter._executor is None
+    stats = trainer._snapshotter.collect_stats()
+    assert stats['Snapshot/WriteSeconds'] > 0
+
+    restored = Trainer(config)
+    train_args = restored.restore(str(tmp_path))
+    assert train_args.start_epoch == 2
+    restored_policy = restored._algo.policy
+    for param, restored_param in zip(policy.parameters(),
+                                     restored_policy.parameters()):
+        assert torch.equal(param, restored_param)
+    loaded = restored._snapshotter.load(str(tmp_path), sections=['policy'])
+    for param, loaded_param in zip(policy.parameters(),
+                                   loaded['policy'].parameters()):
+        assert torch.equal(param, loaded_param)
+
+    restored.resume(n_epochs=3)
+    assert (tmp_path / 'itr_2.pkl').exists()
+    assert restored._snapshotter._executor is None
+
+
+def test_timing(tmp_path):
+    # Other tests may leave outputs logging to deleted files.
+    logger.remove_all()
+    csv_file = str(tmp_path / 'progress.csv')
+    logger.add_output(CsvOutput(csv_file))
+    trace_file = str(tmp_path / 'trace.json')
+    deterministic.set_seed(0)
+    env = PointEnv(max_episode_length=5)
+    policy = GaussianMLPPolicy(env_spec=env.spec, hidden_sizes=(8, ))
+    value_function = GaussianMLPValueFunction(env_spec=env.spec,
+                                              hidden_sizes=(8, ))
+    algo = PPO(env_spec=env.spec,
+               policy=policy,
+               value_function=value_function,
+               discount=0.99)
+    trainer = Trainer(
+        SnapshotConfig(snapshot_dir=str(tmp_path),
+                       snapshot_mode='last',
+                       snapshot_gap=1))
+    trainer.setup(algo, env, sampler_cls=LocalSampler)
+    timing.enable(trace_file)
+    try:
+        trainer.train(n_epochs=2, batch_size=20)
+    finally:
+        timing.disable()
+        logger.remove_all()
+    with open(csv_file) as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 2
+    for key in ('Timing/Sample', 'Timing/Sample/ObtainSamples',
+                'Timing/Sample/ObtainSamples/Rollout', 'Timing/Train',
+                'Timing/Train/ComputeAdvantages', 'Timing/Train/Optimize',
+                'Timing/Snapshot'):
+        assert float(rows[-1][key]) > 0
+    assert float(rows[-1]['Throughput/EnvStepsPerSec']) > 0
+    with open(trace_file) as f:
+        events = json.load(f)
+    assert {'Sample', 'Rollout', 'Train', 'Snapshot'} <= {
+        event['name']
+        for event in events
+    }
+
+
+class _Preempted(Exception):
+    """Raised to interrupt training, as a preempted process would be."""
+
+
+def _setup_ddpg(snapshot_dir):
+    deterministic.set_seed(0)
+    env = PointEnv(max_episode_length=5)
+    policy = DeterministicMLPPolicy(env_spec=env.spec, hidden_sizes=(8, ))
+    qf = ContinuousMLPQFunction(env_spec=env.spec, hidden_sizes=(8, ))
+    algo = DDPG(env_spec=env.spec,
+                policy=policy,
+                qf=qf,
+                replay_buffer=PathBuffer(capacity_in_transitions=1000),
+                steps_per_epoch=4,
+                n_train_steps=2,
+                buffer_batch_size=8,
+                min_buffer_size=10,
+                exploration_policy=AddOrnsteinUhlenbeckNoise(env.spec,
+                                                             policy,
+                                                             sigma=0.2))
+    trainer = Trainer(
+        SnapshotConfig(snapshot_dir=snapshot_dir,
+                       snapshot_mode='last',
+                       snapshot_gap=1))
+    trainer.setup(algo, env, sampler_cls=LocalSampler)
+    return trainer, algo
+
+
+def test_resume_from_checkpoint(tmp_path, monkeypatch):
+    # Other tests may leave outputs logging to deleted files.
+    logger.remove_all()
+    # Each batch holds two whole episodes, so no episode is in progress when
+    # the checkpoint is saved.
+    trainer, algo = _setup_ddpg(str(tmp_path / 'uninterrupted'))
+    trainer.train(n_epochs=3, batch_size=10)
+
+    snapshot_dir = str(tmp_path / 'preempted')
+    preempted, _ = _setup_ddpg(snapshot_dir)
+    with pytest.raises(ValueError):
+        preempted.train(n_epochs=3, batch_size=10, checkpoint_every=0)
+    train_once = DDPG.train_once
+    n_cycles = 0
+
+    def preempt_in_second_cycle_of_second_epoch(self, itr, episodes):
+        nonlocal n_cycles
+        n_cycles += 1
+        if n_cycles == 6:
+            raise _Preempted
+        train_once(self, itr, episodes)
+
+    monkeypatch.setattr(DDPG, 'train_once',
+                        preempt_in_second_cycle_of_second_epoch)
+    with pytest.raises(_Preempted):
+        preempted.train(n_epochs=3, batch_size=10, checkpoint_every=1)
+    monkeypatch.undo()
+
+    resumed = Trainer(
+        SnapshotConfig(snapshot_dir=snapshot_dir,
+                       snapshot_mode='last',
+                       snapshot_gap=1))
+    train_args = resumed.restore(snapshot_dir, from_epoch='checkpoint')
+    assert train_args.start_epoch == 1
+    assert train_args.checkpoint_every == 1
+    resumed.resume()
+    assert resumed.step_itr == trainer.step_itr == 12
+    assert resumed.total_env_steps == trainer.total_env_steps
+    resumed_algo = resumed._algo
+    assert (resumed_algo.replay_buffer.n_transitions_stored ==
+            algo.replay_buffer.n_transitions_stored)
+    for module, resumed_module in ((algo.policy, resumed_algo.policy),
+                                   (algo._qf, resumed_algo._qf)):
+        for param, resumed_param in zip(module.parameters(),
+                                        resumed_module.parameters()):
+            assert torch.equal(param, resumed_param)
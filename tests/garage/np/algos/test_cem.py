@@ -1,9 +1,10 @@
+import numpy as np
 import pytest
 
-from garage.envs import GymEnv
+from garage.envs import GymEnv, PointEnv
 from garage.np.algos import CEM
 from garage.sampler import LocalSampler
-from garage.tf.policies import CategoricalMLPPolicy
+from garage.tf.policies import CategoricalMLPPolicy, GaussianMLPPolicy
 from garage.trainer import TFTrainer
 
 from tests.fixtures import snapshot_config, TfGraphTestCase
@@ -33,3 +34,23 @@ class TestCEM(TfGraphTestCase):
             assert rtn > 40
 
             env.close()
+
+    def test_cem_population(self):
+        """Test CEM evaluating the whole population at once."""
+        with TFTrainer(snapshot_config) as trainer:
+            env = PointEnv(max_episode_length=10)
+            policy = GaussianMLPPolicy(name='policy',
+                                       env_spec=env.spec,
+                                       hidden_sizes=(8, ))
+            algo = CEM(env_spec=env.spec,
+                       policy=policy,
+                       best_frac=0.25,
+                       n_samples=4,
+                       episodes_per_sample=2)
+
+            trainer.setup(algo, env, sampler_cls=LocalSampler, n_workers=3)
+            rtn = trainer.train(n_epochs=2, batch_size=10)
+            assert rtn is not None
+            assert trainer.step_itr == 8
+            assert len(trainer.step_path.lengths) == 8
+            assert np.allclose(policy.get_param_values(), algo._cur_mean)
@@ -1,7 +1,7 @@
-from garage.envs import GymEnv
+from garage.envs import GymEnv, PointEnv
 from garage.np.algos import CMAES
 from garage.sampler import LocalSampler
-from garage.tf.policies import CategoricalMLPPolicy
+from garage.tf.policies import CategoricalMLPPolicy, GaussianMLPPolicy
 from garage.trainer import TFTrainer
 
 from tests.fixtures import snapshot_config, TfGraphTestCase
@@ -27,3 +27,21 @@ class TestCMAES(TfGraphTestCase):
             # No assertion on return because CMAES is not stable.
 
             env.close()
+
+    def test_cma_es_population(self):
+        """Test CMAES evaluating the whole population at once."""
+        with TFTrainer(snapshot_config) as trainer:
+            env = PointEnv(max_episode_length=10)
+            policy = GaussianMLPPolicy(name='policy',
+                                       env_spec=env.spec,
+                                       hidden_sizes=(8, ))
+            algo = CMAES(env_spec=env.spec,
+                         policy=policy,
+                         n_samples=4,
+                         episodes_per_sample=2)
+
+            trainer.setup(algo, env, sampler_cls=LocalSampler, n_workers=3)
+            rtn = trainer.train(n_epochs=2, batch_size=10)
+            assert rtn is not None
+            assert trainer.step_itr == 8
+            assert len(trainer.step_path.lengths) == 8
@@ -0,0 +1,85 @@
+"""Tests for LinearFeatureBaseline and LinearMultiFeatureBaseline."""
+import numpy as np
+import pytest
+
+from garage.np.baselines import (LinearFeatureBaseline,
+                                 LinearMultiFeatureBaseline)
+
+
+def _paths(n_paths=8, obs_dim=4, seed=0):
+    """Build random paths of varying lengths."""
+    rng = np.random.RandomState(seed)
+    return [
+        dict(observations=rng.normal(size=(length, obs_dim)),
+             tasks=rng.normal(size=(length, 2)),
+             returns=rng.normal(size=length))
+        for length in rng.randint(5, 30, size=n_paths)
+    ]
+
+
+def _flatten(paths, keys):
+    """Concatenate paths along the first axis."""
+    return {key: np.concatenate([p[key] for p in paths]) for key in keys}
+
+
+def test_fit_matches_lstsq():
+    paths = _paths()
+    baseline = LinearFeatureBaseline(env_spec=None)
+    baseline.fit(paths)
+    featmat = np.concatenate([
+        baseline._features({'observations': p['observations']})
+        for p in paths
+    ])
+    returns = np.concatenate([p['returns'] for p in paths])
+    expected = np.linalg.lstsq(
+        featmat.T.dot(featmat) + 1e-5 * np.identity(featmat.shape[1]),
+        featmat.T.dot(returns),
+        rcond=-1)[0]
+    assert np.allclose(baseline.get_param_values(), expected)
+
+
+@pytest.mark.parametrize('baseline_cls, keys', [
+    (LinearFeatureBaseline, ['observations']),
+    (LinearMultiFeatureBaseline, ['observations']),
+])
+def test_predict_episodes_matches_predict(baseline_cls, keys):
+    paths = _paths()
+    baseline = baseline_cls(env_spec=None)
+    lengths = np.array([len(p['returns']) for p in paths])
+    flat = _flatten(paths, keys)
+    assert np.all(baseline.predict_episodes(flat, lengths) == 0)
+    baseline.fit(paths)
+    expected = np.concatenate([baseline.predict(p) for p in paths])
+    assert np.allclose(baseline.predict_episodes(flat, lengths), expected)
+
+
+def test_multi_feature_baseline_features():
+    paths = _paths()
+    baseline = LinearMultiFeatureBaseline(env_spec=None,
+                                          features=['observations', 'tasks'])
+    path = paths[0]
+    obs, tasks = path['observations'], path['tasks']
+    expected = np.concatenate(
+        [obs, obs**2, tasks, tasks**2,
+         np.ones((len(obs), 1))], axis=1)
+    assert np.allclose(baseline._features(path), expected)
+    baseline.fit(paths)
+    assert baseline.get_param_values().shape == (2 * (4 + 2) + 1, )
+
+
+def test_gram_decay():
+    paths = _paths()
+    other_paths = _paths(seed=1)
+    baseline = LinearFeatureBaseline(env_spec=None, gram_decay=1.)
+    baseline.fit(paths)
+    baseline.fit(other_paths)
+    joint = LinearFeatureBaseline(env_spec=None)
+    joint.fit(paths + other_paths)
+    # With no decay, the accumulated fit equals a fit on all paths at once.
+    assert np.allclose(baseline.get_param_values(),
+                       joint.get_param_values())
+
+
+def test_invalid_gram_decay():
+    with pytest.raises(ValueError):
+        LinearFeatureBaseline(env_spec=None, gram_decay=0.)
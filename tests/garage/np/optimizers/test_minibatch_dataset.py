@@ -0,0 +1,58 @@
+"""Tests for BatchDataset."""
+import numpy as np
+import torch
+
+from garage.np.optimizers import BatchDataset
+
+
+def test_batch_dataset_covers_inputs_each_epoch():
+    obs = np.arange(30, dtype=np.float32).reshape(10, 3)
+    acts = np.arange(10)
+    dataset = BatchDataset([obs, acts], 4, extra_inputs=['extra'])
+    assert dataset.number_batches == 3
+    for _ in range(3):
+        seen = []
+        for batch_obs, batch_acts, extra in dataset.iterate():
+            assert extra == 'extra'
+            assert batch_obs.flags['C_CONTIGUOUS']
+            np.testing.assert_array_equal(batch_obs[:, 0] // 3, batch_acts)
+            seen.extend(batch_acts)
+        assert sorted(seen) == list(range(10))
+
+
+def test_batch_dataset_reuses_buffers():
+    obs = np.arange(10, dtype=np.float32)
+    dataset = BatchDataset([obs], 5)
+    first = next(dataset.iterate())[0]
+    second = next(dataset.iterate())[0]
+    assert first.base is second.base
+
+
+def test_batch_dataset_without_batch_size():
+    obs = np.arange(10)
+    dataset = BatchDataset([obs], None)
+    assert dataset.number_batches == 1
+    batches = list(dataset.iterate())
+    assert len(batches) == 1
+    assert batches[0][0] is obs
+
+
+def test_batch_dataset_torch_tensors():
+    obs = torch.arange(20.).reshape(10, 2)
+    advs = torch.arange(10.)
+    dataset = BatchDataset([obs, advs], 3)
+    seen = []
+    for batch_obs, batch_advs in dataset.iterate():
+        assert isinstance(batch_obs, torch.Tensor)
+        assert batch_obs.is_contiguous()
+        assert torch.equal(batch_obs[:, 0] / 2, batch_advs)
+        seen.extend(batch_advs.tolist())
+    assert sorted(seen) == list(range(10))
+
+
+def test_batch_dataset_torch_tensors_keep_gradients():
+    params = torch.arange(6., requires_grad=True)
+    dataset = BatchDataset([params], 2)
+    loss = sum(batch.sum() for batch, in dataset.iterate())
+    loss.backward()
+    assert torch.equal(params.grad, torch.ones(6))
@@ -0,0 +1,60 @@
+import collections
+
+import numpy as np
+import pytest
+
+from garage.np import RunningStats
+
+
+def test_cumulative_stats():
+    xs = np.random.normal(3., 2., size=(100, 4))
+    stats = RunningStats(4)
+    for x in xs:
+        stats.update(x)
+    assert stats.count == 100
+    assert np.allclose(stats.mean, xs.mean(axis=0))
+    assert np.allclose(stats.var, xs.var(axis=0))
+    normalized = stats.normalize(xs[0])
+    assert np.allclose(normalized, (xs[0] - xs.mean(axis=0)) /
+                       (xs.std(axis=0) + 1e-8))
+    out = np.empty(4)
+    assert stats.normalize(xs[0], out=out) is out
+    assert np.allclose(out, normalized)
+
+
+def test_merge_stats():
+    xs = np.random.normal(-1., 5., size=(90, 3))
+    parts = [RunningStats(3) for _ in range(3)]
+    parts[0].update_batch(xs[:10])
+    parts[1].update_batch(xs[10:50])
+    for x in xs[50:]:
+        parts[2].update(x)
+    merged = collections.Counter()
+    for part in parts:
+        merged.update({'stats': part})
+    merged = merged['stats']
+    assert merged.count == 90
+    assert np.allclose(merged.mean, xs.mean(axis=0))
+    assert np.allclose(merged.var, xs.var(axis=0))
+    # Merging does not modify the merged statistics.
+    assert parts[0].count == 10
+
+
+def test_moving_average_stats():
+    alpha = 0.1
+    xs = np.random.normal(size=(20, 2))
+    stats = RunningStats(2, alpha=alpha)
+    mean, var = np.zeros(2), np.ones(2)
+    for x in xs:
+        stats.update(x)
+        mean = (1 - alpha) * mean + alpha * x
+        var = (1 - alpha) * var + alpha * np.square(x - mean)
+    assert np.allclose(stats.mean, mean)
+    assert np.allclose(stats.var, var)
+    with pytest.raises(ValueError):
+        stats.merge(RunningStats(2))
+
+
+def test_invalid_alpha():
+    with pytest.raises(ValueError):
+        RunningStats(alpha=0.)
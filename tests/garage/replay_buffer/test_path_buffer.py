@@ -122,3 +122,20 @@ class TestPathBuffer:
         replay_buffer.clear()
         assert replay_buffer.n_transitions_stored == 0
         assert not replay_buffer._buffer
+
+
+def test_log_json_summarizes_buffer():
+    replay_buffer = PathBuffer(100)
+    for _ in range(3):
+        replay_buffer.add_path({
+            'observation': np.zeros((5, 2), dtype=np.float32),
+            'reward': np.zeros((5, 1))
+        })
+    summary = replay_buffer.__log_json__()
+    assert summary['capacity'] == 100
+    assert summary['n_transitions_stored'] == 15
+    assert summary['n_episodes_stored'] == 3
+    assert summary['buffer']['observation'] == {
+        'shape': (100, 2),
+        'dtype': 'float32'
+    }
@@ -0,0 +1,139 @@
+import numpy as np
+import pytest
+
+from garage.envs import normalize, PointEnv
+from garage.np.policies import FixedPolicy
+from garage.sampler import (DefaultWorker, EnvCache, LocalSampler,
+                            SetTaskUpdate, WorkerFactory)
+
+
+class _CountingPointEnv(PointEnv):
+    """PointEnv which counts constructions."""
+
+    constructed = 0
+
+    def __init__(self):
+        super().__init__(max_episode_length=4)
+        type(self).constructed += 1
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class _FirstPointEnv(_CountingPointEnv):
+    constructed = 0
+
+
+class _OtherPointEnv(_CountingPointEnv):
+    constructed = 0
+
+
+class _ThirdPointEnv(_CountingPointEnv):
+    constructed = 0
+
+
+def _reset_counts():
+    for env_type in (_FirstPointEnv, _OtherPointEnv, _ThirdPointEnv):
+        env_type.constructed = 0
+
+
+def _task():
+    return {'goal': np.zeros(2)}
+
+
+def _wrap(env, task):
+    del task
+    return normalize(env)
+
+
+def test_env_cache_lru():
+    cache = EnvCache(capacity=2)
+    envs = [PointEnv() for _ in range(3)]
+    assert cache.pop('a') is None
+    cache.put('a', envs[0])
+    cache.put('b', envs[1])
+    assert cache.pop('a') is envs[0]
+    cache.put('a', envs[0])
+    # 'b' is now the least recently used, so it is evicted.
+    cache.put('c', envs[2])
+    assert cache.pop('b') is None
+    assert len(cache) == 2
+    assert cache.collect_stats() == {
+        'EnvCache/Hits': 1,
+        'EnvCache/Misses': 2,
+        'EnvCache/Evictions': 1
+    }
+    assert cache.collect_stats() == {
+        'EnvCache/Hits': 0,
+        'EnvCache/Misses': 0,
+        'EnvCache/Evictions': 0
+    }
+
+
+def test_env_cache_invalid_capacity():
+    with pytest.raises(ValueError):
+        EnvCache(capacity=-1)
+
+
+def test_set_task_update_uses_cache():
+    _reset_counts()
+    cache = EnvCache(capacity=1)
+    first = SetTaskUpdate(_FirstPointEnv, _task(), None)(None, cache)
+    other = SetTaskUpdate(_OtherPointEnv, _task(), None)(first, cache)
+    env = SetTaskUpdate(_FirstPointEnv, _task(), None)(other, cache)
+    assert env is first
+    assert not first.closed
+    assert _FirstPointEnv.constructed == 1
+    # Switching to a third type evicts _OtherPointEnv from the cache.
+    SetTaskUpdate(_ThirdPointEnv, _task(), None)(env, cache)
+    assert other.closed
+    assert cache.collect_stats()['EnvCache/Hits'] == 1
+
+
+def test_set_task_update_keeps_cached_wrappers():
+    cache = EnvCache(capacity=1)
+    first = SetTaskUpdate(_FirstPointEnv, _task(), _wrap)(None, cache)
+    other = SetTaskUpdate(_OtherPointEnv, _task(), _wrap)(first, cache)
+    goal = np.ones(2)
+    env = SetTaskUpdate(_FirstPointEnv, {'goal': goal}, _wrap)(other, cache)
+    assert env is first
+    assert np.array_equal(env.unwrapped._goal, goal)
+
+
+def test_worker_stats_logged_by_sampler():
+    _reset_counts()
+    max_episode_length = 4
+    env = _FirstPointEnv()
+    policy = FixedPolicy(env.spec,
+                         scripted_actions=[
+                             env.action_space.sample()
+                             for _ in range(max_episode_length)
+                         ])
+    workers = WorkerFactory(seed=100,
+                            max_episode_length=max_episode_length,
+                            n_workers=2,
+                            worker_args=dict(env_cache_size=2))
+    sampler = LocalSampler.from_worker_factory(workers, policy, env)
+    for env_type in (_OtherPointEnv, _FirstPointEnv, _OtherPointEnv):
+        sampler.obtain_exact_episodes(
+            1, policy, env_update=SetTaskUpdate(env_type, _task(), None))
+    stats = sampler.collect_worker_stats()
+    assert stats['EnvCache/Misses'] == 2
+    assert stats['EnvCache/Hits'] == 4
+    assert stats['EnvCache/Evictions'] == 0
+    assert _OtherPointEnv.constructed == 2
+    assert sampler.collect_worker_stats()['EnvCache/Hits'] == 0
+    sampler.shutdown_worker()
+
+
+def test_disabled_env_cache_closes_env():
+    _reset_counts()
+    worker = DefaultWorker(seed=1,
+                           max_episode_length=4,
+                           worker_number=0,
+                           env_cache_size=0)
+    worker.update_env(SetTaskUpdate(_FirstPointEnv, _task(), None))
+    first = worker.env
+    worker.update_env(SetTaskUpdate(_OtherPointEnv, _task(), None))
+    assert first.closed
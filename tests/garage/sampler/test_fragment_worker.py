@@ -5,7 +5,7 @@ import numpy as np
 import pytest
 
 from garage import EpisodeBatch, StepType
-from garage.envs import GridWorldEnv, PointEnv
+from garage.envs import GridWorldEnv, PointEnv, VecMultiEnvWrapper
 from garage.experiment.task_sampler import SetTaskSampler
 from garage.np.policies import FixedPolicy, ScriptedPolicy
 from garage.sampler import FragmentWorker, LocalSampler, WorkerFactory
@@ -178,3 +178,33 @@ def test_update_envs_env_update(timesteps_per_call):
                                10,
                                None,
                                env_update=tasks.sample(n_workers + 1))
+
+
+class _ConstantPolicy:
+    """Policy taking the same continuous action everywhere."""
+
+    def get_actions(self, observations):
+        return np.full((len(observations), 2), 0.1), {}
+
+    def reset(self, do_resets=None):
+        del do_resets
+
+
+def test_vec_multi_env_wrapper_in_local_sampler():
+    goals = [np.array([1., 0.]), np.array([0., 1.]), np.array([-1., 0.])]
+    env = VecMultiEnvWrapper(
+        [PointEnv(goal=goal, max_episode_length=4) for goal in goals])
+    workers = WorkerFactory(seed=100,
+                            max_episode_length=4,
+                            n_workers=1,
+                            worker_class=FragmentWorker,
+                            worker_args=dict(n_envs=3))
+    sampler = LocalSampler.from_worker_factory(workers, _ConstantPolicy(),
+                                               env)
+    episodes = sampler.obtain_samples(0, 30, None)
+    # Every task contributes the same number of transitions.
+    counts = np.bincount(episodes.env_infos['task_id'])
+    assert len(counts) == 3
+    assert counts.min() == counts.max()
+    assert episodes.observations.shape[1] == 6
+    sampler.shutdown_worker()
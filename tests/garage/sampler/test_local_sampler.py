@@ -4,7 +4,7 @@ import pytest
 from garage.envs import PointEnv
 from garage.experiment.task_sampler import SetTaskSampler
 from garage.np.policies import FixedPolicy, ScriptedPolicy
-from garage.sampler import LocalSampler, WorkerFactory
+from garage.sampler import EnvFactory, LocalSampler, WorkerFactory
 
 
 def test_update_envs_env_update():
@@ -88,6 +88,37 @@ def test_obtain_exact_episodes():
         assert (eps.actions == per_worker_actions[worker]).all()
 
 
+class _ConstantActionPolicy(FixedPolicy):
+    """Policy whose only parameter is the action it always takes."""
+
+    def __init__(self, env_spec, max_episode_length):
+        self._action = np.zeros(env_spec.action_space.shape)
+        super().__init__(env_spec, [self._action] * max_episode_length)
+
+    def set_param_values(self, params):
+        self._action[:] = params
+
+    def get_param_values(self):
+        return self._action.copy()
+
+
+def test_obtain_exact_episodes_shared_agent():
+    max_episode_length = 5
+    n_workers = 4
+    env = PointEnv()
+    policy = _ConstantActionPolicy(env.spec, max_episode_length)
+    per_worker_actions = [env.action_space.sample() for _ in range(n_workers)]
+    workers = WorkerFactory(seed=100,
+                            max_episode_length=max_episode_length,
+                            n_workers=n_workers)
+    # All workers share the same policy object.
+    sampler = LocalSampler.from_worker_factory(workers, policy, envs=env)
+    episodes = sampler.obtain_exact_episodes(2,
+                                             agent_update=per_worker_actions)
+    for count, eps in enumerate(episodes.split()):
+        assert (eps.actions == per_worker_actions[count // 2]).all()
+
+
 def test_no_seed():
     max_episode_length = 16
     env = PointEnv()
@@ -103,3 +134,30 @@ def test_no_seed():
     sampler = LocalSampler.from_worker_factory(workers, policy, env)
     episodes = sampler.obtain_samples(0, 160, policy)
     assert sum(episodes.lengths) >= 160
+
+
+def test_init_with_env_factory():
+    max_episode_length = 16
+    env_factory = EnvFactory(PointEnv,
+                             goal=np.array([2., 2.]),
+                             max_episode_length=max_episode_length)
+    env = env_factory()
+    policy = FixedPolicy(env.spec,
+                         scripted_actions=[
+                             env.action_space.sample()
+                             for _ in range(max_episode_length)
+                         ])
+    n_workers = 2
+    workers = WorkerFactory(seed=100,
+                            max_episode_length=max_episode_length,
+                            n_workers=n_workers)
+    sampler = LocalSampler.from_worker_factory(workers, policy, env_factory)
+    episodes = sampler.obtain_samples(0, 32, policy)
+    for goal in episodes.env_infos['task']:
+        assert np.array_equal(goal['goal'], [2., 2.])
+    stats = sampler.collect_worker_stats()
+    assert stats['Worker/EnvSetupSeconds'] > 0
+    # Workers keep their environments across calls.
+    sampler.obtain_samples(0, 32, policy)
+    assert sampler.collect_worker_stats()['Worker/EnvSetupSeconds'] == 0
+    sampler.shutdown_worker()
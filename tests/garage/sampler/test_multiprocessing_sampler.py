@@ -1,3 +1,4 @@
+import os
 import pickle
 from unittest.mock import Mock
 
@@ -6,9 +7,11 @@ import pytest
 
 from garage.envs import PointEnv
 from garage.envs.grid_world_env import GridWorldEnv
+from garage.experiment import timing
 from garage.experiment.task_sampler import SetTaskSampler
 from garage.np.policies import FixedPolicy, ScriptedPolicy
-from garage.sampler import LocalSampler, MultiprocessingSampler, WorkerFactory
+from garage.sampler import (EnvFactory, LocalSampler, MultiprocessingSampler,
+                            WorkerFactory)
 
 
 @pytest.mark.timeout(10)
@@ -108,6 +111,66 @@ def test_init_with_env_updates():
     env.close()
 
 
+@pytest.mark.timeout(10)
+def test_init_with_env_factory():
+    max_episode_length = 16
+    env = PointEnv()
+    policy = FixedPolicy(env.spec,
+                         scripted_actions=[
+                             env.action_space.sample()
+                             for _ in range(max_episode_length)
+                         ])
+    n_workers = 2
+    workers = WorkerFactory(seed=100,
+                            max_episode_length=max_episode_length,
+                            n_workers=n_workers)
+    sampler = MultiprocessingSampler.from_worker_factory(
+        workers, policy, envs=EnvFactory(PointEnv, goal=np.array([2., 2.])))
+    episodes = sampler.obtain_samples(0, 32, policy)
+    for goal in episodes.env_infos['task']:
+        assert np.array_equal(goal['goal'], [2., 2.])
+    assert sampler.collect_worker_stats()['Worker/EnvSetupSeconds'] > 0
+    sampler.shutdown_worker()
+    env.close()
+
+
+@pytest.mark.timeout(30)
+def test_profile_workers(tmp_path):
+    max_episode_length = 16
+    env = PointEnv()
+    policy = FixedPolicy(env.spec,
+                         scripted_actions=[
+                             env.action_space.sample()
+                             for _ in range(max_episode_length)
+                         ])
+    n_workers = 2
+    workers = WorkerFactory(seed=100,
+                            max_episode_length=max_episode_length,
+                            n_workers=n_workers)
+    stack_file = os.path.join(str(tmp_path), 'stacks.txt')
+    timing.enable(stack_file=stack_file, stack_interval=0.001)
+    try:
+        sampler = MultiprocessingSampler.from_worker_factory(
+            workers, policy, env)
+        sampler.obtain_samples(0, 200, policy)
+        stats = sampler.collect_worker_stats()
+        sampler.shutdown_worker()
+    finally:
+        timing.disable()
+    env.close()
+    assert 'Worker/Stacks' not in stats
+    assert stats['Worker/Timing/Rollout'] > 0
+    assert stats['Worker/Timing/Rollout/GetAction'] > 0
+    assert stats['Worker/Timing/Rollout/EnvStep'] > 0
+    assert stats['Worker/Timing/Rollout/CollectEpisode'] > 0
+    assert 0 < stats['Worker/AgentFraction'] < 1
+    assert 0 < stats['Worker/Utilization'] <= 1
+    assert any(name in stats
+               for name in ('Worker/0/Utilization', 'Worker/1/Utilization'))
+    with open(stack_file) as f:
+        assert any(line.startswith('worker-') for line in f)
+
+
 @pytest.mark.timeout(10)
 def test_obtain_exact_episodes():
     max_episode_length = 15
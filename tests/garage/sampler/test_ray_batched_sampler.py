@@ -7,6 +7,7 @@ import ray
 
 from garage.envs import PointEnv
 from garage.envs.grid_world_env import GridWorldEnv
+from garage.experiment import timing
 from garage.experiment.task_sampler import SetTaskSampler
 from garage.np.policies import FixedPolicy, ScriptedPolicy
 from garage.sampler import LocalSampler, RaySampler, WorkerFactory
@@ -136,3 +137,25 @@ def test_init_with_env_updates(ray_local_session_fixture):
                                              envs=tasks.sample(n_workers))
     episodes = sampler.obtain_samples(0, 160, policy)
     assert sum(episodes.lengths) >= 160
+
+
+def test_timing_in_local_mode(ray_local_session_fixture):
+    del ray_local_session_fixture
+    env = PointEnv()
+    policy = FixedPolicy(env.spec,
+                         scripted_actions=[env.action_space.sample()] * 16)
+    workers = WorkerFactory(seed=100, max_episode_length=16, n_workers=2)
+    sampler = RaySampler.from_worker_factory(workers, policy, env)
+    timing.enable()
+    try:
+        with timing.timed('Sample'):
+            sampler.obtain_samples(0, 32, policy)
+        # Workers run in this process, so they are timed by it, rather than
+        # profiled as separate workers.
+        assert timing.is_enabled()
+        assert 'Worker/Utilization' not in sampler.collect_worker_stats()
+        assert timing.collect_stats()['Timing/Sample'] > 0
+    finally:
+        timing.disable()
+        sampler.shutdown_worker()
+        env.close()
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from garage.envs import PointEnv
+from garage.np.policies import UniformRandomPolicy
+from garage.sampler import PooledSampler, SamplerPool, WorkerFactory
+from garage.sampler import sampler_pool
+
+
+class NumPyRandomPolicy(UniformRandomPolicy):
+    """Samples actions with NumPy's global random number generator."""
+
+    def get_action(self, observation):
+        space = self._env_spec.action_space
+        return np.random.uniform(space.low, space.high), dict()
+
+
+@pytest.fixture
+def pool():
+    pool = SamplerPool(n_workers=2, n_slots=1)
+    pool.attach(slot=0, run_id=0)
+    yield pool
+    sampler_pool._attached_pool = None
+    pool.shutdown()
+
+
+def _make_sampler(seed, n_workers=2):
+    env = PointEnv(max_episode_length=5)
+    factory = WorkerFactory(seed=seed,
+                            max_episode_length=5,
+                            n_workers=n_workers)
+    return PooledSampler.from_worker_factory(factory,
+                                             NumPyRandomPolicy(env.spec), env)
+
+
+@pytest.mark.timeout(30)
+def test_samplers_have_own_random_state(pool):
+    del pool
+    sampler = _make_sampler(seed=1)
+    other = _make_sampler(seed=2)
+    episodes = [sampler.obtain_exact_episodes(2, None)]
+    other_episodes = other.obtain_samples(0, 12, None)
+    episodes.append(sampler.obtain_exact_episodes(2, None))
+    assert other_episodes.lengths.sum() >= 12
+    assert len(episodes[0].lengths) == 4
+    assert not np.array_equal(episodes[0].actions[:5],
+                              other_episodes.actions[:5])
+    sampler.shutdown_worker()
+
+    # The same episodes are sampled without the other sampler's requests
+    # in between.
+    sampler = _make_sampler(seed=1)
+    for expected in episodes:
+        batch = sampler.obtain_exact_episodes(2, None)
+        assert np.array_equal(batch.actions, expected.actions)
+        assert np.array_equal(batch.observations, expected.observations)
+    assert sampler.total_env_steps == 40
+    sampler.shutdown_worker()
+    other.shutdown_worker()
+
+
+@pytest.mark.timeout(30)
+def test_worker_errors(pool):
+    del pool
+    sampler = _make_sampler(seed=1)
+    with pytest.raises(RuntimeError, match='TypeError'):
+        sampler.obtain_exact_episodes(1, None, env_update=[None, 'not env'])
+    # Episodes requested by the failed call are discarded.
+    batch = sampler.obtain_exact_episodes(1, None)
+    assert len(batch.lengths) == 2
+    sampler.shutdown_worker()
+
+
+def test_requires_pool():
+    with pytest.raises(ValueError, match='run_experiments'):
+        _make_sampler(seed=1)
+
+
+@pytest.mark.timeout(30)
+def test_requires_worker_per_process(pool):
+    del pool
+    with pytest.raises(ValueError, match='has 2 workers'):
+        _make_sampler(seed=1, n_workers=3)
@@ -0,0 +1,136 @@
+import numpy as np
+import pytest
+
+from garage.envs import PointEnv
+from garage.np.policies import FixedPolicy
+from garage.sampler import (LocalSampler, Sampler, SetTaskUpdate,
+                            TaskScheduler, WorkerFactory)
+
+
+class _FirstPointEnv(PointEnv):
+
+    def __init__(self):
+        super().__init__(max_episode_length=4)
+
+
+class _OtherPointEnv(_FirstPointEnv):
+    pass
+
+
+class _ThirdPointEnv(_FirstPointEnv):
+    pass
+
+
+def _update(env_type, goal=0.):
+    return SetTaskUpdate(env_type, {'goal': np.full(2, goal)}, None)
+
+
+def test_schedule_keeps_env_affinity():
+    scheduler = TaskScheduler(n_workers=2)
+    first = scheduler.schedule(
+        [_update(_FirstPointEnv),
+         _update(_OtherPointEnv)])
+    assert first == [[0, 1]]
+    # Tasks of each type go back to the worker which holds that type.
+    second = scheduler.schedule(
+        [_update(_OtherPointEnv),
+         _update(_FirstPointEnv)])
+    assert second == [[1, 0]]
+
+
+def test_schedule_recently_held_env():
+    scheduler = TaskScheduler(n_workers=2)
+    scheduler.schedule([_update(_FirstPointEnv), _update(_OtherPointEnv)])
+    scheduler.schedule([_update(_ThirdPointEnv), _update(_ThirdPointEnv)])
+    # Both workers now hold _ThirdPointEnv, but worker 1 still caches
+    # _OtherPointEnv.
+    rounds = scheduler.schedule(
+        [_update(_OtherPointEnv),
+         _update(_FirstPointEnv)])
+    assert rounds == [[1, 0]]
+
+
+def test_schedule_shares_free_workers():
+    scheduler = TaskScheduler(n_workers=5)
+    rounds = scheduler.schedule(
+        [_update(_FirstPointEnv),
+         _update(_OtherPointEnv)])
+    assert len(rounds) == 1
+    assert sorted(rounds[0]) == [0, 0, 0, 1, 1]
+    rounds = scheduler.schedule([_update(_FirstPointEnv) for _ in range(7)])
+    assert [len(assignment) for assignment in rounds] == [5, 5]
+    scheduled = [task for assignment in rounds for task in set(assignment)]
+    assert sorted(scheduled) == list(range(7))
+
+
+class _WrappingSampler(Sampler):
+    """Sampler which does not tell its base class its number of workers."""
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, sampler):
+        self._sampler = sampler
+
+    def obtain_samples(self, itr, num_samples, agent_update, env_update=None):
+        return self._sampler.obtain_samples(itr, num_samples, agent_update,
+                                            env_update)
+
+    def obtain_exact_episodes(self, n_eps_per_worker, agent_update,
+                              env_update=None):
+        return self._sampler.obtain_exact_episodes(n_eps_per_worker,
+                                                   agent_update, env_update)
+
+    def shutdown_worker(self):
+        self._sampler.shutdown_worker()
+
+
+@pytest.mark.parametrize('wrap', [False, True])
+def test_obtain_task_episodes(wrap):
+    max_episode_length = 4
+    env = _FirstPointEnv()
+    policy = FixedPolicy(env.spec,
+                         scripted_actions=[
+                             env.action_space.sample()
+                             for _ in range(max_episode_length)
+                         ])
+    workers = WorkerFactory(seed=100,
+                            max_episode_length=max_episode_length,
+                            n_workers=2)
+    sampler = LocalSampler.from_worker_factory(workers, policy, env)
+    if wrap:
+        sampler = _WrappingSampler(sampler)
+    env_types = [_FirstPointEnv, _OtherPointEnv, _FirstPointEnv]
+    updates = [
+        _update(env_type, goal) for goal, env_type in enumerate(env_types)
+    ]
+    episodes = sampler.obtain_task_episodes(3, policy, updates)
+    assert len(episodes.lengths) == 9
+    task_index = episodes.episode_infos_by_episode['task_index']
+    assert np.array_equal(task_index, np.repeat(np.arange(3), 3))
+    for task, episode in zip(task_index, episodes.split()):
+        for step_task in episode.env_infos['task']:
+            assert np.all(step_task['goal'] == task)
+    sampler.shutdown_worker()
+
+
+def test_obtain_task_episodes_min_steps():
+    env = _FirstPointEnv()
+    policy = FixedPolicy(env.spec,
+                         scripted_actions=[env.action_space.sample()] * 4)
+    workers = WorkerFactory(seed=100, max_episode_length=4, n_workers=2)
+    sampler = LocalSampler.from_worker_factory(workers, policy, env)
+    # Episodes of the first task end at once, since its goal is the start.
+    updates = [_update(_FirstPointEnv, goal) for goal in range(3)]
+    episodes = sampler.obtain_task_episodes(1,
+                                            policy,
+                                            updates,
+                                            min_steps_per_task=10)
+    task_index = episodes.episode_infos_by_episode['task_index']
+    assert np.array_equal(np.unique(task_index), np.arange(3))
+    for task in range(3):
+        lengths = episodes.lengths[task_index == task]
+        # Episodes are added until the task has 10 steps, and no more.
+        assert lengths.sum() >= 10
+        assert lengths[:-1].sum() < 10
+    assert np.count_nonzero(task_index == 0) > 3
+    assert np.count_nonzero(task_index == 1) == 3
+    sampler.shutdown_worker()
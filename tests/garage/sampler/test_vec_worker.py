@@ -1,8 +1,11 @@
 import pprint
 
+import numpy as np
 import pytest
 
-from garage.envs import GridWorldEnv
+from garage import StepType
+from garage.envs import (BatchPointEnv, GridWorldEnv, PointEnv,
+                         VecMultiEnvWrapper)
 from garage.experiment.task_sampler import EnvPoolSampler
 from garage.np.policies import ScriptedPolicy
 from garage.sampler import LocalSampler, VecWorker, WorkerFactory
@@ -168,3 +171,68 @@ def test_init_with_env_updates(policy, envs):
 
     true_sampler.shutdown_worker()
     vec_sampler.shutdown_worker()
+
+
+class _ConstantPolicy:
+    """Policy taking the same continuous action everywhere."""
+
+    def get_actions(self, observations):
+        return np.full((len(observations), 2), 0.1), {}
+
+    def reset(self, do_resets=None):
+        del do_resets
+
+
+def test_observations_are_not_overwritten():
+    worker = VecWorker(seed=SEED,
+                       max_episode_length=3,
+                       worker_number=0,
+                       n_envs=2)
+    worker.update_agent(_ConstantPolicy())
+    worker.update_env(PointEnv(max_episode_length=3))
+    eps = worker.rollout()
+    assert len(eps.lengths) == 2
+    # The point moves on every step, so every observation differs.
+    for episode in eps.split():
+        assert len({tuple(obs) for obs in episode.observations}) == 3
+    assert eps.episode_infos_by_episode['goal'].shape == (2, 2)
+    worker.shutdown()
+
+
+def test_vec_multi_env_wrapper():
+    goals = [np.array([1., 0.]), np.array([0., 1.]), np.array([-1., 0.])]
+    env = VecMultiEnvWrapper(
+        [PointEnv(goal=goal, max_episode_length=4) for goal in goals])
+    worker = VecWorker(seed=SEED,
+                       max_episode_length=4,
+                       worker_number=0,
+                       n_envs=3)
+    worker.update_agent(_ConstantPolicy())
+    worker.update_env(env)
+    eps = worker.rollout()
+    # Every task contributes one episode.
+    assert len(eps.lengths) == 3
+    assert sorted(eps.env_infos['task_id'][::4]) == [0, 1, 2]
+    assert eps.observations.shape == (12, 6)
+    assert eps.env_spec is env.spec
+    with pytest.raises(ValueError):
+        worker.update_env(VecMultiEnvWrapper([PointEnv(), PointEnv()]))
+    worker.shutdown()
+
+
+def test_batch_environment():
+    env = BatchPointEnv(3, max_episode_length=4)
+    worker = VecWorker(seed=SEED,
+                       max_episode_length=4,
+                       worker_number=0,
+                       n_envs=3)
+    worker.update_agent(_ConstantPolicy())
+    worker.update_env(env)
+    eps = worker.rollout()
+    assert len(eps.lengths) == 3
+    assert eps.observations.shape == (12, 3)
+    assert eps.env_spec is env.spec
+    assert (eps.step_types[3::4] == StepType.TIMEOUT).all()
+    with pytest.raises(ValueError):
+        worker.update_env(BatchPointEnv(2))
+    worker.shutdown()
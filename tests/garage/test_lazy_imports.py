@@ -0,0 +1,79 @@
+"""Tests that garage imports heavy dependencies only when they are used."""
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+# Each of these takes from a fraction of a second to several seconds to
+# import.
+HEAVY_MODULES = ('tensorflow', 'torch', 'ray', 'dowel', 'scipy', 'akro')
+# Importing garage without any heavy module takes a few tenths of a second.
+IMPORT_TIME_BUDGET = 2.
+
+PACKAGES = ('garage', 'garage.envs', 'garage.experiment', 'garage.sampler',
+            'garage.tf', 'garage.torch')
+
+
+def _import_in_new_process(statement):
+    """Run import statements in a new interpreter.
+
+    Args:
+        statement (str): Import statements to run.
+
+    Returns:
+        float: Seconds spent importing, as measured by `-X importtime`.
+        set[str]: Heavy modules which were imported.
+
+    """
+    code = '{}\nimport sys\nprint(*(m for m in {!r} if m in sys.modules))'
+    command = [
+        sys.executable, '-X', 'importtime', '-c',
+        code.format(statement, HEAVY_MODULES)
+    ]
+    result = subprocess.run(command,
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE,
+                            universal_newlines=True,
+                            check=True)
+    microseconds = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line.split('|')
+        # Nested imports are indented, and included in their parent's time.
+        if cumulative.strip().isdigit() and not name.startswith('  '):
+            microseconds += int(cumulative)
+    return microseconds / 1e6, set(result.stdout.split())
+
+
+@pytest.mark.parametrize('statement', [
+    'import garage',
+    'from garage import Environment, EnvSpec, EpisodeBatch, wrap_experiment',
+    'import ' + ', '.join(PACKAGES),
+    'from garage.sampler import (LocalSampler, MultiprocessingSampler, '
+    'VecWorker, WorkerFactory)',
+    'from garage.experiment import Snapshotter, timing',
+])
+def test_import_is_fast(statement):
+    seconds, heavy_modules = _import_in_new_process(statement)
+    assert not heavy_modules
+    assert seconds < IMPORT_TIME_BUDGET
+
+
+def test_heavy_modules_import_on_use():
+    _, heavy_modules = _import_in_new_process(
+        'from garage.sampler import RaySampler')
+    assert 'ray' in heavy_modules
+    assert 'tensorflow' not in heavy_modules
+
+
+@pytest.mark.parametrize('package', PACKAGES)
+def test_lazy_exports(package):
+    module = importlib.import_module(package)
+    assert set(module.__all__) <= set(dir(module))
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+        assert name in vars(module)
+    with pytest.raises(AttributeError):
+        getattr(module, 'NotExported')
@@ -0,0 +1,67 @@
+import numpy as np
+import tensorflow as tf
+
+from garage.envs import PointEnv
+from garage.experiment.task_sampler import SetTaskSampler
+from garage.np.baselines import LinearFeatureBaseline
+from garage.sampler import LocalSampler, WorkerFactory
+from garage.tf.algos import RL2PPO
+from garage.tf.algos.rl2 import RL2Env
+from garage.tf.policies import GaussianGRUPolicy
+
+from tests.fixtures import TfGraphTestCase
+
+
+class _ShortPointEnv(PointEnv):
+
+    def __init__(self):
+        super().__init__(max_episode_length=4)
+
+
+def _rl2_env(env, _task):
+    return RL2Env(env)
+
+
+class TestRL2(TfGraphTestCase):
+
+    def test_adapt_policies(self):
+        max_episode_length = 4
+        tasks = SetTaskSampler(_ShortPointEnv, wrapper=_rl2_env)
+        env_spec = RL2Env(_ShortPointEnv()).spec
+        policy = GaussianGRUPolicy(env_spec=env_spec,
+                                   hidden_dim=4,
+                                   state_include_action=False)
+        algo = RL2PPO(meta_batch_size=2,
+                      task_sampler=tasks,
+                      env_spec=env_spec,
+                      policy=policy,
+                      baseline=LinearFeatureBaseline(env_spec=env_spec),
+                      episodes_per_trial=2)
+        self.sess.run(tf.compat.v1.global_variables_initializer())
+        updates = tasks.sample(2)
+        sampler = LocalSampler.from_worker_factory(
+            WorkerFactory(seed=1,
+                          max_episode_length=max_episode_length,
+                          n_workers=1),
+            agents=algo.get_exploration_policy(),
+            envs=updates[0])
+        # Explore each task on its own, to find the hidden state it reaches.
+        exploration_eps, explored_hiddens = [], []
+        for update in updates:
+            exploration_eps.append(
+                sampler.obtain_task_episodes(2,
+                                             [algo.get_exploration_policy()],
+                                             [update]))
+            explored_hiddens.append(np.copy(policy._prev_hiddens))
+
+        policy.reset()
+        reset_hiddens = np.copy(policy._prev_hiddens)
+        adapted_policies = algo.adapt_policies(exploration_eps)
+        assert len(adapted_policies) == 2
+        for adapted_policy, hiddens in zip(adapted_policies,
+                                           explored_hiddens):
+            adapted_policy.reset()
+            assert np.allclose(policy._prev_hiddens, hiddens)
+            assert not np.allclose(policy._prev_hiddens, reset_hiddens)
+        assert not np.allclose(explored_hiddens[0], explored_hiddens[1])
+        sampler.shutdown_worker()
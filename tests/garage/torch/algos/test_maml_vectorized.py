@@ -0,0 +1,91 @@
+"""Tests for batched sampling and vectorized adaptation in MAML."""
+import pytest
+import torch
+
+from garage.envs import PointEnv
+from garage.experiment import deterministic, SetTaskSampler
+from garage.sampler import LocalSampler
+from garage.torch.algos import MAMLPPO, MAMLTRPO
+from garage.torch.policies import GaussianMLPPolicy
+from garage.torch.value_functions import GaussianMLPValueFunction
+from garage.trainer import Trainer
+
+from tests.fixtures import snapshot_config
+
+
+def _setup(algo_cls, episodes_per_task, vectorize_tasks, n_workers=2):
+    """Set up a MAML algorithm and trainer on PointEnv."""
+    deterministic.set_seed(1)
+    env = PointEnv(max_episode_length=10)
+    task_sampler = SetTaskSampler(PointEnv, wrapper=lambda env, _: env)
+    policy = GaussianMLPPolicy(env.spec, hidden_sizes=(8, 8))
+    value_function = GaussianMLPValueFunction(env.spec, hidden_sizes=(8, ))
+    algo = algo_cls(env=env,
+                    policy=policy,
+                    value_function=value_function,
+                    task_sampler=task_sampler,
+                    meta_batch_size=3,
+                    inner_lr=0.1,
+                    num_grad_updates=1,
+                    episodes_per_task=episodes_per_task,
+                    vectorize_tasks=vectorize_tasks)
+    trainer = Trainer(snapshot_config)
+    trainer.setup(algo, env, sampler_cls=LocalSampler, n_workers=n_workers)
+    return algo, trainer
+
+
+@pytest.mark.parametrize('algo_cls', [MAMLPPO, MAMLTRPO])
+def test_vectorized_matches_sequential(algo_cls):
+    """Vectorized meta-objective, KL and gradients match the task loop."""
+    algo, trainer = _setup(algo_cls, 4, vectorize_tasks=False)
+    trainer.step_itr = 0
+    all_samples, all_params = algo._obtain_samples(trainer)
+    for task_samples in all_samples:
+        assert [len(s.valids) for s in task_samples] == [4, 4]
+
+    loss = algo._compute_meta_loss(all_samples, all_params)
+    kl = algo._compute_kl_constraint(all_samples, all_params)
+    algo._meta_optimizer.zero_grad()
+    loss.backward()
+    grads = [p.grad.clone() for p in algo.policy.parameters()]
+
+    algo._vectorize_tasks = True
+    stacked = {
+        name: torch.stack([params[name] for params in all_params])
+        for name in all_params[0]
+    }
+    vec_loss = algo._compute_meta_loss(all_samples, stacked)
+    vec_kl = algo._compute_kl_constraint(all_samples, stacked)
+    algo._meta_optimizer.zero_grad()
+    vec_loss.backward()
+    vec_grads = [p.grad.clone() for p in algo.policy.parameters()]
+
+    assert torch.allclose(loss, vec_loss, atol=1e-6)
+    assert torch.allclose(kl, vec_kl, atol=1e-6)
+    for grad, vec_grad in zip(grads, vec_grads):
+        assert torch.allclose(grad, vec_grad, atol=1e-6)
+
+
+@pytest.mark.parametrize('vectorize_tasks', [False, True])
+def test_sampling_keeps_meta_policy(vectorize_tasks):
+    """Sampling adapted policies leaves the shared meta-policy unchanged."""
+    algo, trainer = _setup(MAMLPPO, 2, vectorize_tasks=vectorize_tasks)
+    trainer.step_itr = 0
+    params = dict(algo.policy.named_parameters())
+    before = {name: p.detach().clone() for name, p in params.items()}
+    _, all_params = algo._obtain_samples(trainer)
+    assert dict(algo.policy.named_parameters()) == params
+    for name, param in params.items():
+        assert torch.equal(before[name], param)
+    # Adapted parameters are sent to the workers as detached tensors.
+    for update in algo._task_agent_updates(all_params):
+        assert update.keys() == algo.policy.state_dict().keys()
+        assert all(not value.requires_grad for value in update.values())
+
+
+@pytest.mark.parametrize('episodes_per_task', [None, 2])
+def test_train_vectorized(episodes_per_task):
+    """Train with vectorized adaptation, with and without batched sampling."""
+    algo, trainer = _setup(MAMLTRPO, episodes_per_task, vectorize_tasks=True)
+    assert trainer.train(n_epochs=1, batch_size=20) is not None
+    assert algo._task_batch_cache is None
@@ -0,0 +1,86 @@
+"""Tests for batched adaptation and meta-testing in PEARL."""
+from dowel import tabular
+import pytest
+import torch
+
+from garage import EpisodeBatch
+from garage.envs import PointEnv
+from garage.experiment import MetaEvaluator
+from garage.experiment.deterministic import set_seed
+from garage.experiment.task_sampler import SetTaskSampler
+from garage.torch.algos import PEARL
+from garage.torch.algos.pearl import PEARLWorker
+from garage.torch.policies import TanhGaussianMLPPolicy
+from garage.torch.q_functions import ContinuousMLPQFunction
+
+
+class _ShortPointEnv(PointEnv):
+
+    def __init__(self):
+        super().__init__(never_done=True, max_episode_length=10)
+
+
+def _pearl(latent_dim=3, net_size=8):
+    env = SetTaskSampler(_ShortPointEnv).sample(2)
+    augmented_env = PEARL.augment_env_spec(env[0](), latent_dim)
+    qf = ContinuousMLPQFunction(env_spec=augmented_env,
+                                hidden_sizes=[net_size])
+    vf_env = PEARL.get_env_spec(env[0](), latent_dim, 'vf')
+    vf = ContinuousMLPQFunction(env_spec=vf_env, hidden_sizes=[net_size])
+    inner_policy = TanhGaussianMLPPolicy(env_spec=augmented_env,
+                                         hidden_sizes=[net_size])
+    return PEARL(env=env,
+                 inner_policy=inner_policy,
+                 qf=qf,
+                 vf=vf,
+                 num_train_tasks=2,
+                 num_test_tasks=3,
+                 latent_dim=latent_dim,
+                 encoder_hidden_sizes=[net_size],
+                 test_env_sampler=SetTaskSampler(_ShortPointEnv))
+
+
+def _exploration_episodes(pearl, n_tasks):
+    episodes = []
+    for env_up in SetTaskSampler(_ShortPointEnv).sample(n_tasks):
+        worker = PEARLWorker(seed=1, max_episode_length=10, worker_number=0)
+        worker.update_agent(pearl.get_exploration_policy())
+        worker.update_env(env_up)
+        episodes.append(worker.rollout())
+    return episodes
+
+
+@pytest.mark.parametrize('uneven', [False, True])
+def test_adapt_policies_matches_adapt_policy(uneven):
+    set_seed(1)
+    pearl = _pearl()
+    episodes = _exploration_episodes(pearl, 3)
+    if uneven:
+        episodes[0] = EpisodeBatch.concatenate(episodes[0], episodes[1])
+    policies = pearl.adapt_policies(episodes)
+    assert len({id(policy) for policy in policies}) == 3
+    meta_policy = pearl.get_exploration_policy()
+    for policy, eps in zip(policies, episodes):
+        adapted = pearl.adapt_policy(pearl.get_exploration_policy(), eps)
+        assert torch.allclose(policy.z_means, adapted.z_means, atol=1e-6)
+        assert torch.allclose(policy.z_vars, adapted.z_vars, atol=1e-6)
+        # Adapted policies share networks with the meta-policy.
+        assert policy.networks[0] is meta_policy.networks[0]
+
+
+def test_parallel_meta_test():
+    set_seed(1)
+    pearl = _pearl()
+    evaluator = MetaEvaluator(test_task_sampler=SetTaskSampler(_ShortPointEnv),
+                              n_test_tasks=3,
+                              n_exploration_eps=2,
+                              n_workers=2,
+                              worker_class=PEARLWorker,
+                              worker_args=dict(deterministic=True,
+                                               accum_context=True))
+    pearl.get_exploration_policy().reset_belief()
+    tabular.clear()
+    evaluator.evaluate(pearl)
+    assert tabular.as_dict['MetaTest/Average/NumEpisodes'] == 3
+    # The meta-policy is left with the prior belief.
+    assert pearl.get_exploration_policy().z.shape[0] == 1
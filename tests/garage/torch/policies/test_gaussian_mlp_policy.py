@@ -219,3 +219,35 @@ class TestGaussianMLPPolicies:
         actions, _ = policy.get_actions(np.array([obs, obs]))
         for action in actions:
             assert env.action_space.shape == action.shape
+
+    def test_flat_param_values(self):
+        """Test get/set_param_values with flattened parameters."""
+        env_spec = GymEnv(DummyBoxEnv())
+        obs = torch.ones([2, env_spec.observation_space.flat_dim])
+        policy = GaussianMLPPolicy(env_spec=env_spec, hidden_sizes=(3, ))
+        other = GaussianMLPPolicy(env_spec=env_spec, hidden_sizes=(3, ))
+        policy.flatten_parameters()
+        other.flatten_parameters()
+
+        params = policy.get_param_values()
+        assert isinstance(params, np.ndarray)
+        assert params.ndim == 1
+        other.set_param_values(params)
+        assert np.array_equal(policy(obs)[0].mean.detach(),
+                              other(obs)[0].mean.detach())
+
+        # Mutating the returned values must not affect the policy.
+        params[:] = 0
+        assert not np.array_equal(policy.get_param_values(), params)
+
+        policy_pickled = pickle.loads(pickle.dumps(policy))
+        assert np.array_equal(policy_pickled.get_param_values(),
+                              policy.get_param_values())
+
+    def test_flat_param_values_requires_flatten(self):
+        """Test flat parameters can't be loaded into an unflattened policy."""
+        env_spec = GymEnv(DummyBoxEnv())
+        policy = GaussianMLPPolicy(env_spec=env_spec, hidden_sizes=(3, ))
+        assert isinstance(policy.get_param_values(), dict)
+        with pytest.raises(ValueError):
+            policy.set_param_values(np.zeros(3))
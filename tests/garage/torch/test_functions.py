@@ -7,11 +7,14 @@ import torch.nn.functional as F
 
 from garage.torch import (compute_advantages,
                           dict_np_to_torch,
+                          flatten_module_params,
                           flatten_to_single_vector,
+                          get_flat_params,
                           global_device,
                           pad_to_last,
                           product_of_gaussians,
                           set_gpu_mode,
+                          soft_update_model,
                           torch_to_np,
                           TransposeImage)
 import garage.torch._functions as tu
@@ -87,6 +90,45 @@ def test_flatten_to_single_vector():
     assert expected.shape == flatten_tensor.shape
 
 
+def test_flatten_module_params():
+    """Test that module parameters become views of one flat buffer."""
+    module = torch.nn.Sequential(torch.nn.Linear(3, 4), torch.nn.Linear(4, 2))
+    expected = [p.detach().clone() for p in module.parameters()]
+    flat = flatten_module_params(module)
+    assert flat.shape == (3 * 4 + 4 + 4 * 2 + 2, )
+    for param, value in zip(module.parameters(), expected):
+        assert torch.equal(param, value)
+    flat.zero_()
+    assert all((p == 0).all() for p in module.parameters())
+    assert get_flat_params(module) is flat
+
+
+def test_get_flat_params_reflattens_moved_params():
+    """Test that flattening survives parameters being reassigned."""
+    module = torch.nn.Linear(3, 4)
+    assert get_flat_params(module) is None
+    flat = flatten_module_params(module)
+    module.weight.data = module.weight.data.clone()
+    new_flat = get_flat_params(module)
+    assert new_flat is not flat
+    assert new_flat.data_ptr() == module.weight.data_ptr()
+
+
+def test_soft_update_model_flat():
+    """Test Polyak averaging of flattened modules."""
+    target = torch.nn.Linear(3, 4)
+    source = torch.nn.Linear(3, 4)
+    expected = [
+        t.detach() * 0.9 + s.detach() * 0.1
+        for t, s in zip(target.parameters(), source.parameters())
+    ]
+    flatten_module_params(target)
+    flatten_module_params(source)
+    soft_update_model(target, source, 0.1)
+    for param, value in zip(target.parameters(), expected):
+        assert torch.allclose(param, value)
+
+
 def test_transpose_image():
     """Test TransposeImage."""
     original_env = DummyDiscretePixelEnv()